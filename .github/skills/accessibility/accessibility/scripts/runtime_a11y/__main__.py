@@ -37,11 +37,14 @@ import shutil
 import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, Iterable, Iterator
 from urllib.error import URLError
 from urllib.parse import urljoin, urlparse
 from urllib.request import urlopen
@@ -64,6 +67,8 @@ from runtime_a11y._errors import (
     EXIT_USAGE,
     ScriptError,
 )
+from runtime_a11y._result_cache import ProbeResultCache
+from runtime_a11y._runner import ProbeRunner, RunnerPool
 from runtime_a11y.matrix import compute_coverage, render_artifact_bundle
 from runtime_a11y.matrix._catalog import apply_criteria_catalog, catalog_provenance
 from runtime_a11y.matrix._model import Matrix
@@ -83,6 +88,15 @@ _RUNNER_INDEX = _PACKAGE_DIR / "runner" / "index.mjs"
 _PROBE_MAP_PATH = _PACKAGE_DIR / "probe-criteria-map.json"
 _NODE_MODULES = _PACKAGE_DIR / "node_modules"
 _REPO_ROOT = _PACKAGE_DIR.parents[5]
+# Probes that drive a machine-wide resource, such as the operator's real screen
+# reader, never share the machine with another probe under --jobs.
+_EXCLUSIVE_PROBES = frozenset({"probe-real-sr"})
+# Probes whose results are never reused from the result cache, because their
+# verdicts depend on more than the DOM and CSS snapshot: the real screen reader
+# reports on the operator's machine during this run, broken-links on the
+# current status of each linked URL, and console-errors on script behavior at
+# runtime.
+_UNCACHEABLE_PROBES = _EXCLUSIVE_PROBES | {"probe-broken-links", "probe-console-errors"}
 # An owned server builds the production site before it listens, and that build
 # dominates startup. A full build of this site was measured at 259 seconds, so
 # the owned-start budget is set well above it. Confirming an already-running
@@ -343,6 +357,15 @@ def _iter_runs(
                 yield probe, sid, state
 
 
+def _new_persistent_runner() -> ProbeRunner:
+    """Create a persistent Node runner that serves probe and calibration requests."""
+    return ProbeRunner(
+        ["node", str(_RUNNER_INDEX), "--serve"],
+        cwd=_PACKAGE_DIR,
+        env=os.environ,
+    )
+
+
 def _run_probe(
     config: dict[str, Any],
     probe_id: str,
@@ -350,9 +373,44 @@ def _run_probe(
     state: str,
     base_url: str,
     trace: bool,
+    runner: ProbeRunner | None = None,
+    *,
+    capture_snapshot: bool = False,
+    cached_snapshot: str | None = None,
 ) -> dict[str, Any]:
-    """Invoke the Node runner for one probe/surface/state and parse its JSON."""
+    """Invoke the Node runner for one probe/surface/state and parse its JSON.
+
+    With ``runner``, the request goes to the persistent runner instead of a
+    fresh Node process; its response is interpreted exactly like the one-shot
+    exit code, stdout payload, and stderr. ``capture_snapshot`` asks the runner
+    to hash the settled page into the payload's ``snapshotHash``; when that hash
+    equals ``cached_snapshot``, the runner skips the probe and returns a
+    ``cacheHit`` payload instead.
+    """
     _require_harness_dependencies("running the harness")
+    if runner is not None:
+        response = runner.request(
+            "probe",
+            {
+                "probeId": probe_id,
+                "surfaceId": surface_id,
+                "state": state,
+                "baseUrl": base_url,
+                "trace": trace,
+                "captureSnapshot": capture_snapshot,
+                "cachedSnapshot": cached_snapshot,
+            },
+            config=config,
+        )
+        return _interpret_probe_output(
+            probe_id,
+            surface_id,
+            state,
+            response.payload,
+            response.exit_code,
+            response.stderr,
+        )
+
     command = [
         "node",
         str(_RUNNER_INDEX),
@@ -366,6 +424,8 @@ def _run_probe(
         "RUNTIME_A11Y_STATE": state,
         "RUNTIME_A11Y_BASE_URL": base_url,
         "RUNTIME_A11Y_TRACE": "1" if trace else "0",
+        "RUNTIME_A11Y_CAPTURE_SNAPSHOT": "1" if capture_snapshot else "0",
+        "RUNTIME_A11Y_CACHED_SNAPSHOT": cached_snapshot or "",
     }
     try:
         completed = subprocess.run(
@@ -383,20 +443,38 @@ def _run_probe(
             EXIT_USAGE,
         ) from exc
 
-    # A probe may produce valid accessibility findings and still report an
-    # operational failure, such as being unable to prove it stopped a screen
-    # reader it started. The finding and the failure are separate facts: the
-    # payload is kept so the evidence is not lost, and the failure is carried
-    # alongside it so the run still fails.
     payload: dict[str, Any] | None = None
     if completed.stdout.strip():
         try:
             payload = json.loads(completed.stdout)
         except json.JSONDecodeError:
             payload = None
+    return _interpret_probe_output(
+        probe_id,
+        surface_id,
+        state,
+        payload,
+        completed.returncode,
+        completed.stderr,
+    )
 
-    if completed.returncode != 0:
-        stderr = (completed.stderr or "").strip() or "No probe output captured"
+
+def _interpret_probe_output(
+    probe_id: str,
+    surface_id: str,
+    state: str,
+    payload: dict[str, Any] | None,
+    returncode: int,
+    stderr: str | None,
+) -> dict[str, Any]:
+    """Turn a runner's payload, exit code, and stderr into a probe result."""
+    # A probe may produce valid accessibility findings and still report an
+    # operational failure, such as being unable to prove it stopped a screen
+    # reader it started. The finding and the failure are separate facts: the
+    # payload is kept so the evidence is not lost, and the failure is carried
+    # alongside it so the run still fails.
+    if returncode != 0:
+        stderr = (stderr or "").strip() or "No probe output captured"
         if payload is None:
             raise ScriptError(
                 f"Probe '{probe_id}' failed for surface '{surface_id}' "
@@ -419,9 +497,21 @@ def _run_prerequisite_probe(
     config: dict[str, Any],
     base_url: str,
     trace: bool = False,
+    runner: ProbeRunner | None = None,
 ) -> dict[str, Any]:
     """Probe local calibration prerequisites through the Node executor."""
     _require_harness_dependencies("running calibration")
+    if runner is not None:
+        response = runner.request(
+            "prerequisites", {"baseUrl": base_url, "trace": trace}, config=config
+        )
+        if response.exit_code != 0:
+            stderr = response.stderr.strip() or "No prerequisite output captured"
+            raise ScriptError(f"Calibration prerequisite probe failed: {stderr}")
+        return response.payload or {
+            "ok": True,
+            "reason": "Calibration prerequisites are ready.",
+        }
 
     script = (
         "import { pathToFileURL } from 'node:url';"
@@ -473,6 +563,7 @@ def _run_calibration_session(
     base_url: str,
     run_root: str | None,
     trace: bool = False,
+    runner: ProbeRunner | None = None,
 ) -> dict[str, Any]:
     """Invoke the Node calibration executor and parse its JSON payload."""
     if not _NODE_MODULES.exists():
@@ -482,6 +573,18 @@ def _run_calibration_session(
             "screen reader before running calibration.",
             EXIT_USAGE,
         )
+    if runner is not None:
+        response = runner.request(
+            "calibration",
+            {"baseUrl": base_url, "runRoot": run_root or "", "trace": trace},
+            config=config,
+        )
+        if response.exit_code != 0:
+            stderr = response.stderr.strip() or "No calibration output captured"
+            raise ScriptError(f"Calibration failed: {stderr}")
+        if response.payload is None:
+            raise ScriptError("Calibration produced no JSON output", EXIT_USAGE)
+        return response.payload
 
     command = ["node", str(_PACKAGE_DIR / "runner" / "calibration-executor.mjs")]
     env = {
@@ -1139,6 +1242,96 @@ def _write_visual_review_manifests(
     return manifest_paths
 
 
+def _execute_runs(
+    config: dict[str, Any],
+    run_keys: Iterable[tuple[str, str, str]],
+    base_url: str,
+    trace: bool,
+    jobs: int = 1,
+    runner_pool: RunnerPool | None = None,
+    result_cache: ProbeResultCache | None = None,
+) -> Iterator[tuple[tuple[str, str, str], dict[str, Any]]]:
+    """Yield ``(runKey, payload)`` pairs in ``run_keys`` order.
+
+    With ``jobs`` above one, up to ``jobs`` probes run concurrently and their
+    payloads are released in submission order, so the aggregated document is
+    identical to a serial run. Once any probe reports an operational failure,
+    or raises, no further probe is started; probes already running are waited
+    for, and the consumer stops at the first failure in order. Exclusive probes
+    run alone: in-flight probes drain before one starts, and nothing else
+    starts until it finishes. With ``runner_pool``, each concurrent probe
+    borrows its own persistent runner. With ``result_cache``, a probe whose
+    surface snapshot and code are unchanged yields its cached payload.
+    """
+    # Traced runs exist to capture fresh artifacts, so they bypass the cache.
+    cache = None if trace else result_cache
+
+    def _probe(run_key: tuple[str, str, str]) -> dict[str, Any]:
+        options: dict[str, Any] = {}
+        if cache is not None and run_key[0] not in _UNCACHEABLE_PROBES:
+            options = {
+                "capture_snapshot": True,
+                "cached_snapshot": cache.lookup(*run_key),
+            }
+        if runner_pool is None:
+            payload = _run_probe(config, *run_key, base_url, trace, **options)
+        else:
+            with runner_pool.acquire() as runner:
+                payload = _run_probe(
+                    config, *run_key, base_url, trace, runner=runner, **options
+                )
+        if options:
+            return cache.settle(*run_key, payload)
+        return payload
+
+    if jobs <= 1:
+        for run_key in run_keys:
+            yield run_key, _probe(run_key)
+        return
+
+    stop = threading.Event()
+
+    def _task(run_key: tuple[str, str, str]) -> dict[str, Any] | None:
+        if stop.is_set():
+            return None
+        try:
+            payload = _probe(run_key)
+        except BaseException:
+            stop.set()
+            raise
+        if payload.get("operationalFailure"):
+            stop.set()
+        return payload
+
+    window: deque[tuple[tuple[str, str, str], Future]] = deque()
+
+    def _drain(keep: int):
+        # Release completed payloads in order until at most ``keep`` remain.
+        # Probes are started in submission order, so a probe skipped after a
+        # failure always comes after the failure the consumer stops at.
+        while len(window) > keep:
+            head_key, head = window.popleft()
+            payload = head.result()
+            if payload is not None:
+                yield head_key, payload
+
+    with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="probe") as pool:
+        try:
+            for run_key in run_keys:
+                exclusive = run_key[0] in _EXCLUSIVE_PROBES
+                yield from _drain(0 if exclusive else 2 * jobs - 1)
+                if stop.is_set():
+                    break
+                window.append((run_key, pool.submit(_task, run_key)))
+                if exclusive:
+                    yield from _drain(0)
+            yield from _drain(0)
+        finally:
+            stop.set()
+            for _, future in window:
+                future.cancel()
+
+
 def run(
     config: dict[str, Any],
     probe_filter: str | None,
@@ -1146,6 +1339,9 @@ def run(
     trace: bool,
     surface_filter: str | None = None,
     state_filter: str | None = None,
+    jobs: int = 1,
+    persistent_runner: bool = False,
+    result_cache: Path | None = None,
 ) -> dict[str, Any]:
     """Execute the scoped runs and aggregate normalized probe results.
 
@@ -1153,40 +1349,59 @@ def run(
     account for the state of the machine, so it does not keep driving it. The
     evidence collected up to that point is retained and the document is marked
     quarantined, because a run that did not finish is not a basis for a
-    conformance claim even though its findings are real.
+    conformance claim even though its findings are real. ``jobs`` sets how
+    many probes run concurrently; results keep the ``_iter_runs`` order.
+    ``persistent_runner`` reuses long-lived Node runners across probes.
+    ``result_cache`` names a cache file whose payloads are reused for surfaces
+    that have not changed; reused runs carry ``reused`` provenance.
     """
     runs: list[dict[str, Any]] = []
     results: list[dict[str, Any]] = []
     operational_failure: dict[str, Any] | None = None
-    for probe_id, surface_id, state in _iter_runs(
+    run_keys = _iter_runs(
         config,
         probe_filter,
         surface_filter=surface_filter,
         state_filter=state_filter,
-    ):
-        payload = _run_probe(config, probe_id, surface_id, state, base_url, trace)
-        emitting_probe = payload.get("probeId", probe_id)
-        runs.append(
-            {
+    )
+    runner_pool = RunnerPool(_new_persistent_runner) if persistent_runner else None
+    cache = ProbeResultCache(result_cache) if result_cache is not None else None
+    executions = _execute_runs(
+        config, run_keys, base_url, trace, jobs, runner_pool, cache
+    )
+    try:
+        for (probe_id, surface_id, state), payload in executions:
+            emitting_probe = payload.get("probeId", probe_id)
+            run_entry = {
                 "probeId": emitting_probe,
                 "surfaceId": surface_id,
                 "state": state,
             }
-        )
-        for item in payload.get("results", []):
-            # Stamp the emitting probe on every row. Probes may push rows
-            # inline rather than exclusively through the shared result
-            # builder, so this aggregation point is the only place that sees
-            # them all. Consumers that join a row back to a declared
-            # expectation need it because criterion coverage overlaps across
-            # probes.
-            results.append({**item, "probeId": emitting_probe})
-
-        operational_failure = payload.get("operationalFailure")
-        if operational_failure:
-            if payload.get("cleanup"):
-                operational_failure["cleanup"] = payload["cleanup"]
-            break
+            if payload.get("reused"):
+                run_entry["reused"] = payload["reused"]
+            runs.append(run_entry)
+            for item in payload.get("results", []):
+                # Stamp the emitting probe on every row. Probes may push rows
+                # inline rather than exclusively through the shared result
+                # builder, so this aggregation point is the only place that sees
+                # them all. Consumers that join a row back to a declared
+                # expectation need it because criterion coverage overlaps across
+                # probes.
+                results.append({**item, "probeId": emitting_probe})
+
+            operational_failure = payload.get("operationalFailure")
+            if operational_failure:
+                if payload.get("cleanup"):
+                    operational_failure["cleanup"] = payload["cleanup"]
+                break
+    finally:
+        # Closing the generator waits for probes still in flight, so their
+        # runners are idle before the pool shuts them down.
+        executions.close()
+        if runner_pool is not None:
+            runner_pool.close()
+        if cache is not None:
+            cache.save()
 
     document = {
         "tool": "runtime_a11y",
@@ -1195,6 +1410,8 @@ def run(
         "runs": runs,
         "results": results,
     }
+    if cache is not None:
+        document["resultCache"] = cache.summary()
     if operational_failure:
         document["quarantined"] = True
         document["operationalFailure"] = operational_failure
@@ -1495,6 +1712,17 @@ def _run_at_plan_case(
     return result
 
 
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer argparse value."""
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from exc
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {parsed}")
+    return parsed
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create and configure the argument parser."""
     parser = argparse.ArgumentParser(
@@ -1552,12 +1780,51 @@ def create_parser() -> argparse.ArgumentParser:
             ),
         )
 
+    def _add_jobs(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument(
+            "--jobs",
+            type=_positive_int,
+            default=1,
+            help=(
+                "Number of probe runs to execute concurrently (default: 1). "
+                "Results keep the serial order and screen-reader probes "
+                "always run alone"
+            ),
+        )
+
+    def _add_persistent_runner(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument(
+            "--persistent-runner",
+            action="store_true",
+            help=(
+                "Keep one long-lived Node runner (per --jobs worker) with a warm "
+                "browser instead of starting Node for every probe"
+            ),
+        )
+
+    def _add_result_cache(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument(
+            "--result-cache",
+            type=Path,
+            default=None,
+            help=(
+                "Cache file of probe results; probes whose surface DOM, CSS, and "
+                "probe code are unchanged reuse their cached results"
+            ),
+        )
+
     run_all = subparsers.add_parser("run-all", help="Run every scoped probe")
     _add_common(run_all)
+    _add_jobs(run_all)
+    _add_persistent_runner(run_all)
+    _add_result_cache(run_all)
 
     probe = subparsers.add_parser("probe", help="Run a single probe by id")
     probe.add_argument("probe_id", help="Probe id, e.g. probe-axe")
     _add_common(probe)
+    _add_jobs(probe)
+    _add_persistent_runner(probe)
+    _add_result_cache(probe)
 
     verify_intent = subparsers.add_parser(
         "verify-intent",
@@ -1642,6 +1909,7 @@ def create_parser() -> argparse.ArgumentParser:
     )
     _add_common(run_calibration)
     _add_run_root(run_calibration)
+    _add_persistent_runner(run_calibration)
     run_calibration.add_argument(
         "--prerequisite-only",
         action="store_true",
@@ -1994,9 +2262,16 @@ def _cmd_run_calibration(args: argparse.Namespace) -> int:
     config_for_execution = deepcopy(config)
     if args.base_url:
         config_for_execution["baseUrl"] = args.base_url
+    runner = _new_persistent_runner() if args.persistent_runner else None
 
     if args.prerequisite_only:
-        payload = _run_prerequisite_probe(config_for_execution, base_url, args.trace)
+        try:
+            payload = _run_prerequisite_probe(
+                config_for_execution, base_url, args.trace, runner=runner
+            )
+        finally:
+            if runner is not None:
+                runner.close()
         aggregate = {
             "status": "successful",
             "reason": "Calibration prerequisites are ready.",
@@ -2039,8 +2314,11 @@ def _cmd_run_calibration(args: argparse.Namespace) -> int:
             base_url,
             str(run_root) if run_root is not None else None,
             args.trace,
+            runner=runner,
         )
     finally:
+        if runner is not None:
+            runner.close()
         if server_owned:
             _stop_visual_review_server(server_process)
         _emit_live_test_finish_notice()
@@ -2091,6 +2369,9 @@ def main(argv: list[str] | None = None) -> int:
             args.trace,
             surface_filter=getattr(args, "surface", None),
             state_filter=getattr(args, "state", None),
+            jobs=args.jobs,
+            persistent_runner=args.persistent_runner,
+            result_cache=args.result_cache,
         )
     except ScriptError as exc:
         print(f"Error: {exc}", file=sys.stderr)
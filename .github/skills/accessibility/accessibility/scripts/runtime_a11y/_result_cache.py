@@ -0,0 +1,180 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""Probe result cache keyed on the page the probe would observe.
+
+A cached payload is reused only when the probe, surface, and state match, the
+probe's code is unchanged, and the runner reports that the surface renders the
+same normalized DOM and CSS as when the payload was recorded. The runner still
+loads the page and applies the state to compute that snapshot hash; it only
+skips the probe's own evaluation on a match. So a cache hit never outlives a
+change to the page, the probe, or the shared runner code.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sys
+import threading
+from copy import deepcopy
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from runtime_a11y._errors import ScriptError
+
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_RUNNER_DIR = _PACKAGE_DIR / "runner"
+
+CACHE_FORMAT_VERSION = 1
+
+# Runner inputs every probe shares. A change to any of them can change any
+# probe's verdicts, so each one feeds every probe's version hash.
+_SHARED_PROBE_INPUTS = (
+    _PACKAGE_DIR / "methods.json",
+    _PACKAGE_DIR / "probe-criteria-map.json",
+    _PACKAGE_DIR / "package-lock.json",
+)
+
+
+def _is_probe_module(path: Path) -> bool:
+    return path.parent == _RUNNER_DIR and path.name.startswith("probe-")
+
+
+def probe_version(probe_id: str) -> str:
+    """Hash the probe module together with the shared runner code it runs on.
+
+    Other probes' modules are excluded, so editing one probe does not
+    invalidate every other probe's cached results.
+    """
+    sources = [_RUNNER_DIR / f"{probe_id}.mjs", *_SHARED_PROBE_INPUTS]
+    sources.extend(
+        path
+        for path in sorted(_RUNNER_DIR.rglob("*.mjs"))
+        if not _is_probe_module(path)
+    )
+    digest = hashlib.sha256()
+    for path in sources:
+        digest.update(path.relative_to(_PACKAGE_DIR).as_posix().encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(path.read_bytes() if path.is_file() else b"<missing>")
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ProbeResultCache:
+    """JSON-file store of probe payloads with hit and miss accounting.
+
+    Args:
+        path: Cache file. A missing file starts an empty cache; an unreadable
+            one is reported on stderr and replaced on save.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._versions: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            document = json.loads(self.path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as exc:
+            print(
+                f"Ignoring unreadable result cache {self.path}: {exc}",
+                file=sys.stderr,
+            )
+            return {}
+        if (
+            not isinstance(document, dict)
+            or document.get("version") != CACHE_FORMAT_VERSION
+            or not isinstance(document.get("entries"), dict)
+        ):
+            return {}
+        return document["entries"]
+
+    @staticmethod
+    def _key(probe_id: str, surface_id: str, state: str) -> str:
+        return f"{probe_id}|{surface_id}|{state}"
+
+    def _probe_version(self, probe_id: str) -> str:
+        with self._lock:
+            version = self._versions.get(probe_id)
+            if version is None:
+                version = self._versions[probe_id] = probe_version(probe_id)
+            return version
+
+    def lookup(self, probe_id: str, surface_id: str, state: str) -> str | None:
+        """Return the snapshot hash a reusable entry was recorded against."""
+        version = self._probe_version(probe_id)
+        with self._lock:
+            entry = self._entries.get(self._key(probe_id, surface_id, state))
+        if entry is None or entry.get("probeVersion") != version:
+            return None
+        return entry.get("snapshotHash")
+
+    def settle(
+        self,
+        probe_id: str,
+        surface_id: str,
+        state: str,
+        payload: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Resolve a runner payload against the cache.
+
+        A ``cacheHit`` payload is replaced by a copy of the cached one carrying
+        ``reused`` provenance. Any other payload is returned as is and, when it
+        has a snapshot hash and no operational failure, recorded for next time.
+        """
+        key = self._key(probe_id, surface_id, state)
+        if payload.get("cacheHit"):
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is None or entry["snapshotHash"] != payload.get(
+                    "snapshotHash"
+                ):
+                    raise ScriptError(
+                        f"Runner reported a cache hit for '{key}' with no "
+                        "matching cache entry"
+                    )
+                self.hits += 1
+            reused = deepcopy(entry["payload"])
+            reused["reused"] = {
+                "snapshotHash": entry["snapshotHash"],
+                "probeVersion": entry["probeVersion"],
+                "cachedAt": entry["cachedAt"],
+            }
+            return reused
+
+        snapshot_hash = payload.get("snapshotHash")
+        version = self._probe_version(probe_id)
+        with self._lock:
+            self.misses += 1
+            if snapshot_hash and not payload.get("operationalFailure"):
+                self._entries[key] = {
+                    "snapshotHash": snapshot_hash,
+                    "probeVersion": version,
+                    "cachedAt": datetime.now(timezone.utc).isoformat(),
+                    "payload": deepcopy(payload),
+                }
+        return payload
+
+    def summary(self) -> dict[str, Any]:
+        """Describe cache use for the run document."""
+        return {"path": str(self.path), "hits": self.hits, "misses": self.misses}
+
+    def save(self) -> None:
+        """Write the cache atomically so an interrupted run cannot corrupt it."""
+        with self._lock:
+            document = {"version": CACHE_FORMAT_VERSION, "entries": self._entries}
+            text = json.dumps(document, indent=2, sort_keys=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        temporary.write_text(text + "\n", encoding="utf-8")
+        os.replace(temporary, self.path)
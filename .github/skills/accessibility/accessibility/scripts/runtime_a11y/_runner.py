@@ -0,0 +1,267 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""Client for the persistent Node probe runner.
+
+``node runner/index.mjs --serve`` answers JSON-lines requests on stdin and
+stdout (the protocol is documented in runner/serve.mjs). A ProbeRunner keeps
+one such process alive, so Node startup, module loading, and the headless
+browser launch are paid once per run instead of once per probe. Each response
+carries the payload, exit code, and stderr the one-shot runner would have
+produced, so callers interpret both modes the same way.
+
+A runner that exits or breaks the protocol mid-request fails that request
+with a ScriptError; the next request respawns it.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterator, Mapping
+
+from runtime_a11y._errors import EXIT_USAGE, ScriptError
+
+# Seconds to wait for the runner to exit after a shutdown request or a crash.
+_SHUTDOWN_TIMEOUT_SECONDS = 10.0
+# Trailing runner stderr lines kept for crash diagnostics.
+_STDERR_TAIL_LINES = 20
+
+
+@dataclass(frozen=True, slots=True)
+class RunnerResponse:
+    """One request's outcome, mirroring a one-shot runner invocation."""
+
+    payload: dict[str, Any] | None
+    exit_code: int
+    stderr: str
+
+
+class ProbeRunner:
+    """Long-lived ``index.mjs --serve`` process answering one request at a time.
+
+    Args:
+        command: Command that starts the runner in serve mode.
+        cwd: Working directory for the runner process.
+        env: Environment for the runner process. Per-request RUNTIME_A11Y_*
+            values travel in the request instead.
+    """
+
+    def __init__(
+        self,
+        command: list[str],
+        cwd: Path,
+        env: Mapping[str, str] | None = None,
+    ) -> None:
+        self.command = command
+        self.cwd = cwd
+        self.env = dict(env) if env is not None else None
+        self._process: subprocess.Popen[str] | None = None
+        self._stderr_tail: deque[str] = deque(maxlen=_STDERR_TAIL_LINES)
+        self._stderr_thread: threading.Thread | None = None
+        self._sent_config: str | None = None
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> ProbeRunner:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    @property
+    def alive(self) -> bool:
+        """Return True when the runner process is running."""
+        return self._process is not None and self._process.poll() is None
+
+    def start(self) -> None:
+        """Spawn the runner process if it is not already running."""
+        if self.alive:
+            return
+        try:
+            self._process = subprocess.Popen(
+                self.command,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                encoding="utf-8",
+                bufsize=1,
+                cwd=str(self.cwd),
+                env=self.env,
+            )
+        except FileNotFoundError as exc:
+            raise ScriptError(
+                "Node is unavailable. Install Node.js and system Google Chrome, then "
+                f"run 'npm ci' in {self.cwd}, to run the persistent probe runner.",
+                EXIT_USAGE,
+            ) from exc
+        self._sent_config = None
+        self._stderr_tail.clear()
+        self._stderr_thread = threading.Thread(
+            target=self._drain_stderr,
+            args=(self._process.stderr,),
+            name="probe-runner-stderr",
+            daemon=True,
+        )
+        self._stderr_thread.start()
+
+    def _drain_stderr(self, stream: Any) -> None:
+        # Per-request stderr arrives in each response; this only keeps the
+        # tail for crash reports and stops the pipe from filling up.
+        for line in stream:
+            self._stderr_tail.append(line.rstrip("\n"))
+
+    def request(
+        self,
+        op: str,
+        fields: Mapping[str, Any],
+        config: dict[str, Any] | None = None,
+    ) -> RunnerResponse:
+        """Send one request and wait for its response.
+
+        Args:
+            op: Runner operation: ``probe``, ``prerequisites``, or
+                ``calibration``.
+            fields: Operation fields such as probeId, surfaceId, or baseUrl.
+            config: Runtime config. It is only sent when it differs from the
+                config the running process already holds.
+
+        Raises:
+            ScriptError: When the runner cannot start, exits mid-request,
+                breaks the protocol, or rejects the request.
+        """
+        with self._lock:
+            if not self.alive:
+                if self._process is not None:
+                    print(
+                        "Persistent probe runner is not running; restarting it.",
+                        file=sys.stderr,
+                    )
+                    self._reap()
+                self.start()
+
+            self._next_id += 1
+            message: dict[str, Any] = {"id": self._next_id, "op": op, **fields}
+            config_text = None
+            if config is not None:
+                config_text = json.dumps(config, sort_keys=True)
+                if config_text != self._sent_config:
+                    message["config"] = config
+            try:
+                self._process.stdin.write(json.dumps(message) + "\n")
+                self._process.stdin.flush()
+                line = self._process.stdout.readline()
+            except OSError:
+                line = ""
+            if not line:
+                raise self._crashed(op)
+            if config_text is not None:
+                self._sent_config = config_text
+
+            try:
+                response = json.loads(line)
+            except json.JSONDecodeError:
+                response = None
+            if not isinstance(response, dict) or response.get("id") != message["id"]:
+                self._reap()
+                raise ScriptError(
+                    f"Persistent probe runner returned invalid output for '{op}'"
+                )
+            if not response.get("ok"):
+                raise ScriptError(
+                    f"Persistent probe runner rejected '{op}': "
+                    f"{response.get('error') or 'no reason given'}"
+                )
+            payload = response.get("payload")
+            return RunnerResponse(
+                payload=payload if isinstance(payload, dict) else None,
+                exit_code=int(response.get("exitCode") or 0),
+                stderr=str(response.get("stderr") or ""),
+            )
+
+    def _crashed(self, op: str) -> ScriptError:
+        process = self._process
+        try:
+            code = process.wait(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            code = None
+        if self._stderr_thread is not None:
+            self._stderr_thread.join(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+        self._reap()
+        tail = "\n".join(self._stderr_tail) or "No runner output captured"
+        return ScriptError(
+            f"Persistent probe runner exited during '{op}' (code {code}): {tail}"
+        )
+
+    def _reap(self) -> None:
+        process, self._process = self._process, None
+        if process is None:
+            return
+        if process.poll() is None:
+            process.kill()
+        try:
+            process.wait(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            pass
+        for stream in (process.stdin, process.stdout):
+            try:
+                stream.close()
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Ask the runner to shut down, then reap it."""
+        with self._lock:
+            process = self._process
+            if process is None:
+                return
+            if process.poll() is None:
+                try:
+                    process.stdin.write(json.dumps({"op": "shutdown"}) + "\n")
+                    process.stdin.flush()
+                    process.wait(timeout=_SHUTDOWN_TIMEOUT_SECONDS)
+                except (OSError, subprocess.TimeoutExpired):
+                    pass
+            self._reap()
+
+
+class RunnerPool:
+    """Give each concurrent caller its own runner, reusing idle ones.
+
+    Args:
+        factory: Creates a new, not yet started ProbeRunner.
+    """
+
+    def __init__(self, factory: Callable[[], ProbeRunner]) -> None:
+        self._factory = factory
+        self._idle: list[ProbeRunner] = []
+        self._runners: list[ProbeRunner] = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def acquire(self) -> Iterator[ProbeRunner]:
+        """Borrow a runner for the duration of the ``with`` block."""
+        with self._lock:
+            runner = self._idle.pop() if self._idle else None
+            if runner is None:
+                runner = self._factory()
+                self._runners.append(runner)
+        try:
+            yield runner
+        finally:
+            with self._lock:
+                self._idle.append(runner)
+
+    def close(self) -> None:
+        """Shut down every runner the pool created."""
+        with self._lock:
+            runners, self._runners, self._idle = self._runners, [], []
+        for runner in runners:
+            runner.close()
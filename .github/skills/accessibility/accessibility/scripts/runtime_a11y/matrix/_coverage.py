@@ -3,63 +3,52 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
-
 from runtime_a11y.matrix._model import Cell, Matrix
 
 
-def compute_coverage(matrix: Matrix) -> dict[str, object]:
-    """Compute adequate-coverage summaries and residual recommendations."""
-    applicable_cells = [cell for cell in matrix.cells if cell.isApplicable]
-    if not applicable_cells:
-        return {
-            "overall": {"coverage": 0.0, "denominator": 0, "numerator": 0},
-            "frameworks": {},
-            "residual": [],
-            "nextActions": [],
-        }
+def is_adequately_covered(cell: Cell) -> bool:
+    """Return True when a pass was decided by a method adequate for the cell."""
+    return cell.status == "pass" and cell.verifiedByMethod in cell.adequateMethods
 
-    by_framework: dict[str, list[Cell]] = defaultdict(list)
-    for cell in applicable_cells:
-        criterion = next(
-            (item for item in matrix.criteria if item.id == cell.criterionId),
-            None,
-        )
-        if criterion is None:
-            continue
-        by_framework[criterion.framework].append(cell)
 
-    overall_numerator = sum(
-        1
-        for cell in applicable_cells
-        if cell.status == "pass" and cell.verifiedByMethod in cell.adequateMethods
-    )
-    overall_denominator = len(applicable_cells)
-    overall_percentage = round(
-        (overall_numerator / overall_denominator * 100) if overall_denominator else 0.0,
-        1,
-    )
+def framework_index(matrix: Matrix) -> dict[str, str]:
+    """Map each criterion id to its framework, first criterion winning."""
+    return {
+        criterion_id: criterion.framework
+        for criterion_id, criterion in matrix.criterion_index().items()
+    }
 
-    frameworks: dict[str, dict[str, object]] = {}
-    for framework, cells in by_framework.items():
-        numerator = sum(
-            1
-            for cell in cells
-            if cell.status == "pass" and cell.verifiedByMethod in cell.adequateMethods
-        )
-        denominator = len(cells)
-        frameworks[framework] = {
-            "coverage": round(
-                (numerator / denominator * 100) if denominator else 0.0,
-                1,
-            ),
-            "numerator": numerator,
-            "denominator": denominator,
-        }
 
+def _percentage(numerator: int, denominator: int) -> float:
+    return round((numerator / denominator * 100) if denominator else 0.0, 1)
+
+
+def compute_coverage(matrix: Matrix) -> dict[str, object]:
+    """Compute adequate-coverage summaries and residual recommendations.
+
+    One sweep over the cells accumulates the overall and per-framework tallies
+    and collects the residual, so cost grows with cells plus criteria rather than
+    their product. Cells whose criterion is missing from the matrix count toward
+    the overall figures but no framework.
+    """
+    framework_by_criterion = framework_index(matrix)
+    overall_numerator = 0
+    overall_denominator = 0
+    # framework -> [numerator, denominator], in first-seen order.
+    tallies: dict[str, list[int]] = {}
     residual = []
-    for cell in applicable_cells:
-        if cell.status == "pass" and cell.verifiedByMethod in cell.adequateMethods:
+    for cell in matrix.cells:
+        if not cell.isApplicable:
+            continue
+        covered = is_adequately_covered(cell)
+        overall_denominator += 1
+        overall_numerator += covered
+        framework = framework_by_criterion.get(cell.criterionId)
+        if framework is not None:
+            tally = tallies.setdefault(framework, [0, 0])
+            tally[0] += covered
+            tally[1] += 1
+        if covered:
             continue
         residual.append(
             {
@@ -72,6 +61,23 @@ def compute_coverage(matrix: Matrix) -> dict[str, object]:
             }
         )
 
+    if not overall_denominator:
+        return {
+            "overall": {"coverage": 0.0, "denominator": 0, "numerator": 0},
+            "frameworks": {},
+            "residual": [],
+            "nextActions": [],
+        }
+
+    frameworks: dict[str, dict[str, object]] = {
+        framework: {
+            "coverage": _percentage(numerator, denominator),
+            "numerator": numerator,
+            "denominator": denominator,
+        }
+        for framework, (numerator, denominator) in tallies.items()
+    }
+
     next_actions = [
         {
             "criterionId": item["criterionId"],
@@ -86,7 +92,7 @@ def compute_coverage(matrix: Matrix) -> dict[str, object]:
 
     return {
         "overall": {
-            "coverage": overall_percentage,
+            "coverage": _percentage(overall_numerator, overall_denominator),
             "denominator": overall_denominator,
             "numerator": overall_numerator,
         },
@@ -56,20 +56,17 @@ def _should_replace(
 def merge_updates(matrix: Matrix, updates: list[CandidateUpdate]) -> Matrix:
     """Apply deterministic updates to the matrix cells."""
     cells = list(matrix.cells)
+    index = matrix.cell_index()
     for update in updates:
-        for index, cell in enumerate(cells):
-            if (
-                cell.criterionId != update.criterionId
-                or cell.surfaceId != update.surfaceId
-                or cell.state != update.state
-            ):
-                continue
+        positions = index.get((update.criterionId, update.surfaceId, update.state))
+        for position in positions or ():
+            cell = cells[position]
             if cell.isApplicable is False and update.status != "not-applicable":
                 continue
             if cell.verifiedByMethod in OVERWRITE_LOCKED_METHODS:
                 continue
             if _should_replace(cell.verifiedByMethod, cell.status, cell.date, update):
-                cells[index] = Cell(
+                cells[position] = Cell(
                     criterionId=cell.criterionId,
                     surfaceId=cell.surfaceId,
                     state=cell.state,
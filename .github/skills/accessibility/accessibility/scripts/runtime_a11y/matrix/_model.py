@@ -78,6 +78,23 @@ class Cell:
     isApplicable: bool = True
     methodProvenance: str | None = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "criterionId": self.criterionId,
+            "surfaceId": self.surfaceId,
+            "state": self.state,
+            "status": self.status,
+            "verifiedByMethod": self.verifiedByMethod,
+            "date": self.date,
+            "evidence": self.evidence,
+            "severity": self.severity,
+            "rationale": self.rationale,
+            "requiredMethods": sorted(self.requiredMethods),
+            "adequateMethods": sorted(self.adequateMethods),
+            "isApplicable": self.isApplicable,
+            "methodProvenance": self.methodProvenance,
+        }
+
 
 @dataclass(slots=True)
 class CandidateUpdate:
@@ -92,12 +109,40 @@ class CandidateUpdate:
     rationale: str | None = None
 
 
+CellKey = tuple[str, str, str]
+"""A cell's ``(criterionId, surfaceId, state)`` coordinates."""
+
+
 @dataclass(slots=True)
 class Matrix:
     criteria: list[Criterion]
     surfaces: list[Surface]
     cells: list[Cell]
 
+    def criterion_index(self) -> dict[str, Criterion]:
+        """Map each criterion id to its criterion.
+
+        The first criterion wins when an id repeats, matching a front-to-back
+        search of ``criteria``.
+        """
+        index: dict[str, Criterion] = {}
+        for criterion in self.criteria:
+            index.setdefault(criterion.id, criterion)
+        return index
+
+    def cell_index(self) -> dict[CellKey, list[int]]:
+        """Map each cell key to the positions of its cells, in matrix order.
+
+        Built matrices hold one cell per key, but a hand-edited document can
+        repeat one, so every position is kept. The index reflects the cells at
+        call time; rebuild it after replacing or reordering them.
+        """
+        index: dict[CellKey, list[int]] = {}
+        for position, cell in enumerate(self.cells):
+            key = (cell.criterionId, cell.surfaceId, cell.state)
+            index.setdefault(key, []).append(position)
+        return index
+
     @classmethod
     def from_dict(cls, payload: dict[str, Any]) -> Matrix:
         """Reconstruct a matrix from the rendered JSON representation."""
@@ -161,22 +206,5 @@ class Matrix:
                 }
                 for surface in self.surfaces
             ],
-            "cells": [
-                {
-                    "criterionId": cell.criterionId,
-                    "surfaceId": cell.surfaceId,
-                    "state": cell.state,
-                    "status": cell.status,
-                    "verifiedByMethod": cell.verifiedByMethod,
-                    "date": cell.date,
-                    "evidence": cell.evidence,
-                    "severity": cell.severity,
-                    "rationale": cell.rationale,
-                    "requiredMethods": sorted(cell.requiredMethods),
-                    "adequateMethods": sorted(cell.adequateMethods),
-                    "isApplicable": cell.isApplicable,
-                    "methodProvenance": cell.methodProvenance,
-                }
-                for cell in self.cells
-            ],
+            "cells": [cell.to_dict() for cell in self.cells],
         }
@@ -15,13 +15,16 @@ earl:passed.
 
 from __future__ import annotations
 
-import json
 import re
+from collections.abc import Iterable, Iterator
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
+from runtime_a11y.matrix._coverage import framework_index
 from runtime_a11y.matrix._model import HUMAN_EVIDENCE_METHODS, Cell, Matrix
 from runtime_a11y.matrix._provenance import HVE_NAMESPACE, ArtifactMetadata
+from runtime_a11y.matrix._stream import write_json_document
 
 # Framework identifier -> canonical spec URL used as dct:isPartOf for a criterion.
 _FRAMEWORK_SOURCE = {
@@ -95,24 +98,10 @@ def _earl_mode(method: str | None) -> str:
     return "earl:undisclosed"
 
 
-def build_earl(
-    matrix: Matrix,
-    coverage: dict[str, Any] | None = None,
-    metadata: ArtifactMetadata | None = None,
-) -> dict[str, Any]:
-    """Build an EARL JSON-LD document from the coverage matrix.
-
-    Emits one earl:Assertion per evaluated cell. Cells that were never evaluated
-    (applicable but still ``unknown``) are omitted; inapplicable cells are kept as
-    earl:inapplicable so the report records the determination.
-    """
-    framework_by_criterion = {
-        criterion.id: criterion.framework for criterion in matrix.criteria
-    }
-
+def _assertor(coverage: dict[str, Any] | None) -> dict[str, Any]:
     overall = (coverage or {}).get("overall", {}) if coverage else {}
     coverage_pct = overall.get("coverage", 0)
-    assertor = {
+    return {
         "@id": "_:assertor",
         "@type": "earl:Software",
         "dct:title": "hve-core runtime_a11y",
@@ -122,8 +111,10 @@ def build_earl(
             else "Runtime accessibility probe harness"
         ),
     }
-    graph: list[dict[str, Any]] = [assertor]
 
+
+def _iter_assertions(matrix: Matrix) -> Iterator[dict[str, Any]]:
+    framework_by_criterion = framework_index(matrix)
     for cell in matrix.cells:
         if cell.isApplicable and cell.status in (None, "unknown"):
             continue
@@ -147,29 +138,31 @@ def build_earl(
         if cell.evidence:
             result["dct:source"] = cell.evidence
 
-        graph.append(
-            {
-                "@id": f"_:assertion-{identifier}",
-                "@type": "earl:Assertion",
-                "earl:assertedBy": {"@id": "_:assertor"},
-                "earl:mode": {"@id": _earl_mode(cell.verifiedByMethod)},
-                "hve:method": cell.verifiedByMethod or "unknown",
-                "hve:methodAdequacy": _method_adequacy(cell),
-                "hve:state": cell.state or "default",
-                "earl:subject": {
-                    "@id": f"_:subject-{_identifier_token(subject_id)}",
-                    "@type": "earl:TestSubject",
-                    "dct:identifier": subject_id,
-                },
-                "earl:test": {
-                    "@type": "earl:TestCriterion",
-                    "dct:identifier": cell.criterionId,
-                    "dct:isPartOf": _FRAMEWORK_SOURCE.get(framework, framework),
-                },
-                "earl:result": result,
-            }
-        )
+        yield {
+            "@id": f"_:assertion-{identifier}",
+            "@type": "earl:Assertion",
+            "earl:assertedBy": {"@id": "_:assertor"},
+            "earl:mode": {"@id": _earl_mode(cell.verifiedByMethod)},
+            "hve:method": cell.verifiedByMethod or "unknown",
+            "hve:methodAdequacy": _method_adequacy(cell),
+            "hve:state": cell.state or "default",
+            "earl:subject": {
+                "@id": f"_:subject-{_identifier_token(subject_id)}",
+                "@type": "earl:TestSubject",
+                "dct:identifier": subject_id,
+            },
+            "earl:test": {
+                "@type": "earl:TestCriterion",
+                "dct:identifier": cell.criterionId,
+                "dct:isPartOf": _FRAMEWORK_SOURCE.get(framework, framework),
+            },
+            "earl:result": result,
+        }
+
 
+def _earl_document(
+    graph: Iterable[dict[str, Any]], metadata: ArtifactMetadata | None
+) -> dict[str, Any]:
     return {
         "@context": {
             "earl": "http://www.w3.org/ns/earl#",
@@ -181,6 +174,21 @@ def build_earl(
     }
 
 
+def build_earl(
+    matrix: Matrix,
+    coverage: dict[str, Any] | None = None,
+    metadata: ArtifactMetadata | None = None,
+) -> dict[str, Any]:
+    """Build an EARL JSON-LD document from the coverage matrix.
+
+    Emits one earl:Assertion per evaluated cell. Cells that were never evaluated
+    (applicable but still ``unknown``) are omitted; inapplicable cells are kept as
+    earl:inapplicable so the report records the determination.
+    """
+    graph = [_assertor(coverage), *_iter_assertions(matrix)]
+    return _earl_document(graph, metadata)
+
+
 def render_earl(
     matrix: Matrix,
     coverage: dict[str, Any],
@@ -193,6 +201,5 @@ def render_earl(
     read without its Markdown sibling, so the non-attestation and review state
     travel in the document itself.
     """
-    document = build_earl(matrix, coverage, metadata)
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    graph = chain((_assertor(coverage),), _iter_assertions(matrix))
+    write_json_document(out_path, _earl_document(graph, metadata), end="\n")
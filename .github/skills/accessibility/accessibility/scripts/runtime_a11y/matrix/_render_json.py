@@ -3,12 +3,12 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Any
 
 from runtime_a11y.matrix._model import Matrix
 from runtime_a11y.matrix._provenance import ArtifactMetadata
+from runtime_a11y.matrix._stream import write_json_document
 
 
 def render_json(
@@ -17,8 +17,11 @@ def render_json(
     out_path: Path,
     metadata: ArtifactMetadata | None = None,
 ) -> None:
-    """Write a JSON representation of the matrix and coverage summary."""
-    payload = {
+    """Write a JSON representation of the matrix and coverage summary.
+
+    Cells are serialized one at a time as the file is written.
+    """
+    payload: dict[str, Any] = {
         "criteria": [
             {
                 "id": criterion.id,
@@ -38,28 +41,10 @@ def render_json(
             }
             for surface in matrix.surfaces
         ],
-        "cells": [
-            {
-                "criterionId": cell.criterionId,
-                "surfaceId": cell.surfaceId,
-                "state": cell.state,
-                "status": cell.status,
-                "verifiedByMethod": cell.verifiedByMethod,
-                "date": cell.date,
-                "evidence": cell.evidence,
-                "severity": cell.severity,
-                "rationale": cell.rationale,
-                "requiredMethods": sorted(cell.requiredMethods),
-                "adequateMethods": sorted(cell.adequateMethods),
-                "isApplicable": cell.isApplicable,
-                "methodProvenance": cell.methodProvenance,
-            }
-            for cell in matrix.cells
-        ],
+        "cells": (cell.to_dict() for cell in matrix.cells),
         "coverage": coverage,
     }
     if metadata is not None:
         payload["assessment"] = metadata.to_dict()
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+    write_json_document(out_path, payload)
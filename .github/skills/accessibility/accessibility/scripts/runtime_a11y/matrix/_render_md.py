@@ -3,11 +3,13 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from runtime_a11y.matrix._model import Matrix
 from runtime_a11y.matrix._provenance import ArtifactMetadata
+from runtime_a11y.matrix._stream import write_lines
 
 ACCESSIBILITY_DISCLAIMER = (
     "> [!CAUTION]\n"
@@ -31,49 +33,44 @@ ACCESSIBILITY_DISCLAIMER = (
 HUMAN_REVIEW_CHECKBOX = "- [ ] Reviewed and validated by a qualified human reviewer"
 
 
-def render_markdown(
+def _markdown_lines(
     matrix: Matrix,
     coverage: dict[str, Any],
-    out_path: Path,
     repo_slug: str,
     metadata: ArtifactMetadata | None = None,
-) -> None:
-    """Render a markdown coverage summary for the matrix."""
-    lines: list[str] = []
-    lines.append("<!-- markdownlint-disable-file -->")
-    lines.append("# Accessibility Coverage Matrix")
-    lines.append("")
-    lines.append(ACCESSIBILITY_DISCLAIMER)
-    lines.append("")
-    lines.append(HUMAN_REVIEW_CHECKBOX)
-    lines.append("")
-    lines.append(f"- Repository: {repo_slug}")
+) -> Iterator[str]:
+    yield "<!-- markdownlint-disable-file -->"
+    yield "# Accessibility Coverage Matrix"
+    yield ""
+    yield ACCESSIBILITY_DISCLAIMER
+    yield ""
+    yield HUMAN_REVIEW_CHECKBOX
+    yield ""
+    yield f"- Repository: {repo_slug}"
     if metadata is not None and metadata.quarantined:
-        lines.append(
+        yield (
             "- Quarantined: derived from a run that ended in an operational "
             f"failure ({metadata.quarantineReason or 'reason not recorded'}). "
             "Not a basis for a conformance claim."
         )
-    lines.append("")
-    lines.append("## Coverage Summary")
-    lines.append("")
-    lines.append(
-        f"- Overall coverage: {coverage.get('overall', {}).get('coverage', 0.0)}%"
-    )
-    lines.append("")
-    lines.append("## Per-Framework Coverage")
-    lines.append("")
-    lines.append("| Framework | Coverage | Numerator | Denominator |")
-    lines.append("|-----------|----------|-----------|-------------|")
+    yield ""
+    yield "## Coverage Summary"
+    yield ""
+    yield f"- Overall coverage: {coverage.get('overall', {}).get('coverage', 0.0)}%"
+    yield ""
+    yield "## Per-Framework Coverage"
+    yield ""
+    yield "| Framework | Coverage | Numerator | Denominator |"
+    yield "|-----------|----------|-----------|-------------|"
     frameworks = coverage.get("frameworks", {}) or {}
     for framework_name, stats in sorted(frameworks.items()):
-        lines.append(
+        yield (
             f"| {framework_name} | {stats.get('coverage', 0.0)}% | "
             f"{stats.get('numerator', 0)} | {stats.get('denominator', 0)} |"
         )
-    lines.append("")
-    lines.append("## Residual by Method")
-    lines.append("")
+    yield ""
+    yield "## Residual by Method"
+    yield ""
     residual = coverage.get("residual", []) or []
     grouped: dict[str, list[dict[str, Any]]] = {}
     for item in residual:
@@ -81,32 +78,46 @@ def render_markdown(
         grouped.setdefault(method, []).append(item)
     if grouped:
         for method_name in sorted(grouped):
-            lines.append(f"### {method_name}")
-            lines.append("")
+            yield f"### {method_name}"
+            yield ""
             for item in grouped[method_name]:
-                lines.append(
+                yield (
                     f"- {item['criterionId']} / {item['surfaceId']} / "
                     f"{item['state']} ({item['status']})"
                 )
-            lines.append("")
+            yield ""
     else:
-        lines.append("- None")
-        lines.append("")
-    lines.append("## Probe Run Summary")
-    lines.append("")
-    lines.append("- Runtime probe data is summarized here when available.")
-    lines.append("")
-    lines.append("## Next Actions")
-    lines.append("")
+        yield "- None"
+        yield ""
+    yield "## Probe Run Summary"
+    yield ""
+    yield "- Runtime probe data is summarized here when available."
+    yield ""
+    yield "## Next Actions"
+    yield ""
     next_actions = coverage.get("nextActions", []) or []
     if next_actions:
         for action in next_actions:
-            lines.append(
+            yield (
                 f"- {action['criterionId']} / {action['surfaceId']} / "
                 f"{action['state']} ({action['priority']})"
             )
     else:
-        lines.append("- None")
+        yield "- None"
+
+
+def render_markdown(
+    matrix: Matrix,
+    coverage: dict[str, Any],
+    out_path: Path,
+    repo_slug: str,
+    metadata: ArtifactMetadata | None = None,
+) -> None:
+    """Render a markdown coverage summary for the matrix.
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    Lines are written as they are produced; the residual list can run to one
+    entry per matrix cell.
+    """
+    write_lines(
+        out_path, _markdown_lines(matrix, coverage, repo_slug, metadata), end="\n"
+    )
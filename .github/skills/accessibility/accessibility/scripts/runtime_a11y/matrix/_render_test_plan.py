@@ -7,16 +7,19 @@ from __future__ import annotations
 
 import json
 import re
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
 from runtime_a11y.matrix._aria_at import resolve_aria_at_mapping
+from runtime_a11y.matrix._coverage import is_adequately_covered
 from runtime_a11y.matrix._model import Cell, Matrix
 from runtime_a11y.matrix._provenance import ArtifactMetadata
 from runtime_a11y.matrix._render_md import (
     ACCESSIBILITY_DISCLAIMER,
     HUMAN_REVIEW_CHECKBOX,
 )
+from runtime_a11y.matrix._stream import write_lines
 
 _HUMAN_METHOD_PRIORITY = (
     "screen-reader",
@@ -47,18 +50,19 @@ def build_manual_test_cases(
     runtime_config: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Build unresolved cases that require a human-deciding method."""
-    criterion_by_id = {criterion.id: criterion for criterion in matrix.criteria}
+    criterion_by_id = matrix.criterion_index()
     surface_by_id = {surface.id: surface for surface in matrix.surfaces}
+    configured_patterns: dict[Any, Any] = {}
+    for entry in (runtime_config or {}).get("surfaces", []) or []:
+        if isinstance(entry, dict):
+            configured_patterns.setdefault(entry.get("id"), entry.get("widgetPattern"))
     cases: list[dict[str, Any]] = []
 
     for cell in matrix.cells:
+        if not cell.isApplicable or is_adequately_covered(cell):
+            continue
         method = _recommended_method(cell)
-        adequately_passed = (
-            cell.status == "pass"
-            and cell.verifiedByMethod is not None
-            and cell.verifiedByMethod in cell.adequateMethods
-        )
-        if not cell.isApplicable or method is None or adequately_passed:
+        if method is None:
             continue
 
         criterion = criterion_by_id.get(cell.criterionId)
@@ -66,12 +70,8 @@ def build_manual_test_cases(
         pattern = None
         if surface is not None:
             pattern = surface.widgetPattern
-        if not pattern and runtime_config and surface is not None:
-            for entry in runtime_config.get("surfaces", []) or []:
-                if entry.get("id") != surface.id:
-                    continue
-                pattern = entry.get("widgetPattern")
-                break
+        if not pattern and surface is not None:
+            pattern = configured_patterns.get(surface.id)
         aria_at = resolve_aria_at_mapping(
             pattern,
             cell.state,
@@ -136,15 +136,8 @@ def build_manual_test_cases(
     )
 
 
-def render_manual_test_plan_markdown(
-    matrix: Matrix,
-    out_path: Path,
-    repo_slug: str,
-    runtime_config: dict[str, Any] | None = None,
-) -> None:
-    """Write a human-readable manual accessibility test plan."""
-    cases = build_manual_test_cases(matrix, runtime_config)
-    lines = [
+def _manual_plan_lines(cases: list[dict[str, Any]], repo_slug: str) -> Iterator[str]:
+    yield from [
         "<!-- markdownlint-disable-file -->",
         "# Manual Accessibility Test Plan",
         "",
@@ -168,62 +161,59 @@ def render_manual_test_plan_markdown(
         "",
     ]
     if not cases:
-        lines.extend(["* None", ""])
+        yield from ["* None", ""]
     for case in cases:
         aria_at = case["ariaAt"]
-        lines.extend(
-            [
-                f"### {case['id']}",
-                "",
-                f"* Criterion: {case['framework']} {case['criterionId']} "
-                f"({case['criterionTitle']})",
-                f"* Surface: {case['surfaceName']} ({case['surfaceId']})",
-                f"* Platform: {case['platform']}",
-                f"* State: {case['state']}",
-                f"* Current status: {case['currentStatus']}",
-                f"* Recommended method: {case['recommendedMethod']}",
-                f"* ariaAt mapping status: {aria_at['mappingStatus']}",
-                f"* ARIA-AT mapping ID: {aria_at.get('mappingId') or 'unmapped'}",
-                f"* Upstream test ID: {aria_at.get('upstreamTestId') or 'unmapped'}",
-                f"* ariaAt source: {aria_at['sourceUrl'] or 'unmapped'}",
-                f"* ARIA-AT source: {aria_at['sourceUrl'] or 'unmapped'}",
-                f"* Immutable source: {aria_at.get('immutableUrl') or 'unmapped'}",
-                f"* Upstream SHA: {aria_at.get('upstreamSha') or 'unmapped'}",
-                f"* Catalog version: {aria_at.get('catalogVersion') or 'unmapped'}",
-                f"* Automation eligible: {aria_at['automationEligible']}",
-                f"* Automation exclusion: "
-                f"{aria_at['automationExclusionReason'] or 'None'}",
-                f"* Runbook reference: {aria_at['runbookReference']}",
-                "",
-            ]
-        )
+        yield from [
+            f"### {case['id']}",
+            "",
+            f"* Criterion: {case['framework']} {case['criterionId']} "
+            f"({case['criterionTitle']})",
+            f"* Surface: {case['surfaceName']} ({case['surfaceId']})",
+            f"* Platform: {case['platform']}",
+            f"* State: {case['state']}",
+            f"* Current status: {case['currentStatus']}",
+            f"* Recommended method: {case['recommendedMethod']}",
+            f"* ariaAt mapping status: {aria_at['mappingStatus']}",
+            f"* ARIA-AT mapping ID: {aria_at.get('mappingId') or 'unmapped'}",
+            f"* Upstream test ID: {aria_at.get('upstreamTestId') or 'unmapped'}",
+            f"* ariaAt source: {aria_at['sourceUrl'] or 'unmapped'}",
+            f"* ARIA-AT source: {aria_at['sourceUrl'] or 'unmapped'}",
+            f"* Immutable source: {aria_at.get('immutableUrl') or 'unmapped'}",
+            f"* Upstream SHA: {aria_at.get('upstreamSha') or 'unmapped'}",
+            f"* Catalog version: {aria_at.get('catalogVersion') or 'unmapped'}",
+            f"* Automation eligible: {aria_at['automationEligible']}",
+            f"* Automation exclusion: {aria_at['automationExclusionReason'] or 'None'}",
+            f"* Runbook reference: {aria_at['runbookReference']}",
+            "",
+        ]
         if aria_at.get("functionalExpectations"):
-            lines.extend(["#### Functional Expectations", ""])
-            lines.extend(
+            yield from ["#### Functional Expectations", ""]
+            yield from (
                 f"* {expectation}" for expectation in aria_at["functionalExpectations"]
             )
-            lines.append("")
-        lines.extend(["#### Mapping Commands", ""])
+            yield ""
+        yield from ["#### Mapping Commands", ""]
         if aria_at.get("commands"):
-            lines.extend(
+            yield from (
                 f"* `{json.dumps(command, ensure_ascii=False)}`"
                 for command in aria_at["commands"]
             )
         else:
-            lines.append("* None (manual-only)")
-        lines.extend(["", "#### Mapping Assertions", ""])
+            yield "* None (manual-only)"
+        yield from ["", "#### Mapping Assertions", ""]
         if aria_at.get("assertions"):
-            lines.extend(
+            yield from (
                 f"* `{json.dumps(assertion, ensure_ascii=False)}`"
                 for assertion in aria_at["assertions"]
             )
         else:
-            lines.append("* None (manual-only)")
-        lines.append("")
+            yield "* None (manual-only)"
+        yield ""
         variants = aria_at.get("variants", [])
         nvda_variants = [v for v in variants if v.get("at") == "nvda"]
         jaws_variants = [v for v in variants if v.get("at") == "jaws"]
-        lines.extend(["#### Executable NVDA Variants", ""])
+        yield from ["#### Executable NVDA Variants", ""]
         if nvda_variants:
             for variant in nvda_variants:
                 variant_commands = json.dumps(
@@ -234,85 +224,83 @@ def render_manual_test_plan_markdown(
                     variant.get("assertions", []),
                     ensure_ascii=False,
                 )
-                lines.extend(
-                    [
-                        f"##### {variant.get('id')}",
-                        "",
-                        f"* AT: {variant.get('at')}",
-                        f"* Platform: {variant.get('platform')}",
-                        f"* Automation eligible: {variant.get('automationEligible')}",
-                        "* Automation exclusion: "
-                        f"{variant.get('automationExclusionReason') or 'None'}",
-                        f"* Commands: {variant_commands}",
-                        f"* Assertions: {variant_assertions}",
-                        "",
-                    ]
-                )
+                yield from [
+                    f"##### {variant.get('id')}",
+                    "",
+                    f"* AT: {variant.get('at')}",
+                    f"* Platform: {variant.get('platform')}",
+                    f"* Automation eligible: {variant.get('automationEligible')}",
+                    "* Automation exclusion: "
+                    f"{variant.get('automationExclusionReason') or 'None'}",
+                    f"* Commands: {variant_commands}",
+                    f"* Assertions: {variant_assertions}",
+                    "",
+                ]
         else:
-            lines.extend(["* None", ""])
-        lines.extend(["#### Manual JAWS Variants", ""])
+            yield from ["* None", ""]
+        yield from ["#### Manual JAWS Variants", ""]
         if jaws_variants:
             for variant in jaws_variants:
-                lines.extend(
-                    [
-                        f"##### {variant.get('id')}",
-                        "",
-                        f"* AT: {variant.get('at')}",
-                        f"* Platform: {variant.get('platform')}",
-                        "* Manual evidence required: "
-                        f"{variant.get('manualEvidenceRequired', False)}",
-                        "* Automation exclusion: "
-                        f"{variant.get('automationExclusionReason') or 'None'}",
-                        f"* Runbook reference: {variant.get('runbookReference') or ''}",
+                yield from [
+                    f"##### {variant.get('id')}",
+                    "",
+                    f"* AT: {variant.get('at')}",
+                    f"* Platform: {variant.get('platform')}",
+                    "* Manual evidence required: "
+                    f"{variant.get('manualEvidenceRequired', False)}",
+                    "* Automation exclusion: "
+                    f"{variant.get('automationExclusionReason') or 'None'}",
+                    f"* Runbook reference: {variant.get('runbookReference') or ''}",
+                    "",
+                ]
+                if variant.get("functionalExpectation"):
+                    yield from [
+                        "* Functional expectation: "
+                        f"{variant.get('functionalExpectation')}",
                         "",
                     ]
-                )
-                if variant.get("functionalExpectation"):
-                    lines.extend(
-                        [
-                            "* Functional expectation: "
-                            f"{variant.get('functionalExpectation')}",
-                            "",
-                        ]
-                    )
                 if variant.get("manualCommandGuidance"):
-                    lines.append("* Manual command guidance:")
-                    lines.extend(
+                    yield "* Manual command guidance:"
+                    yield from (
                         f"  * {guidance}"
                         for guidance in variant.get("manualCommandGuidance", [])
                     )
-                    lines.append("")
+                    yield ""
         else:
-            lines.extend(["* None", ""])
-        lines.extend(
-            [
-                "#### Steps",
-                "",
-            ]
-        )
-        lines.extend(
+            yield from ["* None", ""]
+        yield from [
+            "#### Steps",
+            "",
+        ]
+        yield from (
             f"{index}. {step}" for index, step in enumerate(case["steps"], start=1)
         )
-        lines.extend(
-            [
-                "",
-                "#### Expected Result",
-                "",
-                case["expectedResult"],
-                "",
-                "#### Result Record",
-                "",
-                "* Outcome: Not run",
-                "* Observed result:",
-                "* Evidence URI:",
-                "* Tester:",
-                "* Test date:",
-                "",
-            ]
-        )
+        yield from [
+            "",
+            "#### Expected Result",
+            "",
+            case["expectedResult"],
+            "",
+            "#### Result Record",
+            "",
+            "* Outcome: Not run",
+            "* Observed result:",
+            "* Evidence URI:",
+            "* Tester:",
+            "* Test date:",
+            "",
+        ]
 
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text("\n".join(lines), encoding="utf-8")
+
+def render_manual_test_plan_markdown(
+    matrix: Matrix,
+    out_path: Path,
+    repo_slug: str,
+    runtime_config: dict[str, Any] | None = None,
+) -> None:
+    """Write a human-readable manual accessibility test plan."""
+    cases = build_manual_test_cases(matrix, runtime_config)
+    write_lines(out_path, _manual_plan_lines(cases, repo_slug))
 
 
 def _yaml_scalar(value: Any) -> str:
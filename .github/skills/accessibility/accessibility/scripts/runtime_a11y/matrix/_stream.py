@@ -0,0 +1,71 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+"""Incremental writers for the rendered matrix artifacts.
+
+A full matrix holds one entry per criterion x surface x state, each carrying
+evidence and rationale text. Building the whole rendered document before
+writing it holds a second copy of all of that in memory, so these writers
+serialize one entry at a time. Their output is byte-for-byte what the
+equivalent ``json.dumps(..., indent=2)`` or ``"\\n".join(lines)`` call writes.
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import Iterable, Iterator, Mapping
+from pathlib import Path
+from typing import Any, TextIO
+
+_INDENT = "  "
+
+
+def _dumps_at(value: Any, depth: int) -> str:
+    # json.dumps escapes newlines inside strings, so every newline in its
+    # indented output is structural and can be shifted to the nesting depth.
+    return json.dumps(value, indent=len(_INDENT)).replace("\n", "\n" + _INDENT * depth)
+
+
+def _write_items(items: Iterator[Any], handle: TextIO) -> None:
+    opened = False
+    for item in items:
+        handle.write(("," if opened else "[") + "\n" + _INDENT * 2)
+        handle.write(_dumps_at(item, 2))
+        opened = True
+    handle.write(f"\n{_INDENT}]" if opened else "[]")
+
+
+def write_json_document(
+    out_path: Path, document: Mapping[str, Any], *, end: str = ""
+) -> None:
+    """Write ``document`` as indented JSON, streaming its iterator values.
+
+    A top-level value that is an iterator (a generator, for example) is
+    written as a JSON array one item at a time; every other value is
+    serialized whole. The file matches ``json.dumps(document, indent=2) + end``
+    with each iterator replaced by the list it yields.
+    """
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8") as handle:
+        if not document:
+            handle.write("{}" + end)
+            return
+        for position, (key, value) in enumerate(document.items()):
+            handle.write(("," if position else "{") + "\n" + _INDENT)
+            handle.write(json.dumps(key) + ": ")
+            if isinstance(value, Iterator):
+                _write_items(value, handle)
+            else:
+                handle.write(_dumps_at(value, 1))
+        handle.write("\n}" + end)
+
+
+def write_lines(out_path: Path, lines: Iterable[str], *, end: str = "") -> None:
+    """Write ``"\\n".join(lines) + end`` without materializing the joined text."""
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with out_path.open("w", encoding="utf-8") as handle:
+        separator = ""
+        for line in lines:
+            handle.write(separator + line)
+            separator = "\n"
+        handle.write(end)
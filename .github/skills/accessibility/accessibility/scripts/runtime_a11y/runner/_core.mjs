@@ -5,6 +5,7 @@
 // imports Playwright so it can be unit-tested with `node --test` without a
 // browser or node_modules.
 
+import { createHash } from 'node:crypto';
 import { readFile } from 'node:fs/promises';
 
 const PROBE_MAP_URL = new URL('../probe-criteria-map.json', import.meta.url);
@@ -399,7 +400,39 @@ export function realScreenReaderStatus(snapshot) {
   return pending ? 'candidate' : 'pass';
 }
 
+// The persistent runner owns stdout for its JSON-lines protocol, so it captures
+// probe payloads in-process through a sink instead.
+let probeResultSink = null;
+
+export function setProbeResultSink(sink) {
+  probeResultSink = typeof sink === 'function' ? sink : null;
+}
+
 // Emit a probe result document as pretty JSON on stdout.
 export function emitProbeResult(payload) {
+  if (probeResultSink) {
+    probeResultSink(payload);
+    return;
+  }
   console.log(JSON.stringify(payload, null, 2));
 }
+
+// Reduce a page snapshot to the markup and styles a probe observes. Comments,
+// CSP nonces, and whitespace runs change between identical renders, so they
+// are dropped; anything else that differs means the page changed.
+export function normalizePageSnapshot({ html = '', styles = [] } = {}) {
+  const markup = String(html)
+    .replace(/<!--[\s\S]*?-->/g, '')
+    .replace(/\snonce="[^"]*"/g, '')
+    .replace(/\s+/g, ' ')
+    .trim();
+  const css = (Array.isArray(styles) ? styles : [])
+    .map((sheet) => String(sheet).replace(/\s+/g, ' ').trim())
+    .join('\n');
+  return `${markup}\n${css}`;
+}
+
+// Content hash the result cache compares to decide whether a surface changed.
+export function pageSnapshotHash(snapshot) {
+  return createHash('sha256').update(normalizePageSnapshot(snapshot)).digest('hex');
+}
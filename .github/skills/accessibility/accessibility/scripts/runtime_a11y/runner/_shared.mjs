@@ -14,6 +14,7 @@ import {
   emitProbeResult,
   findNamelessControls,
   loadProbeCriteriaMap,
+  pageSnapshotHash,
   redactUrl,
 } from './_core.mjs';
 import { createScreenReaderDriver } from './drivers/driver-contract.mjs';
@@ -951,12 +952,56 @@ export async function readLiveRegionSnapshot(page, { settleMs = 500 } = {}) {
   });
 }
 
+// The persistent runner keeps one headless browser across probe requests. Each
+// probe still gets a fresh context, so cookies, storage, and emulation never
+// leak between runs; only the browser launch is amortized.
+let warmBrowser = null;
+let keepBrowserWarm = false;
+
+export function setKeepBrowserWarm(enabled) {
+  keepBrowserWarm = Boolean(enabled);
+}
+
+export async function closeWarmBrowser() {
+  const browser = warmBrowser;
+  warmBrowser = null;
+  if (browser) {
+    await browser.close().catch(() => undefined);
+  }
+}
+
+async function acquireHeadlessBrowser() {
+  if (!keepBrowserWarm) {
+    return chromium.launch(buildChromeLaunchOptions({ headless: true }));
+  }
+  if (!warmBrowser || !warmBrowser.isConnected()) {
+    warmBrowser = await chromium.launch(buildChromeLaunchOptions({ headless: true }));
+  }
+  return warmBrowser;
+}
+
+// Serialize the settled DOM and the CSS applied to it for the result cache.
+// Cross-origin stylesheets cannot be read, so only their URL contributes.
+export async function capturePageSnapshot(page) {
+  return page.evaluate(() => {
+    const styles = [];
+    for (const sheet of Array.from(document.styleSheets)) {
+      try {
+        styles.push(Array.from(sheet.cssRules, (rule) => rule.cssText).join('\n'));
+      } catch {
+        styles.push(`@import url("${sheet.href || ''}");`);
+      }
+    }
+    return { html: document.documentElement.outerHTML, styles };
+  });
+}
+
 export async function runProbeWithPage(callback) {
   const contextData = getRuntimeContext();
   const { config, probeId, surfaceId, state, baseUrl, trace } = contextData;
   const surface = (config.surfaces || []).find((entry) => entry.id === surfaceId) || null;
   const targetUrl = resolveTargetUrl(baseUrl, surface);
-  const browser = await chromium.launch(buildChromeLaunchOptions({ headless: true }));
+  const browser = await acquireHeadlessBrowser();
   const context = await browser.newContext({
     viewport: DEFAULT_VIEWPORT,
     colorScheme: 'light',
@@ -988,13 +1033,29 @@ export async function runProbeWithPage(callback) {
     // announcements are counted as a fired status message.
     await clearLiveRegionLog(page);
     await applyTrigger(page, trigger);
-    return await callback({ browser, context, page, targetUrl, surface, state, tracePath, baseUrl, probeId, surfaceId });
+    // The result cache asks for a hash of the page the probe would observe. When
+    // it matches the cached one, the probe is skipped and the caller reuses the
+    // cached payload.
+    let snapshotHash = null;
+    if (process.env.RUNTIME_A11Y_CAPTURE_SNAPSHOT === '1') {
+      snapshotHash = pageSnapshotHash(await capturePageSnapshot(page));
+      if (snapshotHash === process.env.RUNTIME_A11Y_CACHED_SNAPSHOT) {
+        return { probeId, surfaceId, state, cacheHit: true, snapshotHash, results: [] };
+      }
+    }
+    const payload = await callback({ browser, context, page, targetUrl, surface, state, tracePath, baseUrl, probeId, surfaceId });
+    if (snapshotHash && payload && typeof payload === 'object') {
+      payload.snapshotHash = snapshotHash;
+    }
+    return payload;
   } finally {
     if (tracePath) {
       await gatherTracingAssets(page, context, tracePath).catch(() => undefined);
     }
     await context.close().catch(() => undefined);
-    await browser.close().catch(() => undefined);
+    if (browser !== warmBrowser) {
+      await browser.close().catch(() => undefined);
+    }
   }
 }
 
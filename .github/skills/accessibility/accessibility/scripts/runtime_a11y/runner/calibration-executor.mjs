@@ -1234,19 +1234,14 @@ function readInputPayload() {
   return JSON.parse(raw);
 }
 
-export async function main() {
-  const config = readInputPayload();
-  if (!config || typeof config !== 'object') {
-    throw new Error('No configuration payload received.');
-  }
-  const runRoot = process.env.RUNTIME_A11Y_RUN_ROOT
-    ? path.resolve(process.env.RUNTIME_A11Y_RUN_ROOT)
-    : null;
+// Run a calibration session and build the run-calibration document. Shared by
+// the one-shot entry point below and the persistent runner's calibration op.
+export async function runCalibrationDocument({ config, runRoot = null }) {
   const session = await runRealCalibrationSession({
     config,
     runRoot,
   });
-  const document = {
+  return {
     tool: 'runtime_a11y',
     command: 'run-calibration',
     runAt: new Date().toISOString(),
@@ -1259,6 +1254,17 @@ export async function main() {
     state: session.state,
     browserTeardown: session.browserTeardown,
   };
+}
+
+export async function main() {
+  const config = readInputPayload();
+  if (!config || typeof config !== 'object') {
+    throw new Error('No configuration payload received.');
+  }
+  const runRoot = process.env.RUNTIME_A11Y_RUN_ROOT
+    ? path.resolve(process.env.RUNTIME_A11Y_RUN_ROOT)
+    : null;
+  const document = await runCalibrationDocument({ config, runRoot });
   process.stdout.write(`${JSON.stringify(document, null, 2)}\n`);
   return document;
 }
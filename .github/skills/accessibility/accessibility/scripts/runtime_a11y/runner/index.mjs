@@ -1,8 +1,6 @@
 // Copyright (c) 2026 Microsoft Corporation. All rights reserved.
 // SPDX-License-Identifier: MIT
-import { existsSync } from 'node:fs';
-import path from 'node:path';
-import { fileURLToPath, pathToFileURL } from 'node:url';
+import { loadProbeRunner, serve } from './serve.mjs';
 
 const probeId = process.argv[2];
 
@@ -11,20 +9,14 @@ if (!probeId) {
   process.exit(1);
 }
 
-const modulePath = path.join(path.dirname(fileURLToPath(import.meta.url)), `${probeId}.mjs`);
-if (!existsSync(modulePath)) {
-  console.error(`Unknown probe module: ${probeId}`);
-  process.exit(1);
-}
-
-try {
-  const mod = await import(pathToFileURL(modulePath).href);
-  const runner = mod.runProbe ?? mod.default;
-  if (typeof runner !== 'function') {
-    throw new Error(`Probe module ${probeId} does not export a runner`);
+if (probeId === '--serve') {
+  await serve();
+} else {
+  try {
+    const runner = await loadProbeRunner(probeId);
+    await runner();
+  } catch (error) {
+    console.error(error instanceof Error ? error.message : String(error));
+    process.exit(1);
   }
-  await runner();
-} catch (error) {
-  console.error(error instanceof Error ? error.message : String(error));
-  process.exit(1);
 }
@@ -0,0 +1,193 @@
+// Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+// Persistent probe runner: a JSON-lines request loop on stdin and stdout.
+//
+// `node runner/index.mjs --serve` keeps Node, the probe modules, and one headless
+// browser loaded across requests instead of paying that startup per probe. Each
+// request is one JSON line with an `id` and an `op`:
+//
+//   {"id":1,"op":"probe","probeId":"probe-axe","surfaceId":"home","state":"default",
+//    "baseUrl":"http://127.0.0.1:3000","trace":false,"captureSnapshot":false,
+//    "cachedSnapshot":null,"config":{...}}
+//   {"id":2,"op":"prerequisites","baseUrl":"...","trace":false}
+//   {"id":3,"op":"calibration","baseUrl":"...","runRoot":"...","trace":false}
+//   {"id":4,"op":"shutdown"}
+//
+// `config` may be omitted once sent; the runner keeps the most recent one. Each
+// response is one JSON line carrying what the one-shot runner reports through
+// its stdout, exit code, and stderr:
+//
+//   {"id":1,"ok":true,"payload":{...},"exitCode":0,"stderr":""}
+//   {"id":1,"ok":false,"error":"Unknown runner op: bogus","stderr":""}
+//
+// Requests run one at a time in arrival order. The per-request RUNTIME_A11Y_*
+// environment is applied only for the duration of the request, so probes read
+// their context exactly as they do under the one-shot runner. Probe output that
+// would reach stdout is routed to stderr so the protocol stream stays parseable.
+
+import { existsSync } from 'node:fs';
+import path from 'node:path';
+import { createInterface } from 'node:readline';
+import { fileURLToPath, pathToFileURL } from 'node:url';
+
+import { setProbeResultSink } from './_core.mjs';
+
+const RUNNER_DIR = path.dirname(fileURLToPath(import.meta.url));
+const PROBE_ID_PATTERN = /^probe-[a-z0-9-]+$/;
+
+export async function loadProbeRunner(probeId) {
+  const modulePath = path.join(RUNNER_DIR, `${probeId}.mjs`);
+  if (!PROBE_ID_PATTERN.test(String(probeId)) || !existsSync(modulePath)) {
+    throw new Error(`Unknown probe module: ${probeId}`);
+  }
+  const mod = await import(pathToFileURL(modulePath).href);
+  const runner = mod.runProbe ?? mod.default;
+  if (typeof runner !== 'function') {
+    throw new Error(`Probe module ${probeId} does not export a runner`);
+  }
+  return runner;
+}
+
+async function withRequestEnv(values, callback) {
+  const previous = {};
+  for (const [key, value] of Object.entries(values)) {
+    previous[key] = process.env[key];
+    process.env[key] = value;
+  }
+  try {
+    return await callback();
+  } finally {
+    for (const [key, value] of Object.entries(previous)) {
+      if (value === undefined) {
+        delete process.env[key];
+      } else {
+        process.env[key] = value;
+      }
+    }
+  }
+}
+
+async function captureStderr(callback) {
+  const chunks = [];
+  const originalWrite = process.stderr.write;
+  process.stderr.write = function write(chunk, encoding, done) {
+    chunks.push(typeof chunk === 'string' ? chunk : Buffer.from(chunk).toString('utf8'));
+    return originalWrite.call(process.stderr, chunk, encoding, done);
+  };
+  try {
+    await callback();
+  } finally {
+    process.stderr.write = originalWrite;
+  }
+  return chunks.join('');
+}
+
+function errorMessage(error) {
+  return error instanceof Error ? error.message : String(error);
+}
+
+async function runProbeRequest(request, session) {
+  const runner = await loadProbeRunner(request.probeId);
+  session.shared ??= await import('./_shared.mjs');
+  session.shared.setKeepBrowserWarm(true);
+  let payload = null;
+  setProbeResultSink((value) => {
+    payload = value;
+  });
+  try {
+    await runner();
+  } finally {
+    setProbeResultSink(null);
+  }
+  return payload;
+}
+
+async function runPrerequisiteRequest(config) {
+  const { probePrerequisites } = await import('./calibration-executor.mjs');
+  return probePrerequisites(config, null);
+}
+
+async function runCalibrationRequest(config, request) {
+  const { runCalibrationDocument } = await import('./calibration-executor.mjs');
+  const runRoot = request.runRoot ? path.resolve(request.runRoot) : null;
+  return runCalibrationDocument({ config, runRoot });
+}
+
+export async function handleRequest(request, session) {
+  if (request.config !== undefined) {
+    session.config = request.config;
+  }
+  const config = session.config ?? {};
+  const env = {
+    RUNTIME_A11Y_CONFIG: JSON.stringify(config),
+    RUNTIME_A11Y_BASE_URL: String(request.baseUrl ?? ''),
+    RUNTIME_A11Y_TRACE: request.trace ? '1' : '0',
+  };
+  let operation;
+  if (request.op === 'probe') {
+    Object.assign(env, {
+      RUNTIME_A11Y_PROBE_ID: String(request.probeId ?? ''),
+      RUNTIME_A11Y_SURFACE_ID: String(request.surfaceId ?? ''),
+      RUNTIME_A11Y_STATE: String(request.state ?? 'default'),
+      RUNTIME_A11Y_CAPTURE_SNAPSHOT: request.captureSnapshot ? '1' : '0',
+      RUNTIME_A11Y_CACHED_SNAPSHOT: String(request.cachedSnapshot ?? ''),
+    });
+    operation = () => runProbeRequest(request, session);
+  } else if (request.op === 'prerequisites') {
+    operation = () => runPrerequisiteRequest(config);
+  } else if (request.op === 'calibration') {
+    env.RUNTIME_A11Y_RUN_ROOT = String(request.runRoot ?? '');
+    operation = () => runCalibrationRequest(config, request);
+  } else {
+    return { id: request.id, ok: false, error: `Unknown runner op: ${request.op}`, stderr: '' };
+  }
+
+  let payload = null;
+  process.exitCode = undefined;
+  const stderr = await captureStderr(() =>
+    withRequestEnv(env, async () => {
+      try {
+        payload = await operation();
+      } catch (error) {
+        process.stderr.write(`${errorMessage(error)}\n`);
+        process.exitCode = 1;
+      }
+    }),
+  );
+  const exitCode = Number(process.exitCode ?? 0) || 0;
+  process.exitCode = undefined;
+  return { id: request.id, ok: true, payload: payload ?? null, exitCode, stderr };
+}
+
+export async function serve({ input = process.stdin, output = process.stdout } = {}) {
+  const writeProtocol = output.write.bind(output);
+  if (output === process.stdout) {
+    process.stdout.write = (...args) => process.stderr.write(...args);
+  }
+  const send = (message) => writeProtocol(`${JSON.stringify(message)}\n`);
+  const session = { config: null, shared: null };
+  const lines = createInterface({ input, crlfDelay: Infinity });
+  try {
+    for await (const line of lines) {
+      if (!line.trim()) {
+        continue;
+      }
+      let request;
+      try {
+        request = JSON.parse(line);
+      } catch (error) {
+        send({ id: null, ok: false, error: `Invalid request: ${errorMessage(error)}`, stderr: '' });
+        continue;
+      }
+      if (request?.op === 'shutdown') {
+        send({ id: request.id, ok: true, payload: null, exitCode: 0, stderr: '' });
+        break;
+      }
+      send(await handleRequest(request ?? {}, session));
+    }
+  } finally {
+    lines.close();
+    await session.shared?.closeWarmBrowser();
+  }
+}
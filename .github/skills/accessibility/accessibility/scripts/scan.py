@@ -13,6 +13,9 @@ import argparse
 import json
 import subprocess
 import sys
+import xml.etree.ElementTree as ET
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +23,11 @@ EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 EXIT_USAGE = 2
 
+AXE_CLI = "@axe-core/cli@4.12.1"
+DEFAULT_BATCH_SIZE = 10
+DEFAULT_JOBS = 2
+_SITEMAP_LOC = "{http://www.sitemaps.org/schemas/sitemap/0.9}loc"
+
 
 class ScriptError(Exception):
     """Raised when the scanner cannot complete the requested operation."""
@@ -34,16 +42,64 @@ def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Run the axe-core accessibility scanner against a URL or file."
     )
-    parser.add_argument("target", help="URL or local file to scan")
+    targets = parser.add_mutually_exclusive_group(required=True)
+    targets.add_argument("target", nargs="?", help="URL or local file to scan")
+    targets.add_argument(
+        "--targets-file",
+        type=Path,
+        default=None,
+        help=(
+            "Batch mode: file listing one URL or local file per line "
+            "(blank lines and lines starting with '#' are ignored)"
+        ),
+    )
+    targets.add_argument(
+        "--sitemap",
+        type=Path,
+        default=None,
+        help="Batch mode: local sitemap.xml whose <loc> entries are scanned",
+    )
     parser.add_argument(
         "--output",
         type=Path,
         default=None,
-        help="Path to write normalized JSON output (defaults to stdout)",
+        help=(
+            "Path to write normalized JSON output, or JSON Lines in batch mode "
+            "(defaults to stdout)"
+        ),
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=_positive_int,
+        default=DEFAULT_BATCH_SIZE,
+        help=(
+            "Batch mode: targets scanned per scanner session "
+            f"(default: {DEFAULT_BATCH_SIZE})"
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_positive_int,
+        default=DEFAULT_JOBS,
+        help=(
+            "Batch mode: scanner sessions run concurrently, which bounds the "
+            f"pages open at once (default: {DEFAULT_JOBS})"
+        ),
     )
     return parser
 
 
+def _positive_int(value: str) -> int:
+    """Parse a strictly positive integer argparse value."""
+    try:
+        parsed = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"expected an integer, got {value!r}") from exc
+    if parsed < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {parsed}")
+    return parsed
+
+
 def normalize_results(raw_results: dict[str, Any], target: str) -> dict[str, Any]:
     """Normalize raw axe-core findings into a stable JSON shape.
 
@@ -110,9 +166,9 @@ def normalize_results(raw_results: dict[str, Any], target: str) -> dict[str, Any
     return normalized
 
 
-def run_scan(target: str) -> dict[str, Any]:
-    """Run the external axe-core scanner and normalize the output."""
-    command = ["npx", "--yes", "@axe-core/cli@4.12.1", target]
+def _run_scanner(arguments: list[str]) -> Any:
+    """Run the external axe-core scanner and parse its JSON output."""
+    command = ["npx", "--yes", AXE_CLI, *arguments]
     try:
         completed = subprocess.run(
             command,
@@ -123,7 +179,7 @@ def run_scan(target: str) -> dict[str, Any]:
     except FileNotFoundError as exc:
         raise ScriptError(
             "Node-based axe scanner is unavailable. "
-            "Install Node.js and run 'npx --yes @axe-core/cli@4.12.1'.",
+            f"Install Node.js and run 'npx --yes {AXE_CLI}'.",
             EXIT_USAGE,
         ) from exc
     except subprocess.CalledProcessError as exc:
@@ -131,16 +187,110 @@ def run_scan(target: str) -> dict[str, Any]:
         raise ScriptError(f"Scanner failed: {stderr}", EXIT_FAILURE) from exc
 
     try:
-        raw_payload = json.loads(completed.stdout)
+        return json.loads(completed.stdout)
     except json.JSONDecodeError as exc:
         raise ScriptError("Scanner returned invalid JSON output", EXIT_FAILURE) from exc
 
+
+def run_scan(target: str) -> dict[str, Any]:
+    """Run the external axe-core scanner and normalize the output."""
+    raw_payload = _run_scanner([target])
     if not isinstance(raw_payload, dict):
         raise ScriptError("Scanner returned unexpected payload format", EXIT_FAILURE)
 
     return normalize_results(raw_payload, target)
 
 
+def _checked_target(target: str, source: Path) -> str:
+    # Targets read from a file reach the scanner's argv, so one that looks
+    # like an option would be parsed as a scanner flag instead of a page.
+    if target.startswith("-"):
+        raise ScriptError(
+            f"Target {target!r} in {source} must not start with '-'", EXIT_USAGE
+        )
+    return target
+
+
+def load_targets(path: Path) -> list[str]:
+    """Read batch targets from a file with one URL or local file per line."""
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except OSError as exc:
+        raise ScriptError(
+            f"Cannot read targets file {path}: {exc}", EXIT_USAGE
+        ) from exc
+    targets = [
+        _checked_target(line.strip(), path)
+        for line in lines
+        if line.strip() and not line.lstrip().startswith("#")
+    ]
+    if not targets:
+        raise ScriptError(f"Targets file {path} lists no targets", EXIT_USAGE)
+    return targets
+
+
+def load_sitemap(path: Path) -> list[str]:
+    """Read batch targets from the ``<loc>`` entries of a local sitemap."""
+    try:
+        root = ET.parse(path).getroot()
+    except (OSError, ET.ParseError) as exc:
+        raise ScriptError(f"Cannot read sitemap {path}: {exc}", EXIT_USAGE) from exc
+    targets = [
+        _checked_target(element.text.strip(), path)
+        for element in root.iter()
+        if element.tag in (_SITEMAP_LOC, "loc")
+        and element.text
+        and element.text.strip()
+    ]
+    if not targets:
+        raise ScriptError(f"Sitemap {path} lists no <loc> entries", EXIT_USAGE)
+    return targets
+
+
+def scan_batch(targets: list[str]) -> list[dict[str, Any]]:
+    """Scan ``targets`` in one scanner session and normalize each result.
+
+    The scanner loads the targets one after another in a single browser, and
+    its ``--stdout`` payload is an array with one result per target, in order.
+    """
+    raw_payload = _run_scanner(["--stdout", *targets])
+    if not isinstance(raw_payload, list) or len(raw_payload) != len(targets):
+        raise ScriptError(
+            f"Scanner returned unexpected payload format for a batch of "
+            f"{len(targets)} targets",
+            EXIT_FAILURE,
+        )
+    return [
+        normalize_results(raw, target)
+        for raw, target in zip(raw_payload, targets, strict=True)
+    ]
+
+
+def iter_batch_scan(
+    targets: list[str],
+    *,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    jobs: int = DEFAULT_JOBS,
+) -> Iterator[dict[str, Any]]:
+    """Yield normalized results for ``targets`` in input order.
+
+    Targets are split into batches of ``batch_size``; up to ``jobs`` batches
+    run at once, each in its own scanner session, so at most ``jobs`` pages
+    are open at a time. A batch's results are yielded as soon as it and every
+    earlier batch have finished.
+    """
+    batches = [
+        targets[start : start + batch_size]
+        for start in range(0, len(targets), batch_size)
+    ]
+    with ThreadPoolExecutor(max_workers=min(jobs, len(batches) or 1)) as pool:
+        try:
+            for results in pool.map(scan_batch, batches):
+                yield from results
+        finally:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+
 def write_output(result: dict[str, Any], output_path: Path | None) -> None:
     """Write the normalized result object to stdout or an output file."""
     payload = json.dumps(result, indent=2)
@@ -152,13 +302,48 @@ def write_output(result: dict[str, Any], output_path: Path | None) -> None:
     output_path.write_text(payload + "\n", encoding="utf-8")
 
 
+def write_jsonl(results: Iterable[dict[str, Any]], output_path: Path | None) -> int:
+    """Write each result as one JSON line as soon as it arrives.
+
+    Returns:
+        Number of results written.
+    """
+    if output_path is None:
+        return _write_lines(results, sys.stdout)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", encoding="utf-8") as handle:
+        return _write_lines(results, handle)
+
+
+def _write_lines(results: Iterable[dict[str, Any]], handle: Any) -> int:
+    count = 0
+    for result in results:
+        handle.write(json.dumps(result) + "\n")
+        handle.flush()
+        count += 1
+    return count
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     parser = create_parser()
     args = parser.parse_args(argv)
 
     try:
-        result = run_scan(args.target)
+        if args.target is not None:
+            result = run_scan(args.target)
+        else:
+            targets = (
+                load_targets(args.targets_file)
+                if args.targets_file is not None
+                else load_sitemap(args.sitemap)
+            )
+            write_jsonl(
+                iter_batch_scan(targets, batch_size=args.batch_size, jobs=args.jobs),
+                args.output,
+            )
+            return EXIT_SUCCESS
     except ScriptError as exc:
         print(f"Error: {exc}", file=sys.stderr)
         return exc.exit_code
@@ -19,6 +19,8 @@ import {
   isForcedColorsIndicatorRisk,
   liveRegionStatus,
   loadProbeCriteriaMap,
+  normalizePageSnapshot,
+  pageSnapshotHash,
   redactUrl,
   tagToCriterion,
   virtualSrNameRoleStatus,
@@ -293,3 +295,32 @@ test('buildProbeResults resolves criteria from the real map', async () => {
   assert.equal(byId['1.3.1'].status, 'fail');
   assert.equal(byId['2.4.1'].status, 'pass');
 });
+
+test('pageSnapshotHash ignores comments, nonces, and whitespace but not content', () => {
+  const base = pageSnapshotHash({
+    html: '<html><body><main>\n  <h1>Title</h1>\n</main></body></html>',
+    styles: ['h1 { color: red; }'],
+  });
+  const cosmetic = pageSnapshotHash({
+    html: '<html><body><!-- build 42 --><main> <h1>Title</h1> </main></body></html>',
+    styles: ['h1 {  color: red;  }'],
+  });
+  const nonced = normalizePageSnapshot({
+    html: '<script nonce="abc123">x()</script>',
+    styles: [],
+  });
+
+  assert.equal(cosmetic, base);
+  assert.doesNotMatch(nonced, /abc123/);
+  assert.notEqual(
+    pageSnapshotHash({ html: '<main><h1>Other</h1></main>', styles: ['h1 { color: red; }'] }),
+    base,
+  );
+  assert.notEqual(
+    pageSnapshotHash({
+      html: '<html><body><main>\n  <h1>Title</h1>\n</main></body></html>',
+      styles: ['h1 { color: blue; }'],
+    }),
+    base,
+  );
+});
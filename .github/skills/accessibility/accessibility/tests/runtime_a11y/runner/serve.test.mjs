@@ -0,0 +1,85 @@
+// Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+// SPDX-License-Identifier: MIT
+
+// Protocol tests for the persistent runner. Runs under `node --test` without a
+// browser or node_modules: no request here reaches a Playwright-backed probe.
+
+import assert from 'node:assert/strict';
+import { PassThrough } from 'node:stream';
+import { test } from 'node:test';
+
+import { emitProbeResult, setProbeResultSink } from '../../../scripts/runtime_a11y/runner/_core.mjs';
+import { handleRequest, loadProbeRunner, serve } from '../../../scripts/runtime_a11y/runner/serve.mjs';
+
+async function exchange(lines) {
+  const input = new PassThrough();
+  const output = new PassThrough();
+  const chunks = [];
+  output.on('data', (chunk) => chunks.push(chunk.toString('utf8')));
+  const done = serve({ input, output });
+  for (const line of lines) {
+    input.write(`${line}\n`);
+  }
+  input.end();
+  await done;
+  return chunks
+    .join('')
+    .split('\n')
+    .filter(Boolean)
+    .map((line) => JSON.parse(line));
+}
+
+test('emitProbeResult hands results to the sink instead of stdout', () => {
+  const received = [];
+  setProbeResultSink((payload) => received.push(payload));
+  try {
+    emitProbeResult({ probeId: 'probe-axe', results: [] });
+  } finally {
+    setProbeResultSink(null);
+  }
+  assert.deepEqual(received, [{ probeId: 'probe-axe', results: [] }]);
+});
+
+test('loadProbeRunner rejects ids outside the probe module pattern', async () => {
+  await assert.rejects(loadProbeRunner('../_core'), /Unknown probe module: \.\.\/_core/);
+  await assert.rejects(loadProbeRunner('probe-does-not-exist'), /Unknown probe module/);
+});
+
+test('handleRequest reports probe failures through exitCode and stderr', async () => {
+  const session = { config: null, shared: null };
+  const original = process.stderr.write;
+  process.stderr.write = () => true;
+  let response;
+  try {
+    response = await handleRequest(
+      { id: 7, op: 'probe', probeId: 'probe-does-not-exist', config: { surfaces: [] } },
+      session,
+    );
+  } finally {
+    process.stderr.write = original;
+  }
+  assert.equal(response.id, 7);
+  assert.equal(response.ok, true);
+  assert.equal(response.payload, null);
+  assert.equal(response.exitCode, 1);
+  assert.match(response.stderr, /Unknown probe module: probe-does-not-exist/);
+  assert.deepEqual(session.config, { surfaces: [] });
+  assert.equal(process.exitCode, undefined);
+});
+
+test('serve answers malformed and unknown requests and stops at shutdown', async () => {
+  const responses = await exchange([
+    'not json',
+    JSON.stringify({ id: 1, op: 'bogus' }),
+    '',
+    JSON.stringify({ id: 2, op: 'shutdown' }),
+    JSON.stringify({ id: 3, op: 'bogus' }),
+  ]);
+
+  assert.equal(responses.length, 3);
+  assert.equal(responses[0].id, null);
+  assert.equal(responses[0].ok, false);
+  assert.match(responses[0].error, /^Invalid request:/);
+  assert.deepEqual(responses[1], { id: 1, ok: false, error: 'Unknown runner op: bogus', stderr: '' });
+  assert.deepEqual(responses[2], { id: 2, ok: true, payload: null, exitCode: 0, stderr: '' });
+});
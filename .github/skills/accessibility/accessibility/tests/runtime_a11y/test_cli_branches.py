@@ -5,6 +5,8 @@ from __future__ import annotations
 
 import json
 import subprocess
+import threading
+import time
 from types import SimpleNamespace
 
 import pytest
@@ -296,6 +298,130 @@ def test_run_probe_raises_on_invalid_json(mocker) -> None:
         )
 
 
+def _fake_probe_runner(delays: dict[str, float], failing: set[str] | None = None):
+    """Build a ``_run_probe`` stand-in that records peak concurrency."""
+    failing = failing or set()
+    lock = threading.Lock()
+    active: list[str] = []
+    overlaps: dict[str, int] = {}
+
+    def _run(_config, probe_id, surface_id, state, _base_url, _trace):
+        with lock:
+            active.append(surface_id)
+            for sid in active:
+                overlaps[sid] = max(overlaps.get(sid, 0), len(active))
+        time.sleep(delays.get(surface_id, 0.0))
+        with lock:
+            active.remove(surface_id)
+        payload = {
+            "probeId": probe_id,
+            "results": [{"criterionId": "1.3.1", "surface": surface_id}],
+        }
+        if surface_id in failing:
+            payload["operationalFailure"] = {"reason": f"{surface_id} failed"}
+        return payload
+
+    return _run, overlaps
+
+
+def test_run_with_jobs_keeps_iter_runs_order(mocker) -> None:
+    keys = [("probe-axe", f"s{index}", "default") for index in range(6)]
+    mocker.patch.object(cli, "_iter_runs", return_value=iter(keys))
+    fake, overlaps = _fake_probe_runner({"s0": 0.05, "s1": 0.03, "s3": 0.02})
+    mocker.patch.object(cli, "_run_probe", side_effect=fake)
+
+    document = cli.run({}, None, "http://127.0.0.1:3000", False, jobs=3)
+
+    assert [entry["surfaceId"] for entry in document["runs"]] == [
+        key[1] for key in keys
+    ]
+    assert [row["surface"] for row in document["results"]] == [key[1] for key in keys]
+    assert max(overlaps.values()) > 1
+    assert "quarantined" not in document
+
+
+def test_run_with_jobs_stops_at_first_operational_failure_in_order(mocker) -> None:
+    keys = [("probe-axe", f"s{index}", "default") for index in range(8)]
+    mocker.patch.object(cli, "_iter_runs", return_value=iter(keys))
+    # s3 fails after s4 has already finished; s4 must not leak into the document.
+    fake, _ = _fake_probe_runner({"s3": 0.05}, failing={"s3", "s4"})
+    run_probe = mocker.patch.object(cli, "_run_probe", side_effect=fake)
+
+    document = cli.run({}, None, "http://127.0.0.1:3000", False, jobs=2)
+
+    assert [entry["surfaceId"] for entry in document["runs"]] == [
+        "s0",
+        "s1",
+        "s2",
+        "s3",
+    ]
+    assert document["quarantined"] is True
+    assert document["operationalFailure"]["reason"] == "s3 failed"
+    assert run_probe.call_count < len(keys)
+
+
+def test_run_with_jobs_runs_exclusive_probes_alone(mocker) -> None:
+    keys = [
+        ("probe-axe", "a", "default"),
+        ("probe-axe", "b", "default"),
+        ("probe-real-sr", "sr", "default"),
+        ("probe-axe", "c", "default"),
+        ("probe-axe", "d", "default"),
+    ]
+    mocker.patch.object(cli, "_iter_runs", return_value=iter(keys))
+    fake, overlaps = _fake_probe_runner({"a": 0.03, "sr": 0.03, "c": 0.01})
+    mocker.patch.object(cli, "_run_probe", side_effect=fake)
+
+    document = cli.run({}, None, "http://127.0.0.1:3000", False, jobs=4)
+
+    assert [entry["surfaceId"] for entry in document["runs"]] == [
+        "a",
+        "b",
+        "sr",
+        "c",
+        "d",
+    ]
+    assert overlaps["sr"] == 1
+    assert overlaps["a"] == 2
+
+
+def test_run_with_jobs_propagates_probe_errors(mocker) -> None:
+    keys = [("probe-axe", f"s{index}", "default") for index in range(4)]
+    mocker.patch.object(cli, "_iter_runs", return_value=iter(keys))
+    mocker.patch.object(
+        cli,
+        "_run_probe",
+        side_effect=[
+            {"probeId": "probe-axe", "results": []},
+            ScriptError("Probe 'probe-axe' returned invalid JSON output"),
+            {"probeId": "probe-axe", "results": []},
+            {"probeId": "probe-axe", "results": []},
+        ],
+    )
+
+    with pytest.raises(ScriptError, match="invalid JSON"):
+        cli.run({}, None, "http://127.0.0.1:3000", False, jobs=2)
+
+
+@pytest.mark.parametrize("value", ["0", "-2", "many"])
+def test_jobs_flag_rejects_non_positive_values(value, capsys) -> None:
+    with pytest.raises(SystemExit):
+        cli.create_parser().parse_args(
+            ["run-all", "--config", "runtime.json", "--jobs", value]
+        )
+
+    assert "--jobs" in capsys.readouterr().err
+
+
+def test_jobs_flag_defaults_to_serial_and_accepts_positive_values() -> None:
+    parser = cli.create_parser()
+
+    assert parser.parse_args(["run-all", "--config", "c.json"]).jobs == 1
+    assert (
+        parser.parse_args(["probe", "probe-axe", "--config", "c.json", "--jobs", "4"])
+    ).jobs == 4
+
+
 def test_write_output_prints_to_stdout_when_no_path(capsys) -> None:
     cli._write_output({"a": 1}, None)
 
@@ -3,9 +3,12 @@
 
 from __future__ import annotations
 
+import time
+
 from runtime_a11y.matrix._build import build_matrix
-from runtime_a11y.matrix._coverage import compute_coverage
-from runtime_a11y.matrix._model import Criterion, Surface
+from runtime_a11y.matrix._coverage import compute_coverage, framework_index
+from runtime_a11y.matrix._model import Cell, Criterion, Matrix, Surface
+from runtime_a11y.matrix._render_earl import build_earl
 
 
 def test_two_of_three_adequate_cells_yield_66_7_percent_coverage() -> None:
@@ -33,3 +36,89 @@ def test_two_of_three_adequate_cells_yield_66_7_percent_coverage() -> None:
     assert summary["overall"]["coverage"] == 66.7
     assert summary["overall"]["numerator"] == 2
     assert summary["overall"]["denominator"] == 3
+
+
+def test_frameworks_tally_in_one_sweep_in_first_seen_order() -> None:
+    criteria = [
+        Criterion(
+            id="1.1.1",
+            framework="wcag-22",
+            title="Name",
+            adequateMethods={"runtime-automation"},
+        ),
+        Criterion(
+            id="502.3.1",
+            framework="section-508",
+            title="Object info",
+            adequateMethods={"runtime-automation"},
+        ),
+    ]
+    surface = Surface(id="web", name="Web", platform="web", states=["default"])
+    matrix = build_matrix(criteria, [surface], ["default", "focus"])
+    for cell in matrix.cells[1:]:
+        cell.status = "pass"
+        cell.verifiedByMethod = "runtime-automation"
+
+    summary = compute_coverage(matrix)
+
+    assert list(summary["frameworks"]) == ["wcag-22", "section-508"]
+    assert summary["frameworks"]["wcag-22"] == {
+        "coverage": 50.0,
+        "numerator": 1,
+        "denominator": 2,
+    }
+    assert summary["frameworks"]["section-508"]["numerator"] == 2
+    assert summary["overall"] == {"coverage": 75.0, "denominator": 4, "numerator": 3}
+    assert [item["state"] for item in summary["residual"]] == ["default"]
+
+
+def test_repeated_criterion_id_resolves_to_first_entry_everywhere() -> None:
+    matrix = Matrix(
+        criteria=[
+            Criterion(id="1.1.1", framework="wcag-22", title="First"),
+            Criterion(id="1.1.1", framework="section-508", title="Second"),
+        ],
+        surfaces=[],
+        cells=[Cell(criterionId="1.1.1", surfaceId="web", state="default")],
+    )
+    matrix.cells[0].status = "fail"
+    matrix.cells[0].verifiedByMethod = "runtime-automation"
+
+    coverage = compute_coverage(matrix)
+    earl = build_earl(matrix, coverage)
+
+    assert framework_index(matrix) == {"1.1.1": "wcag-22"}
+    assert list(coverage["frameworks"]) == ["wcag-22"]
+    assert earl["@graph"][1]["earl:test"]["dct:isPartOf"] == (
+        "https://www.w3.org/TR/WCAG22/"
+    )
+
+
+def test_coverage_scales_with_cells_plus_criteria() -> None:
+    """Benchmark: 600 criteria x 40 surfaces x 5 states (120k cells).
+
+    Looking up each cell's criterion by scanning the catalog takes tens of
+    seconds at this size; the single sweep takes well under one.
+    """
+    criteria = [
+        Criterion(
+            id=f"c{index}",
+            framework="wcag-22" if index % 2 else "section-508",
+            title=f"C{index}",
+            adequateMethods={"runtime-automation"},
+        )
+        for index in range(600)
+    ]
+    surfaces = [
+        Surface(id=f"s{index}", name=f"S{index}", platform="web") for index in range(40)
+    ]
+    matrix = build_matrix(
+        criteria, surfaces, ["default", "hover", "focus", "active", "disabled"]
+    )
+
+    started = time.perf_counter()
+    summary = compute_coverage(matrix)
+    elapsed = time.perf_counter() - started
+
+    assert summary["overall"]["denominator"] == 120_000
+    assert elapsed < 5.0, f"coverage took {elapsed:.2f}s"
@@ -3,8 +3,20 @@
 
 from __future__ import annotations
 
-from runtime_a11y.matrix._merge import merge_updates
-from runtime_a11y.matrix._model import CandidateUpdate, Cell, Criterion, Matrix, Surface
+import random
+import time
+from dataclasses import replace
+
+from runtime_a11y.matrix._build import build_matrix
+from runtime_a11y.matrix._merge import _should_replace, merge_updates
+from runtime_a11y.matrix._model import (
+    OVERWRITE_LOCKED_METHODS,
+    CandidateUpdate,
+    Cell,
+    Criterion,
+    Matrix,
+    Surface,
+)
 
 
 def test_human_cell_preserved_when_automated_update_arrives() -> None:
@@ -68,3 +80,129 @@ def test_probe_failure_replaces_stale_automated_pass() -> None:
 
     assert merged.cells[0].status == "fail"
     assert merged.cells[0].verifiedByMethod == "runtime-automation"
+
+
+def _linear_merge(matrix: Matrix, updates: list[CandidateUpdate]) -> list[Cell]:
+    """Reference merge that scans every cell for every update."""
+    cells = list(matrix.cells)
+    for update in updates:
+        for index, cell in enumerate(cells):
+            if (cell.criterionId, cell.surfaceId, cell.state) != (
+                update.criterionId,
+                update.surfaceId,
+                update.state,
+            ):
+                continue
+            if cell.isApplicable is False and update.status != "not-applicable":
+                continue
+            if cell.verifiedByMethod in OVERWRITE_LOCKED_METHODS:
+                continue
+            if _should_replace(cell.verifiedByMethod, cell.status, cell.date, update):
+                cells[index] = merge_updates(
+                    Matrix(criteria=[], surfaces=[], cells=[cell]), [update]
+                ).cells[0]
+                break
+    return cells
+
+
+def _grid(criteria: int, surfaces: int, states: list[str]) -> Matrix:
+    return build_matrix(
+        [
+            Criterion(
+                id=f"c{index}",
+                framework="wcag-22",
+                title=f"C{index}",
+                adequateMethods={"runtime-automation"},
+            )
+            for index in range(criteria)
+        ],
+        [
+            Surface(
+                id=f"s{index}",
+                name=f"S{index}",
+                platform="mobile" if index % 4 == 0 else "web",
+                states=states,
+            )
+            for index in range(surfaces)
+        ],
+        states,
+    )
+
+
+def _random_updates(
+    matrix: Matrix, states: list[str], count: int, seed: int
+) -> list[CandidateUpdate]:
+    rng = random.Random(seed)
+    return [
+        CandidateUpdate(
+            criterionId=rng.choice(matrix.criteria).id,
+            surfaceId=rng.choice(matrix.surfaces).id,
+            state=rng.choice([*states, "missing"]),
+            status=rng.choice(["pass", "fail", "partial", "not-applicable"]),
+            method=rng.choice(
+                ["runtime-automation", "static-analysis", "manual-keyboard"]
+            ),
+            date=f"2026-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}",
+            evidence=f"row-{index}",
+        )
+        for index in range(count)
+    ]
+
+
+def test_indexed_merge_matches_linear_scan() -> None:
+    states = ["default", "hover", "focus"]
+    matrix = _grid(12, 8, states)
+    # Repeat one key so the index has to honour every position in order.
+    matrix.cells.append(replace(matrix.cells[0], verifiedByMethod=None))
+    updates = _random_updates(matrix, states, 2_000, seed=7)
+
+    merged = merge_updates(matrix, updates)
+
+    assert merged.cells == _linear_merge(matrix, updates)
+
+
+def test_duplicate_key_falls_through_to_next_unlocked_cell() -> None:
+    locked = Cell(
+        criterionId="1.1.1",
+        surfaceId="web",
+        state="default",
+        status="pass",
+        verifiedByMethod="manual-keyboard",
+    )
+    open_cell = Cell(criterionId="1.1.1", surfaceId="web", state="default")
+    matrix = Matrix(criteria=[], surfaces=[], cells=[locked, open_cell])
+
+    merged = merge_updates(
+        matrix,
+        [
+            CandidateUpdate(
+                criterionId="1.1.1",
+                surfaceId="web",
+                state="default",
+                status="fail",
+                method="runtime-automation",
+            )
+        ],
+    )
+
+    assert matrix.cell_index() == {("1.1.1", "web", "default"): [0, 1]}
+    assert merged.cells[0] is locked
+    assert merged.cells[1].status == "fail"
+
+
+def test_merge_scales_linearly_with_updates() -> None:
+    """Benchmark: 90 criteria x 40 surfaces x 5 states against 40k probe rows.
+
+    A per-update scan of the 18k cells takes minutes here; the indexed merge
+    takes well under a second, so the bound only catches a quadratic regression.
+    """
+    states = ["default", "hover", "focus", "active", "disabled"]
+    matrix = _grid(90, 40, states)
+    updates = _random_updates(matrix, states, 40_000, seed=11)
+
+    started = time.perf_counter()
+    merged = merge_updates(matrix, updates)
+    elapsed = time.perf_counter() - started
+
+    assert len(merged.cells) == 18_000
+    assert elapsed < 5.0, f"merge took {elapsed:.2f}s"
@@ -4,12 +4,15 @@
 from __future__ import annotations
 
 import json
+import tracemalloc
 from pathlib import Path
 from typing import Any
 
+import pytest
 from runtime_a11y.matrix._model import Cell, Criterion, Matrix, Surface
 from runtime_a11y.matrix._render_json import render_json
 from runtime_a11y.matrix._render_md import render_markdown
+from runtime_a11y.matrix._stream import write_json_document, write_lines
 
 
 def _sample_matrix() -> Matrix:
@@ -124,3 +127,70 @@ def test_render_markdown_handles_empty_residual_and_next_actions(
     assert "## Next Actions" in text
     # Both the residual and next-actions else-branches render a "- None" bullet.
     assert text.count("- None") == 2
+
+
+@pytest.mark.parametrize(
+    "document",
+    [
+        {},
+        {"empty": [], "nested": {"a": [1, {"b": None}], "c": {}}, "text": 'é\n"x"'},
+        {"items": [{"evidence": "line\nbreak", "tags": ["x", "y"]}, 3, "s"]},
+        {"only": [[]]},
+    ],
+)
+def test_write_json_document_matches_json_dumps(
+    tmp_path: Path, document: dict[str, Any]
+) -> None:
+    out_path = tmp_path / "nested" / "doc.json"
+    streamed = {
+        key: iter(value) if isinstance(value, list) else value
+        for key, value in document.items()
+    }
+
+    write_json_document(out_path, streamed, end="\n")
+
+    assert out_path.read_text(encoding="utf-8") == json.dumps(document, indent=2) + "\n"
+
+
+@pytest.mark.parametrize("lines", [[], [""], ["a", "", "b"]])
+def test_write_lines_matches_join(tmp_path: Path, lines: list[str]) -> None:
+    out_path = tmp_path / "lines.md"
+
+    write_lines(out_path, iter(lines), end="\n")
+
+    assert out_path.read_text(encoding="utf-8") == "\n".join(lines) + "\n"
+
+
+def test_render_json_streams_cells_with_bounded_memory(tmp_path: Path) -> None:
+    evidence = "e" * 2_000
+    matrix = Matrix(
+        criteria=[Criterion(id="1.3.1", framework="wcag-22", title="Info")],
+        surfaces=[],
+        cells=[
+            Cell(
+                criterionId="1.3.1",
+                surfaceId=f"surface-{index}",
+                state="default",
+                status="fail",
+                evidence=evidence,
+                rationale=evidence,
+            )
+            for index in range(3_000)
+        ],
+    )
+    out_path = tmp_path / "coverage.json"
+
+    tracemalloc.start()
+    try:
+        render_json(matrix, {"overall": {}}, out_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    size = out_path.stat().st_size
+    assert size > 12_000_000
+    # Building the document first would peak above the file size.
+    assert peak < size // 10
+    assert json.loads(out_path.read_text(encoding="utf-8"))["cells"][-1] == (
+        matrix.cells[-1].to_dict()
+    )
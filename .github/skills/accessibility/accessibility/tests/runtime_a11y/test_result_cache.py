@@ -0,0 +1,294 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+import runtime_a11y.__main__ as cli
+from runtime_a11y import _result_cache
+from runtime_a11y._errors import ScriptError
+from runtime_a11y._result_cache import ProbeResultCache, probe_version
+
+
+@pytest.fixture()
+def package_tree(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    package = tmp_path / "runtime_a11y"
+    runner = package / "runner"
+    (runner / "drivers").mkdir(parents=True)
+    for name in ("methods.json", "probe-criteria-map.json", "package-lock.json"):
+        (package / name).write_text("{}", encoding="utf-8")
+    for name in ("probe-axe.mjs", "probe-forms.mjs", "_shared.mjs"):
+        (runner / name).write_text(f"// {name}\n", encoding="utf-8")
+    (runner / "drivers" / "nvda.mjs").write_text("// driver\n", encoding="utf-8")
+    monkeypatch.setattr(_result_cache, "_PACKAGE_DIR", package)
+    monkeypatch.setattr(_result_cache, "_RUNNER_DIR", runner)
+    monkeypatch.setattr(
+        _result_cache,
+        "_SHARED_PROBE_INPUTS",
+        tuple(
+            package / name
+            for name in ("methods.json", "probe-criteria-map.json", "package-lock.json")
+        ),
+    )
+    return package
+
+
+def _payload(snapshot: str = "h1", **extra: Any) -> dict[str, Any]:
+    return {
+        "probeId": "probe-axe",
+        "runAt": "2026-10-01T00:00:00+00:00",
+        "results": [{"criterionId": "1.3.1", "status": "pass"}],
+        "snapshotHash": snapshot,
+        **extra,
+    }
+
+
+def test_probe_version_tracks_own_module_and_shared_code(package_tree):
+    runner = package_tree / "runner"
+    before = probe_version("probe-axe")
+
+    (runner / "probe-forms.mjs").write_text("// edited\n", encoding="utf-8")
+    assert probe_version("probe-axe") == before
+
+    (runner / "drivers" / "nvda.mjs").write_text("// edited\n", encoding="utf-8")
+    after_shared = probe_version("probe-axe")
+    assert after_shared != before
+
+    (runner / "probe-axe.mjs").write_text("// edited\n", encoding="utf-8")
+    assert probe_version("probe-axe") != after_shared
+
+
+def test_cache_records_misses_and_reuses_them_after_reload(package_tree, tmp_path):
+    path = tmp_path / "cache" / "results.json"
+    cache = ProbeResultCache(path)
+    assert cache.lookup("probe-axe", "home", "default") is None
+
+    settled = cache.settle("probe-axe", "home", "default", _payload())
+    cache.save()
+
+    assert settled == _payload()
+    reloaded = ProbeResultCache(path)
+    assert reloaded.lookup("probe-axe", "home", "default") == "h1"
+    assert reloaded.lookup("probe-axe", "home", "focus") is None
+
+    reused = reloaded.settle(
+        "probe-axe",
+        "home",
+        "default",
+        {"cacheHit": True, "snapshotHash": "h1", "results": []},
+    )
+
+    assert reused["results"] == _payload()["results"]
+    assert reused["runAt"] == _payload()["runAt"]
+    assert reused["reused"]["snapshotHash"] == "h1"
+    assert reused["reused"]["probeVersion"] == probe_version("probe-axe")
+    assert reloaded.summary() == {"path": str(path), "hits": 1, "misses": 0}
+    assert not list(path.parent.glob("*.tmp"))
+
+
+def test_cache_invalidates_entries_when_probe_code_changes(package_tree, tmp_path):
+    cache = ProbeResultCache(tmp_path / "results.json")
+    cache.settle("probe-axe", "home", "default", _payload())
+
+    (package_tree / "runner" / "probe-axe.mjs").write_text("// v2\n", encoding="utf-8")
+
+    assert (
+        ProbeResultCache(tmp_path / "results.json").lookup(
+            "probe-axe", "home", "default"
+        )
+        is None
+    )
+    cache.save()
+    assert (
+        ProbeResultCache(tmp_path / "results.json").lookup(
+            "probe-axe", "home", "default"
+        )
+        is None
+    )
+
+
+def test_cache_skips_failed_and_unhashed_payloads(package_tree, tmp_path):
+    cache = ProbeResultCache(tmp_path / "results.json")
+
+    cache.settle(
+        "probe-axe", "home", "default", _payload(operationalFailure={"reason": "x"})
+    )
+    cache.settle("probe-axe", "home", "focus", _payload(snapshot=None))
+
+    assert cache.lookup("probe-axe", "home", "default") is None
+    assert cache.lookup("probe-axe", "home", "focus") is None
+    assert cache.misses == 2
+
+
+def test_cache_rejects_hit_without_matching_entry(package_tree, tmp_path):
+    cache = ProbeResultCache(tmp_path / "results.json")
+    cache.settle("probe-axe", "home", "default", _payload())
+
+    with pytest.raises(ScriptError, match="no matching cache entry"):
+        cache.settle(
+            "probe-axe", "home", "default", {"cacheHit": True, "snapshotHash": "h2"}
+        )
+
+
+@pytest.mark.parametrize(
+    "content", ["not json", json.dumps({"version": 99, "entries": {}})]
+)
+def test_cache_starts_empty_from_unusable_file(package_tree, tmp_path, content):
+    path = tmp_path / "results.json"
+    path.write_text(content, encoding="utf-8")
+
+    cache = ProbeResultCache(path)
+
+    assert cache.lookup("probe-axe", "home", "default") is None
+
+
+def _fake_runner(calls: list[dict[str, Any]], snapshots: dict[str, str]):
+    def fake_run_probe(
+        _config,
+        probe_id,
+        surface_id,
+        state,
+        _base_url,
+        _trace,
+        runner=None,
+        *,
+        capture_snapshot=False,
+        cached_snapshot=None,
+    ):
+        calls.append(
+            {
+                "probeId": probe_id,
+                "surfaceId": surface_id,
+                "capture": capture_snapshot,
+                "cached": cached_snapshot,
+            }
+        )
+        snapshot = snapshots[surface_id] if capture_snapshot else None
+        if snapshot is not None and snapshot == cached_snapshot:
+            return {"probeId": probe_id, "cacheHit": True, "snapshotHash": snapshot}
+        payload = {
+            "probeId": probe_id,
+            "results": [{"criterionId": "1.3.1", "surfaceId": surface_id}],
+        }
+        if snapshot is not None:
+            payload["snapshotHash"] = snapshot
+        return payload
+
+    return fake_run_probe
+
+
+def test_run_reuses_cached_results_for_unchanged_surfaces(
+    package_tree, tmp_path, mocker
+):
+    keys = [("probe-axe", "home", "default"), ("probe-axe", "about", "default")]
+    mocker.patch.object(cli, "_iter_runs", side_effect=lambda *a, **k: iter(keys))
+    calls: list[dict[str, Any]] = []
+    snapshots = {"home": "h-home", "about": "h-about"}
+    mocker.patch.object(cli, "_run_probe", side_effect=_fake_runner(calls, snapshots))
+    cache_path = tmp_path / "results-cache.json"
+
+    first = cli.run({}, None, "http://127.0.0.1:3000", False, result_cache=cache_path)
+    snapshots["about"] = "h-about-2"
+    second = cli.run({}, None, "http://127.0.0.1:3000", False, result_cache=cache_path)
+
+    assert first["resultCache"]["misses"] == 2
+    assert second["resultCache"] == {"path": str(cache_path), "hits": 1, "misses": 1}
+    assert [call["cached"] for call in calls] == [None, None, "h-home", "h-about"]
+    assert second["runs"][0]["reused"]["snapshotHash"] == "h-home"
+    assert "reused" not in second["runs"][1]
+    assert second["results"] == first["results"]
+
+
+def test_run_bypasses_cache_for_traces_and_real_screen_reader(
+    package_tree, tmp_path, mocker
+):
+    keys = [("probe-real-sr", "home", "default"), ("probe-axe", "home", "default")]
+    mocker.patch.object(cli, "_iter_runs", side_effect=lambda *a, **k: iter(keys))
+    calls: list[dict[str, Any]] = []
+    mocker.patch.object(
+        cli, "_run_probe", side_effect=_fake_runner(calls, {"home": "h"})
+    )
+    cache_path = tmp_path / "results-cache.json"
+
+    cli.run({}, None, "http://127.0.0.1:3000", False, result_cache=cache_path)
+    traced = cli.run({}, None, "http://127.0.0.1:3000", True, result_cache=cache_path)
+
+    assert [call["capture"] for call in calls] == [False, True, False, False]
+    assert traced["resultCache"]["misses"] == 0
+
+
+@pytest.mark.parametrize("probe_id", ["probe-broken-links", "probe-console-errors"])
+def test_run_reruns_probes_outside_the_snapshot_when_cache_is_hot(
+    package_tree, tmp_path, mocker, probe_id
+):
+    keys = [(probe_id, "home", "default"), ("probe-axe", "home", "default")]
+    mocker.patch.object(cli, "_iter_runs", side_effect=lambda *a, **k: iter(keys))
+    calls: list[dict[str, Any]] = []
+    mocker.patch.object(
+        cli, "_run_probe", side_effect=_fake_runner(calls, {"home": "h"})
+    )
+    cache_path = tmp_path / "results-cache.json"
+
+    cli.run({}, None, "http://127.0.0.1:3000", False, result_cache=cache_path)
+    hot = cli.run({}, None, "http://127.0.0.1:3000", False, result_cache=cache_path)
+
+    assert [call["probeId"] for call in calls] == [probe_id, "probe-axe"] * 2
+    assert [call["capture"] for call in calls] == [False, True, False, True]
+    assert hot["resultCache"]["hits"] == 1
+    assert "reused" not in hot["runs"][0]
+    assert hot["runs"][1]["reused"]["snapshotHash"] == "h"
+
+
+def test_one_shot_probe_passes_snapshot_options_in_env(mocker):
+    mocker.patch.object(cli, "_NODE_MODULES", cli._PACKAGE_DIR)
+    captured: dict[str, Any] = {}
+
+    def fake_run(command, capture_output, text, check, env, cwd):
+        captured["env"] = env
+        return SimpleNamespace(
+            returncode=0,
+            stdout=json.dumps({"cacheHit": True, "snapshotHash": "h1"}),
+            stderr="",
+        )
+
+    mocker.patch("runtime_a11y.__main__.subprocess.run", side_effect=fake_run)
+
+    payload = cli._run_probe(
+        {},
+        "probe-axe",
+        "home",
+        "default",
+        "http://127.0.0.1:3000",
+        False,
+        capture_snapshot=True,
+        cached_snapshot="h1",
+    )
+
+    assert payload == {"cacheHit": True, "snapshotHash": "h1"}
+    assert captured["env"]["RUNTIME_A11Y_CAPTURE_SNAPSHOT"] == "1"
+    assert captured["env"]["RUNTIME_A11Y_CACHED_SNAPSHOT"] == "h1"
+
+
+def test_result_cache_flag_reaches_run(mocker, tmp_path):
+    config_path = tmp_path / "runtime.json"
+    config_path.write_text("{}", encoding="utf-8")
+    mocker.patch.object(cli, "load_validated_config", return_value={"baseUrl": "x"})
+    run = mocker.patch.object(cli, "run", return_value={"runs": []})
+    mocker.patch.object(cli, "_write_output")
+
+    cli.main(
+        [
+            "run-all",
+            "--config",
+            str(config_path),
+            "--result-cache",
+            str(tmp_path / "cache.json"),
+        ]
+    )
+
+    assert run.call_args.kwargs["result_cache"] == tmp_path / "cache.json"
@@ -0,0 +1,331 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+import shutil
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+import runtime_a11y.__main__ as cli
+from runtime_a11y._errors import EXIT_USAGE, ScriptError
+from runtime_a11y._runner import ProbeRunner, RunnerPool, RunnerResponse
+
+# A stand-in for ``index.mjs --serve`` that speaks the same JSON-lines protocol.
+# ``crash`` exits mid-request, ``garble`` answers with a non-JSON line, and
+# ``probe`` echoes the request plus the config the process currently holds.
+_FAKE_RUNNER = textwrap.dedent(
+    """
+    import json, os, sys
+
+    held_config = None
+    for line in sys.stdin:
+        request = json.loads(line)
+        if "config" in request:
+            held_config = request["config"]
+        op = request.get("op")
+        if op == "shutdown":
+            break
+        if op == "crash":
+            sys.stderr.write("runner blew up\\n")
+            sys.stderr.flush()
+            os._exit(3)
+        if op == "garble":
+            print("not json", flush=True)
+            continue
+        if op not in {"probe", "prerequisites", "calibration"}:
+            response = {"id": request["id"], "ok": False, "error": f"bad op {op}"}
+        else:
+            response = {
+                "id": request["id"],
+                "ok": True,
+                "payload": {
+                    "pid": os.getpid(),
+                    "configSent": "config" in request,
+                    "heldConfig": held_config,
+                    "request": request,
+                    **(request.get("payload") or {}),
+                },
+                "exitCode": request.get("exitCode", 0),
+                "stderr": request.get("stderr", ""),
+            }
+        print(json.dumps(response), flush=True)
+    """
+)
+
+
+@pytest.fixture()
+def fake_runner_command(tmp_path: Path) -> list[str]:
+    script = tmp_path / "fake_runner.py"
+    script.write_text(_FAKE_RUNNER, encoding="utf-8")
+    return [sys.executable, str(script)]
+
+
+def test_runner_sends_config_only_when_it_changes(fake_runner_command, tmp_path):
+    with ProbeRunner(fake_runner_command, cwd=tmp_path) as runner:
+        first = runner.request("probe", {"probeId": "probe-axe"}, config={"a": 1})
+        second = runner.request("probe", {"probeId": "probe-axe"}, config={"a": 1})
+        third = runner.request("probe", {"probeId": "probe-axe"}, config={"a": 2})
+
+    assert first.payload["configSent"] is True
+    assert second.payload["configSent"] is False
+    assert second.payload["heldConfig"] == {"a": 1}
+    assert third.payload["configSent"] is True
+    assert first.payload["pid"] == third.payload["pid"]
+    assert not runner.alive
+
+
+def test_runner_reports_crash_and_respawns(fake_runner_command, tmp_path, capsys):
+    with ProbeRunner(fake_runner_command, cwd=tmp_path) as runner:
+        before = runner.request("probe", {}, config={"a": 1}).payload["pid"]
+
+        with pytest.raises(ScriptError, match=r"exited during 'crash' \(code 3\)"):
+            runner.request("crash", {})
+        assert "runner blew up" in "\n".join(runner._stderr_tail)
+
+        after = runner.request("probe", {}, config={"a": 1}).payload
+
+    assert after["pid"] != before
+    # A respawned process holds no config, so it is sent again.
+    assert after["configSent"] is True
+
+
+def test_runner_restarts_a_process_that_died_between_requests(
+    fake_runner_command, tmp_path, capsys
+):
+    with ProbeRunner(fake_runner_command, cwd=tmp_path) as runner:
+        before = runner.request("probe", {}).payload["pid"]
+        runner._process.kill()
+        runner._process.wait()
+
+        after = runner.request("probe", {}).payload["pid"]
+
+    assert after != before
+    assert "restarting" in capsys.readouterr().err
+
+
+def test_runner_rejects_protocol_errors(fake_runner_command, tmp_path):
+    with ProbeRunner(fake_runner_command, cwd=tmp_path) as runner:
+        with pytest.raises(ScriptError, match="rejected 'bogus': bad op bogus"):
+            runner.request("bogus", {})
+        assert runner.alive
+
+        with pytest.raises(ScriptError, match="invalid output for 'garble'"):
+            runner.request("garble", {})
+        assert not runner.alive
+
+
+def test_runner_reports_missing_node_as_usage_error(tmp_path):
+    runner = ProbeRunner([str(tmp_path / "missing-node")], cwd=tmp_path)
+
+    with pytest.raises(ScriptError) as exc_info:
+        runner.request("probe", {})
+
+    assert exc_info.value.exit_code == EXIT_USAGE
+
+
+def test_runner_pool_reuses_idle_runners_and_closes_all(mocker):
+    created = []
+
+    def factory():
+        runner = mocker.MagicMock(spec=ProbeRunner)
+        created.append(runner)
+        return runner
+
+    pool = RunnerPool(factory)
+    with pool.acquire() as first:
+        with pool.acquire() as second:
+            assert first is not second
+    with pool.acquire() as reused:
+        assert reused in (first, second)
+    pool.close()
+
+    assert len(created) == 2
+    for runner in created:
+        runner.close.assert_called_once_with()
+
+
+def test_run_probe_interprets_persistent_runner_responses(
+    fake_runner_command, tmp_path, mocker
+):
+    mocker.patch.object(cli, "_NODE_MODULES", cli._PACKAGE_DIR)
+    with ProbeRunner(fake_runner_command, cwd=tmp_path) as runner:
+        clean = cli._run_probe(
+            {"surfaces": []},
+            "probe-axe",
+            "web",
+            "default",
+            "http://127.0.0.1:3000",
+            True,
+            runner=runner,
+        )
+        assert clean["request"] == {
+            "id": 1,
+            "op": "probe",
+            "probeId": "probe-axe",
+            "surfaceId": "web",
+            "state": "default",
+            "baseUrl": "http://127.0.0.1:3000",
+            "trace": True,
+            "captureSnapshot": False,
+            "cachedSnapshot": None,
+            "config": {"surfaces": []},
+        }
+        assert "operationalFailure" not in clean
+
+        mocker.patch.object(
+            runner,
+            "request",
+            wraps=lambda op, fields, config=None: ProbeRunner.request(
+                runner,
+                op,
+                {**fields, "exitCode": 1, "stderr": "cleanup unverified\n"},
+                config,
+            ),
+        )
+        failed = cli._run_probe(
+            {"surfaces": []},
+            "probe-real-sr",
+            "web",
+            "default",
+            "http://127.0.0.1:3000",
+            False,
+            runner=runner,
+        )
+
+    assert failed["operationalFailure"] == {
+        "probeId": "probe-real-sr",
+        "surfaceId": "web",
+        "state": "default",
+        "reason": "cleanup unverified",
+    }
+
+
+def test_calibration_helpers_use_persistent_runner(
+    fake_runner_command, tmp_path, mocker
+):
+    mocker.patch.object(cli, "_NODE_MODULES", cli._PACKAGE_DIR)
+    with ProbeRunner(fake_runner_command, cwd=tmp_path) as runner:
+        ready = cli._run_prerequisite_probe(
+            {"calibration": {}}, "http://127.0.0.1:3000", runner=runner
+        )
+        session = cli._run_calibration_session(
+            {"calibration": {}},
+            "http://127.0.0.1:3000",
+            "runs/one",
+            runner=runner,
+        )
+
+    assert ready["request"]["op"] == "prerequisites"
+    assert session["request"]["op"] == "calibration"
+    assert session["request"]["runRoot"] == "runs/one"
+    assert session["configSent"] is False
+
+
+@pytest.mark.parametrize(
+    ("helper", "message"),
+    [
+        ("_run_prerequisite_probe", "Calibration prerequisite probe failed: nope"),
+        ("_run_calibration_session", "Calibration failed: nope"),
+    ],
+)
+def test_calibration_helpers_raise_on_runner_failure(mocker, helper, message):
+    mocker.patch.object(cli, "_NODE_MODULES", cli._PACKAGE_DIR)
+    runner = mocker.MagicMock(spec=ProbeRunner)
+    runner.request.return_value = RunnerResponse(None, 1, "nope\n")
+    args = ({}, "http://127.0.0.1:3000")
+    if helper == "_run_calibration_session":
+        args = (*args, None)
+
+    with pytest.raises(ScriptError, match=message):
+        getattr(cli, helper)(*args, runner=runner)
+
+
+def test_run_with_persistent_runner_shares_and_closes_runners(mocker):
+    keys = [("probe-axe", f"s{index}", "default") for index in range(3)]
+    mocker.patch.object(cli, "_iter_runs", return_value=iter(keys))
+    runner = mocker.MagicMock(spec=ProbeRunner)
+    mocker.patch.object(cli, "_new_persistent_runner", return_value=runner)
+    run_probe = mocker.patch.object(
+        cli,
+        "_run_probe",
+        side_effect=lambda *args, runner: {"probeId": args[1], "results": []},
+    )
+
+    document = cli.run({}, None, "http://127.0.0.1:3000", False, persistent_runner=True)
+
+    assert len(document["runs"]) == 3
+    assert {call.kwargs["runner"] for call in run_probe.call_args_list} == {runner}
+    runner.close.assert_called_once_with()
+
+
+@pytest.mark.parametrize("prerequisite_only", [True, False])
+def test_run_calibration_closes_persistent_runner(
+    mocker, monkeypatch, tmp_path, prerequisite_only
+):
+    monkeypatch.setattr(cli, "_REPO_ROOT", tmp_path)
+    runner = mocker.MagicMock(spec=ProbeRunner)
+    mocker.patch.object(cli, "_new_persistent_runner", return_value=runner)
+    prerequisite = mocker.patch.object(
+        cli, "_run_prerequisite_probe", return_value={"ok": True}
+    )
+    session = mocker.patch.object(
+        cli,
+        "_run_calibration_session",
+        return_value={"aggregate": {"status": "successful"}},
+    )
+    config_path = tmp_path / "runtime.json"
+    config_path.write_text(
+        json.dumps(
+            {
+                "baseUrl": "http://127.0.0.1:3000",
+                "calibration": {"journeys": [{"id": "14399", "bugId": "14399"}]},
+            }
+        ),
+        encoding="utf-8",
+    )
+    out_path = (
+        tmp_path
+        / ".copilot-tracking"
+        / "accessibility"
+        / "local-runs"
+        / "persistent"
+        / "calibration-output.json"
+    )
+    argv = [
+        "run-calibration",
+        "--config",
+        str(config_path),
+        "--out",
+        str(out_path),
+        "--persistent-runner",
+    ]
+    if prerequisite_only:
+        argv.append("--prerequisite-only")
+
+    assert cli.main(argv) == 0
+
+    used = prerequisite if prerequisite_only else session
+    assert used.call_args.kwargs["runner"] is runner
+    runner.close.assert_called_once_with()
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node is not installed")
+def test_node_serve_mode_speaks_the_protocol(tmp_path):
+    with cli._new_persistent_runner() as runner:
+        with pytest.raises(ScriptError, match="Unknown runner op: bogus"):
+            runner.request("bogus", {})
+        response = runner.request(
+            "probe",
+            {"probeId": "probe-does-not-exist", "surfaceId": "web", "state": "default"},
+            config={"surfaces": []},
+        )
+        process = runner._process
+
+    assert response.payload is None
+    assert response.exit_code == 1
+    assert response.stderr
+    assert process.returncode == 0
@@ -0,0 +1,161 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+import scan
+
+_SITEMAP = """<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc> https://example.com/ </loc></url>
+  <url><loc>https://example.com/about</loc><lastmod>2026-01-01</lastmod></url>
+</urlset>
+"""
+
+
+def _raw(target: str) -> dict[str, object]:
+    return {
+        "url": target,
+        "violations": [
+            {"id": "image-alt", "impact": "critical", "nodes": [{"target": [target]}]}
+        ],
+        "passes": [{"id": "document-title"}],
+    }
+
+
+def _fake_scanner(command, capture_output, text, check):
+    targets = command[command.index("--stdout") + 1 :]
+    return SimpleNamespace(
+        stdout=json.dumps([_raw(target) for target in targets]), stderr=""
+    )
+
+
+def test_given_targets_file_when_loaded_then_skips_blanks_and_comments(
+    tmp_path: Path,
+) -> None:
+    path = tmp_path / "targets.txt"
+    path.write_text(
+        "# pages\nhttps://example.com\n\n  ./page.html  \n", encoding="utf-8"
+    )
+
+    assert scan.load_targets(path) == ["https://example.com", "./page.html"]
+
+
+def test_given_sitemap_when_loaded_then_returns_loc_entries(tmp_path: Path) -> None:
+    path = tmp_path / "sitemap.xml"
+    path.write_text(_SITEMAP, encoding="utf-8")
+
+    assert scan.load_sitemap(path) == [
+        "https://example.com/",
+        "https://example.com/about",
+    ]
+
+
+@pytest.mark.parametrize(
+    ("loader", "content", "message"),
+    [
+        (scan.load_targets, "# nothing\n", "lists no targets"),
+        (scan.load_targets, "--chromedriver-path=/tmp/x\n", "must not start"),
+        (scan.load_sitemap, "<urlset/>", "lists no <loc> entries"),
+        (scan.load_sitemap, "<urlset>", "Cannot read sitemap"),
+    ],
+)
+def test_given_unusable_target_source_when_loaded_then_raises_usage_error(
+    tmp_path: Path, loader, content: str, message: str
+) -> None:
+    path = tmp_path / "targets"
+    path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(scan.ScriptError, match=message) as exc_info:
+        loader(path)
+
+    assert exc_info.value.exit_code == scan.EXIT_USAGE
+
+
+def test_given_batch_when_scanned_then_uses_one_session_and_normalizes_each() -> None:
+    targets = ["https://example.com/a", "https://example.com/b"]
+    with patch("scan.subprocess.run", side_effect=_fake_scanner) as mock_run:
+        results = scan.scan_batch(targets)
+
+    assert mock_run.call_count == 1
+    command = mock_run.call_args.args[0]
+    assert command[:4] == ["npx", "--yes", scan.AXE_CLI, "--stdout"]
+    assert command[4:] == targets
+    assert results == [scan.normalize_results(_raw(t), t) for t in targets]
+
+
+@pytest.mark.parametrize("stdout", ['{"violations": []}', "[{}]"])
+def test_given_mismatched_batch_payload_when_scanned_then_raises(stdout: str) -> None:
+    with patch("scan.subprocess.run") as mock_run:
+        mock_run.return_value = SimpleNamespace(stdout=stdout, stderr="")
+        with pytest.raises(scan.ScriptError, match="batch of 2 targets"):
+            scan.scan_batch(["a.html", "b.html"])
+
+
+def test_given_many_targets_when_batch_scanned_then_bounds_sessions_in_order() -> None:
+    targets = [f"https://example.com/{index}" for index in range(7)]
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def slow_scanner(command, capture_output, text, check):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.02)
+        with lock:
+            active -= 1
+        return _fake_scanner(command, capture_output, text, check)
+
+    with patch("scan.subprocess.run", side_effect=slow_scanner) as mock_run:
+        results = list(scan.iter_batch_scan(targets, batch_size=3, jobs=2))
+
+    assert mock_run.call_count == 3
+    assert peak <= 2
+    assert [result["target"] for result in results] == targets
+
+
+def test_given_targets_file_when_main_runs_then_writes_jsonl(tmp_path: Path) -> None:
+    targets_file = tmp_path / "targets.txt"
+    targets_file.write_text("https://example.com/a\n./b.html\n", encoding="utf-8")
+    out = tmp_path / "nested" / "results.jsonl"
+
+    with patch("scan.subprocess.run", side_effect=_fake_scanner):
+        exit_code = scan.main(
+            ["--targets-file", str(targets_file), "--output", str(out)]
+        )
+
+    assert exit_code == scan.EXIT_SUCCESS
+    lines = out.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["target"] for line in lines] == [
+        "https://example.com/a",
+        "./b.html",
+    ]
+    assert json.loads(lines[0])["summary"]["violations"] == 1
+
+
+def test_given_failing_batch_when_main_runs_then_returns_error_code(
+    tmp_path: Path, capsys
+) -> None:
+    sitemap = tmp_path / "sitemap.xml"
+    sitemap.write_text(_SITEMAP, encoding="utf-8")
+
+    with patch("scan.subprocess.run", side_effect=FileNotFoundError("npx")):
+        exit_code = scan.main(["--sitemap", str(sitemap)])
+
+    assert exit_code == scan.EXIT_USAGE
+    assert "Error:" in capsys.readouterr().err
+
+
+def test_given_target_and_batch_source_when_parsed_then_rejects_both() -> None:
+    with pytest.raises(SystemExit):
+        scan.create_parser().parse_args(["https://example.com", "--sitemap", "x"])
@@ -27,6 +27,12 @@
 .PARAMETER Resolution
     Output resolution in WIDTHxHEIGHT format.
 
+.PARAMETER Jobs
+    Maximum number of segments rendered at once.
+
+.PARAMETER CacheDir
+    Directory that keeps rendered segments for reuse across runs.
+
 .EXAMPLE
     ./Invoke-AssembleVideo.ps1 -ManifestPath examples/segments.yml -OutputPath ./output/demo.mp4
 #>
@@ -43,7 +49,13 @@ param(
     [int]$Fps,
 
     [Parameter(Mandatory = $false)]
-    [string]$Resolution
+    [string]$Resolution,
+
+    [Parameter(Mandatory = $false)]
+    [int]$Jobs,
+
+    [Parameter(Mandatory = $false)]
+    [string]$CacheDir
 )
 
 $ErrorActionPreference = 'Stop'
@@ -89,6 +101,8 @@ if ($MyInvocation.InvocationName -ne '.') {
         if ($OutputPath) { $PythonArgs += '--output', $OutputPath }
         if ($PSBoundParameters.ContainsKey('Fps')) { $PythonArgs += '--fps', $Fps }
         if ($Resolution) { $PythonArgs += '--resolution', $Resolution }
+        if ($PSBoundParameters.ContainsKey('Jobs')) { $PythonArgs += '--jobs', $Jobs }
+        if ($CacheDir) { $PythonArgs += '--cache-dir', $CacheDir }
 
         & $python $script @PythonArgs
         if ($LASTEXITCODE -ne 0) {
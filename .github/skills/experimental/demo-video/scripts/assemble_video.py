@@ -7,16 +7,24 @@ This script reads a YAML manifest describing ordered visual segments (still
 images or motion clips) and matching narration WAV files. Each segment is
 normalized into a short MP4 clip, then concatenated into a final output MP4
 with the narration audio track.
+
+Segments render concurrently in a bounded worker pool. With a cache directory,
+each normalized clip is stored under a key derived from its inputs and render
+settings, so unchanged segments are reused on later runs instead of re-encoded.
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import hashlib
 import logging
+import os
 import shutil
 import subprocess
 import sys
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -26,6 +34,14 @@ EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
 EXIT_ERROR = 2
 
+# Worker pool bound. Each FFmpeg encode is multi-threaded already, so a few
+# concurrent segments saturate a machine.
+MAX_RENDER_JOBS = 4
+# Bump when _render_segment changes its encoder arguments so cached clips
+# rendered with the old arguments are not reused.
+SEGMENT_CACHE_VERSION = "1"
+HASH_CHUNK_BYTES = 1024 * 1024
+
 
 class ManifestError(ValueError):
     """Raised for invalid or incomplete manifest definitions."""
@@ -56,6 +72,19 @@ def create_parser() -> argparse.ArgumentParser:
         "--resolution",
         help="Output resolution in WIDTHxHEIGHT format, for example 1280x720",
     )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        help=(
+            "Maximum segments to render at once "
+            f"(default: CPU count, at most {MAX_RENDER_JOBS})"
+        ),
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help="Directory that keeps rendered segments for reuse across runs",
+    )
     parser.add_argument(
         "-v",
         "--verbose",
@@ -349,6 +378,96 @@ def _render_segment(
     _run_ffmpeg(command)
 
 
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        while chunk := handle.read(HASH_CHUNK_BYTES):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _segment_cache_key(segment: dict[str, Any], resolution: str, fps: int) -> str:
+    """Build the content-addressed cache key for a normalized segment."""
+    source = segment["visual"] if segment.get("visual") is not None else segment["clip"]
+    parts = [
+        SEGMENT_CACHE_VERSION,
+        str(segment["type"]),
+        _file_digest(Path(source)),
+        _file_digest(Path(segment["narration"])),
+        f"{segment['duration']}",
+        resolution,
+        str(fps),
+        _build_filter_string(resolution, fps),
+    ]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def _normalize_segment(
+    *,
+    index: int,
+    segment: dict[str, Any],
+    resolution: str,
+    fps: int,
+    ffmpeg_path: str,
+    work_dir: Path,
+    cache_dir: Path | None,
+) -> Path:
+    """Return a normalized MP4 for one segment, reusing a cached render if any."""
+    if cache_dir is None:
+        output_path = work_dir / f"segment-{index:02d}.mp4"
+        logging.debug(
+            "Rendering segment #%d (duration=%.3fs)", index, float(segment["duration"])
+        )
+        _render_segment(
+            segment=segment,
+            output_path=output_path,
+            resolution=resolution,
+            fps=fps,
+            ffmpeg_path=ffmpeg_path,
+        )
+        return output_path
+
+    cached_path = cache_dir / f"{_segment_cache_key(segment, resolution, fps)}.mp4"
+    if cached_path.is_file():
+        logging.debug("Reusing cached segment #%d: %s", index, cached_path.name)
+        return cached_path
+
+    logging.debug(
+        "Rendering segment #%d (duration=%.3fs)", index, float(segment["duration"])
+    )
+    # Render beside the cache entry and rename it into place, so an interrupted
+    # encode never leaves a truncated clip under a valid key.
+    descriptor, temp_name = tempfile.mkstemp(
+        prefix=f".{cached_path.stem}-", suffix=".mp4", dir=str(cache_dir)
+    )
+    os.close(descriptor)
+    try:
+        _render_segment(
+            segment=segment,
+            output_path=Path(temp_name),
+            resolution=resolution,
+            fps=fps,
+            ffmpeg_path=ffmpeg_path,
+        )
+        os.replace(temp_name, cached_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(temp_name)
+        raise
+    return cached_path
+
+
+def _collect_results(futures: list[Future[Any]]) -> list[Any]:
+    """Return future results in order, cancelling queued work on the first error."""
+    try:
+        return [future.result() for future in futures]
+    except BaseException:
+        for future in futures:
+            future.cancel()
+        raise
+
+
 def _run_ffmpeg(command: list[str]) -> None:
     """Run an FFmpeg command and raise a clear error on failure."""
     logging.debug("Running FFmpeg: %s", " ".join(command))
@@ -367,8 +486,15 @@ def assemble_video(
     output_path: Path | None,
     fps: int | None,
     resolution: str | None,
+    jobs: int | None = None,
+    cache_dir: Path | None = None,
 ) -> Path:
-    """Assemble the final MP4 from the manifest."""
+    """Assemble the final MP4 from the manifest.
+
+    Narration probes and segment renders run on up to ``jobs`` worker threads.
+    When ``cache_dir`` is set, rendered segments are kept there and reused by
+    later runs whose inputs and render settings are unchanged.
+    """
     ffmpeg_path = _require_command("ffmpeg")
 
     manifest_data = _read_manifest(manifest_path)
@@ -391,55 +517,71 @@ def assemble_video(
     selected_resolution = resolution or config.get("resolution") or "1280x720"
     _validate_resolution(selected_resolution)
 
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    selected_jobs = (
+        jobs if jobs is not None else min(MAX_RENDER_JOBS, os.cpu_count() or 1)
+    )
+    if selected_jobs <= 0:
+        raise ManifestError(f"Jobs must be greater than zero, got {selected_jobs}")
 
-    normalized_paths: list[Path] = []
-    with tempfile.TemporaryDirectory(
-        prefix="demo-video-", dir=str(output_path.parent)
-    ) as temp_dir_name:
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    if cache_dir is not None:
+        cache_dir = cache_dir.resolve()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+
+    resolved_segments: list[dict[str, Any]] = []
+    for segment in segments:
+        visual_source = segment.get("visual")
+        clip_source = segment.get("clip")
+        narration_path = _resolve_path(segment["narration"], base_dir=manifest_dir)
+        if not narration_path.is_file():
+            raise ManifestError(f"Narration file not found: {narration_path}")
+
+        segment_data = dict(segment)
+        segment_data["narration"] = str(narration_path)
+        if visual_source is not None:
+            visual_path = _resolve_path(visual_source, base_dir=manifest_dir)
+            if not visual_path.is_file():
+                raise ManifestError(f"Visual file not found: {visual_path}")
+            segment_data["visual"] = str(visual_path)
+        else:
+            clip_path = _resolve_path(clip_source, base_dir=manifest_dir)
+            if not clip_path.is_file():
+                raise ManifestError(f"Clip file not found: {clip_path}")
+            segment_data["clip"] = str(clip_path)
+        resolved_segments.append(segment_data)
+
+    with (
+        tempfile.TemporaryDirectory(
+            prefix="demo-video-", dir=str(output_path.parent)
+        ) as temp_dir_name,
+        ThreadPoolExecutor(max_workers=selected_jobs) as pool,
+    ):
         temp_dir = Path(temp_dir_name)
 
-        for index, segment in enumerate(segments, start=1):
-            visual_source = segment.get("visual")
-            clip_source = segment.get("clip")
-            narration_path = _resolve_path(segment["narration"], base_dir=manifest_dir)
-            if not narration_path.is_file():
-                raise ManifestError(f"Narration file not found: {narration_path}")
-
-            if visual_source is not None:
-                visual_path = _resolve_path(visual_source, base_dir=manifest_dir)
-                if not visual_path.is_file():
-                    raise ManifestError(f"Visual file not found: {visual_path}")
-            else:
-                clip_path = _resolve_path(clip_source, base_dir=manifest_dir)
-                if not clip_path.is_file():
-                    raise ManifestError(f"Clip file not found: {clip_path}")
-
-            if segment.get("duration") is None:
-                duration = _probe_duration(narration_path)
-            else:
-                duration = segment["duration"]
-            logging.debug(
-                "Rendering segment #%d (duration=%.3fs)", index, float(duration)
-            )
-
-            normalized_path = temp_dir / f"segment-{index:02d}.mp4"
-            segment_data = dict(segment)
-            segment_data["narration"] = str(narration_path)
-            segment_data["duration"] = duration
-            if visual_source is not None:
-                segment_data["visual"] = str(visual_path)
-            else:
-                segment_data["clip"] = str(clip_path)
-
-            _render_segment(
-                segment=segment_data,
-                output_path=normalized_path,
-                resolution=selected_resolution,
-                fps=int(selected_fps),
-                ffmpeg_path=ffmpeg_path,
-            )
-            normalized_paths.append(normalized_path)
+        probes = {
+            index: pool.submit(_probe_duration, Path(segment["narration"]))
+            for index, segment in enumerate(resolved_segments)
+            if segment.get("duration") is None
+        }
+        durations = _collect_results(list(probes.values()))
+        for index, duration in zip(probes, durations):
+            resolved_segments[index]["duration"] = duration
+
+        normalized_paths: list[Path] = _collect_results(
+            [
+                pool.submit(
+                    _normalize_segment,
+                    index=index,
+                    segment=segment,
+                    resolution=selected_resolution,
+                    fps=int(selected_fps),
+                    ffmpeg_path=ffmpeg_path,
+                    work_dir=temp_dir,
+                    cache_dir=cache_dir,
+                )
+                for index, segment in enumerate(resolved_segments, start=1)
+            ]
+        )
 
         concat_list_path = temp_dir / "concat.txt"
         with concat_list_path.open("w", encoding="utf-8") as handle:
@@ -476,6 +618,8 @@ def main() -> int:
             output_path=args.output,
             fps=args.fps,
             resolution=args.resolution,
+            jobs=args.jobs,
+            cache_dir=args.cache_dir,
         )
     except KeyboardInterrupt:
         print("Interrupted by user", file=sys.stderr)
@@ -26,6 +26,8 @@ Describe 'Invoke-AssembleVideo.ps1 wrapper' -Tag 'Unit' {
         $scriptContent | Should -Match '--output'
         $scriptContent | Should -Match '--fps'
         $scriptContent | Should -Match '--resolution'
+        $scriptContent | Should -Match '--jobs'
+        $scriptContent | Should -Match '--cache-dir'
     }
 
     It 'Defines the expected wrapper parameters' {
@@ -34,5 +36,7 @@ Describe 'Invoke-AssembleVideo.ps1 wrapper' -Tag 'Unit' {
         $scriptContent | Should -Match '\[string\]\$OutputPath'
         $scriptContent | Should -Match '\[int\]\$Fps'
         $scriptContent | Should -Match '\[string\]\$Resolution'
+        $scriptContent | Should -Match '\[int\]\$Jobs'
+        $scriptContent | Should -Match '\[string\]\$CacheDir'
     }
 }
@@ -4,6 +4,10 @@
 
 from __future__ import annotations
 
+import shutil
+import subprocess
+import threading
+from pathlib import Path
 from types import SimpleNamespace
 
 import assemble_video
@@ -350,3 +354,327 @@ class TestAssembleVideo:
         args, kwargs = run_mock.call_args
         assert isinstance(args[0], list)
         assert kwargs.get("shell") is not True
+
+
+def _write_manifest(tmp_path, count, *, duration=True):
+    lines = ["segments:"]
+    for index in range(1, count + 1):
+        (tmp_path / f"frame-{index}.png").write_bytes(f"png-{index}".encode())
+        (tmp_path / f"narration-{index}.wav").write_bytes(f"wav-{index}".encode())
+        lines += [
+            "  - type: frame",
+            f"    visual: frame-{index}.png",
+            f"    narration: narration-{index}.wav",
+        ]
+        if duration:
+            lines.append("    duration: 1.5")
+    manifest_path = tmp_path / "segments.yml"
+    manifest_path.write_text("\n".join(lines), encoding="utf-8")
+    return manifest_path
+
+
+@pytest.fixture()
+def recorded_renders(mocker, mock_ffmpeg_dependencies):
+    renders = []
+    concat_lists = []
+
+    def fake_render_segment(*, segment, output_path, resolution, fps, ffmpeg_path):
+        renders.append(Path(segment["visual"]).name)
+        output_path.write_bytes(Path(segment["visual"]).read_bytes())
+
+    def fake_run_ffmpeg(command):
+        concat_lists.append(Path(command[command.index("-i") + 1]).read_text())
+
+    mocker.patch.object(
+        assemble_video, "_render_segment", side_effect=fake_render_segment
+    )
+    mocker.patch.object(assemble_video, "_run_ffmpeg", side_effect=fake_run_ffmpeg)
+    return renders, concat_lists
+
+
+class TestSegmentRenderPool:
+    """Tests for concurrent probing and rendering of manifest segments."""
+
+    def test_given_jobs_when_assemble_video_then_segments_render_concurrently(
+        self, tmp_path, mocker, mock_ffmpeg_dependencies
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 2)
+        barrier = threading.Barrier(2, timeout=5)
+        mocker.patch.object(
+            assemble_video,
+            "_render_segment",
+            side_effect=lambda **kwargs: barrier.wait(),
+        )
+
+        # Act
+        assemble_video.assemble_video(
+            manifest_path=manifest_path,
+            output_path=tmp_path / "demo.mp4",
+            fps=None,
+            resolution=None,
+            jobs=2,
+        )
+
+        # Assert
+        assert not barrier.broken
+
+    def test_given_many_segments_when_assemble_video_then_concat_keeps_order(
+        self, tmp_path, mocker, recorded_renders
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 5, duration=False)
+        probe_mock = mocker.patch.object(
+            assemble_video, "_probe_duration", return_value=2.0
+        )
+        _, concat_lists = recorded_renders
+
+        # Act
+        assemble_video.assemble_video(
+            manifest_path=manifest_path,
+            output_path=tmp_path / "demo.mp4",
+            fps=None,
+            resolution=None,
+            jobs=3,
+        )
+
+        # Assert
+        assert probe_mock.call_count == 5
+        listed = [line.split("/")[-1] for line in concat_lists[0].splitlines()]
+        assert listed == [f"segment-{index:02d}.mp4'" for index in range(1, 6)]
+
+    def test_given_failing_segment_when_assemble_video_then_raises_manifest_error(
+        self, tmp_path, mocker, mock_ffmpeg_dependencies
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 3)
+
+        def fake_render_segment(*, segment, output_path, resolution, fps, ffmpeg_path):
+            if segment["visual"].endswith("frame-2.png"):
+                raise assemble_video.ManifestError("FFmpeg command failed")
+
+        mocker.patch.object(
+            assemble_video, "_render_segment", side_effect=fake_render_segment
+        )
+
+        # Act / Assert
+        with pytest.raises(assemble_video.ManifestError, match="FFmpeg command"):
+            assemble_video.assemble_video(
+                manifest_path=manifest_path,
+                output_path=tmp_path / "demo.mp4",
+                fps=None,
+                resolution=None,
+                jobs=2,
+            )
+
+    def test_given_non_positive_jobs_when_assemble_video_then_raises(
+        self, tmp_path, mock_ffmpeg_dependencies
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 1)
+
+        # Act / Assert
+        with pytest.raises(assemble_video.ManifestError, match="Jobs must be"):
+            assemble_video.assemble_video(
+                manifest_path=manifest_path,
+                output_path=tmp_path / "demo.mp4",
+                fps=None,
+                resolution=None,
+                jobs=0,
+            )
+
+
+class TestSegmentCache:
+    """Tests for the content-addressed normalized segment cache."""
+
+    def test_given_unchanged_inputs_when_rerun_then_cached_segments_reused(
+        self, tmp_path, recorded_renders
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 3)
+        cache_dir = tmp_path / "cache"
+        renders, concat_lists = recorded_renders
+        assemble = lambda: assemble_video.assemble_video(  # noqa: E731
+            manifest_path=manifest_path,
+            output_path=tmp_path / "demo.mp4",
+            fps=None,
+            resolution=None,
+            cache_dir=cache_dir,
+        )
+        assemble()
+        renders.clear()
+
+        # Act
+        assemble()
+
+        # Assert
+        assert renders == []
+        assert concat_lists[0] == concat_lists[1]
+        assert len(list(cache_dir.glob("*.mp4"))) == 3
+        assert not list(cache_dir.glob(".*"))
+
+    def test_given_one_narration_changed_when_rerun_then_only_that_segment_renders(
+        self, tmp_path, recorded_renders
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 3)
+        cache_dir = tmp_path / "cache"
+        renders, concat_lists = recorded_renders
+        assemble = lambda: assemble_video.assemble_video(  # noqa: E731
+            manifest_path=manifest_path,
+            output_path=tmp_path / "demo.mp4",
+            fps=None,
+            resolution=None,
+            cache_dir=cache_dir,
+        )
+        assemble()
+        renders.clear()
+        (tmp_path / "narration-2.wav").write_bytes(b"new narration")
+
+        # Act
+        assemble()
+
+        # Assert
+        assert renders == ["frame-2.png"]
+        first, second = (listing.splitlines() for listing in concat_lists)
+        assert [first[0], first[2]] == [second[0], second[2]]
+        assert first[1] != second[1]
+
+    @pytest.mark.parametrize(
+        "change",
+        [{"fps": 30}, {"resolution": "640x360"}],
+    )
+    def test_given_render_settings_changed_when_rerun_then_segments_rerender(
+        self, tmp_path, recorded_renders, change
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 2)
+        cache_dir = tmp_path / "cache"
+        renders, _ = recorded_renders
+        settings = {"fps": None, "resolution": None}
+        assemble_video.assemble_video(
+            manifest_path=manifest_path,
+            output_path=tmp_path / "demo.mp4",
+            cache_dir=cache_dir,
+            **settings,
+        )
+        renders.clear()
+
+        # Act
+        assemble_video.assemble_video(
+            manifest_path=manifest_path,
+            output_path=tmp_path / "demo.mp4",
+            cache_dir=cache_dir,
+            **{**settings, **change},
+        )
+
+        # Assert
+        assert sorted(renders) == ["frame-1.png", "frame-2.png"]
+
+    def test_given_render_failure_when_cache_dir_then_no_partial_entry_remains(
+        self, tmp_path, mocker, mock_ffmpeg_dependencies
+    ):
+        # Arrange
+        manifest_path = _write_manifest(tmp_path, 1)
+        cache_dir = tmp_path / "cache"
+
+        def fake_render_segment(*, segment, output_path, resolution, fps, ffmpeg_path):
+            output_path.write_bytes(b"partial")
+            raise assemble_video.ManifestError("FFmpeg command failed")
+
+        mocker.patch.object(
+            assemble_video, "_render_segment", side_effect=fake_render_segment
+        )
+
+        # Act
+        with pytest.raises(assemble_video.ManifestError):
+            assemble_video.assemble_video(
+                manifest_path=manifest_path,
+                output_path=tmp_path / "demo.mp4",
+                fps=None,
+                resolution=None,
+                cache_dir=cache_dir,
+            )
+
+        # Assert
+        assert list(cache_dir.iterdir()) == []
+
+
+@pytest.mark.skipif(
+    shutil.which("ffmpeg") is None or shutil.which("ffprobe") is None,
+    reason="FFmpeg is not installed",
+)
+class TestAssembleVideoWithFfmpeg:
+    """End-to-end assembly against a tiny FFmpeg-generated fixture."""
+
+    @pytest.fixture()
+    def testsrc_manifest(self, tmp_path):
+        ffmpeg = shutil.which("ffmpeg")
+        sources = {
+            "clip.mp4": ["-f", "lavfi", "-i", "testsrc=size=64x48:rate=8:d=0.5"],
+            "frame.png": ["-f", "lavfi", "-i", "testsrc=size=64x48", "-frames:v", "1"],
+            "one.wav": ["-f", "lavfi", "-i", "sine=frequency=440:duration=0.5"],
+            "two.wav": ["-f", "lavfi", "-i", "sine=frequency=660:duration=0.5"],
+        }
+        for name, args in sources.items():
+            subprocess.run(
+                [ffmpeg, "-v", "error", "-y", *args, str(tmp_path / name)],
+                check=True,
+            )
+        manifest_path = tmp_path / "segments.yml"
+        manifest_path.write_text(
+            "resolution: 64x48\n"
+            "fps: 8\n"
+            "segments:\n"
+            "  - type: frame\n"
+            "    visual: frame.png\n"
+            "    narration: one.wav\n"
+            "  - type: clip\n"
+            "    clip: clip.mp4\n"
+            "    narration: two.wav\n",
+            encoding="utf-8",
+        )
+        return manifest_path
+
+    def test_given_testsrc_segments_when_rerun_with_cache_then_only_edit_rerenders(
+        self, tmp_path, mocker, testsrc_manifest
+    ):
+        # Arrange
+        cache_dir = tmp_path / "cache"
+        output_path = tmp_path / "demo.mp4"
+        render_spy = mocker.spy(assemble_video, "_render_segment")
+        assemble = lambda: assemble_video.assemble_video(  # noqa: E731
+            manifest_path=testsrc_manifest,
+            output_path=output_path,
+            fps=None,
+            resolution=None,
+            jobs=2,
+            cache_dir=cache_dir,
+        )
+        assemble()
+        first_duration = assemble_video._probe_duration(output_path)
+        subprocess.run(
+            [
+                shutil.which("ffmpeg"),
+                "-v",
+                "error",
+                "-y",
+                "-f",
+                "lavfi",
+                "-i",
+                "sine=frequency=880:duration=0.5",
+                str(tmp_path / "two.wav"),
+            ],
+            check=True,
+        )
+
+        # Act
+        assemble()
+
+        # Assert
+        assert render_spy.call_count == 3
+        assert first_duration == pytest.approx(1.0, abs=0.2)
+        assert assemble_video._probe_duration(output_path) == pytest.approx(
+            first_duration, abs=0.1
+        )
+        assert len(list(cache_dir.glob("*.mp4"))) == 3
@@ -1140,6 +1140,45 @@ def discover_slides(content_dir: Path) -> list[tuple[int, Path]]:
     return sorted(slides, key=lambda x: x[0])
 
 
+def new_presentation(style: dict, template: str | Path | None = None):
+    """Create an empty presentation sized and tagged from style.yaml.
+
+    With *template*, the template's masters, layouts, and theme are kept and
+    its slides are removed; dimensions are only overridden when style.yaml
+    sets them explicitly. Without a template, a blank presentation uses the
+    style dimensions or the 16:9 defaults.
+    """
+    dims = style.get("dimensions", {})
+    width = dims.get("width_inches", 13.333)
+    height = dims.get("height_inches", 7.5)
+
+    if template:
+        prs = Presentation(str(template))
+        # Only override dimensions when explicitly set in style.yaml
+        if "dimensions" in style:
+            prs.slide_width = Inches(width)
+            prs.slide_height = Inches(height)
+
+        # Remove existing slides from the template — keep only theme/layouts
+        while len(prs.slides) > 0:
+            rId = prs.slides._sldIdLst[0].rId
+            prs.part.drop_rel(rId)
+            prs.slides._sldIdLst.remove(prs.slides._sldIdLst[0])
+    else:
+        prs = Presentation()
+        prs.slide_width = Inches(width)
+        prs.slide_height = Inches(height)
+
+    # Apply presentation metadata from style.yaml
+    metadata = style.get("metadata", {})
+    if metadata:
+        props = prs.core_properties
+        for key, value in metadata.items():
+            if hasattr(props, key):
+                setattr(props, key, value)
+    return prs
+
+
 def main():
     """CLI entry point for building a PowerPoint deck from YAML."""
     parser = argparse.ArgumentParser(
@@ -1251,31 +1290,9 @@ def main():
     output_path = Path(args.output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    dims = style.get("dimensions", {})
-    width = dims.get("width_inches", 13.333)
-    height = dims.get("height_inches", 7.5)
-
     if args.template:
         # Template build: open template and preserve its theme/layouts
-        prs = Presentation(args.template)
-        # Only override dimensions when explicitly set in style.yaml
-        if "dimensions" in style:
-            prs.slide_width = Inches(width)
-            prs.slide_height = Inches(height)
-
-        # Remove existing slides from the template — keep only theme/layouts
-        while len(prs.slides) > 0:
-            rId = prs.slides._sldIdLst[0].rId
-            prs.part.drop_rel(rId)
-            prs.slides._sldIdLst.remove(prs.slides._sldIdLst[0])
-
-        # Apply presentation metadata from style.yaml
-        metadata = style.get("metadata", {})
-        if metadata:
-            props = prs.core_properties
-            for key, value in metadata.items():
-                if hasattr(props, key):
-                    setattr(props, key, value)
+        prs = new_presentation(style, args.template)
 
         slides_data = discover_slides(content_dir)
         if not slides_data:
@@ -1329,17 +1346,7 @@ def main():
                 )
     else:
         # Full build
-        prs = Presentation()
-        prs.slide_width = Inches(width)
-        prs.slide_height = Inches(height)
-
-        # Apply presentation metadata from style.yaml
-        metadata = style.get("metadata", {})
-        if metadata:
-            props = prs.core_properties
-            for key, value in metadata.items():
-                if hasattr(props, key):
-                    setattr(props, key, value)
+        prs = new_presentation(style)
 
         slides_data = discover_slides(content_dir)
         if not slides_data:
@@ -22,6 +22,7 @@ import tempfile
 from pathlib import Path
 
 from pdf_safety import PdfRenderError, PdfSafetyError, safe_open_pdf
+from soffice_server import LibreOfficeServer, LibreOfficeServerError
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -87,16 +88,28 @@ def find_libreoffice() -> str | None:
     return None
 
 
-def convert_pptx_to_pdf(pptx_path: Path, output_dir: Path) -> Path:
+def convert_pptx_to_pdf(
+    pptx_path: Path,
+    output_dir: Path,
+    server: LibreOfficeServer | None = None,
+) -> Path:
     """Convert a PPTX file to PDF using LibreOffice headless mode.
 
     Args:
         pptx_path: Path to the input PPTX file.
         output_dir: Directory where the PDF will be written.
+        server: Optional persistent LibreOffice server. When it fails, the
+            conversion falls back to a one-shot ``soffice`` subprocess.
 
     Returns:
         Path to the generated PDF file.
     """
+    if server is not None:
+        try:
+            return server.convert(pptx_path, output_dir)
+        except LibreOfficeServerError as e:
+            logger.warning("%s; falling back to one-shot conversion", e)
+
     soffice = find_libreoffice()
     if not soffice:
         logger.error("LibreOffice is required for PPTX-to-PDF conversion.")
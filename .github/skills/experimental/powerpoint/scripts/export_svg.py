@@ -7,9 +7,14 @@ Converts a PPTX file to individual SVG images via an intermediate PDF
 generated by LibreOffice headless mode. Each slide is rendered to SVG
 using PyMuPDF's vector export.
 
+Multi-deck exports reuse one persistent headless LibreOffice instance
+(see soffice_server.py) and fall back to one-shot conversion when it is
+unavailable.
+
 Usage:
     python export_svg.py --input presentation.pptx --output-dir svg/
     python export_svg.py --input presentation.pptx --output-dir svg/ --slides 1,3,5
+    python export_svg.py --inputs a.pptx b.pptx --output-dir svg/
 """
 
 from __future__ import annotations
@@ -31,6 +36,7 @@ from pptx_utils import (
     configure_logging,
     parse_slide_filter,
 )
+from soffice_server import LibreOfficeServer, LibreOfficeServerError
 
 logger = logging.getLogger(__name__)
 
@@ -48,8 +54,13 @@ def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Export PowerPoint slides to SVG images"
     )
-    parser.add_argument(
-        "--input", required=True, type=Path, help="Input PPTX file path"
+    inputs = parser.add_mutually_exclusive_group(required=True)
+    inputs.add_argument("--input", type=Path, help="Input PPTX file path")
+    inputs.add_argument(
+        "--inputs",
+        nargs="+",
+        type=Path,
+        help="Multiple input PPTX files; each deck exports to OUTPUT_DIR/<stem>/",
     )
     parser.add_argument(
         "--output-dir",
@@ -61,6 +72,11 @@ def create_parser() -> argparse.ArgumentParser:
         "--slides",
         help="Comma-separated slide numbers to export (1-based, default: all)",
     )
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Disable the persistent LibreOffice server for multi-deck exports",
+    )
     parser.add_argument(
         "-v", "--verbose", action="store_true", help="Enable verbose output"
     )
@@ -98,16 +114,28 @@ def find_libreoffice() -> str | None:
     return None
 
 
-def convert_pptx_to_pdf(pptx_path: Path, output_dir: Path) -> Path:
+def convert_pptx_to_pdf(
+    pptx_path: Path,
+    output_dir: Path,
+    server: LibreOfficeServer | None = None,
+) -> Path:
     """Convert a PPTX file to PDF using LibreOffice headless mode.
 
     Args:
         pptx_path: Path to the input PPTX file.
         output_dir: Directory where the PDF will be written.
+        server: Optional persistent LibreOffice server. When it fails, the
+            conversion falls back to a one-shot ``soffice`` subprocess.
 
     Returns:
         Path to the generated PDF file.
     """
+    if server is not None:
+        try:
+            return server.convert(pptx_path, output_dir)
+        except LibreOfficeServerError as e:
+            logger.warning("%s; falling back to one-shot conversion", e)
+
     soffice = find_libreoffice()
     if not soffice:
         raise LibreOfficeError(
@@ -215,18 +243,47 @@ def export_pdf_to_svg(
     return exported
 
 
+def _export_deck(
+    pptx_path: Path,
+    output_dir: Path,
+    slides: list[int] | None,
+    server: LibreOfficeServer | None,
+) -> list[Path]:
+    """Convert one deck to PDF in a scratch directory and render its SVGs."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        pdf_path = convert_pptx_to_pdf(pptx_path, Path(tmp_dir), server)
+        return export_pdf_to_svg(pdf_path, output_dir, slides)
+
+
 def run(args: argparse.Namespace) -> int:
     """Execute the SVG export pipeline."""
-    pptx_path = args.input.resolve()
+    batch = args.input is None
+    pptx_paths = [p.resolve() for p in (args.inputs if batch else [args.input])]
     output_dir = args.output_dir.resolve()
 
-    if not pptx_path.exists():
-        logger.error("Input file not found: %s", pptx_path)
-        return EXIT_ERROR
-
-    if pptx_path.suffix.lower() != ".pptx":
-        logger.error("Input file must be a .pptx file: %s", pptx_path)
-        return EXIT_ERROR
+    for pptx_path in pptx_paths:
+        if not pptx_path.exists():
+            logger.error("Input file not found: %s", pptx_path)
+            return EXIT_ERROR
+
+        if pptx_path.suffix.lower() != ".pptx":
+            logger.error("Input file must be a .pptx file: %s", pptx_path)
+            return EXIT_ERROR
+
+    # Batch decks export to OUTPUT_DIR/<stem>/, so equal stems would overwrite
+    # each other's slides. Compare case-insensitively for macOS and Windows.
+    if batch:
+        seen: dict[str, Path] = {}
+        for pptx_path in pptx_paths:
+            other = seen.setdefault(pptx_path.stem.casefold(), pptx_path)
+            if other != pptx_path:
+                logger.error(
+                    "Decks %s and %s would share output directory %s",
+                    other,
+                    pptx_path,
+                    output_dir / pptx_path.stem,
+                )
+                return EXIT_ERROR
 
     slides: list[int] | None = None
     if args.slides:
@@ -234,14 +291,24 @@ def run(args: argparse.Namespace) -> int:
         slides = sorted(slide_set) if slide_set else None
         logger.info("Filtering to slides: %s", slides)
 
-    with tempfile.TemporaryDirectory() as tmp_dir:
-        tmp_path = Path(tmp_dir)
-        try:
-            pdf_path = convert_pptx_to_pdf(pptx_path, tmp_path)
-            exported = export_pdf_to_svg(pdf_path, output_dir, slides)
-        except (LibreOfficeError, PyMuPDFError) as e:
-            logger.error("%s", e)
-            return EXIT_FAILURE
+    # A persistent server only pays off when several decks share its startup.
+    server: LibreOfficeServer | None = None
+    if len(pptx_paths) > 1 and not args.no_server:
+        soffice = find_libreoffice()
+        if soffice:
+            server = LibreOfficeServer(soffice)
+
+    exported: list[Path] = []
+    try:
+        for pptx_path in pptx_paths:
+            deck_dir = output_dir / pptx_path.stem if batch else output_dir
+            exported.extend(_export_deck(pptx_path, deck_dir, slides, server))
+    except (LibreOfficeError, PyMuPDFError) as e:
+        logger.error("%s", e)
+        return EXIT_FAILURE
+    finally:
+        if server is not None:
+            server.close()
 
     logger.info("SVG export complete: %d slide(s) → %s", len(exported), output_dir)
     return EXIT_SUCCESS
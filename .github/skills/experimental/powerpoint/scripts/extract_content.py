@@ -10,11 +10,22 @@ Usage::
     python extract_content.py \
         --input existing-deck.pptx --output-dir content/ \
         --slides 3,7,15
+
+    python extract_content.py \
+        --input existing-deck.pptx --output-dir content/ --shared-images
+
+    python extract_content.py \
+        --input large-deck.pptx --output-dir content/ --jobs 0
 """
 
 import argparse
+import hashlib
 import logging
+import os
+import shutil
+import threading
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 import yaml
@@ -154,11 +165,98 @@ def _is_background_image(shape, slide_w: float, slide_h: float) -> bool:
     return (w >= slide_w * 0.95) and (h >= slide_h * 0.95)
 
 
-def _save_image_blob(shape, output_dir: Path, slide_num: int, img_count: int) -> dict:
+def _prepare_image_blob(blob: bytes, ext: str) -> tuple[bytes, str]:
+    """Validate or convert a raw image blob, returning the bytes to write."""
+    if ext == "wmf":
+        _validate_wmf_magic_bytes(blob)
+    elif ext == "emf":
+        _validate_emf_magic_bytes(blob)
+    elif ext == "svg":
+        blob = _convert_svg_to_png(blob)
+        ext = "png"
+    return blob, ext
+
+
+def _checked_image_path(img_path: Path, root: Path) -> Path:
+    """Return *img_path* after verifying it resolves inside *root*."""
+    if not img_path.resolve().is_relative_to(root.resolve()):
+        raise _ImageSecurityError(
+            f"Image path {img_path} escapes output directory {root}"
+        )
+    return img_path
+
+
+class ImageStore:
+    """Content-addressed image cache shared across one extraction run.
+
+    Each distinct blob is hashed once, and its magic-byte validation or
+    SVG-to-PNG conversion runs once per SHA-256 digest. Failures are cached
+    too, so a rejected blob repeated on every slide is rejected without
+    re-parsing.
+
+    With *shared_dir* set, each digest is written once as
+    ``<shared_dir>/<digest>.<ext>`` and every slide references that file via
+    a relative path. Otherwise each slide keeps its own
+    ``images/image-NN.<ext>`` copy, written from the first processed file.
+    """
+
+    def __init__(self, shared_dir: Path | None = None):
+        self.shared_dir = shared_dir
+        self._written: dict[str, Path] = {}
+        self._failures: dict[str, ValueError] = {}
+        self._lock = threading.Lock()
+
+    def save(self, blob: bytes, ext: str, slide_dir: Path, img_count: int) -> dict:
+        """Validate, convert, and write *blob*, returning its YAML path entry."""
+        digest = hashlib.sha256(blob).hexdigest()
+        with self._lock:
+            failure = self._failures.get(digest)
+            if failure is not None:
+                raise failure
+            source = self._written.get(digest)
+            if source is None:
+                try:
+                    data, ext = _prepare_image_blob(blob, ext)
+                except ValueError as exc:
+                    self._failures[digest] = exc
+                    raise
+            else:
+                data, ext = None, source.suffix[1:]
+
+            if self.shared_dir is not None:
+                img_path = _checked_image_path(
+                    self.shared_dir / f"{digest}.{ext}", self.shared_dir
+                )
+            else:
+                img_path = _checked_image_path(
+                    slide_dir / "images" / f"image-{img_count:02d}.{ext}", slide_dir
+                )
+
+            if source is None or img_path != source:
+                img_path.parent.mkdir(parents=True, exist_ok=True)
+                if data is not None:
+                    img_path.write_bytes(data)
+                else:
+                    shutil.copyfile(source, img_path)
+            if source is None:
+                self._written[digest] = img_path
+
+        return {"path": Path(os.path.relpath(img_path, slide_dir)).as_posix()}
+
+
+def _save_image_blob(
+    shape,
+    output_dir: Path,
+    slide_num: int,
+    img_count: int,
+    image_store: ImageStore | None = None,
+) -> dict:
     """Save an embedded image blob to disk with security validation.
 
     Validates content type against an allowlist, enforces a size limit,
-    and checks that the resolved output path stays within *output_dir*.
+    and checks that the resolved output path stays within *output_dir*
+    (or the store's shared directory). Repeated blobs are validated and
+    converted once per *image_store*.
     """
     try:
         img = shape.image
@@ -175,26 +273,9 @@ def _save_image_blob(shape, output_dir: Path, slide_num: int, img_count: int) ->
             f"Image blob size {len(blob)} exceeds limit of {MAX_IMAGE_BLOB_BYTES} bytes"
         )
 
-    if ext == "wmf":
-        _validate_wmf_magic_bytes(blob)
-    elif ext == "emf":
-        _validate_emf_magic_bytes(blob)
-    elif ext == "svg":
-        blob = _convert_svg_to_png(blob)
-        ext = "png"
-
-    img_name = f"image-{img_count:02d}.{ext}"
-    img_path = output_dir / "images" / img_name
-
-    if not img_path.resolve().is_relative_to(output_dir.resolve()):
-        raise _ImageSecurityError(
-            f"Image path {img_path} escapes output directory {output_dir}"
-        )
-
-    img_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(img_path, "wb") as f:
-        f.write(blob)
-    return {"path": f"images/{img_name}"}
+    if image_store is None:
+        image_store = ImageStore()
+    return image_store.save(blob, ext, output_dir, img_count)
 
 
 def extract_freeform(shape) -> dict:
@@ -285,6 +366,7 @@ def extract_group(
     *,
     _depth: int = 0,
     max_depth: int = MAX_GROUP_DEPTH,
+    image_store: ImageStore | None = None,
 ) -> dict:
     """Extract a group shape and its nested child elements.
 
@@ -309,6 +391,7 @@ def extract_group(
             img_count,
             _depth=_depth + 1,
             max_depth=max_depth,
+            image_store=image_store,
         )
         if child_elem:
             elem["elements"].append(child_elem)
@@ -323,6 +406,7 @@ def _extract_shape_by_type(
     *,
     _depth: int = 0,
     max_depth: int = MAX_GROUP_DEPTH,
+    image_store: ImageStore | None = None,
 ) -> dict | None:
     """Dispatch extraction based on shape_type, table/chart, or freeform."""
     shape_type = shape.shape_type
@@ -338,7 +422,9 @@ def _extract_shape_by_type(
         return extractor(shape)
 
     if shape_type == 13:  # PICTURE
-        return extract_image(shape, output_dir, slide_num, img_count)
+        return extract_image(
+            shape, output_dir, slide_num, img_count, image_store=image_store
+        )
     if shape_type == 6:  # GROUP
         return extract_group(
             shape,
@@ -347,6 +433,7 @@ def _extract_shape_by_type(
             img_count,
             _depth=_depth,
             max_depth=max_depth,
+            image_store=image_store,
         )
 
     # Table and chart detection via attribute check
@@ -368,6 +455,7 @@ def extract_child_shape(
     *,
     _depth: int = 0,
     max_depth: int = MAX_GROUP_DEPTH,
+    image_store: ImageStore | None = None,
 ) -> dict | None:
     """Extract a single child shape within a group."""
     result = _extract_shape_by_type(
@@ -377,6 +465,7 @@ def extract_child_shape(
         img_count,
         _depth=_depth,
         max_depth=max_depth,
+        image_store=image_store,
     )
     if result is not None:
         return result
@@ -624,10 +713,19 @@ def extract_textbox(shape) -> dict:
     return elem
 
 
-def extract_image(shape, output_dir: Path, slide_num: int, img_count: int) -> dict:
+def extract_image(
+    shape,
+    output_dir: Path,
+    slide_num: int,
+    img_count: int,
+    *,
+    image_store: ImageStore | None = None,
+) -> dict:
     """Extract an image element and save the image file."""
     try:
-        blob_result = _save_image_blob(shape, output_dir, slide_num, img_count)
+        blob_result = _save_image_blob(
+            shape, output_dir, slide_num, img_count, image_store=image_store
+        )
     except _ImageSecurityError:
         raise
     except ValueError as exc:
@@ -705,104 +803,147 @@ def extract_image(shape, output_dir: Path, slide_num: int, img_count: int) -> di
     return elem
 
 
-def detect_global_style(prs) -> dict:
-    """Analyze the presentation to detect common styling patterns.
+def _new_style_stats() -> dict:
+    """Return empty accumulators for global style detection."""
+    return {
+        "bg_colors": Counter(),
+        "text_colors": Counter(),
+        "accent_colors": Counter(),
+        "fill_colors": Counter(),
+        "font_names": Counter(),
+        "font_sizes": Counter(),
+        # Per-slide analysis for theme clustering
+        "slide_profiles": [],
+    }
 
-    Detects multiple theme zones (e.g., light and dark slides) by clustering
-    slides based on background brightness and dominant text colors.
+
+def _begin_slide_style(slide, stats: dict) -> dict:
+    """Record the slide background in *stats* and return a per-slide profile.
+
+    Feed the slide's shapes to :func:`_collect_shape_style` and close the
+    profile with :func:`_finish_slide_style`.
     """
-    bg_colors = Counter()
-    text_colors = Counter()
-    accent_colors = Counter()
-    fill_colors = Counter()
-    font_names = Counter()
-    font_sizes = Counter()
+    profile = {
+        "bg_color": None,
+        "has_bg_image": False,
+        "text_colors": Counter(),
+        "fill_colors": Counter(),
+    }
 
-    # Per-slide analysis for theme clustering
-    slide_profiles = []
+    # Detect background colors
+    try:
+        fill_result = extract_fill(slide.background.fill)
+        if isinstance(fill_result, str):
+            stats["bg_colors"][fill_result] += 1
+            profile["bg_color"] = fill_result
+    except (AttributeError, TypeError):
+        # Slide background fill is unavailable; skip color detection.
+        pass
 
-    slide_w = emu_to_inches(prs.slide_width)
-    slide_h = emu_to_inches(prs.slide_height)
+    return profile
 
-    for slide_idx, slide in enumerate(prs.slides):
-        slide_num = slide_idx + 1
-        slide_bg = None
-        slide_text_colors = Counter()
-        slide_fill_colors = Counter()
-        has_bg_image = False
-
-        # Detect background colors
-        try:
-            fill_result = extract_fill(slide.background.fill)
-            if isinstance(fill_result, str):
-                bg_colors[fill_result] += 1
-                slide_bg = fill_result
-        except (AttributeError, TypeError):
-            # Slide background fill is unavailable; skip color detection.
-            pass
-
-        for i, shape in enumerate(slide.shapes):
-            # Detect full-slide background images
-            if (
-                i == 0
-                and shape.shape_type == 13
-                and _is_background_image(shape, slide_w, slide_h)
-            ):
-                has_bg_image = True
-                continue
 
-            # Collect fill colors
-            try:
-                fill_result = extract_fill(shape.fill)
-                if isinstance(fill_result, str):
-                    h = emu_to_inches(shape.height)
-                    if h < 0.1:
-                        accent_colors[fill_result] += 1
-                    else:
-                        fill_colors[fill_result] += 1
-                        slide_fill_colors[fill_result] += 1
-            except (AttributeError, TypeError):
-                # Shape exposes no fill; skip color collection.
-                pass
-
-            # Collect font information
-            if shape.has_text_frame:
-                for para in shape.text_frame.paragraphs:
-                    for run in para.runs:
-                        if run.font.name:
-                            base_name = normalize_font_family(run.font.name)
-                            font_names[base_name] += 1
-                        if run.font.size:
-                            font_sizes[int(run.font.size.pt)] += 1
-                        try:
-                            color = extract_color(run.font.color)
-                            if isinstance(color, str) and color.startswith("#"):
-                                text_colors[color] += 1
-                                slide_text_colors[color] += 1
-                        except (AttributeError, TypeError):
-                            # Run font color is unavailable; skip it.
-                            pass
-
-        # Classify slide brightness
-        bg_brightness = _classify_slide_brightness(
-            slide_bg, slide_text_colors, has_bg_image
-        )
-        slide_profiles.append(
-            {
-                "slide": slide_num,
-                "bg_color": slide_bg,
-                "bg_brightness": bg_brightness,
-                "has_bg_image": has_bg_image,
-                "text_colors": dict(slide_text_colors),
-                "fill_colors": dict(slide_fill_colors),
-            }
-        )
+def _collect_shape_style(
+    shape,
+    z_index: int,
+    slide_dims: tuple[float, float],
+    stats: dict,
+    profile: dict,
+) -> None:
+    """Accumulate one shape's colors and fonts into *stats* and *profile*."""
+    slide_w, slide_h = slide_dims
+
+    # Detect full-slide background images
+    if (
+        z_index == 0
+        and shape.shape_type == 13
+        and _is_background_image(shape, slide_w, slide_h)
+    ):
+        profile["has_bg_image"] = True
+        return
+
+    # Collect fill colors
+    try:
+        fill_result = extract_fill(shape.fill)
+        if isinstance(fill_result, str):
+            h = emu_to_inches(shape.height)
+            if h < 0.1:
+                stats["accent_colors"][fill_result] += 1
+            else:
+                stats["fill_colors"][fill_result] += 1
+                profile["fill_colors"][fill_result] += 1
+    except (AttributeError, TypeError):
+        # Shape exposes no fill; skip color collection.
+        pass
+
+    # Collect font information
+    if shape.has_text_frame:
+        for para in shape.text_frame.paragraphs:
+            for run in para.runs:
+                if run.font.name:
+                    base_name = normalize_font_family(run.font.name)
+                    stats["font_names"][base_name] += 1
+                if run.font.size:
+                    stats["font_sizes"][int(run.font.size.pt)] += 1
+                try:
+                    color = extract_color(run.font.color)
+                    if isinstance(color, str) and color.startswith("#"):
+                        stats["text_colors"][color] += 1
+                        profile["text_colors"][color] += 1
+                except (AttributeError, TypeError):
+                    # Run font color is unavailable; skip it.
+                    pass
+
+
+def _finish_slide_style(slide_num: int, stats: dict, profile: dict) -> None:
+    """Classify the slide's brightness and append its theme profile to *stats*."""
+    bg_brightness = _classify_slide_brightness(
+        profile["bg_color"], profile["text_colors"], profile["has_bg_image"]
+    )
+    stats["slide_profiles"].append(
+        {
+            "slide": slide_num,
+            "bg_color": profile["bg_color"],
+            "bg_brightness": bg_brightness,
+            "has_bg_image": profile["has_bg_image"],
+            "text_colors": dict(profile["text_colors"]),
+            "fill_colors": dict(profile["fill_colors"]),
+        }
+    )
+
+
+def _collect_slide_style(
+    slide, slide_num: int, slide_dims: tuple[float, float], stats: dict
+) -> None:
+    """Accumulate one slide's colors, fonts, and theme profile into *stats*.
+
+    Used for slides that are not being extracted; :func:`extract_slide`
+    collects the same statistics during its own shape walk when given
+    ``style_stats``.
+    """
+    profile = _begin_slide_style(slide, stats)
+    for z_index, shape in enumerate(slide.shapes):
+        _collect_shape_style(shape, z_index, slide_dims, stats, profile)
+    _finish_slide_style(slide_num, stats, profile)
+
+
+def _build_global_style(prs, stats: dict) -> dict:
+    """Turn accumulated style statistics into the global style.yaml mapping."""
+    text_colors = stats["text_colors"]
+    fill_colors = stats["fill_colors"]
+    accent_colors = stats["accent_colors"]
+    font_names = stats["font_names"]
+    font_sizes = stats["font_sizes"]
 
     # Build global color map from frequency analysis
-    colors = _build_color_map(bg_colors, fill_colors, text_colors, accent_colors)
+    colors = _build_color_map(
+        stats["bg_colors"], fill_colors, text_colors, accent_colors
+    )
 
     # Detect themes by clustering slides into light/dark groups
-    themes = _cluster_themes(slide_profiles, text_colors, fill_colors, accent_colors)
+    themes = _cluster_themes(
+        stats["slide_profiles"], text_colors, fill_colors, accent_colors
+    )
 
     # Determine primary fonts
     body_font = "Segoe UI"
@@ -860,6 +1001,19 @@ def detect_global_style(prs) -> dict:
     return style
 
 
+def detect_global_style(prs) -> dict:
+    """Analyze the presentation to detect common styling patterns.
+
+    Detects multiple theme zones (e.g., light and dark slides) by clustering
+    slides based on background brightness and dominant text colors.
+    """
+    stats = _new_style_stats()
+    slide_dims = (emu_to_inches(prs.slide_width), emu_to_inches(prs.slide_height))
+    for slide_idx, slide in enumerate(prs.slides):
+        _collect_slide_style(slide, slide_idx + 1, slide_dims, stats)
+    return _build_global_style(prs, stats)
+
+
 def _classify_slide_brightness(
     bg_color: str | None, text_colors: Counter, has_bg_image: bool
 ) -> str:
@@ -1000,8 +1154,16 @@ def extract_slide(
     slide_num: int,
     output_dir: Path,
     slide_dims: tuple[float, float] | None = None,
+    image_store: ImageStore | None = None,
+    style_stats: dict | None = None,
 ) -> dict:
-    """Extract all elements from a slide into a content.yaml structure."""
+    """Extract all elements from a slide into a content.yaml structure.
+
+    Pass one *image_store* across slides so repeated images are validated,
+    converted, and (in shared mode) written only once per run. When
+    *style_stats* is given, the slide's global style statistics are
+    accumulated into it during the same shape walk.
+    """
     slide_dir = output_dir / f"slide-{slide_num:03d}"
     slide_dir.mkdir(parents=True, exist_ok=True)
 
@@ -1039,9 +1201,18 @@ def extract_slide(
         # Notes slide or text frame is unavailable; skip notes.
         pass
 
+    style_profile = None
+    if style_stats is not None:
+        if slide_dims is None:
+            raise ValueError("style_stats requires slide_dims")
+        style_profile = _begin_slide_style(slide, style_stats)
+
     img_count = 0
 
     for z_index, shape in enumerate(list(slide.shapes)):
+        if style_profile is not None:
+            _collect_shape_style(shape, z_index, slide_dims, style_stats, style_profile)
+
         shape_type = shape.shape_type
 
         # Track image count for filename generation
@@ -1059,7 +1230,9 @@ def extract_slide(
             continue
 
         # Use shared dispatcher for all other shape types
-        elem = _extract_shape_by_type(shape, slide_num, slide_dir, img_count)
+        elem = _extract_shape_by_type(
+            shape, slide_num, slide_dir, img_count, image_store=image_store
+        )
         if elem is not None:
             elem["z_order"] = z_index
             content["elements"].append(elem)
@@ -1090,6 +1263,9 @@ def extract_slide(
             elem_data["_unrecognized_shape_type"] = int(shape_type)
         content["elements"].append(elem_data)
 
+    if style_profile is not None:
+        _finish_slide_style(slide_num, style_stats, style_profile)
+
     return content, slide_dir
 
 
@@ -1197,6 +1373,27 @@ def _resolve_theme_refs_in_content(
     return resolve_value(content)
 
 
+def _write_slide_content(content: dict, content_path: Path, theme_colors: dict) -> dict:
+    """Resolve theme references and serialize one slide's content.yaml.
+
+    Runs in worker processes under ``--jobs``, so it takes and returns only
+    plain picklable data.
+    """
+    # Resolve @theme references to hex values when --resolve-themes is set
+    if theme_colors:
+        content = _resolve_theme_refs_in_content(content, theme_colors)
+
+    with open(content_path, "w", encoding="utf-8") as f:
+        yaml.dump(
+            content,
+            f,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+    return content
+
+
 def main():
     """CLI entry point for extracting PPTX content into YAML."""
     parser = argparse.ArgumentParser(
@@ -1212,7 +1409,22 @@ def main():
         action="store_true",
         help="Resolve @theme references to actual hex RGB values from the deck's theme",
     )
+    parser.add_argument(
+        "--shared-images",
+        action="store_true",
+        help="Write each distinct image once under global/images/ and reference "
+        "it from every slide instead of copying it into each slide directory",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for slide YAML serialization "
+        "(default: 1, 0 = one per CPU)",
+    )
     args = parser.parse_args()
+    if args.jobs < 0:
+        parser.error("--jobs must be 0 or a positive integer")
 
     pptx_path = Path(args.input)
     output_dir = Path(args.output_dir)
@@ -1229,8 +1441,30 @@ def main():
     h = emu_to_inches(prs.slide_height)
     print(f'Dimensions: {w}" x {h}"')
 
-    # Detect and save global style
-    global_style = detect_global_style(prs)
+    # Single traversal: extracted slides accumulate style statistics during
+    # their own shape walk, and slides skipped by --slides are walked only for
+    # style, so global/style.yaml still covers the whole deck.
+    global_dir = output_dir / "global"
+    slide_dims = (emu_to_inches(prs.slide_width), emu_to_inches(prs.slide_height))
+    image_store = ImageStore(global_dir / "images" if args.shared_images else None)
+    style_stats = _new_style_stats()
+    extracted_slides = []
+    for i, slide in enumerate(prs.slides):
+        slide_num = i + 1
+        if slide_filter and slide_num not in slide_filter:
+            _collect_slide_style(slide, slide_num, slide_dims, style_stats)
+            continue
+        content, slide_dir = extract_slide(
+            slide,
+            slide_num,
+            output_dir,
+            slide_dims=slide_dims,
+            image_store=image_store,
+            style_stats=style_stats,
+        )
+        extracted_slides.append((slide_num, content, slide_dir / "content.yaml"))
+
+    global_style = _build_global_style(prs, style_stats)
 
     # Resolve theme colors when requested
     theme_colors = {}
@@ -1241,7 +1475,6 @@ def main():
             global_style = _resolve_theme_refs_in_content(global_style, theme_colors)
             print(f"Resolved {len(theme_colors)} theme colors")
 
-    global_dir = output_dir / "global"
     global_dir.mkdir(parents=True, exist_ok=True)
     style_path = global_dir / "style.yaml"
     with open(style_path, "w", encoding="utf-8") as f:
@@ -1254,36 +1487,35 @@ def main():
         )
     print(f"Global style saved to {style_path}")
 
-    # Extract slides (filtered or all)
-    slide_dims = (emu_to_inches(prs.slide_width), emu_to_inches(prs.slide_height))
-    extracted = 0
-    for i, slide in enumerate(prs.slides):
-        slide_num = i + 1
-        if slide_filter and slide_num not in slide_filter:
-            continue
-        content, slide_dir = extract_slide(
-            slide, slide_num, output_dir, slide_dims=slide_dims
-        )
-
-        # Resolve @theme references to hex values when --resolve-themes is set
-        if args.resolve_themes and theme_colors:
-            content = _resolve_theme_refs_in_content(content, theme_colors)
-
-        content_path = slide_dir / "content.yaml"
-        with open(content_path, "w", encoding="utf-8") as f:
-            yaml.dump(
-                content,
-                f,
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
+    # Serialize slide YAML, fanned out to worker processes when requested
+    jobs = args.jobs or os.cpu_count() or 1
+    contents = [content for _num, content, _path in extracted_slides]
+    paths = [path for _num, _content, path in extracted_slides]
+    if jobs > 1 and len(extracted_slides) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            written = list(
+                pool.map(
+                    _write_slide_content,
+                    contents,
+                    paths,
+                    [theme_colors] * len(contents),
+                )
             )
+    else:
+        written = [
+            _write_slide_content(content, path, theme_colors)
+            for content, path in zip(contents, paths)
+        ]
+
+    for (slide_num, _content, content_path), content in zip(extracted_slides, written):
         print(
             f"Slide {slide_num}: {content.get('title', 'Untitled')} -> {content_path}"
         )
-        extracted += 1
 
-    print(f"\nExtraction complete. {extracted} slide(s) extracted to {output_dir}")
+    print(
+        f"\nExtraction complete. {len(extracted_slides)} slide(s) extracted "
+        f"to {output_dir}"
+    )
 
 
 if __name__ == "__main__":
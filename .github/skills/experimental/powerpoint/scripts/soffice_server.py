@@ -0,0 +1,288 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Persistent headless LibreOffice conversion server.
+
+``soffice --headless --convert-to`` pays several seconds of LibreOffice
+startup for every conversion. This module keeps one headless instance
+alive behind a local UNO pipe and drives PPTX-to-PDF conversions through
+it, so batch and watch workflows amortize the startup cost across decks.
+
+The UNO bridge (``import uno``) ships with LibreOffice's bundled Python
+and is not installable from PyPI. When it is unavailable, or the server
+fails to start or crashes mid-run, :class:`LibreOfficeServerError` is
+raised and callers fall back to the one-shot subprocess conversion.
+
+Usage:
+    with LibreOfficeServer(soffice) as server:
+        for deck in decks:
+            server.convert(deck, output_dir)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import secrets
+import shutil
+import subprocess
+import tempfile
+import threading
+import time
+from pathlib import Path
+from types import ModuleType
+
+logger = logging.getLogger(__name__)
+
+# Seconds to wait for a freshly spawned soffice to accept UNO connections.
+DEFAULT_STARTUP_TIMEOUT = 30.0
+
+# Interval between UNO connection attempts while soffice is starting.
+CONNECT_POLL_INTERVAL = 0.25
+
+# Seconds to wait for soffice to exit after a terminate request.
+SHUTDOWN_TIMEOUT = 10.0
+
+PDF_EXPORT_FILTER = "impress_pdf_Export"
+
+
+class LibreOfficeServerError(RuntimeError):
+    """Raised when the persistent LibreOffice server cannot convert a file."""
+
+
+def _import_uno() -> ModuleType:
+    """Import the LibreOffice UNO bridge or raise LibreOfficeServerError."""
+    try:
+        import uno  # noqa: PLC0415 — ships with LibreOffice, not PyPI
+    except ImportError as exc:
+        raise LibreOfficeServerError(
+            "LibreOffice UNO bridge (python 'uno' module) is not available"
+        ) from exc
+    return uno
+
+
+class LibreOfficeServer:
+    """Headless LibreOffice instance reused across PPTX-to-PDF conversions.
+
+    The instance runs with a private user profile and listens on a named
+    UNO pipe, so it never collides with a desktop LibreOffice session.
+    Conversions are serialized with a lock; a crashed instance is detected
+    before each conversion and respawned once. A failed startup is
+    remembered, so later calls raise immediately instead of waiting out
+    another ``startup_timeout``.
+
+    Args:
+        soffice: Path to the soffice/libreoffice executable.
+        startup_timeout: Seconds to wait for the UNO pipe to accept
+            connections after spawning soffice.
+    """
+
+    def __init__(
+        self,
+        soffice: str,
+        *,
+        startup_timeout: float = DEFAULT_STARTUP_TIMEOUT,
+    ) -> None:
+        self.soffice = soffice
+        self.startup_timeout = startup_timeout
+        self._process: subprocess.Popen | None = None
+        self._desktop = None
+        self._uno: ModuleType | None = None
+        self._profile_dir: Path | None = None
+        self._startup_error: LibreOfficeServerError | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> LibreOfficeServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def alive(self) -> bool:
+        """Return True when the soffice process is running and connected."""
+        return (
+            self._process is not None
+            and self._process.poll() is None
+            and self._desktop is not None
+        )
+
+    def start(self) -> None:
+        """Spawn soffice and connect to its UNO pipe.
+
+        Raises:
+            LibreOfficeServerError: When the UNO bridge is missing, soffice
+                exits during startup, or the pipe does not come up within
+                ``startup_timeout`` seconds, or when an earlier startup of
+                this server already failed.
+        """
+        if self.alive:
+            return
+        if self._startup_error is not None:
+            raise LibreOfficeServerError(
+                f"LibreOffice server failed to start earlier: {self._startup_error}"
+            )
+        try:
+            self._spawn()
+        except LibreOfficeServerError as exc:
+            self._startup_error = exc
+            raise
+
+    def _spawn(self) -> None:
+        """Launch soffice with a private profile and connect to its pipe."""
+        self._uno = _import_uno()
+        self._profile_dir = Path(tempfile.mkdtemp(prefix="hve-soffice-profile-"))
+        pipe_name = f"hve-soffice-{os.getpid()}-{secrets.token_hex(4)}"
+        cmd = [
+            self.soffice,
+            "--headless",
+            "--invisible",
+            "--nologo",
+            "--nodefault",
+            "--norestore",
+            "--nolockcheck",
+            f"-env:UserInstallation={self._profile_dir.as_uri()}",
+            f"--accept=pipe,name={pipe_name};urp;StarOffice.ComponentContext",
+        ]
+        logger.info("Starting persistent LibreOffice server (pipe %s)", pipe_name)
+        try:
+            self._process = subprocess.Popen(
+                cmd,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as exc:
+            self._cleanup_profile()
+            raise LibreOfficeServerError(
+                f"LibreOffice executable could not be started: {self.soffice}"
+            ) from exc
+
+        try:
+            self._desktop = self._connect(pipe_name)
+        except LibreOfficeServerError:
+            self.close()
+            raise
+
+    def _connect(self, pipe_name: str):
+        """Poll the UNO pipe until soffice accepts a connection."""
+        uno = self._uno
+        local_context = uno.getComponentContext()
+        resolver = local_context.ServiceManager.createInstanceWithContext(
+            "com.sun.star.bridge.UnoUrlResolver", local_context
+        )
+        url = f"uno:pipe,name={pipe_name};urp;StarOffice.ComponentContext"
+        deadline = time.monotonic() + self.startup_timeout
+        while True:
+            if self._process.poll() is not None:
+                raise LibreOfficeServerError(
+                    "LibreOffice server exited during startup "
+                    f"(code {self._process.returncode})"
+                )
+            try:
+                context = resolver.resolve(url)
+            except Exception as exc:  # NoConnectException is a UNO type
+                if time.monotonic() >= deadline:
+                    raise LibreOfficeServerError(
+                        "LibreOffice server did not accept connections within "
+                        f"{self.startup_timeout}s"
+                    ) from exc
+                time.sleep(CONNECT_POLL_INTERVAL)
+                continue
+            return context.ServiceManager.createInstanceWithContext(
+                "com.sun.star.frame.Desktop", context
+            )
+
+    def _property(self, name: str, value):
+        prop = self._uno.createUnoStruct("com.sun.star.beans.PropertyValue")
+        prop.Name = name
+        prop.Value = value
+        return prop
+
+    def convert(self, pptx_path: Path, output_dir: Path) -> Path:
+        """Convert a PPTX file to PDF through the running instance.
+
+        Args:
+            pptx_path: Path to the input PPTX file.
+            output_dir: Directory where the PDF will be written.
+
+        Returns:
+            Path to the generated PDF file, named like the one-shot
+            ``--convert-to`` output (``<stem>.pdf``).
+
+        Raises:
+            LibreOfficeServerError: When the instance cannot be (re)started
+                or the conversion fails.
+        """
+        with self._lock:
+            if not self.alive:
+                if self._process is not None:
+                    logger.warning("LibreOffice server is not running; respawning")
+                    self.close()
+                self.start()
+
+            output_dir.mkdir(parents=True, exist_ok=True)
+            pdf_path = output_dir / (pptx_path.stem + ".pdf")
+            uno = self._uno
+            logger.info("Converting %s to PDF via LibreOffice server", pptx_path.name)
+            document = None
+            try:
+                document = self._desktop.loadComponentFromURL(
+                    uno.systemPathToFileUrl(str(pptx_path.resolve())),
+                    "_blank",
+                    0,
+                    (
+                        self._property("Hidden", True),
+                        self._property("ReadOnly", True),
+                    ),
+                )
+                if document is None:
+                    raise LibreOfficeServerError(
+                        f"LibreOffice could not load {pptx_path.name}"
+                    )
+                document.storeToURL(
+                    uno.systemPathToFileUrl(str(pdf_path.resolve())),
+                    (self._property("FilterName", PDF_EXPORT_FILTER),),
+                )
+            except LibreOfficeServerError:
+                raise
+            except Exception as exc:
+                raise LibreOfficeServerError(
+                    f"LibreOffice server conversion failed for {pptx_path.name}: {exc}"
+                ) from exc
+            finally:
+                if document is not None:
+                    try:
+                        document.close(True)
+                    except Exception:  # noqa: BLE001 — best-effort release
+                        logger.debug("Failed to close %s", pptx_path.name)
+
+        if not pdf_path.exists():
+            raise LibreOfficeServerError(f"Expected PDF not found: {pdf_path}")
+        return pdf_path
+
+    def close(self) -> None:
+        """Terminate the soffice instance and remove its private profile."""
+        if self._desktop is not None:
+            try:
+                self._desktop.terminate()
+            except Exception:  # noqa: BLE001 — the bridge drops on terminate
+                logger.debug("LibreOffice desktop terminate raised; ignoring")
+            self._desktop = None
+
+        if self._process is not None:
+            if self._process.poll() is None:
+                self._process.terminate()
+                try:
+                    self._process.wait(timeout=SHUTDOWN_TIMEOUT)
+                except subprocess.TimeoutExpired:
+                    self._process.kill()
+                    self._process.wait()
+            self._process = None
+
+        self._cleanup_profile()
+
+    def _cleanup_profile(self) -> None:
+        if self._profile_dir is not None:
+            shutil.rmtree(self._profile_dir, ignore_errors=True)
+            self._profile_dir = None
@@ -3,9 +3,16 @@
 # SPDX-License-Identifier: MIT
 """Validate PPTX element geometry against spacing and margin rules.
 
-Checks edge margins, adjacent element gaps, boundary overflow, and
-title-subtitle clearance. Decorative accent bars (full-width shapes at
-top with height ≤ 0.12") are exempted from margin rules.
+Checks edge margins, adjacent element gaps, boundary overflow,
+title-subtitle clearance, and partial shape overlaps. Decorative accent
+bars (full-width shapes at top with height ≤ 0.12") are exempted from
+margin rules.
+
+Gap and overlap checks run against a per-slide :class:`ShapeIndex` that
+flattens group shapes into absolute slide coordinates. Gap queries bisect a
+sorted top-edge list, and overlap queries sweep down the slide comparing each
+shape only against the shapes it overlaps vertically, so stacked layouts that
+share a column are not compared pairwise.
 
 Usage::
 
@@ -19,13 +26,18 @@ Usage::
 from __future__ import annotations
 
 import argparse
+import bisect
+import heapq
 import json
 import logging
 import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
 from pptx import Presentation
+from pptx.enum.shapes import MSO_SHAPE_TYPE
+from pptx.oxml.ns import qn
 from pptx.shapes.base import BaseShape
 from pptx_utils import (
     EXIT_ERROR,
@@ -43,6 +55,7 @@ QUALITY_ICON = {"good": "✅", "needs-attention": "⚠️"}
 
 ACCENT_BAR_MAX_HEIGHT = 0.12
 POSITION_TOLERANCE_IN = 0.01  # floating-point tolerance for inch comparisons
+MAX_GROUP_DEPTH = 20  # nested groups deeper than this are indexed as one box
 
 
 def _is_accent_bar(shape: BaseShape, slide_width_in: float) -> bool:
@@ -208,48 +221,215 @@ def check_edge_margins(
     return issues
 
 
-def check_adjacent_gaps(shapes: list[BaseShape], gap: float) -> list[dict]:
+@dataclass(frozen=True)
+class ShapeRect:
+    """Axis-aligned bounds of a leaf shape in absolute slide inches.
+
+    ``root`` is the top-level slide shape the leaf belongs to; it is the
+    shape itself unless the leaf was flattened out of a group.
+    """
+
+    left: float
+    top: float
+    right: float
+    bottom: float
+    shape: BaseShape
+    root: BaseShape
+
+
+def _group_child_transform(group: BaseShape, parent: tuple) -> tuple:
+    """Compose the EMU affine transform that maps a group's child coordinates.
+
+    Transforms are ``(offset_x, offset_y, scale_x, scale_y)`` tuples mapping
+    a child-space coordinate ``v`` to slide space as ``offset + scale * v``.
+    """
+    ox, oy, sx, sy = parent
+    xfrm = group._element.grpSpPr.find(qn("a:xfrm"))
+    ch_off = xfrm.find(qn("a:chOff")) if xfrm is not None else None
+    ch_ext = xfrm.find(qn("a:chExt")) if xfrm is not None else None
+    ch_x = int(ch_off.get("x", 0)) if ch_off is not None else 0
+    ch_y = int(ch_off.get("y", 0)) if ch_off is not None else 0
+    ch_cx = int(ch_ext.get("cx", 0)) if ch_ext is not None else 0
+    ch_cy = int(ch_ext.get("cy", 0)) if ch_ext is not None else 0
+    gx, gy = group.left or 0, group.top or 0
+    gsx = (group.width or 0) / ch_cx if ch_cx else 1.0
+    gsy = (group.height or 0) / ch_cy if ch_cy else 1.0
+    return (
+        ox + sx * (gx - ch_x * gsx),
+        oy + sy * (gy - ch_y * gsy),
+        sx * gsx,
+        sy * gsy,
+    )
+
+
+def flatten_shapes(shapes: list[BaseShape]) -> list[ShapeRect]:
+    """Flatten group shapes into leaf rectangles in absolute slide inches.
+
+    Rotation is ignored; bounds are the unrotated frame, matching the other
+    geometry checks.
+    """
+    rects: list[ShapeRect] = []
+    identity = (0.0, 0.0, 1.0, 1.0)
+    stack = [(shape, shape, identity, 0) for shape in reversed(shapes)]
+    while stack:
+        shape, root, (ox, oy, sx, sy), depth = stack.pop()
+        if shape.shape_type == MSO_SHAPE_TYPE.GROUP and depth < MAX_GROUP_DEPTH:
+            child_tx = _group_child_transform(shape, (ox, oy, sx, sy))
+            stack.extend(
+                (child, root, child_tx, depth + 1)
+                for child in reversed(list(shape.shapes))
+            )
+            continue
+        left = emu_to_inches(ox + sx * (shape.left or 0))
+        top = emu_to_inches(oy + sy * (shape.top or 0))
+        width = emu_to_inches(sx * (shape.width or 0))
+        height = emu_to_inches(sy * (shape.height or 0))
+        rects.append(ShapeRect(left, top, left + width, top + height, shape, root))
+    return rects
+
+
+class ShapeIndex:
+    """Per-slide spatial index over flattened shape rectangles.
+
+    Rectangles are kept sorted by top edge for window queries and for the
+    overlap sweep. Leaves flattened out of the same group are never paired
+    with each other, because intra-group layering is deliberate composition.
+    """
+
+    def __init__(self, shapes: list[BaseShape]):
+        self.rects = sorted(flatten_shapes(shapes), key=lambda r: r.top)
+        self._tops = [r.top for r in self.rects]
+
+    def _same_group(self, a: ShapeRect, b: ShapeRect) -> bool:
+        return a.root is b.root and a.shape is not a.root
+
+    def vertical_neighbors(self, gap: float):
+        """Yield ``(upper, lower, vertical_gap)`` pairs closer than *gap*.
+
+        A pair qualifies when the lower rectangle starts at or below the
+        upper one's bottom edge, the space between them is under the
+        minimum gap, and both share horizontal extent.
+        """
+        limit = gap - POSITION_TOLERANCE_IN
+        for upper in self.rects:
+            lo = bisect.bisect_left(self._tops, upper.bottom)
+            hi = bisect.bisect_left(self._tops, upper.bottom + limit)
+            for lower in self.rects[lo:hi]:
+                if lower is upper or self._same_group(upper, lower):
+                    continue
+                h_overlap = min(upper.right, lower.right) - max(upper.left, lower.left)
+                if h_overlap > POSITION_TOLERANCE_IN:
+                    yield upper, lower, lower.top - upper.bottom
+
+    def overlapping_pairs(self):
+        """Yield ``(a, b)`` pairs whose areas intersect by more than tolerance.
+
+        Sweeps rectangles in top-edge order while keeping the still-open ones,
+        those whose bottom lies more than tolerance below the current top,
+        in a list sorted by left edge. Each rectangle is compared only with
+        open rectangles that start left of its right edge, so the cost is
+        O(n log n) plus the vertically overlapping candidates examined. Pairs
+        are yielded in top-edge order of ``a``, then of ``b``.
+        """
+        tol = POSITION_TOLERANCE_IN
+        pairs: list[tuple[int, int]] = []
+        open_by_left: list[tuple[float, int]] = []
+        closing: list[tuple[float, int]] = []
+        for j, b in enumerate(self.rects):
+            while closing and closing[0][0] <= b.top + tol:
+                _bottom, i = heapq.heappop(closing)
+                del open_by_left[
+                    bisect.bisect_left(open_by_left, (self.rects[i].left, i))
+                ]
+            stop = bisect.bisect_left(open_by_left, (b.right - tol, -1))
+            for _left, i in open_by_left[:stop]:
+                a = self.rects[i]
+                if self._same_group(a, b):
+                    continue
+                v_overlap = min(a.bottom, b.bottom) - b.top
+                h_overlap = min(a.right, b.right) - max(a.left, b.left)
+                if v_overlap > tol and h_overlap > tol:
+                    pairs.append((i, j))
+            bisect.insort(open_by_left, (b.left, j))
+            heapq.heappush(closing, (b.bottom, j))
+        for i, j in sorted(pairs):
+            yield self.rects[i], self.rects[j]
+
+
+def _contains(outer: ShapeRect, inner: ShapeRect) -> bool:
+    """Return True when *inner* lies within *outer* (within tolerance)."""
+    tol = POSITION_TOLERANCE_IN
+    return (
+        inner.left >= outer.left - tol
+        and inner.top >= outer.top - tol
+        and inner.right <= outer.right + tol
+        and inner.bottom <= outer.bottom + tol
+    )
+
+
+def check_adjacent_gaps(
+    shapes: list[BaseShape], gap: float, index: ShapeIndex | None = None
+) -> list[dict]:
     """Check vertical gaps between vertically adjacent elements.
 
-    Sorts shapes by top position and checks consecutive pairs for minimum
-    vertical clearance. Only pairs that share horizontal extent are evaluated.
+    Every pair of shapes that share horizontal extent is evaluated, not
+    only neighbors in top-edge order, so a near-collision hidden behind an
+    unrelated shape in another column is still reported. Group shapes are
+    flattened into their children.
 
     Note: Horizontal gaps between side-by-side elements at the same vertical
     level are not checked by this function.
     """
+    if index is None:
+        index = ShapeIndex(shapes)
     issues: list[dict] = []
-    rects = []
-    for s in shapes:
-        top = emu_to_inches(s.top)
-        height = emu_to_inches(s.height)
-        rects.append((top, top + height, s))
-    rects.sort(key=lambda r: r[0])
+    for upper, lower, vertical_gap in index.vertical_neighbors(gap):
+        shape_a, shape_b = upper.shape, lower.shape
+        label_a = _shape_label(shape_a)
+        label_b = _shape_label(shape_b)
+        issues.append(
+            {
+                "check_type": "adjacent_gap",
+                "severity": "warning",
+                "description": (
+                    f"Gap between '{label_a}' and '{label_b}' "
+                    f'is {vertical_gap:.2f}" (minimum {gap}")'
+                ),
+                "location": f"{shape_a.name or 'shape'}→{shape_b.name or 'shape'}",
+            }
+        )
+    return issues
 
-    for i in range(len(rects) - 1):
-        _, bottom_a, shape_a = rects[i]
-        top_b, _, shape_b = rects[i + 1]
-        vertical_gap = top_b - bottom_a
-        # Verify shapes share horizontal extent before flagging
-        left_a = emu_to_inches(shape_a.left)
-        right_a = left_a + emu_to_inches(shape_a.width)
-        left_b = emu_to_inches(shape_b.left)
-        right_b = left_b + emu_to_inches(shape_b.width)
-        h_overlap = min(right_a, right_b) - max(left_a, left_b)
-        too_close = vertical_gap < gap - POSITION_TOLERANCE_IN
-        if too_close and vertical_gap >= 0 and h_overlap > POSITION_TOLERANCE_IN:
-            label_a = _shape_label(shape_a)
-            label_b = _shape_label(shape_b)
-            issues.append(
-                {
-                    "check_type": "adjacent_gap",
-                    "severity": "warning",
-                    "description": (
-                        f"Gap between '{label_a}' and '{label_b}' "
-                        f'is {vertical_gap:.2f}" (minimum {gap}")'
-                    ),
-                    "location": f"{shape_a.name or 'shape'}→{shape_b.name or 'shape'}",
-                }
-            )
+
+def check_overlaps(
+    shapes: list[BaseShape], index: ShapeIndex | None = None
+) -> list[dict]:
+    """Report shapes that partially overlap one another.
+
+    Full containment (text on a card, an icon inside a panel) is treated as
+    deliberate layering and skipped; only partial intersections, which
+    usually indicate overflowing or misplaced elements, are reported as
+    info-level findings.
+    """
+    if index is None:
+        index = ShapeIndex(shapes)
+    issues: list[dict] = []
+    for a, b in index.overlapping_pairs():
+        if _contains(a, b) or _contains(b, a):
+            continue
+        width = min(a.right, b.right) - max(a.left, b.left)
+        height = min(a.bottom, b.bottom) - max(a.top, b.top)
+        issues.append(
+            {
+                "check_type": "overlap",
+                "severity": "info",
+                "description": (
+                    f"Shape '{_shape_label(a.shape)}' overlaps "
+                    f"'{_shape_label(b.shape)}' by {width:.2f}\" x {height:.2f}\""
+                ),
+                "location": f"{a.shape.name or 'shape'}↔{b.shape.name or 'shape'}",
+            }
+        )
     return issues
 
 
@@ -351,9 +531,11 @@ def validate_slide_geometry(
         non_accent_shapes.append(shape)
         issues.extend(check_edge_margins(shape, slide_w_in, slide_h_in, margin))
 
-    # Adjacent gaps and title clearance use non-accent shapes only
-    issues.extend(check_adjacent_gaps(non_accent_shapes, gap))
+    # Adjacent gaps, title clearance, and overlaps use non-accent shapes only
+    index = ShapeIndex(non_accent_shapes)
+    issues.extend(check_adjacent_gaps(non_accent_shapes, gap, index))
     issues.extend(check_title_clearance(non_accent_shapes, clearance))
+    issues.extend(check_overlaps(non_accent_shapes, index))
 
     quality = "good" if not issues else "needs-attention"
     return {
@@ -484,7 +666,7 @@ def create_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description=(
             "Validate PPTX element geometry: edge margins, adjacent gaps, "
-            "boundary overflow, and title-subtitle clearance"
+            "boundary overflow, title-subtitle clearance, and shape overlaps"
         )
     )
     parser.add_argument(
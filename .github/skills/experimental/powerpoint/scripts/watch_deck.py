@@ -0,0 +1,453 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Watch a content directory and incrementally rebuild and re-render the deck.
+
+Runs build, export, and render in one long-lived process. python-pptx,
+PyMuPDF, the parsed style.yaml, and the in-memory presentation stay warm
+between edits. The content directory is polled for changes. A burst of
+saves is coalesced once the tree has been quiet for the debounce window.
+
+Edits confined to ``slide-NNN/`` folders rebuild only those slides in place
+and re-render only their pages. Changes to style.yaml, to files outside
+slide folders, or to the set of slides trigger a full rebuild. When an
+image output directory is given, PPTX-to-PDF conversion reuses one
+persistent LibreOffice server (see ``soffice_server.py``).
+
+Usage:
+    python watch_deck.py --content-dir content/ \
+        --style content/global/style.yaml \
+        --output slide-deck/presentation.pptx
+    python watch_deck.py --content-dir content/ \
+        --style content/global/style.yaml \
+        --output slide-deck/presentation.pptx \
+        --image-output-dir slide-deck/validation/ --resolution 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import re
+import sys
+import tempfile
+import time
+from collections.abc import Iterable
+from pathlib import Path
+
+from build_deck import build_slide, discover_slides, new_presentation
+from export_slides import convert_pptx_to_pdf, filter_pdf_pages, find_libreoffice
+from pptx_utils import (
+    EXIT_ERROR,
+    EXIT_SUCCESS,
+    configure_logging,
+    load_yaml,
+)
+from render_pdf_images import render_pages
+from soffice_server import LibreOfficeServer
+
+logger = logging.getLogger(__name__)
+
+# Seconds between content directory scans.
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Seconds the tree must stay unchanged before a rebuild starts.
+DEFAULT_DEBOUNCE = 1.0
+
+SLIDE_DIR_PATTERN = re.compile(r"slide-(\d+)$")
+RENDERED_IMAGE_PATTERN = re.compile(r"slide-\d+\.jpg$")
+
+Snapshot = dict[Path, tuple[int, int]]
+
+
+def _is_ignored(path: Path, ignored: Iterable[Path]) -> bool:
+    """Return True for editor temp files and paths under *ignored* roots."""
+    if path.name.startswith(".") or path.name.endswith("~"):
+        return True
+    return any(path == root or root in path.parents for root in ignored)
+
+
+def snapshot_tree(
+    content_dir: Path,
+    extra_files: Iterable[Path] = (),
+    ignored: Iterable[Path] = (),
+) -> Snapshot:
+    """Record ``(mtime_ns, size)`` for every file under *content_dir*.
+
+    Args:
+        content_dir: Root directory to scan recursively.
+        extra_files: Additional files to track, such as a style.yaml that
+            lives outside the content directory.
+        ignored: Files or directories excluded from the snapshot, such as
+            build outputs written inside the content directory.
+
+    Returns:
+        Mapping of resolved file path to its modification time and size.
+    """
+    ignored = [p.resolve() for p in ignored]
+    snapshot: Snapshot = {}
+    candidates = list(content_dir.resolve().rglob("*"))
+    candidates.extend(p.resolve() for p in extra_files)
+    for path in candidates:
+        if _is_ignored(path, ignored):
+            continue
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        if path.is_file():
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+    return snapshot
+
+
+def diff_snapshots(before: Snapshot, after: Snapshot) -> set[Path]:
+    """Return paths added, removed, or modified between two snapshots."""
+    changed = set(before.keys() ^ after.keys())
+    changed.update(p for p in before.keys() & after.keys() if before[p] != after[p])
+    return changed
+
+
+def classify_changes(
+    changed: Iterable[Path], content_dir: Path, style_path: Path
+) -> set[int] | None:
+    """Map changed paths to the slide numbers they affect.
+
+    Args:
+        changed: Resolved paths reported by :func:`diff_snapshots`.
+        content_dir: Content directory containing ``slide-NNN/`` folders.
+        style_path: Global style.yaml path.
+
+    Returns:
+        Slide numbers to rebuild, or None when any change requires a full
+        rebuild (style.yaml, shared files, or paths outside slide folders).
+    """
+    content_dir = content_dir.resolve()
+    style_path = style_path.resolve()
+    slide_nums: set[int] = set()
+    for path in changed:
+        if path == style_path:
+            return None
+        try:
+            rel = path.relative_to(content_dir)
+        except ValueError:
+            return None
+        match = SLIDE_DIR_PATTERN.match(rel.parts[0]) if len(rel.parts) > 1 else None
+        if match is None:
+            return None
+        slide_nums.add(int(match.group(1)))
+    return slide_nums
+
+
+class DeckWatcher:
+    """Incremental build and render loop for one content directory.
+
+    The presentation object is kept in memory between rebuilds and saved
+    after each one. Slide numbers are mapped to their position in the deck,
+    so gaps in the ``slide-NNN`` numbering still re-render the right pages.
+    A failed build discards the in-memory deck and the next change triggers
+    a full rebuild.
+
+    Args:
+        content_dir: Content directory containing ``slide-NNN/`` folders.
+        style_path: Global style.yaml path.
+        output_path: PPTX file written after every rebuild.
+        image_dir: Directory for rendered ``slide-NNN.jpg`` images. When
+            None, the watcher only builds the PPTX.
+        dpi: Resolution for rendered images.
+        template: Optional template PPTX for themed builds.
+        allow_scripts: Authorize execution of content-extra.py scripts.
+        server: Optional persistent LibreOffice server for PDF conversion.
+        debounce: Seconds the tree must stay quiet before rebuilding.
+    """
+
+    def __init__(
+        self,
+        content_dir: Path,
+        style_path: Path,
+        output_path: Path,
+        *,
+        image_dir: Path | None = None,
+        dpi: int = 150,
+        template: Path | None = None,
+        allow_scripts: bool = False,
+        server: LibreOfficeServer | None = None,
+        debounce: float = DEFAULT_DEBOUNCE,
+    ) -> None:
+        self.content_dir = content_dir.resolve()
+        self.style_path = style_path.resolve()
+        self.output_path = output_path.resolve()
+        self.image_dir = image_dir.resolve() if image_dir else None
+        self.dpi = dpi
+        self.template = template
+        self.allow_scripts = allow_scripts
+        self.server = server
+        self.debounce = debounce
+        self._style: dict | None = None
+        self._prs = None
+        self._slide_dirs: dict[int, Path] = {}
+        self._positions: dict[int, int] = {}
+        self._snapshot: Snapshot = {}
+        self._pending: set[Path] = set()
+        self._last_change = 0.0
+
+    def _scan(self) -> Snapshot:
+        ignored = [self.output_path]
+        if self.image_dir is not None:
+            ignored.append(self.image_dir)
+        return snapshot_tree(self.content_dir, [self.style_path], ignored)
+
+    def build_all(self) -> list[int]:
+        """Build every slide into a fresh presentation and save it.
+
+        Returns:
+            Slide numbers in deck order; empty when no slides were found.
+        """
+        if self._style is None:
+            self._style = load_yaml(self.style_path)
+        slides_data = discover_slides(self.content_dir)
+        if not slides_data:
+            logger.error("No slide content found in %s", self.content_dir)
+            return []
+
+        prs = new_presentation(self._style, self.template)
+        for num, slide_dir in slides_data:
+            slide_content = load_yaml(slide_dir / "content.yaml")
+            build_slide(
+                prs,
+                slide_content,
+                self._style,
+                slide_dir,
+                allow_scripts=self.allow_scripts,
+            )
+        self._prs = prs
+        self._slide_dirs = dict(slides_data)
+        self._positions = {num: idx for idx, (num, _) in enumerate(slides_data)}
+        self._save()
+        logger.info("Built %d slides", len(slides_data))
+        return [num for num, _ in slides_data]
+
+    def rebuild(self, slide_nums: Iterable[int]) -> list[int]:
+        """Rebuild existing slides in place and save the presentation.
+
+        Returns:
+            Rebuilt slide numbers in deck order.
+        """
+        ordered = sorted(slide_nums, key=self._positions.__getitem__)
+        for num in ordered:
+            slide_dir = self._slide_dirs[num]
+            slide_content = load_yaml(slide_dir / "content.yaml")
+            build_slide(
+                self._prs,
+                slide_content,
+                self._style,
+                slide_dir,
+                existing_slide=self._prs.slides[self._positions[num]],
+                allow_scripts=self.allow_scripts,
+            )
+            logger.info("Rebuilt slide %d in-place", num)
+        self._save()
+        return ordered
+
+    def _save(self) -> None:
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._prs.save(str(self.output_path))
+        logger.info("Deck saved to %s", self.output_path)
+
+    def render(self, slide_nums: list[int], *, full: bool) -> None:
+        """Convert the saved deck to PDF and render the given slides to JPG.
+
+        Args:
+            slide_nums: Slide numbers in deck order.
+            full: When True, also remove rendered images for slides that no
+                longer exist in the deck.
+        """
+        if self.image_dir is None or not slide_nums:
+            return
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmp_path = Path(tmp_dir)
+            pdf_path = convert_pptx_to_pdf(self.output_path, tmp_path, self.server)
+            if not full:
+                pages = [self._positions[num] + 1 for num in slide_nums]
+                pdf_path = filter_pdf_pages(pdf_path, pages, tmp_path / "changed.pdf")
+            render_pages(pdf_path, self.image_dir, self.dpi, slide_nums)
+
+        if full:
+            keep = {f"slide-{num:03d}.jpg" for num in slide_nums}
+            for image in self.image_dir.glob("slide-*.jpg"):
+                if RENDERED_IMAGE_PATTERN.match(image.name) and image.name not in keep:
+                    image.unlink()
+
+    def process(self, changed: set[Path] | None) -> bool:
+        """Rebuild and re-render for a set of changed paths.
+
+        Args:
+            changed: Changed paths, or None to force a full rebuild.
+
+        Returns:
+            True when the build and render succeeded.
+        """
+        slide_nums = None
+        if changed is not None:
+            if self.style_path in changed:
+                self._style = None
+            slide_nums = classify_changes(changed, self.content_dir, self.style_path)
+        if slide_nums is not None and (
+            self._prs is None
+            or {num for num, _ in discover_slides(self.content_dir)}
+            != self._slide_dirs.keys()
+        ):
+            slide_nums = None
+
+        try:
+            if slide_nums is None:
+                built = self.build_all()
+                self.render(built, full=True)
+                return bool(built)
+            rebuilt = self.rebuild(slide_nums)
+            self.render(rebuilt, full=False)
+            return True
+        except SystemExit:
+            # The export helpers exit on missing tools; keep watching instead.
+            logger.error("Export failed; waiting for the next change")
+        except Exception as exc:
+            logger.error("Rebuild failed: %s", exc)
+            self._prs = None
+        return False
+
+    def start(self) -> bool:
+        """Take the initial snapshot and run a full build and render."""
+        self._snapshot = self._scan()
+        return self.process(None)
+
+    def poll(self, now: float) -> bool:
+        """Scan for changes and rebuild once the debounce window has passed.
+
+        Args:
+            now: Current monotonic time in seconds.
+
+        Returns:
+            True when a rebuild ran during this poll.
+        """
+        snapshot = self._scan()
+        changed = diff_snapshots(self._snapshot, snapshot)
+        self._snapshot = snapshot
+        if changed:
+            self._pending |= changed
+            self._last_change = now
+            return False
+        if not self._pending or now - self._last_change < self.debounce:
+            return False
+        pending, self._pending = self._pending, set()
+        self.process(pending)
+        return True
+
+    def run(
+        self,
+        interval: float = DEFAULT_POLL_INTERVAL,
+        max_polls: int | None = None,
+    ) -> None:
+        """Build once, then poll until interrupted or *max_polls* is reached."""
+        self.start()
+        logger.info("Watching %s for changes (Ctrl+C to stop)", self.content_dir)
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            time.sleep(interval)
+            self.poll(time.monotonic())
+            polls += 1
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create and configure argument parser."""
+    parser = argparse.ArgumentParser(
+        description="Watch YAML content and incrementally rebuild the deck"
+    )
+    parser.add_argument(
+        "--content-dir", required=True, type=Path, help="Path to the content/ directory"
+    )
+    parser.add_argument(
+        "--style", required=True, type=Path, help="Path to the global style.yaml"
+    )
+    parser.add_argument("--output", required=True, type=Path, help="Output PPTX path")
+    parser.add_argument(
+        "--template", type=Path, help="Template PPTX file path for themed builds"
+    )
+    parser.add_argument(
+        "--image-output-dir",
+        type=Path,
+        help="Render changed slides to JPG images in this directory",
+    )
+    parser.add_argument(
+        "--resolution", type=int, default=150, help="Image DPI (default: 150)"
+    )
+    parser.add_argument(
+        "--allow-scripts",
+        action="store_true",
+        help="Authorize execution of content-extra.py scripts (trusted content only)",
+    )
+    parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"Seconds between scans (default: {DEFAULT_POLL_INTERVAL})",
+    )
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=DEFAULT_DEBOUNCE,
+        help=(
+            "Seconds the content must stay unchanged before rebuilding "
+            f"(default: {DEFAULT_DEBOUNCE})"
+        ),
+    )
+    parser.add_argument(
+        "--no-server",
+        action="store_true",
+        help="Use one-shot LibreOffice conversions instead of a persistent server",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="Enable verbose output"
+    )
+    return parser
+
+
+def main() -> int:
+    """CLI entry point for watch mode."""
+    parser = create_parser()
+    args = parser.parse_args()
+    configure_logging(args.verbose)
+
+    if not args.content_dir.is_dir():
+        logger.error("Content directory not found: %s", args.content_dir)
+        return EXIT_ERROR
+    if not args.style.is_file():
+        logger.error("Style file not found: %s", args.style)
+        return EXIT_ERROR
+
+    server = None
+    if args.image_output_dir and not args.no_server:
+        soffice = find_libreoffice()
+        if soffice:
+            server = LibreOfficeServer(soffice)
+
+    watcher = DeckWatcher(
+        args.content_dir,
+        args.style,
+        args.output,
+        image_dir=args.image_output_dir,
+        dpi=args.resolution,
+        template=args.template,
+        allow_scripts=args.allow_scripts,
+        server=server,
+        debounce=args.debounce,
+    )
+    try:
+        watcher.run(args.interval)
+    except KeyboardInterrupt:
+        print("\nStopped watching", file=sys.stderr)
+    finally:
+        if server is not None:
+            server.close()
+    return EXIT_SUCCESS
+
+
+if __name__ == "__main__":
+    sys.exit(main())
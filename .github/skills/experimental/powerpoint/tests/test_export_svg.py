@@ -272,3 +272,72 @@ class TestExportPdfToSvgMalformed:
     def test_rejects_empty_pdf(self, malformed_pdf_dir, tmp_path):
         with pytest.raises(PyMuPDFError, match="PDF safety check failed"):
             export_pdf_to_svg(malformed_pdf_dir / "empty.pdf", tmp_path / "svg")
+
+
+class TestRunBatch:
+    """Tests for multi-deck exports through --inputs."""
+
+    def test_batch_shares_one_server(self, mocker, tmp_path):
+        decks = [tmp_path / "a.pptx", tmp_path / "b.pptx"]
+        for deck in decks:
+            deck.write_bytes(b"PK")
+        mocker.patch("export_svg.find_libreoffice", return_value="/usr/bin/soffice")
+        server_cls = mocker.patch("export_svg.LibreOfficeServer")
+        mock_export = mocker.patch(
+            "export_svg._export_deck", side_effect=lambda p, d, s, srv: [d / "x.svg"]
+        )
+        parser = create_parser()
+        args = parser.parse_args(
+            ["--inputs", *map(str, decks), "--output-dir", str(tmp_path / "out")]
+        )
+
+        assert run(args) == 0
+        server_cls.assert_called_once_with("/usr/bin/soffice")
+        server_cls.return_value.close.assert_called_once()
+        deck_dirs = [c.args[1] for c in mock_export.call_args_list]
+        assert deck_dirs == [tmp_path / "out" / "a", tmp_path / "out" / "b"]
+        assert all(
+            c.args[3] is server_cls.return_value for c in mock_export.call_args_list
+        )
+
+    def test_no_server_flag_disables_server(self, mocker, tmp_path):
+        decks = [tmp_path / "a.pptx", tmp_path / "b.pptx"]
+        for deck in decks:
+            deck.write_bytes(b"PK")
+        server_cls = mocker.patch("export_svg.LibreOfficeServer")
+        mock_export = mocker.patch("export_svg._export_deck", return_value=[])
+        parser = create_parser()
+        args = parser.parse_args(
+            [
+                "--inputs",
+                *map(str, decks),
+                "--output-dir",
+                str(tmp_path / "out"),
+                "--no-server",
+            ]
+        )
+
+        assert run(args) == 0
+        server_cls.assert_not_called()
+        assert all(c.args[3] is None for c in mock_export.call_args_list)
+
+    def test_rejects_decks_with_same_stem(self, mocker, tmp_path):
+        decks = [tmp_path / "a" / "deck.pptx", tmp_path / "b" / "Deck.pptx"]
+        for deck in decks:
+            deck.parent.mkdir()
+            deck.write_bytes(b"PK")
+        mock_export = mocker.patch("export_svg._export_deck")
+        parser = create_parser()
+        args = parser.parse_args(
+            ["--inputs", *map(str, decks), "--output-dir", str(tmp_path / "out")]
+        )
+
+        assert run(args) == 2
+        mock_export.assert_not_called()
+
+    def test_input_and_inputs_are_exclusive(self):
+        parser = create_parser()
+        with pytest.raises(SystemExit):
+            parser.parse_args(
+                ["--input", "a.pptx", "--inputs", "b.pptx", "--output-dir", "o"]
+            )
@@ -8,14 +8,17 @@ from unittest.mock import MagicMock
 
 import pytest
 from extract_content import (
+    ImageStore,
     _build_color_map,
     _classify_slide_brightness,
     _cluster_themes,
+    _collect_slide_style,
     _convert_svg_to_png,
     _has_formatting_variation,
     _ImageSecurityError,
     _is_background_image,
     _is_freeform,
+    _new_style_stats,
     _resolve_theme_colors,
     _resolve_theme_refs_in_content,
     _sanitize_svg,
@@ -378,7 +381,7 @@ class TestExtractImage:
             return_value={"path": "images/image-01.png"},
         )
         result = extract_image(pic, output_dir, 2, 5)
-        mock_save.assert_called_once_with(pic, output_dir, 2, 5)
+        mock_save.assert_called_once_with(pic, output_dir, 2, 5, image_store=None)
         assert result["path"] == "images/image-01.png"
 
 
@@ -949,6 +952,89 @@ class TestSaveImageBlob:
             _save_image_blob(mock_shape, tmp_path, 1, 1)
 
 
+class TestImageStore:
+    """Tests for the content-addressed ImageStore."""
+
+    def _svg_shape(self):
+        shape = MagicMock()
+        shape.image.content_type = "image/svg+xml"
+        shape.image.blob = b'<svg xmlns="http://www.w3.org/2000/svg"/>'
+        return shape
+
+    def test_repeated_blob_converted_once_per_slide_copies(self, tmp_path, mocker):
+        convert = mocker.patch(
+            "extract_content._convert_svg_to_png", return_value=b"\x89PNG"
+        )
+        store = ImageStore()
+        shape = self._svg_shape()
+        first = _save_image_blob(shape, tmp_path / "slide-001", 1, 1, store)
+        second = _save_image_blob(shape, tmp_path / "slide-002", 2, 3, store)
+
+        assert convert.call_count == 1
+        assert first["path"] == "images/image-01.png"
+        assert second["path"] == "images/image-03.png"
+        copied = tmp_path / "slide-002" / second["path"]
+        assert copied.read_bytes() == b"\x89PNG"
+
+    def test_shared_dir_writes_each_digest_once(self, tmp_path, mocker):
+        mocker.patch("extract_content._convert_svg_to_png", return_value=b"\x89PNG")
+        shared = tmp_path / "global" / "images"
+        store = ImageStore(shared)
+        shape = self._svg_shape()
+        first = _save_image_blob(shape, tmp_path / "slide-001", 1, 1, store)
+        second = _save_image_blob(shape, tmp_path / "slide-002", 2, 1, store)
+
+        assert first["path"] == second["path"]
+        assert first["path"].startswith("../global/images/")
+        assert len(list(shared.iterdir())) == 1
+        assert not (tmp_path / "slide-001" / "images").exists()
+        resolved = (tmp_path / "slide-002" / second["path"]).resolve()
+        assert resolved.read_bytes() == b"\x89PNG"
+
+    def test_distinct_blobs_get_distinct_files(self, tmp_path):
+        store = ImageStore(tmp_path / "shared")
+        paths = set()
+        for payload in (b"a", b"b"):
+            shape = MagicMock()
+            shape.image.content_type = "image/png"
+            shape.image.blob = payload
+            paths.add(_save_image_blob(shape, tmp_path / "s", 1, 1, store)["path"])
+        assert len(paths) == 2
+
+    def test_rejected_blob_failure_is_cached(self, tmp_path, mocker):
+        validate = mocker.patch(
+            "extract_content._validate_wmf_magic_bytes",
+            side_effect=_ImageSecurityError("bad wmf"),
+        )
+        store = ImageStore()
+        shape = MagicMock()
+        shape.image.content_type = "image/x-wmf"
+        shape.image.blob = b"\x00" * 8
+        for slide_num in (1, 2):
+            with pytest.raises(_ImageSecurityError, match="bad wmf"):
+                _save_image_blob(shape, tmp_path, slide_num, 1, store)
+        assert validate.call_count == 1
+
+    def test_extract_slide_shares_store_across_slides(
+        self, blank_presentation, sample_image_path, tmp_path
+    ):
+        layout = blank_presentation.slide_layouts[6]
+        slides = [blank_presentation.slides.add_slide(layout) for _ in range(2)]
+        for slide in slides:
+            slide.shapes.add_picture(str(sample_image_path), Inches(1), Inches(1))
+        store = ImageStore(tmp_path / "global" / "images")
+
+        paths = [
+            extract_slide(slide, n, tmp_path, image_store=store)[0]["elements"][0][
+                "path"
+            ]
+            for n, slide in enumerate(slides, start=1)
+        ]
+
+        assert paths[0] == paths[1]
+        assert len(list((tmp_path / "global" / "images").iterdir())) == 1
+
+
 class TestValidateEmfMagicBytes:
     """Tests for _validate_emf_magic_bytes."""
 
@@ -1535,6 +1621,32 @@ class TestExtractSlideDeep:
         # follow_master_background is read-only, so we verify structure
         assert "elements" in content
 
+    def test_style_stats_match_standalone_collection(self, blank_slide, tmp_path):
+        shape = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(4), Inches(2)
+        )
+        shape.fill.solid()
+        shape.fill.fore_color.rgb = RGBColor(0x2D, 0x2D, 0x44)
+        run = shape.text_frame.paragraphs[0].add_run()
+        run.text = "Styled"
+        run.font.name = "Arial"
+        run.font.size = Pt(18)
+        run.font.color.rgb = RGBColor(0xFF, 0xFF, 0xFF)
+        dims = (13.333, 7.5)
+        expected = _new_style_stats()
+        _collect_slide_style(blank_slide, 1, dims, expected)
+
+        stats = _new_style_stats()
+        extract_slide(blank_slide, 1, tmp_path, slide_dims=dims, style_stats=stats)
+
+        assert stats == expected
+        assert stats["fill_colors"]["#2D2D44"] == 1
+        assert stats["font_names"]["Arial"] == 1
+
+    def test_style_stats_require_slide_dims(self, blank_slide, tmp_path):
+        with pytest.raises(ValueError, match="slide_dims"):
+            extract_slide(blank_slide, 1, tmp_path, style_stats=_new_style_stats())
+
 
 class TestDetectGlobalStyleDeep:
     """Tests for detect_global_style with styled slides."""
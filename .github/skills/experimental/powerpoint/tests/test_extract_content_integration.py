@@ -5,9 +5,11 @@
 from pathlib import Path
 from unittest.mock import patch
 
+import extract_content
 import pytest
 import yaml
-from extract_content import main
+from extract_content import detect_global_style, main
+from pptx import Presentation
 from validate_deck import max_severity, validate_deck
 
 EXPECTED_FIXTURE = {
@@ -125,6 +127,80 @@ def test_main_resolves_theme_colors_for_real_fixture(
     )
 
 
+@pytest.mark.integration
+def test_main_shared_images_references_global_store(
+    minimal_test_fixture_path, tmp_path
+):
+    output_dir = tmp_path / "output"
+
+    with patch(
+        "sys.argv",
+        [
+            "extract_content.py",
+            "--input",
+            str(minimal_test_fixture_path),
+            "--output-dir",
+            str(output_dir),
+            "--shared-images",
+        ],
+    ):
+        main()
+
+    slide_2_dir = output_dir / "slide-002"
+    image_ref = _read_yaml(slide_2_dir / "content.yaml")["elements"][2]["path"]
+
+    assert image_ref.startswith("../global/images/")
+    assert (slide_2_dir / image_ref).resolve().is_file()
+    assert not (slide_2_dir / "images").exists()
+
+
+def _run_extract(pptx_path, output_dir, *extra):
+    argv = ["extract_content.py", "--input", str(pptx_path)]
+    argv += ["--output-dir", str(output_dir), *extra]
+    with patch("sys.argv", argv):
+        main()
+    return {
+        path.relative_to(output_dir).as_posix(): path.read_bytes()
+        for path in sorted(output_dir.rglob("*"))
+        if path.is_file()
+    }
+
+
+@pytest.mark.integration
+def test_main_parallel_jobs_match_serial_output(minimal_test_fixture_path, tmp_path):
+    serial = _run_extract(minimal_test_fixture_path, tmp_path / "serial")
+    parallel = _run_extract(
+        minimal_test_fixture_path, tmp_path / "parallel", "--jobs", "2"
+    )
+
+    assert parallel == serial
+
+
+@pytest.mark.integration
+def test_main_single_pass_style_matches_detect_global_style(
+    minimal_test_fixture_path, tmp_path
+):
+    files = _run_extract(minimal_test_fixture_path, tmp_path / "out", "--slides", "2")
+    style = yaml.safe_load(files["global/style.yaml"])
+
+    expected = detect_global_style(Presentation(str(minimal_test_fixture_path)))
+
+    assert style == expected
+    assert "slide-001/content.yaml" not in files
+
+
+@pytest.mark.integration
+def test_main_walks_extracted_slides_once(minimal_test_fixture_path, tmp_path):
+    with patch(
+        "extract_content._collect_slide_style",
+        wraps=extract_content._collect_slide_style,
+    ) as collect:
+        _run_extract(minimal_test_fixture_path, tmp_path / "out", "--slides", "2")
+
+    # Only slide 1, skipped by --slides, needs a style-only walk.
+    assert [c.args[1] for c in collect.call_args_list] == [1]
+
+
 @pytest.mark.integration
 def test_generated_fixture_passes_validate_deck(
     minimal_test_fixture_path: Path,
@@ -0,0 +1,206 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Tests for soffice_server module.
+
+The UNO bridge only ships with LibreOffice, so these tests inject a fake
+``uno`` module and mock ``subprocess.Popen`` for the soffice process.
+"""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+from soffice_server import (
+    PDF_EXPORT_FILTER,
+    LibreOfficeServer,
+    LibreOfficeServerError,
+)
+
+
+class _FakeStruct:
+    """Stand-in for a UNO PropertyValue struct."""
+
+    Name = ""
+    Value = None
+
+
+def _make_fake_uno(desktop: MagicMock) -> MagicMock:
+    """Build a fake ``uno`` module whose resolver returns ``desktop``."""
+    fake_uno = MagicMock()
+    remote_context = MagicMock()
+    remote_context.ServiceManager.createInstanceWithContext.return_value = desktop
+    resolver = MagicMock()
+    resolver.resolve.return_value = remote_context
+    local_context = fake_uno.getComponentContext.return_value
+    local_context.ServiceManager.createInstanceWithContext.return_value = resolver
+    fake_uno.createUnoStruct.side_effect = lambda _name: _FakeStruct()
+    fake_uno.systemPathToFileUrl.side_effect = lambda p: Path(p).as_uri()
+    return fake_uno
+
+
+@pytest.fixture()
+def fake_desktop(tmp_path):
+    """Desktop mock whose documents write the requested PDF on store."""
+    desktop = MagicMock()
+    document = MagicMock()
+
+    def store(url, _props):
+        Path(url.removeprefix("file://")).write_bytes(b"%PDF-1.4")
+
+    document.storeToURL.side_effect = store
+    desktop.loadComponentFromURL.return_value = document
+    return desktop
+
+
+@pytest.fixture()
+def fake_popen(mocker):
+    """Mock Popen returning a process that stays alive until terminated."""
+    process = MagicMock()
+    process.poll.return_value = None
+    return mocker.patch("subprocess.Popen", return_value=process)
+
+
+class TestLibreOfficeServer:
+    """Tests for LibreOfficeServer lifecycle and conversions."""
+
+    def test_missing_uno_raises(self, mocker):
+        mocker.patch.dict("sys.modules", {"uno": None})
+        server = LibreOfficeServer("/usr/bin/soffice")
+        with pytest.raises(LibreOfficeServerError, match="UNO bridge"):
+            server.start()
+
+    def test_converts_multiple_decks_with_one_process(
+        self, mocker, fake_desktop, fake_popen, tmp_path
+    ):
+        mocker.patch.dict("sys.modules", {"uno": _make_fake_uno(fake_desktop)})
+        decks = [tmp_path / "a.pptx", tmp_path / "b.pptx"]
+        for deck in decks:
+            deck.write_bytes(b"PK")
+        out = tmp_path / "out"
+
+        with LibreOfficeServer("/usr/bin/soffice") as server:
+            results = [server.convert(deck, out) for deck in decks]
+
+        assert results == [out / "a.pdf", out / "b.pdf"]
+        assert fake_popen.call_count == 1
+        cmd = fake_popen.call_args.args[0]
+        assert "--headless" in cmd
+        assert any(arg.startswith("--accept=pipe,name=") for arg in cmd)
+        store_props = fake_desktop.loadComponentFromURL.return_value.storeToURL
+        assert store_props.call_args.args[1][0].Value == PDF_EXPORT_FILTER
+        fake_desktop.terminate.assert_called_once()
+
+    def test_respawns_after_crash(self, mocker, fake_desktop, fake_popen, tmp_path):
+        mocker.patch.dict("sys.modules", {"uno": _make_fake_uno(fake_desktop)})
+        crashed, fresh = MagicMock(), MagicMock()
+        crashed.poll.return_value = None
+        fresh.poll.return_value = None
+        fake_popen.side_effect = [crashed, fresh]
+        deck = tmp_path / "deck.pptx"
+        deck.write_bytes(b"PK")
+
+        server = LibreOfficeServer("/usr/bin/soffice")
+        server.start()
+        crashed.poll.return_value = -9
+        assert not server.alive
+        server.convert(deck, tmp_path)
+        assert server.alive
+        server.close()
+
+        assert fake_popen.call_count == 2
+        fresh.terminate.assert_called_once()
+
+    def test_startup_exit_raises(self, mocker, fake_desktop, fake_popen):
+        mocker.patch.dict("sys.modules", {"uno": _make_fake_uno(fake_desktop)})
+        fake_popen.return_value.poll.return_value = 81
+        fake_popen.return_value.returncode = 81
+        with pytest.raises(LibreOfficeServerError, match="exited during startup"):
+            LibreOfficeServer("/usr/bin/soffice").start()
+
+    def test_startup_timeout_raises(self, mocker, fake_desktop, fake_popen):
+        fake_uno = _make_fake_uno(fake_desktop)
+        resolver = (
+            fake_uno.getComponentContext.return_value.ServiceManager
+        ).createInstanceWithContext.return_value
+        resolver.resolve.side_effect = RuntimeError("NoConnectException")
+        mocker.patch.dict("sys.modules", {"uno": fake_uno})
+        mocker.patch("soffice_server.time.sleep")
+        server = LibreOfficeServer("/usr/bin/soffice", startup_timeout=0)
+        with pytest.raises(LibreOfficeServerError, match="did not accept"):
+            server.start()
+        fake_popen.return_value.terminate.assert_called_once()
+
+    def test_failed_startup_is_not_retried(
+        self, mocker, fake_desktop, fake_popen, tmp_path
+    ):
+        fake_uno = _make_fake_uno(fake_desktop)
+        resolver = (
+            fake_uno.getComponentContext.return_value.ServiceManager
+        ).createInstanceWithContext.return_value
+        resolver.resolve.side_effect = RuntimeError("NoConnectException")
+        mocker.patch.dict("sys.modules", {"uno": fake_uno})
+        mocker.patch("soffice_server.time.sleep")
+        deck = tmp_path / "deck.pptx"
+        deck.write_bytes(b"PK")
+        server = LibreOfficeServer("/usr/bin/soffice", startup_timeout=0)
+
+        with pytest.raises(LibreOfficeServerError, match="did not accept"):
+            server.convert(deck, tmp_path)
+        with pytest.raises(LibreOfficeServerError, match="failed to start earlier"):
+            server.convert(deck, tmp_path)
+
+        assert fake_popen.call_count == 1
+
+    def test_conversion_failure_is_wrapped(
+        self, mocker, fake_desktop, fake_popen, tmp_path
+    ):
+        mocker.patch.dict("sys.modules", {"uno": _make_fake_uno(fake_desktop)})
+        document = fake_desktop.loadComponentFromURL.return_value
+        document.storeToURL.side_effect = RuntimeError("IOException")
+        deck = tmp_path / "deck.pptx"
+        deck.write_bytes(b"PK")
+
+        with LibreOfficeServer("/usr/bin/soffice") as server:
+            with pytest.raises(LibreOfficeServerError, match="conversion failed"):
+                server.convert(deck, tmp_path)
+        document.close.assert_called_once_with(True)
+
+    def test_popen_oserror_raises(self, mocker, fake_desktop):
+        mocker.patch.dict("sys.modules", {"uno": _make_fake_uno(fake_desktop)})
+        mocker.patch("subprocess.Popen", side_effect=OSError("nope"))
+        with pytest.raises(LibreOfficeServerError, match="could not be started"):
+            LibreOfficeServer("/missing/soffice").start()
+
+
+class TestConvertFallback:
+    """Exporters fall back to the one-shot subprocess when the server fails."""
+
+    @pytest.mark.parametrize("module_name", ["export_slides", "export_svg"])
+    def test_falls_back_to_subprocess(self, mocker, tmp_path, module_name):
+        module = pytest.importorskip(module_name)
+        server = MagicMock()
+        server.convert.side_effect = LibreOfficeServerError("server down")
+        mocker.patch(f"{module_name}.find_libreoffice", return_value="/usr/bin/soffice")
+        mock_run = mocker.patch("subprocess.run")
+        mock_run.return_value = MagicMock(stdout="", stderr="")
+        pptx = tmp_path / "deck.pptx"
+        pptx.write_bytes(b"PK")
+        (tmp_path / "deck.pdf").write_bytes(b"%PDF-1.4")
+
+        result = module.convert_pptx_to_pdf(pptx, tmp_path, server)
+
+        assert result == tmp_path / "deck.pdf"
+        server.convert.assert_called_once()
+        mock_run.assert_called_once()
+
+    @pytest.mark.parametrize("module_name", ["export_slides", "export_svg"])
+    def test_uses_server_when_available(self, mocker, tmp_path, module_name):
+        module = pytest.importorskip(module_name)
+        server = MagicMock()
+        server.convert.return_value = tmp_path / "deck.pdf"
+        mock_run = mocker.patch("subprocess.run")
+
+        result = module.convert_pptx_to_pdf(tmp_path / "deck.pptx", tmp_path, server)
+
+        assert result == tmp_path / "deck.pdf"
+        mock_run.assert_not_called()
@@ -11,13 +11,16 @@ from pptx import Presentation
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.util import Inches
 from validate_geometry import (
+    ShapeIndex,
     _is_accent_bar,
     _shape_label,
     check_adjacent_gaps,
     check_boundary_overflow,
     check_edge_margins,
+    check_overlaps,
     check_title_clearance,
     create_parser,
+    flatten_shapes,
     generate_report,
     main,
     max_severity,
@@ -314,6 +317,202 @@ class TestCheckAdjacentGaps:
         assert len(issues) == 1
         assert issues[0]["check_type"] == "adjacent_gap"
 
+    def test_non_consecutive_near_collision(self, blank_slide):
+        """A tall left-column shape is checked against the next left shape
+        even when a right-column shape sits between them in top order."""
+        tall = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(4), Inches(3)
+        )
+        side = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(7), Inches(1.5), Inches(4), Inches(1)
+        )
+        below = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(4.1), Inches(4), Inches(1)
+        )
+        issues = check_adjacent_gaps([tall, side, below], 0.3)
+        assert len(issues) == 1
+        assert issues[0]["location"] == f"{tall.name}→{below.name}"
+
+    def test_group_children_checked_in_absolute_coordinates(self, blank_slide):
+        group = blank_slide.shapes.add_group_shape()
+        child = group.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(4), Inches(1)
+        )
+        below = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(2.1), Inches(4), Inches(1)
+        )
+        issues = check_adjacent_gaps([group, below], 0.3)
+        assert len(issues) == 1
+        assert issues[0]["location"] == f"{child.name}→{below.name}"
+
+    def test_children_of_same_group_not_paired(self, blank_slide):
+        group = blank_slide.shapes.add_group_shape()
+        group.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(4), Inches(1)
+        )
+        group.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(2.05), Inches(4), Inches(1)
+        )
+        assert check_adjacent_gaps([group], 0.3) == []
+
+
+class TestFlattenShapes:
+    """Tests for group flattening into absolute coordinates."""
+
+    def test_scaled_group_maps_child_offsets(self, blank_slide):
+        group = blank_slide.shapes.add_group_shape()
+        group.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(2), Inches(1)
+        )
+        # Move the group to (4", 2") and double its rendered size while the
+        # child coordinate space stays at the original extents.
+        xfrm = group._element.grpSpPr.find(
+            "{http://schemas.openxmlformats.org/drawingml/2006/main}xfrm"
+        )
+        xfrm.find("{http://schemas.openxmlformats.org/drawingml/2006/main}off").set(
+            "x", str(Inches(4))
+        )
+        xfrm.find("{http://schemas.openxmlformats.org/drawingml/2006/main}off").set(
+            "y", str(Inches(2))
+        )
+        ext = xfrm.find("{http://schemas.openxmlformats.org/drawingml/2006/main}ext")
+        ext.set("cx", str(Inches(4)))
+        ext.set("cy", str(Inches(2)))
+
+        (rect,) = flatten_shapes([group])
+
+        assert (rect.left, rect.top, rect.right, rect.bottom) == pytest.approx(
+            (4.0, 2.0, 8.0, 4.0)
+        )
+        assert rect.root is group
+
+    def test_plain_shapes_pass_through(self, blank_slide):
+        shape = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(2), Inches(3), Inches(4)
+        )
+        (rect,) = flatten_shapes([shape])
+        assert (rect.left, rect.top, rect.right, rect.bottom) == (1, 2, 4, 6)
+        assert rect.shape is shape
+
+
+def _brute_force_overlaps(rects):
+    return [
+        (a.shape.shape_id, b.shape.shape_id)
+        for i, a in enumerate(rects)
+        for b in rects[i + 1 :]
+        if min(a.right, b.right) - max(a.left, b.left) > 0.01
+        and min(a.bottom, b.bottom) - max(a.top, b.top) > 0.01
+    ]
+
+
+class TestOverlapSweep:
+    """Tests for the ShapeIndex overlap sweep."""
+
+    def test_random_layout_matches_brute_force_in_order(self, blank_slide):
+        import random
+
+        rng = random.Random(7)
+        shapes = [
+            blank_slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE,
+                Inches(rng.choice([0, 1, 2.5]) + rng.uniform(0, 10)),
+                Inches(rng.choice([0, 1, 2.5]) + rng.uniform(0, 6)),
+                Inches(rng.uniform(0, 2)),
+                Inches(rng.choice([0, 0.005, rng.uniform(0, 1.5)])),
+            )
+            for _ in range(300)
+        ]
+        index = ShapeIndex(shapes)
+
+        pairs = [
+            (a.shape.shape_id, b.shape.shape_id) for a, b in index.overlapping_pairs()
+        ]
+
+        assert pairs
+        assert pairs == _brute_force_overlaps(index.rects)
+
+    def test_stacked_column_compares_only_vertical_neighbors(
+        self, blank_slide, monkeypatch
+    ):
+        shapes = [
+            blank_slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE,
+                Inches(1),
+                Inches(row * 0.02),
+                Inches(4),
+                Inches(0.02),
+            )
+            for row in range(200)
+        ]
+        index = ShapeIndex(shapes)
+        comparisons = []
+        same_group = index._same_group
+        monkeypatch.setattr(
+            index,
+            "_same_group",
+            lambda a, b: comparisons.append((a, b)) or same_group(a, b),
+        )
+
+        assert list(index.overlapping_pairs()) == []
+        assert len(comparisons) < 2 * len(shapes)
+
+
+class TestCheckOverlaps:
+    """Tests for check_overlaps."""
+
+    def test_partial_overlap_reported(self, blank_slide):
+        a = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(4), Inches(2)
+        )
+        b = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(4), Inches(2), Inches(4), Inches(2)
+        )
+        issues = check_overlaps([a, b])
+        assert len(issues) == 1
+        assert issues[0]["check_type"] == "overlap"
+        assert issues[0]["severity"] == "info"
+        assert '1.00" x 1.00"' in issues[0]["description"]
+
+    def test_containment_and_touching_skipped(self, blank_slide):
+        card = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(1), Inches(1), Inches(6), Inches(4)
+        )
+        text = blank_slide.shapes.add_textbox(
+            Inches(1.5), Inches(1.5), Inches(3), Inches(1)
+        )
+        neighbor = blank_slide.shapes.add_shape(
+            MSO_SHAPE.RECTANGLE, Inches(7), Inches(1), Inches(2), Inches(2)
+        )
+        assert check_overlaps([card, text, neighbor]) == []
+
+    def test_dense_grid_matches_brute_force(self, blank_slide):
+        shapes = [
+            blank_slide.shapes.add_shape(
+                MSO_SHAPE.RECTANGLE,
+                Inches(0.5 + col * 0.9),
+                Inches(0.5 + row * 0.9),
+                Inches(1),
+                Inches(1),
+            )
+            for row in range(6)
+            for col in range(10)
+        ]
+        index = ShapeIndex(shapes)
+        pairs = {
+            (a.shape.shape_id, b.shape.shape_id) for a, b in index.overlapping_pairs()
+        }
+        rects = index.rects
+        expected = set()
+        for i, a in enumerate(rects):
+            for b in rects[i + 1 :]:
+                if (
+                    min(a.right, b.right) - max(a.left, b.left) > 0.01
+                    and min(a.bottom, b.bottom) - max(a.top, b.top) > 0.01
+                ):
+                    expected.add((a.shape.shape_id, b.shape.shape_id))
+        assert pairs == expected
+        assert len(check_overlaps(shapes, index)) == len(expected)
+
 
 class TestCheckTitleClearance:
     """Tests for check_title_clearance."""
@@ -0,0 +1,231 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Tests for watch_deck module."""
+
+import os
+from pathlib import Path
+
+import pytest
+from pptx import Presentation
+from watch_deck import (
+    DeckWatcher,
+    classify_changes,
+    diff_snapshots,
+    snapshot_tree,
+)
+
+
+def _write_slide(content_dir: Path, num: int, text: str) -> Path:
+    slide_dir = content_dir / f"slide-{num:03d}"
+    slide_dir.mkdir(parents=True, exist_ok=True)
+    content_yaml = slide_dir / "content.yaml"
+    content_yaml.write_text(
+        f"slide: {num}\n"
+        "elements:\n"
+        "  - type: textbox\n"
+        "    left: 1.0\n"
+        "    top: 1.0\n"
+        "    width: 4.0\n"
+        "    height: 1.0\n"
+        f"    text: {text}\n"
+    )
+    return content_yaml
+
+
+def _touch_later(path: Path) -> None:
+    """Bump mtime so the change is visible on coarse-grained filesystems."""
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _slide_texts(pptx_path: Path) -> list[str]:
+    prs = Presentation(str(pptx_path))
+    return [
+        " ".join(s.text_frame.text for s in slide.shapes if s.has_text_frame)
+        for slide in prs.slides
+    ]
+
+
+@pytest.fixture()
+def content(tmp_path):
+    """Content directory with three slides (numbered 1, 2, 5) and a style."""
+    content_dir = tmp_path / "content"
+    for num in (1, 2, 5):
+        _write_slide(content_dir, num, f"Slide {num}")
+    style = content_dir / "global" / "style.yaml"
+    style.parent.mkdir(parents=True)
+    style.write_text("dimensions:\n  width_inches: 13.333\n  height_inches: 7.5\n")
+    return content_dir, style
+
+
+class TestSnapshots:
+    """Tests for snapshot_tree and diff_snapshots."""
+
+    def test_detects_added_removed_and_modified(self, content):
+        content_dir, _ = content
+        before = snapshot_tree(content_dir)
+        modified = content_dir / "slide-001" / "content.yaml"
+        _touch_later(modified)
+        added = content_dir / "slide-002" / "notes.txt"
+        added.write_text("x")
+        removed = content_dir / "slide-005" / "content.yaml"
+        removed.unlink()
+
+        changed = diff_snapshots(before, snapshot_tree(content_dir))
+
+        assert changed == {p.resolve() for p in (modified, added, removed)}
+
+    def test_ignores_temp_files_and_output_dirs(self, content):
+        content_dir, _ = content
+        (content_dir / "slide-001" / ".content.yaml.swp").write_text("x")
+        (content_dir / "slide-001" / "content.yaml~").write_text("x")
+        renders = content_dir / "renders"
+        renders.mkdir()
+        (renders / "slide-001.jpg").write_bytes(b"jpg")
+
+        snapshot = snapshot_tree(content_dir, ignored=[renders])
+
+        names = {p.name for p in snapshot}
+        assert names == {"content.yaml", "style.yaml"}
+
+
+class TestClassifyChanges:
+    """Tests for classify_changes."""
+
+    def test_slide_folder_changes_map_to_slide_numbers(self, content):
+        content_dir, style = content
+        changed = {
+            (content_dir / "slide-002" / "content.yaml").resolve(),
+            (content_dir / "slide-005" / "images" / "a.png").resolve(),
+        }
+        assert classify_changes(changed, content_dir, style) == {2, 5}
+
+    def test_style_change_requires_full_rebuild(self, content):
+        content_dir, style = content
+        assert classify_changes({style.resolve()}, content_dir, style) is None
+
+    def test_shared_file_change_requires_full_rebuild(self, content, tmp_path):
+        content_dir, style = content
+        shared = (content_dir / "global" / "logo.png").resolve()
+        assert classify_changes({shared}, content_dir, style) is None
+        outside = (tmp_path / "elsewhere.yaml").resolve()
+        assert classify_changes({outside}, content_dir, style) is None
+
+
+class TestDeckWatcher:
+    """Tests for DeckWatcher incremental rebuilds."""
+
+    def test_start_builds_full_deck(self, content, tmp_path):
+        content_dir, style = content
+        output = tmp_path / "deck" / "presentation.pptx"
+        watcher = DeckWatcher(content_dir, style, output)
+
+        assert watcher.start()
+        assert _slide_texts(output) == ["Slide 1", "Slide 2", "Slide 5"]
+
+    def test_slide_edit_rebuilds_only_that_slide(self, mocker, content, tmp_path):
+        content_dir, style = content
+        output = tmp_path / "presentation.pptx"
+        watcher = DeckWatcher(content_dir, style, output, debounce=1.0)
+        watcher.start()
+        build_all = mocker.spy(watcher, "build_all")
+        rebuild = mocker.spy(watcher, "rebuild")
+
+        _write_slide(content_dir, 5, "Edited")
+        _touch_later(content_dir / "slide-005" / "content.yaml")
+        assert not watcher.poll(10.0)
+        assert not watcher.poll(10.5)
+        assert watcher.poll(11.0)
+
+        build_all.assert_not_called()
+        assert rebuild.spy_return == [5]
+        assert _slide_texts(output) == ["Slide 1", "Slide 2", "Edited"]
+
+    def test_debounce_restarts_on_further_changes(self, mocker, content, tmp_path):
+        content_dir, style = content
+        watcher = DeckWatcher(content_dir, style, tmp_path / "p.pptx", debounce=1.0)
+        watcher.start()
+        process = mocker.patch.object(watcher, "process")
+
+        slide_yaml = content_dir / "slide-001" / "content.yaml"
+        _touch_later(slide_yaml)
+        watcher.poll(10.0)
+        _touch_later(slide_yaml)
+        watcher.poll(10.8)
+        assert not watcher.poll(11.5)
+        assert watcher.poll(11.8)
+        process.assert_called_once_with({slide_yaml.resolve()})
+
+    def test_new_slide_triggers_full_rebuild(self, mocker, content, tmp_path):
+        content_dir, style = content
+        output = tmp_path / "presentation.pptx"
+        watcher = DeckWatcher(content_dir, style, output, debounce=0)
+        watcher.start()
+        rebuild = mocker.spy(watcher, "rebuild")
+
+        _write_slide(content_dir, 3, "Inserted")
+        watcher.poll(1.0)
+        watcher.poll(2.0)
+
+        rebuild.assert_not_called()
+        assert _slide_texts(output) == ["Slide 1", "Slide 2", "Inserted", "Slide 5"]
+
+    def test_build_error_keeps_watching_and_recovers(self, content, tmp_path):
+        content_dir, style = content
+        output = tmp_path / "presentation.pptx"
+        watcher = DeckWatcher(content_dir, style, output, debounce=0)
+        watcher.start()
+
+        slide_yaml = content_dir / "slide-002" / "content.yaml"
+        slide_yaml.write_text("slide: [unclosed\n")
+        assert watcher.process({slide_yaml.resolve()}) is False
+
+        _write_slide(content_dir, 2, "Fixed")
+        assert watcher.process({slide_yaml.resolve()}) is True
+        assert _slide_texts(output) == ["Slide 1", "Fixed", "Slide 5"]
+
+    def test_render_uses_deck_positions(self, mocker, content, tmp_path):
+        content_dir, style = content
+        image_dir = tmp_path / "images"
+        server = mocker.MagicMock()
+        convert = mocker.patch(
+            "watch_deck.convert_pptx_to_pdf", return_value=tmp_path / "full.pdf"
+        )
+        filter_pages = mocker.patch(
+            "watch_deck.filter_pdf_pages", return_value=tmp_path / "changed.pdf"
+        )
+        render = mocker.patch("watch_deck.render_pages")
+        watcher = DeckWatcher(
+            content_dir,
+            style,
+            tmp_path / "presentation.pptx",
+            image_dir=image_dir,
+            server=server,
+        )
+        watcher.start()
+        render.assert_called_once_with(tmp_path / "full.pdf", image_dir, 150, [1, 2, 5])
+        render.reset_mock()
+
+        slide_yaml = content_dir / "slide-005" / "content.yaml"
+        watcher.process({slide_yaml.resolve()})
+
+        assert convert.call_args.args[2] is server
+        assert filter_pages.call_args.args[1] == [3]
+        render.assert_called_once_with(tmp_path / "changed.pdf", image_dir, 150, [5])
+
+    def test_full_render_prunes_removed_slide_images(self, mocker, content, tmp_path):
+        content_dir, style = content
+        image_dir = tmp_path / "images"
+        image_dir.mkdir()
+        for name in ("slide-001.jpg", "slide-009.jpg", "slide-009-notes.jpg"):
+            (image_dir / name).write_bytes(b"jpg")
+        mocker.patch("watch_deck.convert_pptx_to_pdf")
+        mocker.patch("watch_deck.render_pages")
+        watcher = DeckWatcher(
+            content_dir, style, tmp_path / "p.pptx", image_dir=image_dir
+        )
+
+        watcher.start()
+
+        remaining = sorted(p.name for p in image_dir.iterdir())
+        assert remaining == ["slide-001.jpg", "slide-009-notes.jpg"]
@@ -22,22 +22,42 @@ and exit 2 means the scan did not complete and ``status`` is ``error``. Callers
 accept a durable write only on exit 0 with ``status`` of ``completed`` and the
 expected ``modes`` attestation.
 
+``--stream`` scans input of any size in bounded memory. Findings are printed
+as JSON Lines while the scan runs, and the last line is the report without its
+``findings`` list; callers must read that final line's ``status``.
+
+File scans run across a process pool and reuse cached findings for files whose
+contents and active ruleset are unchanged since an earlier run.
+``--changed-since <ref>`` limits the scan to files that ``git diff`` reports as
+changed from ``ref``, optionally under the given paths.
+
 Usage::
 
     python -m scripts.scan_sensitive_content <path> [<path> ...]
     python -m scripts.scan_sensitive_content --data --denylist terms.txt <path>
     cat adr.md | python -m scripts.scan_sensitive_content
+    python -m scripts.scan_sensitive_content --stream decision-log.md
+    python -m scripts.scan_sensitive_content --changed-since main docs/decisions
 """
 
 from __future__ import annotations
 
 import argparse
+import contextlib
+import functools
+import hashlib
 import json
+import os
 import re
+import subprocess
 import sys
-from collections.abc import Iterator
+import tempfile
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
-from typing import Any, NamedTuple
+from typing import Any, NamedTuple, TextIO
 
 try:
     from ._utils import safe_resolve
@@ -58,6 +78,18 @@ MAX_LINE_LENGTH = 10000
 MAX_DENYLIST_BYTES = 64 * 1024
 MAX_DENYLIST_TERMS = 1000
 MIN_DENYLIST_TERM_LENGTH = 3
+MAX_DENYLIST_CACHE_ENTRIES = 8
+
+# Streaming bounds. ``--stream`` has no total-size limit; it holds one read
+# chunk, one window of lines, and the sample-row context overlap at a time.
+STREAM_READ_CHARS = 64 * 1024
+STREAM_WINDOW_CHARS = 1024 * 1024
+
+# File scans. Cached findings are keyed by the SHA-256 of a file's bytes and of
+# the active ruleset, so an edited file or scanner invalidates its entry.
+MAX_SCAN_CACHE_ENTRIES = 4096
+PARALLEL_MIN_CHARS = 256 * 1024
+GIT_TIMEOUT_SECONDS = 30
 
 SKILL_ROOT = Path(__file__).resolve().parent.parent
 REPO_ROOT = SKILL_ROOT.parents[3] if len(SKILL_ROOT.parents) >= 4 else SKILL_ROOT
@@ -75,11 +107,19 @@ class ScanError(Exception):
 
 
 class Rule(NamedTuple):
-    """A named detection rule with a compiled pattern and confidence label."""
+    """A named detection rule with a compiled pattern and confidence label.
+
+    ``literals`` and ``needs_digit`` describe what any match must contain: at
+    least one of the lowercase ``literals`` once the line is case-folded, and a
+    ``\\d`` character. ``scan_text`` skips the pattern on lines that fail either
+    check, so the prefilter can only drop lines the pattern would not match.
+    """
 
     category: str
     confidence: str
     pattern: re.Pattern[str]
+    literals: tuple[str, ...] = ()
+    needs_digit: bool = False
 
 
 # High-confidence PII blocks durable/external writes. Names and roles are not
@@ -89,16 +129,20 @@ RULES: tuple[Rule, ...] = (
         "email_address",
         "high",
         re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
+        literals=("@",),
     ),
     Rule(
         "phone_number",
         "high",
         re.compile(r"\b(?:\+?1[\s.-]?)?(?:\(?\d{3}\)?[\s.-]?)\d{3}[\s.-]?\d{4}\b"),
+        needs_digit=True,
     ),
     Rule(
         "national_identifier",
         "high",
         re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
+        literals=("-",),
+        needs_digit=True,
     ),
 )
 
@@ -121,6 +165,7 @@ PUBLIC_ONLY_RULES: tuple[Rule, ...] = (
             r"(?:[:/][^\s)\"']*)?",
             re.IGNORECASE,
         ),
+        literals=("http",),
     ),
 )
 
@@ -137,11 +182,13 @@ DATA_ONLY_RULES: tuple[Rule, ...] = (
             r"[^\r\n;]*(?:;[^\r\n;=]+=[^\r\n;]*)+",
             re.IGNORECASE,
         ),
+        literals=("=",),
     ),
     Rule(
         "jdbc_odbc_uri",
         "high",
         re.compile(r"\b(?:jdbc|odbc):[^\s\"']+", re.IGNORECASE),
+        literals=("jdbc:", "odbc:"),
     ),
     Rule(
         "db_uri_with_credentials",
@@ -150,41 +197,49 @@ DATA_ONLY_RULES: tuple[Rule, ...] = (
             r"\b(?:postgres(?:ql)?|mysql|mongodb(?:\+srv)?|redis)://" r"[^\s/@:]+:[^\s/@]+@[^\s\"']+",
             re.IGNORECASE,
         ),
+        literals=("://",),
     ),
     Rule(
         "storage_key",
         "high",
         re.compile(r"\bAccountKey\s*=\s*[A-Za-z0-9+/]{20,}={0,2}", re.IGNORECASE),
+        literals=("accountkey",),
     ),
     Rule(
         "bearer_token",
         "high",
         re.compile(r"\bAuthorization\s*:\s*Bearer\s+[A-Za-z0-9._~+/-]{12,}", re.IGNORECASE),
+        literals=("bearer",),
     ),
     Rule(
         "private_key_block",
         "high",
         re.compile(r"-----BEGIN (?:RSA |EC |DSA |OPENSSH |PGP )?PRIVATE KEY-----"),
+        literals=("private key-----",),
     ),
     Rule(
         "cloud_access_key_id",
         "high",
         re.compile(r"\b(?:AKIA|ASIA|AGPA|AIDA|AROA|ANPA|ANVA)[A-Z0-9]{16}\b"),
+        literals=("akia", "asia", "agpa", "aida", "aroa", "anpa", "anva"),
     ),
     Rule(
         "source_control_token",
         "high",
         re.compile(r"\bgh[pousr]_[A-Za-z0-9]{36,}\b"),
+        literals=("ghp_", "gho_", "ghu_", "ghs_", "ghr_"),
     ),
     Rule(
         "chat_webhook_token",
         "high",
         re.compile(r"\bxox[baprs]-[A-Za-z0-9-]{10,}\b"),
+        literals=("xoxb-", "xoxa-", "xoxp-", "xoxr-", "xoxs-"),
     ),
     Rule(
         "web_token",
         "high",
         re.compile(r"\beyJ[A-Za-z0-9_-]{10,}\.eyJ[A-Za-z0-9_-]{10,}\.[A-Za-z0-9_-]{10,}\b"),
+        literals=("eyj",),
     ),
     Rule(
         "generic_secret_assignment",
@@ -194,21 +249,26 @@ DATA_ONLY_RULES: tuple[Rule, ...] = (
             r"\s*[:=]\s*[\"']?[A-Za-z0-9/+_=-]{16,}[\"']?",
             re.IGNORECASE,
         ),
+        literals=(":", "="),
     ),
     Rule(
         "uk_national_insurance",
         "warn",
         re.compile(r"\b[A-CEGHJ-PR-TW-Z]{2}\s?\d{2}\s?\d{2}\s?\d{2}\s?[A-D]\b", re.IGNORECASE),
+        needs_digit=True,
     ),
     Rule(
         "canadian_sin",
         "warn",
         re.compile(r"\b\d{3}[ -]\d{3}[ -]\d{3}\b"),
+        needs_digit=True,
     ),
     Rule(
         "international_phone",
         "warn",
         re.compile(r"(?<!\w)\+[2-9]\d{7,14}\b"),
+        literals=("+",),
+        needs_digit=True,
     ),
 )
 
@@ -313,6 +373,7 @@ CODE_FENCE_PATTERN = re.compile(r"^\s*(?:```|~~~)")
 MARKDOWN_TABLE_ROW_PATTERN = re.compile(r"^\s*\|(?:[^|]+\|){2,}\s*$")
 # Alignment/separator rows carry no data and must not be reported as samples.
 MARKDOWN_SEPARATOR_CELL_PATTERN = re.compile(r"^[\s:-]+$")
+DIGIT_PATTERN = re.compile(r"\d")
 JSON_ARRAY_PATTERN = re.compile(r"^\s*\[(?:[^\[\]]|\[[^\]]*\])*\]\s*,?\s*$")
 SAS_URL_PATTERN = re.compile(r"https?://[^\s\"']{1,512}\?[^\s\"']{1,2048}", re.IGNORECASE)
 # Documentation placeholders must not block writes.
@@ -357,6 +418,36 @@ def _iter_lines(text: str) -> Iterator[tuple[int, str]]:
         yield line_number, line[:MAX_LINE_LENGTH]
 
 
+def _iter_stream_lines(handle: TextIO) -> Iterator[tuple[int, str]]:
+    """Yield the same numbered, truncated lines as ``_iter_lines`` from a stream.
+
+    Reads ``STREAM_READ_CHARS`` at a time and splits with ``str.splitlines`` so
+    line boundaries match a whole-text scan. A line's content past
+    ``MAX_LINE_LENGTH`` is discarded as it arrives instead of being buffered.
+    """
+    line_number = 0
+    pending = ""
+    overflowed = False
+    while chunk := handle.read(STREAM_READ_CHARS):
+        # Keep a "\r\n" pair that straddles two reads as one line break.
+        while chunk.endswith("\r") and (extra := handle.read(1)):
+            chunk += extra
+        for piece in chunk.splitlines(keepends=True):
+            body = piece.splitlines()[0]
+            if not overflowed:
+                pending += body
+                if len(pending) > MAX_LINE_LENGTH:
+                    pending = pending[:MAX_LINE_LENGTH]
+                    overflowed = True
+            if len(body) != len(piece):
+                line_number += 1
+                yield line_number, pending
+                pending = ""
+                overflowed = False
+    if pending or overflowed:
+        yield line_number + 1, pending
+
+
 def _redact(match: str) -> str:
     """Return a masked preview of matched content for safe reporting."""
     stripped = match.strip()
@@ -415,10 +506,10 @@ def _normalize_identifier(value: str) -> str:
     return re.sub(r"[^A-Za-z0-9]+", "_", value).strip("_").lower()
 
 
-def _scan_structured_columns(text: str, source: str) -> list[dict[str, Any]]:
+def _scan_structured_columns(lines: Iterable[tuple[int, str]], source: str) -> list[dict[str, Any]]:
     """Detect sensitive column names only in structured declarations."""
     findings: list[dict[str, Any]] = []
-    for line_number, line in _iter_lines(text):
+    for line_number, line in lines:
         candidates: list[tuple[str, int]] = []
         for pattern in STRUCTURED_COLUMN_PATTERNS:
             match = pattern.search(line)
@@ -467,7 +558,7 @@ def _is_sample_row(line: str) -> bool:
     return not all(MARKDOWN_SEPARATOR_CELL_PATTERN.match(cell) for cell in cells)
 
 
-def _scan_sample_rows(text: str, source: str) -> list[dict[str, Any]]:
+def _scan_sample_rows(lines: Iterable[tuple[int, str]], source: str) -> list[dict[str, Any]]:
     """Warn on table or array rows in an explicit, bounded sample context.
 
     The context ends at the next heading, a fenced-code delimiter, a blank line
@@ -479,7 +570,7 @@ def _scan_sample_rows(text: str, source: str) -> list[dict[str, Any]]:
     sample_context = False
     context_start = 0
     matched_rows = 0
-    for line_number, line in _iter_lines(text):
+    for line_number, line in lines:
         if SAMPLE_CONTEXT_PATTERN.search(line):
             sample_context = True
             context_start = line_number
@@ -501,10 +592,10 @@ def _scan_sample_rows(text: str, source: str) -> list[dict[str, Any]]:
     return findings
 
 
-def _scan_sas_tokens(text: str, source: str) -> list[dict[str, Any]]:
+def _scan_sas_tokens(lines: Iterable[tuple[int, str]], source: str) -> list[dict[str, Any]]:
     """Detect SAS URLs only when signature, expiry, and permission fields coexist."""
     findings: list[dict[str, Any]] = []
-    for line_number, line in _iter_lines(text):
+    for line_number, line in lines:
         for match in SAS_URL_PATTERN.finditer(line):
             query = match.group(0).split("?", 1)[1].lower()
             fields = {part.split("=", 1)[0] for part in query.split("&") if "=" in part}
@@ -522,9 +613,125 @@ def _scan_sas_tokens(text: str, source: str) -> list[dict[str, Any]]:
     return findings
 
 
-def _build_denylist_rules(terms: list[str]) -> tuple[Rule, ...]:
-    """Build case-insensitive literal high-confidence rules."""
-    return tuple(Rule("denylist_term", "high", re.compile(re.escape(term), re.IGNORECASE)) for term in terms)
+# Characters that ``re.IGNORECASE`` treats as equal although their lowercase
+# forms differ (dotless i, long s, Greek symbol variants, and so on), mapped to
+# one representative so denylist folding agrees with the regex engine.
+_CASE_VARIANTS = str.maketrans(
+    {
+        "\u0131": "i",
+        "\u017f": "s",
+        "\u00b5": "\u03bc",
+        "\u0345": "\u03b9",
+        "\u1fbe": "\u03b9",
+        "\u1fd3": "\u0390",
+        "\u1fe3": "\u03b0",
+        "\u03d0": "\u03b2",
+        "\u03f5": "\u03b5",
+        "\u03d1": "\u03b8",
+        "\u03f0": "\u03ba",
+        "\u03d6": "\u03c0",
+        "\u03f1": "\u03c1",
+        "\u03c2": "\u03c3",
+        "\u03d5": "\u03c6",
+        "\u1c80": "\u0432",
+        "\u1c81": "\u0434",
+        "\u1c82": "\u043e",
+        "\u1c83": "\u0441",
+        "\u1c84": "\u0442",
+        "\u1c85": "\u0442",
+        "\u1c86": "\u044a",
+        "\u1c87": "\u0463",
+        "\u1c88": "\ua64b",
+        "\u1e9b": "\u1e61",
+        "\ufb05": "\ufb06",
+    }
+)
+
+_CASE_VARIANT_PATTERN = re.compile("[" + "".join(chr(code) for code in _CASE_VARIANTS) + "]")
+
+
+def _fold_case(text: str) -> str:
+    """Fold ``text`` for case-insensitive literal matching without changing its length.
+
+    ``str.lower`` is length-preserving for every character except U+0130, whose
+    single-character lowercase is ``i``; that is also what ``re`` compares.
+    """
+    if text.isascii():
+        return text.lower()
+    lowered = text.replace("\u0130", "i").lower()
+    if _CASE_VARIANT_PATTERN.search(lowered) is None:
+        return lowered
+    return lowered.translate(_CASE_VARIANTS)
+
+
+class DenylistMatcher:
+    """Match every denylist term against a line in one pass.
+
+    The folded terms form an Aho-Corasick automaton, so scan cost grows with
+    line length rather than with lines times terms. For each term, ``finditer``
+    reports the same non-overlapping leftmost matches that a case-insensitive
+    ``re.finditer`` over the escaped term would.
+    """
+
+    def __init__(self, terms: Sequence[str], digest: str = "") -> None:
+        self.terms = tuple(terms)
+        self.digest = digest
+        self._lengths = tuple(len(term) for term in self.terms)
+        goto: list[dict[str, int]] = [{}]
+        outputs: list[tuple[int, ...]] = [()]
+        for index, term in enumerate(self.terms):
+            state = 0
+            for char in _fold_case(term):
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto[state][char] = next_state
+                    goto.append({})
+                    outputs.append(())
+                state = next_state
+            outputs[state] += (index,)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in goto[state].items():
+                queue.append(next_state)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[next_state] = goto[fallback].get(char, 0) if state else 0
+                outputs[next_state] += outputs[fail[next_state]]
+        self._goto = goto
+        self._fail = fail
+        self._outputs = outputs
+
+    def __len__(self) -> int:
+        return len(self.terms)
+
+    def finditer(self, line: str, folded: str | None = None) -> Iterator[tuple[int, str]]:
+        """Yield ``(start, matched text)`` pairs ordered by start, then term order.
+
+        ``folded`` may pass in ``_fold_case(line)`` when the caller already has it.
+        """
+        goto, fail, outputs, lengths = self._goto, self._fail, self._outputs, self._lengths
+        hits: list[tuple[int, int]] = []
+        next_start: dict[int, int] = {}
+        state = 0
+        for position, char in enumerate(_fold_case(line) if folded is None else folded):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for index in outputs[state]:
+                start = position - lengths[index] + 1
+                if start >= next_start.get(index, 0):
+                    hits.append((start, index))
+                    next_start[index] = position + 1
+        hits.sort()
+        for start, index in hits:
+            yield start, line[start : start + lengths[index]]
+
+
+_DENYLIST_CACHE: dict[str, DenylistMatcher] = {}
 
 
 def _finding_sort_key(finding: dict[str, Any]) -> tuple[str, int, int, str]:
@@ -532,11 +739,12 @@ def _finding_sort_key(finding: dict[str, Any]) -> tuple[str, int, int, str]:
     return (finding["source"], finding["line"], finding["column"], finding["category"])
 
 
-def _load_denylist(path: Path) -> tuple[Rule, ...]:
+def _load_denylist(path: Path) -> DenylistMatcher:
     """Read unique nonblank UTF-8 denylist terms without exposing them.
 
     Fails closed: an unreadable, oversized, or effectively empty denylist is a
-    configuration error rather than a scan with no denylist rules.
+    configuration error rather than a scan with no denylist rules. Compiled
+    matchers are cached by the SHA-256 of the file contents.
     """
     try:
         if not path.is_file():
@@ -547,8 +755,16 @@ def _load_denylist(path: Path) -> tuple[Rule, ...]:
     if size > MAX_DENYLIST_BYTES:
         raise ScanError("denylist_too_large", f"denylist exceeds {MAX_DENYLIST_BYTES} bytes")
     try:
-        lines = path.read_text(encoding="utf-8").splitlines()
-    except (OSError, UnicodeError) as exc:
+        raw = path.read_bytes()
+    except OSError as exc:
+        raise ScanError("denylist_unreadable", "denylist must be a readable UTF-8 text file") from exc
+    digest = hashlib.sha256(raw).hexdigest()
+    cached = _DENYLIST_CACHE.get(digest)
+    if cached is not None:
+        return cached
+    try:
+        lines = raw.decode("utf-8").splitlines()
+    except UnicodeError as exc:
         raise ScanError("denylist_unreadable", "denylist must be a readable UTF-8 text file") from exc
     terms: list[str] = []
     seen: set[str] = set()
@@ -570,31 +786,41 @@ def _load_denylist(path: Path) -> tuple[Rule, ...]:
             raise ScanError("denylist_too_large", f"denylist exceeds {MAX_DENYLIST_TERMS} terms")
     if not terms:
         raise ScanError("denylist_empty", "denylist contains no usable terms")
-    return _build_denylist_rules(terms)
+    matcher = DenylistMatcher(terms, digest)
+    if len(_DENYLIST_CACHE) >= MAX_DENYLIST_CACHE_ENTRIES:
+        _DENYLIST_CACHE.pop(next(iter(_DENYLIST_CACHE)))
+    _DENYLIST_CACHE[digest] = matcher
+    return matcher
 
 
-def scan_text(
-    text: str,
+def _scan_lines(
+    lines: Sequence[tuple[int, str]],
     source: str,
     *,
-    public: bool = False,
-    data: bool = False,
-    denylist_rules: tuple[Rule, ...] = (),
+    public: bool,
+    data: bool,
+    denylist: DenylistMatcher | None,
+    context: Sequence[tuple[int, str]] = (),
 ) -> list[dict[str, Any]]:
-    """Return a list of finding dicts for ``text`` attributed to ``source``.
+    """Return sorted findings for numbered ``lines``.
 
-    When ``public`` is true, internal-URL rules are included; in a private
-    repository those references are expected and are not flagged.
+    ``context`` holds the lines just before ``lines``. Only the sample-row
+    scanner reads it, to recover a sample context opened earlier in the input.
     """
     active_rules = RULES
     if public:
         active_rules = (*active_rules, *PUBLIC_ONLY_RULES)
     if data:
         active_rules = (*active_rules, *DATA_ONLY_RULES)
-    active_rules = (*active_rules, *denylist_rules)
     findings: list[dict[str, Any]] = []
-    for line_number, line in _iter_lines(text):
+    for line_number, line in lines:
+        folded = _fold_case(line)
+        has_digit = DIGIT_PATTERN.search(line) is not None
         for rule in active_rules:
+            if rule.needs_digit and not has_digit:
+                continue
+            if rule.literals and not any(literal in folded for literal in rule.literals):
+                continue
             for match in rule.pattern.finditer(line):
                 if rule.category == "generic_secret_assignment" and PLACEHOLDER_VALUE_PATTERN.match(
                     _assignment_value(match.group(0))
@@ -610,14 +836,76 @@ def scan_text(
                         match.group(0),
                     )
                 )
-    if data:
-        findings.extend(_scan_structured_columns(text, source))
-        findings.extend(_scan_sample_rows(text, source))
-        findings.extend(_scan_sas_tokens(text, source))
+        if denylist is not None:
+            for start, matched in denylist.finditer(line, folded):
+                findings.append(_finding(source, line_number, start + 1, "denylist_term", "high", matched))
+    if data and lines:
+        first_line = lines[0][0]
+        findings.extend(_scan_structured_columns(lines, source))
+        findings.extend(
+            finding for finding in _scan_sample_rows([*context, *lines], source) if finding["line"] >= first_line
+        )
+        findings.extend(_scan_sas_tokens(lines, source))
     findings.sort(key=_finding_sort_key)
     return findings
 
 
+def scan_text(
+    text: str,
+    source: str,
+    *,
+    public: bool = False,
+    data: bool = False,
+    denylist: DenylistMatcher | None = None,
+) -> list[dict[str, Any]]:
+    """Return a list of finding dicts for ``text`` attributed to ``source``.
+
+    When ``public`` is true, internal-URL rules are included; in a private
+    repository those references are expected and are not flagged.
+    """
+    return _scan_lines(list(_iter_lines(text)), source, public=public, data=data, denylist=denylist)
+
+
+def scan_stream(
+    handle: TextIO,
+    source: str,
+    *,
+    public: bool = False,
+    data: bool = False,
+    denylist: DenylistMatcher | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield the findings ``scan_text`` would return for ``handle``'s contents.
+
+    Lines are scanned in windows of about ``STREAM_WINDOW_CHARS``. Each window
+    is rescanned with the previous ``SAMPLE_CONTEXT_MAX_LINES + 1`` lines as
+    context, which is as far back as a sample-row context can reach. Findings
+    are yielded window by window, in the same order as ``scan_text``.
+    """
+    context: deque[tuple[int, str]] = deque(maxlen=SAMPLE_CONTEXT_MAX_LINES + 1)
+    window: list[tuple[int, str]] = []
+    window_chars = 0
+    for numbered in _iter_stream_lines(handle):
+        window.append(numbered)
+        window_chars += len(numbered[1]) + 1
+        if window_chars >= STREAM_WINDOW_CHARS:
+            yield from _scan_lines(window, source, public=public, data=data, denylist=denylist, context=context)
+            context.extend(window)
+            window = []
+            window_chars = 0
+    yield from _scan_lines(window, source, public=public, data=data, denylist=denylist, context=context)
+
+
+def _worker_count(value: str) -> int:
+    """Parse ``--jobs``, where 0 means one worker per available CPU."""
+    try:
+        count = int(value)
+    except ValueError:
+        count = -1
+    if count < 0:
+        raise argparse.ArgumentTypeError("must be a non-negative integer")
+    return count
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the argument parser."""
     parser = argparse.ArgumentParser(
@@ -661,6 +949,32 @@ def create_parser() -> argparse.ArgumentParser:
             "per line; enables high-confidence matching independently."
         ),
     )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Scan input of any size in bounded memory, printing findings as "
+            "JSON Lines followed by a final report line without findings."
+        ),
+    )
+    parser.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help=(
+            "Scan only files that git reports as changed from REF, limited to the given paths when any are supplied."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=_worker_count,
+        default=0,
+        help="Worker processes for file scans; 0 uses every available CPU.",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Scan every file and neither read nor write the result cache.",
+    )
     return parser
 
 
@@ -680,8 +994,13 @@ def _build_report(
     denylist_rule_count: int,
     findings: list[dict[str, Any]],
     error: ScanError | None = None,
+    summary: dict[str, int] | None = None,
 ) -> dict[str, Any]:
-    """Build the versioned report emitted on every terminal path."""
+    """Build the versioned report emitted on every terminal path.
+
+    A streamed report passes the running ``summary`` and omits ``findings``,
+    which were already printed.
+    """
     report: dict[str, Any] = {
         "schema_version": SCHEMA_VERSION,
         "status": status,
@@ -690,8 +1009,10 @@ def _build_report(
         report["error"] = {"code": error.code, "message": error.message}
     report["modes"] = modes
     report["denylist_rule_count"] = denylist_rule_count
-    report["findings"] = findings
-    report["summary"] = _summarize(findings)
+    if summary is None:
+        report["findings"] = findings
+        summary = _summarize(findings)
+    report["summary"] = summary
     return report
 
 
@@ -713,15 +1034,198 @@ def _allow_roots(args: argparse.Namespace) -> list[Path]:
     return roots
 
 
+def _scan_cache_path() -> Path:
+    """Return the per-user file holding cached findings."""
+    if os.name == "nt":  # pragma: no cover - Windows
+        local_app_data = os.environ.get("LOCALAPPDATA", "").strip()
+        root = Path(local_app_data).expanduser() if local_app_data else Path.home() / "AppData/Local"
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+        root = Path(xdg).expanduser() if xdg else Path.home() / ".cache"
+    return root / "hve-core" / "adr-author" / "scan-cache.json"
+
+
+@functools.cache
+def _scanner_digest() -> str:
+    """Return the SHA-256 of this module, which defines every rule."""
+    return hashlib.sha256(Path(__file__).read_bytes()).hexdigest()
+
+
+def _ruleset_digest(args: argparse.Namespace, denylist: DenylistMatcher | None) -> str:
+    """Return a digest of everything besides file content that shapes findings."""
+    material = [SCHEMA_VERSION, _scanner_digest(), bool(args.public), bool(args.data)]
+    material.append(denylist.digest if denylist is not None else None)
+    return hashlib.sha256(json.dumps(material).encode("utf-8")).hexdigest()
+
+
+def _load_scan_cache() -> dict[str, Any]:
+    """Read the result cache, treating a missing or damaged file as empty."""
+    try:
+        loaded = json.loads(_scan_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return loaded if isinstance(loaded, dict) else {}
+
+
+def _cached_findings(cache: dict[str, Any], key: str, source: str) -> list[dict[str, Any]] | None:
+    """Return the cached findings for ``key`` attributed to ``source``.
+
+    An entry of the wrong shape is a cache miss, so a damaged cache can only
+    cost a rescan, never hide a finding behind malformed data. Findings in
+    ``NO_PREVIEW_CATEGORIES`` carry the integer ``length`` that ``_finding``
+    records in place of a preview; no other category may.
+    """
+    entry = cache.get(key)
+    if not isinstance(entry, list):
+        return None
+    findings: list[dict[str, Any]] = []
+    for item in entry:
+        if not isinstance(item, dict):
+            return None
+        fields = {"line", "column", "category", "confidence", "match"}
+        if item.get("category") in NO_PREVIEW_CATEGORIES:
+            fields.add("length")
+        if (
+            set(item) != fields
+            or not all(isinstance(item[field], int) for field in ("line", "column"))
+            or not all(isinstance(item[field], str) for field in ("category", "match"))
+            or item["confidence"] not in ("high", "warn")
+            or ("length" in fields and type(item["length"]) is not int)
+        ):
+            return None
+        findings.append({"source": source, **item})
+    return findings
+
+
+def _store_scan_cache(cache: dict[str, Any]) -> None:
+    """Write the result cache atomically; write failures are ignored."""
+    while len(cache) > MAX_SCAN_CACHE_ENTRIES:
+        cache.pop(next(iter(cache)))
+    cache_path = _scan_cache_path()
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        descriptor, temp_name = tempfile.mkstemp(dir=cache_path.parent, prefix=".scan-cache-", suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(cache, handle)
+            os.replace(temp_name, cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
+    except OSError:
+        pass
+
+
+_WORKER_OPTIONS: tuple[bool, bool, DenylistMatcher | None] = (False, False, None)
+
+
+def _init_scan_worker(public: bool, data: bool, denylist: DenylistMatcher | None) -> None:
+    """Receive the scan options once per worker process instead of per file."""
+    global _WORKER_OPTIONS
+    _WORKER_OPTIONS = (public, data, denylist)
+
+
+def _scan_in_worker(item: tuple[str, str]) -> list[dict[str, Any]]:
+    """Scan one ``(source, text)`` pair with the worker's scan options."""
+    public, data, denylist = _WORKER_OPTIONS
+    return scan_text(item[1], item[0], public=public, data=data, denylist=denylist)
+
+
+def _scan_texts(
+    args: argparse.Namespace,
+    items: list[tuple[str, str]],
+    denylist: DenylistMatcher | None,
+) -> list[list[dict[str, Any]]]:
+    """Scan ``(source, text)`` pairs, across processes when the input is large enough.
+
+    Small inputs are scanned in this process because starting workers costs
+    more than the scan itself.
+    """
+    jobs = args.jobs or os.cpu_count() or 1
+    if jobs > 1 and len(items) > 1 and sum(len(text) for _, text in items) >= PARALLEL_MIN_CHARS:
+        try:
+            with ProcessPoolExecutor(
+                max_workers=min(jobs, len(items)),
+                initializer=_init_scan_worker,
+                initargs=(args.public, args.data, denylist),
+            ) as pool:
+                return list(pool.map(_scan_in_worker, items))
+        except (OSError, BrokenProcessPool):
+            # No usable worker processes here; the serial scan below is authoritative.
+            pass
+    return [scan_text(text, source, public=args.public, data=args.data, denylist=denylist) for source, text in items]
+
+
+def _changed_paths(ref: str, pathspecs: list[Path], allow_roots: list[Path]) -> list[Path]:
+    """Return the files changed since ``ref`` that lie under ``allow_roots``.
+
+    Uses the local ``git diff --name-only`` against the working tree, so staged
+    and unstaged edits count; deleted and untracked files are not listed. The
+    working directory's repository is untrusted input, so changed files outside
+    the allow roots are dropped with a note on stderr rather than widening them.
+    """
+    if not ref or ref.startswith("-"):
+        raise ScanError("git_error", "--changed-since requires a git revision")
+    try:
+        top = subprocess.run(
+            ["git", "rev-parse", "--show-toplevel"],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=GIT_TIMEOUT_SECONDS,
+        ).stdout.strip()
+        names = subprocess.run(
+            ["git", "diff", "--name-only", "-z", "--diff-filter=d", ref, "--", *map(str, pathspecs)],
+            capture_output=True,
+            text=True,
+            check=True,
+            timeout=GIT_TIMEOUT_SECONDS,
+        ).stdout
+    except (OSError, subprocess.SubprocessError) as exc:
+        raise ScanError("git_error", f"git diff against '{ref}' failed") from exc
+    root = Path(top)
+    cwd = Path.cwd().resolve()
+    changed: list[Path] = []
+    dropped = 0
+    for name in filter(None, names.split("\0")):
+        path = root / name
+        if not path.is_file():
+            # Submodule gitlinks and type changes to directories have no text to scan.
+            continue
+        try:
+            safe_resolve(path, allow_roots)
+        except ValueError:
+            dropped += 1
+            continue
+        changed.append(path.relative_to(cwd) if path.is_relative_to(cwd) else path)
+    if dropped:
+        print(
+            f"scan_sensitive_content: skipped {dropped} changed file(s) outside the allow roots; "
+            "pass --allow-root to include them",
+            file=sys.stderr,
+        )
+    return changed
+
+
 def _scan_paths(
     args: argparse.Namespace,
+    paths: list[Path],
     allow_roots: list[Path],
-    denylist_rules: tuple[Rule, ...],
+    denylist: DenylistMatcher | None,
 ) -> list[dict[str, Any]]:
-    """Scan every requested path, failing closed on any path, size, or read failure."""
+    """Scan every requested path, failing closed on any path, size, or read failure.
+
+    Files whose contents and ruleset match a cached result reuse its findings;
+    the rest are scanned, then recorded unless ``--no-cache`` is set.
+    """
     findings: list[dict[str, Any]] = []
+    cache = {} if args.no_cache else _load_scan_cache()
+    ruleset = _ruleset_digest(args, denylist)
+    pending: list[tuple[str, str]] = []
+    pending_keys: list[str] = []
     total_bytes = 0
-    for raw in args.paths:
+    for raw in paths:
         try:
             resolved = safe_resolve(raw, allow_roots)
         except ValueError as exc:
@@ -733,26 +1237,33 @@ def _scan_paths(
         if total_bytes > MAX_INPUT_BYTES:
             raise ScanError("input_too_large", f"input exceeds {MAX_INPUT_BYTES} bytes")
         try:
-            text = resolved.read_text(encoding="utf-8")
+            content = resolved.read_bytes()
+            text = content.decode("utf-8")
         except UnicodeDecodeError as exc:
             raise ScanError("decode_error", f"failed to decode '{raw}' as UTF-8") from exc
         except OSError as exc:
             raise ScanError("read_error", f"failed to read '{raw}'") from exc
-        findings.extend(
-            scan_text(
-                text,
-                str(raw),
-                public=args.public,
-                data=args.data,
-                denylist_rules=denylist_rules,
-            )
-        )
+        key = f"{ruleset}:{hashlib.sha256(content).hexdigest()}"
+        cached = _cached_findings(cache, key, str(raw))
+        if cached is not None:
+            findings.extend(cached)
+            continue
+        pending.append((str(raw), text))
+        pending_keys.append(key)
+    for key, file_findings in zip(pending_keys, _scan_texts(args, pending, denylist)):
+        findings.extend(file_findings)
+        cache.pop(key, None)
+        cache[key] = [
+            {field: value for field, value in finding.items() if field != "source"} for finding in file_findings
+        ]
+    if pending and not args.no_cache:
+        _store_scan_cache(cache)
     return findings
 
 
 def _scan_stdin(
     args: argparse.Namespace,
-    denylist_rules: tuple[Rule, ...],
+    denylist: DenylistMatcher | None,
 ) -> list[dict[str, Any]]:
     """Scan stdin, failing closed on decode failure or over-limit input."""
     try:
@@ -768,10 +1279,59 @@ def _scan_stdin(
         STDIN_SOURCE,
         public=args.public,
         data=args.data,
-        denylist_rules=denylist_rules,
+        denylist=denylist,
     )
 
 
+def _stream_sources(paths: list[Path], allow_roots: list[Path]) -> list[tuple[Path | None, str]]:
+    """Resolve every streamed path up front so a bad path fails before any output."""
+    sources: list[tuple[Path | None, str]] = []
+    for raw in paths:
+        try:
+            resolved = safe_resolve(raw, allow_roots)
+        except ValueError as exc:
+            raise ScanError("path_error", f"path error: {exc}") from exc
+        if not resolved.is_file():
+            raise ScanError("read_error", f"failed to read '{raw}'")
+        sources.append((resolved, str(raw)))
+    return sources
+
+
+def _stream_scan(
+    args: argparse.Namespace,
+    sources: list[tuple[Path | None, str]],
+    denylist: DenylistMatcher | None,
+    summary: dict[str, int],
+) -> None:
+    """Print each finding as one JSON line, counting it into ``summary``."""
+    for path, source in sources:
+        label = "stdin" if path is None else f"'{source}'"
+        try:
+            if path is None:
+                _print_stream_findings(args, sys.stdin, source, denylist, summary)
+            else:
+                with open(path, encoding="utf-8") as handle:
+                    _print_stream_findings(args, handle, source, denylist, summary)
+        except UnicodeDecodeError as exc:
+            raise ScanError("decode_error", f"failed to decode {label} as UTF-8") from exc
+        except OSError as exc:
+            raise ScanError("read_error", f"failed to read {label}") from exc
+
+
+def _print_stream_findings(
+    args: argparse.Namespace,
+    handle: TextIO,
+    source: str,
+    denylist: DenylistMatcher | None,
+    summary: dict[str, int],
+) -> None:
+    """Print the findings for one streamed source as they are found."""
+    for finding in scan_stream(handle, source, public=args.public, data=args.data, denylist=denylist):
+        summary[finding["confidence"]] += 1
+        summary["total"] += 1
+        print(json.dumps(finding), flush=True)
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main entry point."""
     args = create_parser().parse_args(argv)
@@ -780,7 +1340,9 @@ def main(argv: list[str] | None = None) -> int:
         "data": bool(args.data),
         "denylist": args.denylist is not None,
     }
-    denylist_rules: tuple[Rule, ...] = ()
+    denylist: DenylistMatcher | None = None
+
+    summary = {"high": 0, "warn": 0, "total": 0}
 
     try:
         allow_roots = _allow_roots(args)
@@ -789,29 +1351,48 @@ def main(argv: list[str] | None = None) -> int:
                 denylist_path = safe_resolve(args.denylist, allow_roots)
             except ValueError as exc:
                 raise ScanError("path_error", f"denylist path error: {exc}") from exc
-            denylist_rules = _load_denylist(denylist_path)
-        findings = _scan_paths(args, allow_roots, denylist_rules) if args.paths else _scan_stdin(args, denylist_rules)
+            denylist = _load_denylist(denylist_path)
+        paths: list[Path] = args.paths
+        if args.changed_since is not None:
+            paths = _changed_paths(args.changed_since, args.paths, allow_roots)
+        read_stdin = not args.paths and args.changed_since is None
+        if args.stream:
+            sources = [(None, STDIN_SOURCE)] if read_stdin else _stream_sources(paths, allow_roots)
+            _stream_scan(args, sources, denylist, summary)
+            findings = []
+        elif read_stdin:
+            findings = _scan_stdin(args, denylist)
+        else:
+            findings = _scan_paths(args, paths, allow_roots, denylist)
     except ScanError as exc:
         print(f"scan_sensitive_content: {exc.message}", file=sys.stderr)
-        print(
-            json.dumps(
-                _build_report(
-                    status=STATUS_ERROR,
-                    modes=modes,
-                    denylist_rule_count=len(denylist_rules),
-                    findings=[],
-                    error=exc,
-                ),
-                indent=2,
-            )
+        report = _build_report(
+            status=STATUS_ERROR,
+            modes=modes,
+            denylist_rule_count=len(denylist) if denylist is not None else 0,
+            findings=[],
+            error=exc,
+            summary=summary if args.stream else None,
         )
+        print(json.dumps(report) if args.stream else json.dumps(report, indent=2))
         return EXIT_ERROR
 
+    if args.stream:
+        report = _build_report(
+            status=STATUS_COMPLETED,
+            modes=modes,
+            denylist_rule_count=len(denylist) if denylist is not None else 0,
+            findings=[],
+            summary=summary,
+        )
+        print(json.dumps(report))
+        return EXIT_FAILURE if summary["high"] else EXIT_SUCCESS
+
     findings.sort(key=_finding_sort_key)
     report = _build_report(
         status=STATUS_COMPLETED,
         modes=modes,
-        denylist_rule_count=len(denylist_rules),
+        denylist_rule_count=len(denylist) if denylist is not None else 0,
         findings=findings,
     )
     print(json.dumps(report, indent=2))
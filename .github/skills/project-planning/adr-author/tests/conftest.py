@@ -76,6 +76,14 @@ _Y_STATEMENT_FALLBACK = dedent(
 )
 
 
+@pytest.fixture(autouse=True)
+def isolated_cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point per-user caches at a tmp directory so tests never share results."""
+    cache_home = tmp_path / "cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache_home))
+    return cache_home
+
+
 @pytest.fixture()
 def tmp_skill_root(tmp_path: Path) -> Path:
     """Create a tmp directory mirroring the adr-author skill layout.
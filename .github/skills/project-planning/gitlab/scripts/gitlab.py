@@ -18,29 +18,64 @@ Environment variables:
     XDG_DATA_HOME: Optional POSIX base directory for OAuth profile storage.
     LOCALAPPDATA: Optional Windows base directory for OAuth profile storage.
     GITLAB_PROJECT: Optional project id or path. Auto-detected from git remote.
+    GITLAB_PROJECT_CACHE: Set to 0 to disable the git-remote project cache.
+    XDG_CACHE_HOME: Optional POSIX base directory for the project cache.
 """
 
 from __future__ import annotations
 
+import atexit
+import codecs
+import contextlib
+import http.client
+import importlib.util
 import json
 import logging
 import os
 import pathlib
 import re
+import ssl
 import subprocess
 import sys
+import tempfile
+import threading
+import time
 import traceback
 import urllib.error
 import urllib.parse
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Callable, NoReturn, cast
+from types import ModuleType
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, NoReturn, cast
 
 sys.dont_write_bytecode = True
 
-import _gitlab_credentials as credentials  # noqa: E402
-import _gitlab_oauth as oauth  # noqa: E402
+
+def _lazy_import(name: str) -> ModuleType:
+    """Return ``name`` as a module that executes on first attribute access."""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None or spec.loader is None:
+        raise ImportError(f"cannot find module {name}")
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Token-mode commands never touch the OAuth flows or the profile store, so
+# those modules load only when a code path first reaches into them.
+if TYPE_CHECKING:
+    import _gitlab_credentials as credentials
+    import _gitlab_oauth as oauth
+else:
+    credentials = _lazy_import("_gitlab_credentials")
+    oauth = _lazy_import("_gitlab_oauth")
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -48,10 +83,23 @@ EXIT_USAGE = 2
 REQUEST_TIMEOUT = 30
 MAX_BODY_BYTES = 1_048_576
 MAX_LOG_BYTES = 65_536
+LOG_CHUNK_BYTES = 65_536
+MAX_LOG_CARRY_CHARS = 65_536
+LOG_FOLLOW_INTERVAL_SECONDS = 3.0
+WATCH_MIN_INTERVAL_SECONDS = 2
+WATCH_MAX_INTERVAL_SECONDS = 30
+WATCH_BACKOFF_FACTOR = 1.5
+WATCH_TIMEOUT_SECONDS = 3600
+MAX_WATCH_TIMEOUT_SECONDS = 86_400
 MAX_NUMERIC_ID = 2_147_483_647
 MAX_POSITIVE_INT = 100
+MAX_IDLE_CONNECTIONS = 4
+MAX_PROJECT_CACHE_ENTRIES = 64
+AUDIT_BUFFER_BYTES = 64 * 1024
 VALID_MR_STATES = {"all", "opened", "closed", "locked", "merged"}
 REF_PATTERN = re.compile(r"^[\w./-]+$")
+TERMINAL_STATUSES = frozenset({"success", "failed", "canceled", "skipped", "manual"})
+FAILED_STATUSES = frozenset({"failed", "canceled"})
 
 selected_fields: list[str] | None = None
 gitlab_url = ""
@@ -173,7 +221,175 @@ class _NoRedirect(urllib.request.HTTPRedirectHandler):
         )
 
 
-_OPENER = urllib.request.build_opener(_NoRedirect())
+# Methods that are safe to resend when a reused connection turns out to be stale.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# A reused socket the server already closed fails with one of these before any
+# response bytes arrive.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """Response that hands its connection back to the pool once fully read."""
+
+    _release: Callable[[bool], None] | None = None
+
+    def close(self) -> None:
+        # ``fp`` is cleared only after the whole body has been consumed; a
+        # partially read response leaves unread bytes on the socket, so that
+        # connection must not carry another request.
+        reusable = self.fp is None and not self.will_close
+        super().close()
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable)
+
+
+class _ConnectionPool:
+    """Thread-safe set of idle persistent connections keyed by destination."""
+
+    def __init__(self, max_idle: int = MAX_IDLE_CONNECTIONS) -> None:
+        self._max_idle = max_idle
+        self._idle: dict[tuple[Any, ...], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple[Any, ...]) -> http.client.HTTPConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def release(
+        self,
+        key: tuple[Any, ...],
+        connection: http.client.HTTPConnection,
+        reusable: bool,
+    ) -> None:
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle:
+                    idle.append(connection)
+                    return
+        connection.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class _KeepAliveMixin:
+    """Serve ``urllib`` requests over pooled persistent connections.
+
+    The mixin replaces only the connection step of the standard handlers, so
+    the opener's redirect refusal, proxy selection, and error processing are
+    unchanged.
+    """
+
+    _pool: _ConnectionPool
+    _new_connection: Callable[[str, Any], http.client.HTTPConnection]
+
+    def _pooled_open(self, request: urllib.request.Request) -> _PooledResponse:
+        host = request.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        tunnel_host = getattr(request, "_tunnel_host", None)
+        key = (request.type, host, tunnel_host, request.timeout)
+        headers = dict(request.unredirected_hdrs)
+        headers.update({k: v for k, v in request.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        headers["Connection"] = "keep-alive"
+        tunnel_headers = {}
+        if "Proxy-Authorization" in headers:
+            tunnel_headers["Proxy-Authorization"] = headers.pop("Proxy-Authorization")
+        method = request.get_method()
+
+        connection = self._pool.acquire(key)
+        while True:
+            reused = connection is not None
+            if connection is None:
+                connection = self._new_connection(host, request.timeout)
+                connection.response_class = _PooledResponse
+                if tunnel_host:
+                    connection.set_tunnel(tunnel_host, headers=tunnel_headers)
+            try:
+                try:
+                    connection.request(
+                        method,
+                        request.selector,
+                        request.data,
+                        headers,
+                        encode_chunked=request.has_header("Transfer-encoding"),
+                    )
+                except _STALE_CONNECTION_ERRORS:
+                    # An incomplete send cannot have been acted on, so any
+                    # method is safe to resend on a fresh connection.
+                    if not reused:
+                        raise
+                    connection.close()
+                    connection = None
+                    continue
+                try:
+                    response = connection.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused or method not in _IDEMPOTENT_METHODS:
+                        raise
+                    connection.close()
+                    connection = None
+                    continue
+            except OSError as exc:
+                connection.close()
+                raise urllib.error.URLError(exc) from exc
+            break
+
+        response = cast(_PooledResponse, response)
+        pooled = connection
+        response._release = lambda reusable: self._pool.release(key, pooled, reusable)
+        # Match ``AbstractHTTPHandler.do_open`` so error processing sees the
+        # same response surface as the standard handlers provide.
+        response.msg = response.reason  # type: ignore[assignment]
+        response.url = request.get_full_url()
+        return response
+
+
+class _KeepAliveHTTPHandler(_KeepAliveMixin, urllib.request.HTTPHandler):
+    """Plain HTTP handler for loopback development servers."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pool = _ConnectionPool()
+        self._new_connection = lambda host, timeout: http.client.HTTPConnection(
+            host, timeout=timeout
+        )
+
+    def http_open(self, req: urllib.request.Request) -> _PooledResponse:
+        return self._pooled_open(req)
+
+
+class _KeepAliveHTTPSHandler(_KeepAliveMixin, urllib.request.HTTPSHandler):
+    """HTTPS handler that verifies certificates with one shared TLS context."""
+
+    def __init__(self) -> None:
+        context = ssl.create_default_context()
+        context.set_alpn_protocols(["http/1.1"])
+        super().__init__(context=context)
+        self._pool = _ConnectionPool()
+        self._new_connection = lambda host, timeout: http.client.HTTPSConnection(
+            host, timeout=timeout, context=context
+        )
+
+    def https_open(self, req: urllib.request.Request) -> _PooledResponse:
+        return self._pooled_open(req)
+
+
+_HTTP_HANDLER = _KeepAliveHTTPHandler()
+_HTTPS_HANDLER = _KeepAliveHTTPSHandler()
+_OPENER = urllib.request.build_opener(_NoRedirect(), _HTTP_HANDLER, _HTTPS_HANDLER)
 
 
 @dataclass(frozen=True)
@@ -421,17 +637,18 @@ def _sanitize_remote_url(remote_url: str) -> str:
     return pattern.sub(r"\g<scheme>", remote_url)
 
 
+def _is_valid_project_path(path: str) -> bool:
+    """Return whether a project path is free of traversal and separator escapes."""
+    if not path or any(char in path for char in {"%", "\\"}):
+        return False
+    return all(segment not in {"", ".", ".."} for segment in path.split("/"))
+
+
 def _validate_project_path(path: str) -> None:
     """Reject project paths that contain traversal or separator escapes."""
-    if not path:
-        die("invalid project path", EXIT_USAGE)
-    if any(char in path for char in {"%", "\\"}):
+    if not _is_valid_project_path(path):
         die("invalid project path", EXIT_USAGE)
 
-    for segment in path.split("/"):
-        if segment in {"", ".", ".."}:
-            die("invalid project path", EXIT_USAGE)
-
 
 def _summarize_error_body(raw_error: str) -> str:
     """Prefer a structured message and otherwise return a redacted preview."""
@@ -448,9 +665,109 @@ def _summarize_error_body(raw_error: str) -> str:
     return _preview_text(_redact(raw_error))
 
 
-def _audit_write(event: dict[str, Any]) -> bool:
+class _AuditWriter:
+    """Append-only audit sink that keeps the log open and batches records.
+
+    Each line is written whole under one lock, so records from worker threads
+    never interleave. While buffering is enabled, best-effort records wait in
+    memory until ``AUDIT_BUFFER_BYTES`` accumulate, a durable record arrives,
+    or the buffer is flushed; otherwise every record is flushed immediately.
+    """
+
+    def __init__(self) -> None:
+        self.buffering = False
+        self._lock = threading.Lock()
+        self._path = ""
+        self._handle: Any = None
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+
+    def write(self, path: str, line: str, *, durable: bool) -> None:
+        with self._lock:
+            if path != self._path:
+                self._close_locked()
+            if self._handle is None:
+                self._handle = open(path, "a", encoding="utf-8")  # noqa: SIM115
+                self._path = path
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            if (
+                durable
+                or not self.buffering
+                or self._pending_bytes >= AUDIT_BUFFER_BYTES
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _flush_locked(self) -> None:
+        if self._handle is None or not self._pending:
+            return
+        lines = "".join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        self._handle.write(lines)
+        self._handle.flush()
+
+    def _close_locked(self) -> None:
+        handle, self._handle, self._path = self._handle, None, ""
+        if handle is None:
+            return
+        try:
+            if self._pending:
+                handle.write("".join(self._pending))
+        finally:
+            self._pending = []
+            self._pending_bytes = 0
+            handle.close()
+
+
+_AUDIT_WRITER = _AuditWriter()
+
+
+def _close_audit_log() -> None:
+    """Flush and close the audit log, warning instead of raising."""
+    try:
+        _AUDIT_WRITER.close()
+    except OSError as exc:
+        _emit(f"warning: audit log flush failed: {exc}", level=logging.WARNING)
+
+
+atexit.register(_close_audit_log)
+
+
+@contextlib.contextmanager
+def _buffered_audit() -> Iterator[None]:
+    """Batch best-effort audit records for the duration of one command.
+
+    Attempt records still reach the log before their request is sent; only
+    outcome and item records wait, and they are flushed when the block exits.
+    """
+    _AUDIT_WRITER.buffering = True
+    try:
+        yield
+    finally:
+        _AUDIT_WRITER.buffering = False
+        try:
+            _AUDIT_WRITER.flush()
+        except OSError as exc:
+            _emit(f"warning: audit log flush failed: {exc}", level=logging.WARNING)
+
+
+def _audit_write(event: dict[str, Any], *, durable: bool = False) -> bool:
     """Append one audit event as a JSON line when auditing is enabled.
 
+    Args:
+        event: Audit record; string values are redacted before writing.
+        durable: Flush the record to the log before returning, even while
+            best-effort records are being buffered.
+
     Returns:
         True when an event was written, False when auditing is disabled.
 
@@ -467,8 +784,7 @@ def _audit_write(event: dict[str, Any]) -> bool:
         key: _redact(value) if isinstance(value, str) else value
         for key, value in _sanitize_structured(event).items()
     }
-    with open(path, "a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record) + "\n")
+    _AUDIT_WRITER.write(path, json.dumps(record) + "\n", durable=durable)
     return True
 
 
@@ -490,7 +806,7 @@ def _audit_event(actor: str, method: str, resource: str, event: str) -> dict[str
 def _audit_attempt(actor: str, method: str, resource: str) -> None:
     """Write the write-ahead attempt record, failing closed when unwritable."""
     try:
-        _audit_write(_audit_event(actor, method, resource, "attempt"))
+        _audit_write(_audit_event(actor, method, resource, "attempt"), durable=True)
     except OSError as exc:
         die(f"audit log write failed; refusing to proceed: {exc}", EXIT_FAILURE)
 
@@ -534,7 +850,7 @@ def _oauth_audit_event(operation: str, event: str) -> dict[str, Any]:
 def _oauth_audit_attempt(operation: str) -> None:
     """Write an OAuth attempt before egress, failing closed when configured."""
     try:
-        _audit_write(_oauth_audit_event(operation, "attempt"))
+        _audit_write(_oauth_audit_event(operation, "attempt"), durable=True)
     except OSError:
         die("audit log write failed; refusing OAuth request", EXIT_FAILURE)
 
@@ -804,13 +1120,120 @@ def strip_git_suffix(path: str) -> str:
     return path
 
 
+def _project_cache_path() -> pathlib.Path:
+    """Return the per-user file that maps repositories to project paths."""
+    if os.name == "nt":  # pragma: no cover - Windows
+        local_app_data = os.environ.get("LOCALAPPDATA", "").strip()
+        root = (
+            pathlib.Path(local_app_data).expanduser()
+            if local_app_data
+            else pathlib.Path.home() / "AppData/Local"
+        )
+    else:
+        xdg = os.environ.get("XDG_CACHE_HOME", "").strip()
+        root = pathlib.Path(xdg).expanduser() if xdg else pathlib.Path.home() / ".cache"
+    return root / "hve-core" / "gitlab" / "projects.json"
+
+
+def _git_config_key() -> tuple[str, list[int]] | None:
+    """Return the enclosing repository root and its config file's version.
+
+    The version is the ``[mtime_ns, size]`` of the config file that holds
+    ``remote.origin.url``, following a ``.git`` file to the common directory of
+    a linked worktree. Returns None when git itself could resolve the remote
+    differently, so the caller falls back to asking git.
+    """
+    if any(os.environ.get(name) for name in ("GIT_DIR", "GIT_CONFIG_COUNT")):
+        return None
+    try:
+        cwd = pathlib.Path.cwd()
+        for directory in (cwd, *cwd.parents):
+            dot_git = directory / ".git"
+            if dot_git.is_dir():
+                git_dir = dot_git
+            elif dot_git.is_file():
+                pointer = dot_git.read_text(encoding="utf-8").strip()
+                if not pointer.startswith("gitdir:"):
+                    return None
+                git_dir = directory / pointer[len("gitdir:") :].strip()
+                common_dir = git_dir / "commondir"
+                if common_dir.is_file():
+                    git_dir = git_dir / common_dir.read_text(encoding="utf-8").strip()
+            else:
+                continue
+            config = (git_dir / "config").stat()
+            return str(directory.resolve()), [config.st_mtime_ns, config.st_size]
+    except (OSError, ValueError):
+        return None
+    return None
+
+
+def _load_project_cache() -> dict[str, Any]:
+    """Read the project cache, treating a missing or damaged file as empty."""
+    try:
+        loaded = json.loads(_project_cache_path().read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    return cast(dict[str, Any], loaded) if isinstance(loaded, dict) else {}
+
+
+def _cached_project(key: tuple[str, list[int]]) -> str | None:
+    """Return the cached project path for an unchanged repository config."""
+    entry = _load_project_cache().get(key[0])
+    if not isinstance(entry, dict):
+        return None
+    entry = cast(dict[str, Any], entry)
+    path = entry.get("project")
+    if entry.get("config") != key[1] or not isinstance(path, str):
+        return None
+    return path if _is_valid_project_path(path) else None
+
+
+def _store_project(key: tuple[str, list[int]], path: str) -> None:
+    """Record a resolved project path; cache write failures are ignored."""
+    cache = _load_project_cache()
+    cache.pop(key[0], None)
+    cache[key[0]] = {"config": key[1], "project": path}
+    while len(cache) > MAX_PROJECT_CACHE_ENTRIES:
+        cache.pop(next(iter(cache)))
+    cache_path = _project_cache_path()
+    try:
+        cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        descriptor, temp_name = tempfile.mkstemp(
+            dir=cache_path.parent, prefix=".projects-", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(descriptor, "w", encoding="utf-8") as handle:
+                json.dump(cache, handle)
+            os.replace(temp_name, cache_path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.unlink(temp_name)
+            raise
+    except OSError:
+        LOGGER.debug("could not write project cache %s", cache_path)
+
+
 def project() -> str:
-    """Resolve the target GitLab project from environment or git remote."""
+    """Resolve the target GitLab project from environment or git remote.
+
+    A project derived from ``git remote`` is cached per repository and reused
+    until that repository's git config changes, so most commands skip the
+    ``git`` subprocess entirely.
+    """
     configured_project = os.environ.get("GITLAB_PROJECT", "")
     if configured_project:
         _validate_project_path(configured_project)
         return urllib.parse.quote(configured_project, safe="")
 
+    cache_key = (
+        None if os.environ.get("GITLAB_PROJECT_CACHE") == "0" else _git_config_key()
+    )
+    if cache_key is not None:
+        cached = _cached_project(cache_key)
+        if cached is not None:
+            return urllib.parse.quote(cached, safe="")
+
     try:
         remote_url = subprocess.check_output(
             ["git", "remote", "get-url", "origin"],
@@ -839,6 +1262,8 @@ def project() -> str:
             EXIT_USAGE,
         )
     _validate_project_path(path)
+    if cache_key is not None:
+        _store_project(cache_key, path)
     return urllib.parse.quote(path, safe="")
 
 
@@ -901,8 +1326,17 @@ def _request_bytes(
     data: object | None = None,
     require_json: bool = True,
     error_context: str | None = None,
+    response_headers: dict[str, str] | None = None,
+    chunk_sink: Callable[[bytes], bool] | None = None,
 ) -> bytes:
-    """Issue an HTTP request through the hardened transport."""
+    """Issue an HTTP request through the hardened transport.
+
+    When ``response_headers`` is given, it receives the success response's
+    headers with lowercased names. A ``304 Not Modified`` answer to an
+    ``If-None-Match`` request returns an empty body. When ``chunk_sink`` is
+    given, the body is passed to it in ``LOG_CHUNK_BYTES`` pieces instead of
+    being returned, and reading stops early once the sink returns False.
+    """
     request_headers = {"Accept": "application/json"}
     if headers:
         request_headers.update(headers)
@@ -921,11 +1355,22 @@ def _request_bytes(
                 content_type = ""
                 if hasattr(response, "headers"):
                     content_type = str(response.headers.get("Content-Type", "") or "")
-                result = _read_capped(
-                    response,
-                    MAX_BODY_BYTES,
-                    fail_on_limit=require_json,
-                )
+                    if response_headers is not None:
+                        response_headers.update(
+                            (str(name).lower(), str(value))
+                            for name, value in response.headers.items()
+                        )
+                if chunk_sink is not None:
+                    result = b""
+                    while chunk := response.read(LOG_CHUNK_BYTES):
+                        if not chunk_sink(chunk):
+                            break
+                else:
+                    result = _read_capped(
+                        response,
+                        MAX_BODY_BYTES,
+                        fail_on_limit=require_json,
+                    )
                 if require_json and result.strip():
                     if not content_type:
                         die("unexpected Content-Type: <missing>", EXIT_FAILURE)
@@ -934,8 +1379,19 @@ def _request_bytes(
                 _audit_outcome(audit_actor, method, url, "success")
                 return result
         except urllib.error.HTTPError as error:
-            body_bytes = _read_capped(error, MAX_BODY_BYTES, fail_on_limit=False)
+            try:
+                body_bytes = _read_capped(error, MAX_BODY_BYTES, fail_on_limit=False)
+            finally:
+                error.close()
             raw_error = body_bytes.decode("utf-8", errors="replace")
+            if error.code == 304 and "If-None-Match" in request_headers:
+                if response_headers is not None and error.headers is not None:
+                    response_headers.update(
+                        (str(name).lower(), str(value))
+                        for name, value in error.headers.items()
+                    )
+                _audit_outcome(audit_actor, method, url, "success", status=304)
+                return b""
             if (
                 error.code == 401
                 and method.upper() in {"GET", "HEAD"}
@@ -1025,6 +1481,95 @@ def request(
     return parsed
 
 
+def _next_page_url(url: str, headers: dict[str, str]) -> str | None:
+    """Return the next page URL from GitLab's pagination headers.
+
+    The ``Link`` header covers both keyset and offset pagination; the
+    ``X-Next-Page`` header is the offset fallback when ``Link`` is omitted.
+    Links that leave the configured API are refused so the token is never
+    replayed to another host.
+    """
+    next_url = ""
+    for entry in headers.get("link", "").split(","):
+        target, _, parameters = entry.partition(";")
+        if re.search(r'\brel="?next"?', parameters):
+            next_url = target.strip().strip("<>")
+            break
+    if not next_url:
+        next_page = headers.get("x-next-page", "").strip()
+        if not next_page:
+            return None
+        if not next_page.isdigit():
+            die("GitLab returned an invalid X-Next-Page header", EXIT_FAILURE)
+        parsed = urllib.parse.urlsplit(url)
+        query = [
+            (key, value)
+            for key, value in urllib.parse.parse_qsl(
+                parsed.query, keep_blank_values=True
+            )
+            if key != "page"
+        ]
+        query.append(("page", next_page))
+        next_url = urllib.parse.urlunsplit(
+            parsed._replace(query=urllib.parse.urlencode(query))
+        )
+
+    candidate = urllib.parse.urlsplit(next_url)
+    api = urllib.parse.urlsplit(api_url)
+    if (candidate.scheme, candidate.netloc) != (api.scheme, api.netloc) or not (
+        candidate.path.startswith(api.path.rstrip("/") + "/")
+    ):
+        die("refusing pagination link outside the GitLab API", EXIT_FAILURE)
+    return next_url
+
+
+def _fetch_page(url: str) -> tuple[list[Any], str | None]:
+    """Fetch one page of a list endpoint and locate the page after it."""
+    headers: dict[str, str] = {}
+    raw = _request_bytes("GET", url, headers=_auth_headers(), response_headers=headers)
+    try:
+        records = json.loads(raw) if raw.strip() else []
+    except (json.JSONDecodeError, ValueError):
+        die("GitLab returned an invalid JSON page", EXIT_FAILURE)
+    if not isinstance(records, list):
+        die("GitLab returned a non-list page", EXIT_FAILURE)
+    return cast(list[Any], records), _next_page_url(url, headers)
+
+
+def iter_records(url: str) -> Iterator[Any]:
+    """Yield every record of a paginated list endpoint.
+
+    The next page is requested on a worker thread while the current page is
+    being consumed, so output starts after the first page and later pages
+    overlap with printing.
+    """
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending: Future[tuple[list[Any], str | None]] | None = executor.submit(
+            _fetch_page, url
+        )
+        while pending is not None:
+            records, next_url = pending.result()
+            pending = executor.submit(_fetch_page, next_url) if next_url else None
+            yield from records
+
+
+def stream_records(records: Iterable[Any]) -> None:
+    """Print records as they arrive, as JSON lines or ``--fields`` rows."""
+    if selected_fields:
+        _emit_structured_stdout("\t".join(selected_fields))
+    for record in records:
+        sanitized = _sanitize_structured(record)
+        if selected_fields:
+            _emit_structured_stdout(_field_row(sanitized))
+        else:
+            _emit_structured_stdout(json.dumps(sanitized))
+
+
+def _pop_flag(args: list[str], flag: str) -> tuple[list[str], bool]:
+    """Remove a boolean flag from positional arguments."""
+    return [arg for arg in args if arg != flag], flag in args
+
+
 def parse_fields(arguments: list[str]) -> list[str]:
     """Extract the optional --fields argument from the CLI."""
     global selected_fields
@@ -1062,6 +1607,13 @@ def extract_field(obj: Any, path: str) -> str:
     return str(cast(object, current))
 
 
+def _field_row(item: Any) -> str:
+    """Format one record as a tab-separated row of the selected fields."""
+    return "\t".join(
+        extract_field(item, field_name) for field_name in selected_fields or []
+    )
+
+
 def print_fields(data: Any) -> None:
     """Print extracted fields for a list response or a single object."""
     if not selected_fields:
@@ -1071,11 +1623,7 @@ def print_fields(data: Any) -> None:
     if isinstance(sanitized, list):
         _emit_structured_stdout("\t".join(selected_fields))
         for item in cast(list[Any], sanitized):
-            _emit_structured_stdout(
-                "\t".join(
-                    extract_field(item, field_name) for field_name in selected_fields
-                )
-            )
+            _emit_structured_stdout(_field_row(item))
         return
 
     for field_name in selected_fields:
@@ -1093,16 +1641,20 @@ def load_json_payload(raw_payload: str, usage: str) -> object:
 
 
 def cmd_mr_list(args: list[str]) -> None:
-    """List merge requests."""
+    """List merge requests, or stream every page with ``--all``."""
+    args, paginate = _pop_flag(args, "--all")
     state = args[0] if args else "all"
     validate_state(state)
-    max_results = args[1] if len(args) > 1 else "20"
+    max_results = args[1] if len(args) > 1 else ("100" if paginate else "20")
     validate_positive_int(max_results, "max_results", MAX_POSITIVE_INT)
-    data = request(
-        "GET",
-        f"{api_url}/projects/{project()}/merge_requests?state={state}&per_page={max_results}&order_by=created_at&sort=desc",
-        quiet=bool(selected_fields),
+    url = (
+        f"{api_url}/projects/{project()}/merge_requests?state={state}"
+        f"&per_page={max_results}&order_by=created_at&sort=desc"
     )
+    if paginate:
+        stream_records(iter_records(url))
+        return
+    data = request("GET", url, quiet=bool(selected_fields))
     if selected_fields and data is not None:
         print_fields(data)
 
@@ -1180,27 +1732,35 @@ def cmd_mr_comment(args: list[str]) -> None:
     )
 
 
+def _is_user_note(note: Any) -> bool:
+    """Return True for notes written by people rather than by GitLab."""
+    return isinstance(note, dict) and not cast(dict[str, Any], note).get(
+        "system", False
+    )
+
+
 def cmd_mr_notes(args: list[str]) -> None:
-    """List merge request notes."""
+    """List merge request notes, or stream every page with ``--all``."""
+    args, paginate = _pop_flag(args, "--all")
     if not args:
-        die("usage: gitlab mr-notes <mr-iid> [max]", EXIT_USAGE)
+        die("usage: gitlab mr-notes <mr-iid> [max] [--all]", EXIT_USAGE)
     merge_request_iid = args[0]
     validate_numeric_id(merge_request_iid)
     max_results = args[1] if len(args) > 1 else "100"
     validate_positive_int(max_results, "max_results", MAX_POSITIVE_INT)
-    data = request(
-        "GET",
-        f"{api_url}/projects/{project()}/merge_requests/{merge_request_iid}/notes?per_page={max_results}&sort=asc",
-        quiet=bool(selected_fields),
+    url = (
+        f"{api_url}/projects/{project()}/merge_requests/{merge_request_iid}"
+        f"/notes?per_page={max_results}&sort=asc"
     )
+    if paginate:
+        notes = iter_records(url)
+        if selected_fields:
+            notes = (note for note in notes if _is_user_note(note))
+        stream_records(notes)
+        return
+    data = request("GET", url, quiet=bool(selected_fields))
     if selected_fields and isinstance(data, list):
-        notes = [
-            cast(dict[str, Any], note)
-            for note in cast(list[Any], data)
-            if isinstance(note, dict)
-            and not cast(dict[str, Any], note).get("system", False)
-        ]
-        print_fields(notes)
+        print_fields([note for note in cast(list[Any], data) if _is_user_note(note)])
 
 
 def cmd_pipeline_get(args: list[str]) -> None:
@@ -1227,27 +1787,177 @@ def cmd_pipeline_run(args: list[str]) -> None:
 
 
 def cmd_pipeline_jobs(args: list[str]) -> None:
-    """List pipeline jobs."""
+    """List pipeline jobs, or stream every page with ``--all``."""
+    args, paginate = _pop_flag(args, "--all")
     if not args:
-        die("usage: gitlab pipeline-jobs <pipeline-id>", EXIT_USAGE)
+        die("usage: gitlab pipeline-jobs <pipeline-id> [--all]", EXIT_USAGE)
     pipeline_id = args[0]
     validate_numeric_id(pipeline_id)
-    data = request(
-        "GET",
-        f"{api_url}/projects/{project()}/pipelines/{pipeline_id}/jobs",
-        quiet=bool(selected_fields),
-    )
+    url = f"{api_url}/projects/{project()}/pipelines/{pipeline_id}/jobs"
+    if paginate:
+        stream_records(iter_records(f"{url}?per_page={MAX_POSITIVE_INT}"))
+        return
+    data = request("GET", url, quiet=bool(selected_fields))
     if selected_fields and data is not None:
         print_fields(data)
 
 
-def cmd_job_log(args: list[str]) -> None:
-    """Print raw job trace output."""
-    if not args:
-        die("usage: gitlab job-log <job-id>", EXIT_USAGE)
-    job_id = args[0]
-    validate_numeric_id(job_id)
-    url = f"{api_url}/projects/{project()}/jobs/{job_id}/trace"
+class _LogStream:
+    """Decode trace bytes and print them as redacted, line-aligned text.
+
+    Redaction patterns end at whitespace, so a secret split across two reads
+    would slip past them. Text is held back until its line ends, or for very
+    long lines until whitespace, and is only then redacted and printed.
+    """
+
+    def __init__(self, *, limit: int | None) -> None:
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._carry = ""
+        self._limit = limit
+        self._written = 0
+        # A read that starts mid-trace may begin inside a secret, so its
+        # partial first line is dropped rather than printed unredacted.
+        self._skip_partial_line = False
+        self.truncated = False
+
+    def skip_partial_line(self) -> None:
+        """Drop text up to the next newline; the read starts mid-trace."""
+        self._carry = ""
+        self._skip_partial_line = True
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume one chunk; return False once the output limit is reached."""
+        text = self._carry + self._decoder.decode(chunk)
+        self._carry = ""
+        if self._skip_partial_line:
+            newline = text.find("\n")
+            if newline < 0:
+                return True
+            text = text[newline + 1 :]
+            self._skip_partial_line = False
+        cut = text.rfind("\n") + 1
+        if not cut and len(text) > MAX_LOG_CARRY_CHARS:
+            cut = max(text.rfind(" "), text.rfind("\t")) + 1 or len(text)
+        self._carry = text[cut:]
+        return self._write(text[:cut])
+
+    def close(self) -> None:
+        """Print any held-back text and the truncation marker."""
+        if not self.truncated:
+            self._write(self._carry + self._decoder.decode(b"", final=True))
+        self._carry = ""
+        if self.truncated:
+            _emit_stdout("\n... [truncated]", end="")
+
+    def _write(self, text: str) -> bool:
+        if not text or self.truncated:
+            return not self.truncated
+        redacted = _redact(text)
+        if self._limit is not None and self._written + len(redacted) > self._limit:
+            redacted = redacted[: self._limit - self._written]
+            self.truncated = True
+        self._written += len(redacted)
+        _emit_stdout(redacted, end="")
+        return not self.truncated
+
+
+def _pop_option(args: list[str], option: str) -> tuple[list[str], str | None]:
+    """Remove an option and its value from positional arguments."""
+    if option not in args:
+        return args, None
+    index = args.index(option)
+    if index + 1 >= len(args):
+        die(f"usage: {option} requires a value", EXIT_USAGE)
+    return args[:index] + args[index + 2 :], args[index + 1]
+
+
+class _TraceReader:
+    """Fetch a job trace by HTTP byte range and print it through a ``_LogStream``.
+
+    Servers that ignore ``Range`` answer with the whole trace; the reader then
+    discards the unwanted bytes itself, so output is the same either way.
+    """
+
+    def __init__(self, url: str, output: _LogStream) -> None:
+        self._url = url
+        self._output = output
+        self._printed_end = 0
+        self._headers: dict[str, str] = {}
+        self._position: int | None = None
+        self._ranged = False
+        self._start = 0
+        self._tail: int | None = None
+        self._window = bytearray()
+        self.offset = 0
+
+    def read(self, *, start: int = 0, tail: int | None = None) -> None:
+        """Print trace bytes from ``start``, or only the last ``tail`` bytes."""
+        self._headers = {}
+        self._position = None
+        self._start = start
+        self._tail = tail
+        self._window = bytearray()
+        self.offset = max(self.offset, start)
+        byte_range = f"bytes=-{tail}" if tail is not None else f"bytes={start}-"
+        try:
+            _request_bytes(
+                "GET",
+                self._url,
+                headers={**_auth_headers(), "Range": byte_range},
+                require_json=False,
+                error_context="fetching job log",
+                response_headers=self._headers,
+                chunk_sink=self._consume,
+            )
+        except GitLabAPIError as error:
+            # 416 means the trace has no bytes at or after ``start`` yet.
+            if error.status != 416:
+                raise
+            return
+        if self._position is None:
+            return
+        if self._window:
+            self._print(self._position - len(self._window), bytes(self._window))
+        self.offset = max(self.offset, self._position)
+
+    def _consume(self, chunk: bytes) -> bool:
+        if self._position is None:
+            content_range = self._headers.get("content-range", "").strip()
+            match = re.match(r"bytes (\d+)-\d+/", content_range)
+            self._ranged = match is not None
+            self._position = int(match.group(1)) if match else 0
+        position = self._position
+        self._position += len(chunk)
+        if self._ranged:
+            return self._print(position, chunk)
+        if self._tail is not None:
+            self._window.extend(chunk)
+            del self._window[: -self._tail]
+            return True
+        if self._position <= self._start:
+            return True
+        if position < self._start:
+            chunk = chunk[self._start - position :]
+            position = self._start
+        return self._print(position, chunk)
+
+    def _print(self, position: int, chunk: bytes) -> bool:
+        if position != self._printed_end:
+            self._output.skip_partial_line()
+        self._printed_end = position + len(chunk)
+        return self._output.feed(chunk)
+
+
+def _job_status(job_url: str) -> str:
+    """Return the current status of one job."""
+    data = request("GET", job_url, quiet=True)
+    if isinstance(data, dict):
+        return str(cast(dict[str, Any], data).get("status", ""))
+    return ""
+
+
+def _print_job_log(url: str) -> None:
+    """Print the start of a job trace, capped at ``MAX_LOG_BYTES``."""
     raw_bytes = _request_bytes(
         "GET",
         url,
@@ -1261,6 +1971,175 @@ def cmd_job_log(args: list[str]) -> None:
     _emit_stdout(log_text, end="")
 
 
+def cmd_job_log(args: list[str]) -> None:
+    """Print job trace output, optionally by byte range or while the job runs."""
+    args, follow = _pop_flag(args, "--follow")
+    args, tail = _pop_option(args, "--tail")
+    args, offset = _pop_option(args, "--offset")
+    if not args:
+        die(
+            "usage: gitlab job-log <job-id> [--tail N | --offset N] [--follow]",
+            EXIT_USAGE,
+        )
+    job_id = args[0]
+    validate_numeric_id(job_id)
+    if tail is not None and offset is not None:
+        die("--tail and --offset cannot be combined", EXIT_USAGE)
+    if tail is not None:
+        validate_positive_int(tail, "--tail", MAX_LOG_BYTES)
+    if offset is not None and not re.fullmatch(r"\d+", offset):
+        die(f"--offset must be a non-negative integer, got: {offset}", EXIT_USAGE)
+    job_url = f"{api_url}/projects/{project()}/jobs/{job_id}"
+    if not follow and tail is None and offset is None:
+        _print_job_log(f"{job_url}/trace")
+        return
+
+    output = _LogStream(limit=None if follow else MAX_LOG_BYTES)
+    reader = _TraceReader(f"{job_url}/trace", output)
+    try:
+        reader.read(
+            start=int(offset or 0), tail=int(tail) if tail is not None else None
+        )
+        while follow:
+            # Read the status first so the trace read after a terminal status
+            # is guaranteed to include the job's final output.
+            status = _job_status(job_url)
+            reader.read(start=reader.offset)
+            if status in TERMINAL_STATUSES:
+                break
+            sys.stdout.flush()
+            time.sleep(LOG_FOLLOW_INTERVAL_SECONDS)
+    finally:
+        output.close()
+
+
+class _ConditionalCache:
+    """Re-fetch GET resources with ``If-None-Match`` and reuse unchanged data."""
+
+    def __init__(self) -> None:
+        self._entries: dict[str, tuple[str, Any, str | None]] = {}
+
+    def get(self, url: str) -> tuple[Any, str | None]:
+        """Return the resource at ``url`` and the URL of its next page."""
+        headers = _auth_headers()
+        cached = self._entries.get(url)
+        if cached is not None and cached[0]:
+            headers["If-None-Match"] = cached[0]
+        response_headers: dict[str, str] = {}
+        raw = _request_bytes(
+            "GET", url, headers=headers, response_headers=response_headers
+        )
+        if not raw and cached is not None and "If-None-Match" in headers:
+            return cached[1], cached[2]
+        try:
+            data = json.loads(raw) if raw.strip() else None
+        except (json.JSONDecodeError, ValueError):
+            die("GitLab returned invalid JSON while watching", EXIT_FAILURE)
+        next_url = _next_page_url(url, response_headers)
+        self._entries[url] = (response_headers.get("etag", ""), data, next_url)
+        return data, next_url
+
+
+def _watched_jobs(cache: _ConditionalCache, url: str) -> Iterator[dict[str, Any]]:
+    """Yield every job of a pipeline through the conditional cache."""
+    next_url: str | None = url
+    while next_url:
+        page, next_url = cache.get(next_url)
+        if not isinstance(page, list):
+            die("GitLab returned a non-list jobs page", EXIT_FAILURE)
+        for job in cast(list[Any], page):
+            if isinstance(job, dict):
+                yield cast(dict[str, Any], job)
+
+
+def _emit_watch_event(event: dict[str, Any]) -> None:
+    """Print one watch event as a sanitized JSON line."""
+    event = {"ts": datetime.now(timezone.utc).isoformat(), **event}
+    _emit_structured_stdout(json.dumps(_sanitize_structured(event)))
+
+
+def cmd_pipeline_watch(args: list[str]) -> None:
+    """Stream pipeline and job status changes until the pipeline finishes.
+
+    Polls back off from the interval toward ``WATCH_MAX_INTERVAL_SECONDS``
+    while nothing changes and reset on the next transition.
+    """
+    args, interval = _pop_option(args, "--interval")
+    args, timeout = _pop_option(args, "--timeout")
+    if not args:
+        die(
+            "usage: gitlab pipeline-watch <pipeline-id> [--interval S] [--timeout S]",
+            EXIT_USAGE,
+        )
+    pipeline_id = args[0]
+    validate_numeric_id(pipeline_id)
+    if interval is not None:
+        validate_positive_int(interval, "--interval", WATCH_MAX_INTERVAL_SECONDS)
+    if timeout is not None:
+        validate_positive_int(timeout, "--timeout", MAX_WATCH_TIMEOUT_SECONDS)
+    min_delay = float(interval or WATCH_MIN_INTERVAL_SECONDS)
+    deadline = time.monotonic() + float(timeout or WATCH_TIMEOUT_SECONDS)
+    pipeline_url = f"{api_url}/projects/{project()}/pipelines/{pipeline_id}"
+    jobs_url = f"{pipeline_url}/jobs?per_page={MAX_POSITIVE_INT}"
+
+    cache = _ConditionalCache()
+    job_statuses: dict[str, str] = {}
+    pipeline_status: str | None = None
+    delay = min_delay
+    while True:
+        # Read the pipeline before its jobs so a terminal pipeline status is
+        # only reported after the final job transitions.
+        pipeline, _ = cache.get(pipeline_url)
+        if not isinstance(pipeline, dict):
+            die("GitLab returned a non-object pipeline", EXIT_FAILURE)
+        changed = False
+        for job in _watched_jobs(cache, jobs_url):
+            job_id = str(job.get("id", ""))
+            status = str(job.get("status", ""))
+            previous = job_statuses.get(job_id)
+            if status == previous:
+                continue
+            job_statuses[job_id] = status
+            changed = True
+            _emit_watch_event(
+                {
+                    "event": "job",
+                    "pipeline": int(pipeline_id),
+                    "job": job.get("id"),
+                    "name": job.get("name"),
+                    "stage": job.get("stage"),
+                    "status": status,
+                    "previous": previous,
+                }
+            )
+        status = str(cast(dict[str, Any], pipeline).get("status", ""))
+        if status != pipeline_status:
+            changed = True
+            _emit_watch_event(
+                {
+                    "event": "pipeline",
+                    "pipeline": int(pipeline_id),
+                    "status": status,
+                    "previous": pipeline_status,
+                }
+            )
+            pipeline_status = status
+        if status in TERMINAL_STATUSES:
+            break
+        if time.monotonic() >= deadline:
+            die(f"timed out watching pipeline {pipeline_id}", EXIT_FAILURE)
+        delay = (
+            min_delay
+            if changed
+            else min(delay * WATCH_BACKOFF_FACTOR, WATCH_MAX_INTERVAL_SECONDS)
+        )
+        sys.stdout.flush()
+        time.sleep(delay)
+
+    if pipeline_status in FAILED_STATUSES:
+        die(f"pipeline {pipeline_id} finished with status {pipeline_status}")
+
+
 COMMANDS: dict[str, Callable[[list[str]], None]] = {
     "mr-list": cmd_mr_list,
     "mr-get": cmd_mr_get,
@@ -1271,6 +2150,7 @@ COMMANDS: dict[str, Callable[[list[str]], None]] = {
     "pipeline-get": cmd_pipeline_get,
     "pipeline-run": cmd_pipeline_run,
     "pipeline-jobs": cmd_pipeline_jobs,
+    "pipeline-watch": cmd_pipeline_watch,
     "job-log": cmd_job_log,
 }
 
@@ -1423,7 +2303,8 @@ def main() -> int:
                 die("usage: gitlab auth {login|device-login|status|logout}", EXIT_USAGE)
             global _AUDIT_OP
             _AUDIT_OP = f"auth-{arguments[1]}"
-            handler(arguments[2:])
+            with _buffered_audit():
+                handler(arguments[2:])
             return EXIT_SUCCESS
 
         require_environment()
@@ -1431,13 +2312,15 @@ def main() -> int:
         if not arguments or arguments[0] not in COMMANDS:
             die(
                 "usage: gitlab {mr-list|mr-get|mr-create|mr-update|mr-comment|"
-                "auth|mr-notes|pipeline-get|pipeline-run|pipeline-jobs|job-log} "
+                "auth|mr-notes|pipeline-get|pipeline-run|pipeline-jobs|"
+                "pipeline-watch|job-log} "
                 "[args...]",
                 EXIT_USAGE,
             )
 
         _AUDIT_OP = arguments[0]
-        COMMANDS[arguments[0]](arguments[1:])
+        with _buffered_audit():
+            COMMANDS[arguments[0]](arguments[1:])
         return EXIT_SUCCESS
     except GitLabError as exc:
         _emit_debug_traceback(exc)
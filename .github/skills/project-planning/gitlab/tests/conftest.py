@@ -9,6 +9,7 @@ import urllib.error
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from email.message import Message
+from pathlib import Path
 from types import ModuleType
 from typing import Literal
 
@@ -68,7 +69,7 @@ HttpErrorFactory = Callable[[str, int, str], urllib.error.HTTPError]
 
 
 @pytest.fixture(autouse=True)
-def reset_gitlab_state(monkeypatch: pytest.MonkeyPatch) -> None:
+def reset_gitlab_state(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
     """Reset module globals and seed environment variables for each test."""
     gitlab.selected_fields = None
     gitlab.gitlab_url = ""
@@ -82,6 +83,8 @@ def reset_gitlab_state(monkeypatch: pytest.MonkeyPatch) -> None:
     monkeypatch.delenv("GITLAB_OAUTH_CLIENT_ID", raising=False)
     monkeypatch.delenv("GITLAB_PROFILE", raising=False)
     monkeypatch.delenv("GITLAB_TOKEN_STORE", raising=False)
+    monkeypatch.delenv("GITLAB_PROJECT_CACHE", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
 
 
 @pytest.fixture
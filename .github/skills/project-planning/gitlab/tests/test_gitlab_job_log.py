@@ -0,0 +1,206 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Ranged and streaming job-log tests for gitlab.py."""
+
+from __future__ import annotations
+
+import io
+import json
+import re
+import urllib.error
+import urllib.request
+from email.message import Message
+from typing import Literal
+
+import gitlab
+import pytest
+from conftest import ConfiguredGitLab
+from pytest_mock import MockerFixture
+from test_constants import TEST_API_URL, TEST_PROJECT_ENCODED
+
+JOB_URL = f"{TEST_API_URL}/projects/{TEST_PROJECT_ENCODED}/jobs/7"
+
+
+class ChunkedResponse:
+    """HTTP response stub that honors read sizes and carries headers."""
+
+    def __init__(self, body: bytes, content_type: str, **headers: str) -> None:
+        self._body = io.BytesIO(body)
+        self.headers = Message()
+        self.headers["Content-Type"] = content_type
+        for name, value in headers.items():
+            self.headers[name.replace("_", "-")] = value
+
+    def __enter__(self) -> ChunkedResponse:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> Literal[False]:
+        return False
+
+    def read(self, amount: int | None = None) -> bytes:
+        return self._body.read(amount)
+
+
+class TraceServer:
+    """Serve a growing job trace, optionally honoring ``Range`` requests."""
+
+    def __init__(self, traces: list[bytes], statuses: list[str], *, ranged: bool):
+        self.traces = traces
+        self.statuses = statuses
+        self.ranged = ranged
+        self.ranges: list[str] = []
+
+    def __call__(
+        self, request: urllib.request.Request, timeout: int
+    ) -> ChunkedResponse:
+        if request.full_url == JOB_URL:
+            status = self.statuses.pop(0)
+            return ChunkedResponse(
+                json.dumps({"status": status}).encode(), "application/json"
+            )
+        trace = self.traces.pop(0) if len(self.traces) > 1 else self.traces[0]
+        byte_range = str(request.get_header("Range"))
+        self.ranges.append(byte_range)
+        if not self.ranged:
+            return ChunkedResponse(trace, "text/plain")
+        suffix = re.fullmatch(r"bytes=-(\d+)", byte_range)
+        start = (
+            max(0, len(trace) - int(suffix.group(1)))
+            if suffix
+            else int(byte_range[6:-1])
+        )
+        if start >= len(trace):
+            raise urllib.error.HTTPError(
+                request.full_url, 416, "range", Message(), io.BytesIO(b"")
+            )
+        return ChunkedResponse(
+            trace[start:],
+            "text/plain",
+            Content_Range=f"bytes {start}-{len(trace) - 1}/{len(trace)}",
+        )
+
+
+@pytest.fixture
+def serve(
+    configured_gitlab: ConfiguredGitLab,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+):
+    monkeypatch.setattr(gitlab, "project", lambda: TEST_PROJECT_ENCODED)
+    monkeypatch.setattr(gitlab.time, "sleep", lambda seconds: None)
+
+    def _serve(
+        traces: list[bytes], statuses: list[str] | None = None, *, ranged: bool = True
+    ) -> TraceServer:
+        server = TraceServer(traces, statuses or [], ranged=ranged)
+        mocker.patch("gitlab._OPENER.open", side_effect=server)
+        return server
+
+    return _serve
+
+
+def test_log_stream_redacts_secrets_split_across_chunks(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    stream = gitlab._LogStream(limit=None)
+
+    stream.feed(b"step 1\nAuthorization: Bearer abc")
+    stream.feed(b"def123 done\nlast")
+    stream.close()
+
+    output = capsys.readouterr().out
+    assert "abc" not in output
+    assert "def123" not in output
+    assert output.startswith("step 1\n")
+    assert output.endswith("done\nlast")
+
+
+def test_log_stream_cuts_long_lines_at_whitespace(
+    capsys: pytest.CaptureFixture[str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gitlab, "MAX_LOG_CARRY_CHARS", 8)
+    stream = gitlab._LogStream(limit=None)
+
+    stream.feed(b"aaaa bbbb cc")
+    assert capsys.readouterr().out == "aaaa bbbb "
+    stream.close()
+
+    assert capsys.readouterr().out == "cc"
+
+
+def test_log_stream_decodes_multibyte_characters_across_chunks(
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    stream = gitlab._LogStream(limit=None)
+    encoded = "café\n".encode()
+
+    stream.feed(encoded[:4])
+    stream.feed(encoded[4:])
+    stream.close()
+
+    assert capsys.readouterr().out == "café\n"
+
+
+@pytest.mark.parametrize("ranged", [True, False])
+def test_tail_prints_last_bytes_without_partial_first_line(
+    serve, ranged: bool, capsys: pytest.CaptureFixture[str]
+) -> None:
+    server = serve([b"token abc123\nline two\nline three\n"], ranged=ranged)
+
+    gitlab.cmd_job_log(["7", "--tail", "16"])
+
+    assert server.ranges == ["bytes=-16"]
+    assert capsys.readouterr().out == "line three\n"
+
+
+def test_offset_past_end_prints_nothing(
+    serve, capsys: pytest.CaptureFixture[str]
+) -> None:
+    serve([b"short\n"])
+
+    gitlab.cmd_job_log(["7", "--offset", "100"])
+
+    assert capsys.readouterr().out == ""
+
+
+def test_offset_output_is_truncated_at_log_limit(
+    serve, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr(gitlab, "MAX_LOG_BYTES", 10)
+    serve([b"line one\n" * 20], ranged=False)
+
+    gitlab.cmd_job_log(["7", "--offset", "0"])
+
+    assert capsys.readouterr().out == "line one\nl\n... [truncated]"
+
+
+@pytest.mark.parametrize("ranged", [True, False])
+def test_follow_polls_only_new_bytes_until_job_finishes(
+    serve, ranged: bool, capsys: pytest.CaptureFixture[str]
+) -> None:
+    traces = [b"one\ntw", b"one\ntwo\nthree\n", b"one\ntwo\nthree\nfour\n"]
+    server = serve(traces, ["running", "running", "success"], ranged=ranged)
+
+    gitlab.cmd_job_log(["7", "--follow"])
+
+    assert capsys.readouterr().out == "one\ntwo\nthree\nfour\n"
+    assert server.ranges == ["bytes=0-", "bytes=6-", "bytes=14-", "bytes=19-"]
+
+
+@pytest.mark.parametrize(
+    ("args", "message"),
+    [
+        (["7", "--tail", "1", "--offset", "2"], "cannot be combined"),
+        (["7", "--tail", "0"], "--tail must be a positive integer"),
+        (["7", "--offset", "-1"], "--offset must be a non-negative integer"),
+        (["7", "--tail"], "--tail requires a value"),
+    ],
+)
+def test_job_log_rejects_invalid_range_options(
+    serve, args: list[str], message: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(SystemExit) as exc_info:
+        gitlab.cmd_job_log(args)
+
+    assert exc_info.value.code == gitlab.EXIT_USAGE
+    assert message in capsys.readouterr().err
@@ -0,0 +1,223 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Persistent-connection transport and buffered audit tests for gitlab.py."""
+
+from __future__ import annotations
+
+import http.server
+import json
+import threading
+import urllib.error
+import urllib.request
+from collections.abc import Iterator
+from pathlib import Path
+
+import gitlab
+import pytest
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    peers: list[int]
+    close_after: set[str]
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        self.peers.append(self.client_address[1])
+        if self.path == "/redirect":
+            self.send_response(302)
+            self.send_header("Location", "https://elsewhere.example/")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = json.dumps({"path": self.path}).encode() * 64
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        if self.path in self.close_after:
+            # Drop the socket without announcing it, as an idle timeout would.
+            self.close_connection = True
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002
+        pass
+
+
+@pytest.fixture()
+def server() -> Iterator[tuple[str, type[_Handler]]]:
+    handler = type("Handler", (_Handler,), {"peers": [], "close_after": set()})
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", handler
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+@pytest.fixture()
+def opener() -> Iterator[urllib.request.OpenerDirector]:
+    handler = gitlab._KeepAliveHTTPHandler()
+    yield urllib.request.build_opener(gitlab._NoRedirect(), handler)
+    handler._pool.clear()
+
+
+def _get(opener: urllib.request.OpenerDirector, url: str) -> bytes:
+    with opener.open(url, timeout=5) as response:
+        return response.read()
+
+
+def test_module_opener_uses_keep_alive_handlers() -> None:
+    assert gitlab._HTTP_HANDLER in gitlab._OPENER.handlers
+    assert gitlab._HTTPS_HANDLER in gitlab._OPENER.handlers
+    assert not any(
+        type(handler) in {urllib.request.HTTPHandler, urllib.request.HTTPSHandler}
+        for handler in gitlab._OPENER.handlers
+    )
+
+
+def test_sequential_requests_reuse_one_connection(server, opener) -> None:
+    base, handler = server
+
+    assert b'"/one"' in _get(opener, f"{base}/one")
+    assert b'"/two"' in _get(opener, f"{base}/two")
+
+    assert len(handler.peers) == 2
+    assert handler.peers[0] == handler.peers[1]
+
+
+def test_partially_read_response_is_not_reused(server, opener) -> None:
+    base, handler = server
+
+    with opener.open(f"{base}/one", timeout=5) as response:
+        response.read(10)
+    _get(opener, f"{base}/two")
+
+    assert handler.peers[0] != handler.peers[1]
+
+
+def test_stale_connection_is_replaced_for_idempotent_request(server, opener) -> None:
+    base, handler = server
+    handler.close_after.add("/one")
+
+    _get(opener, f"{base}/one")
+    assert b'"/two"' in _get(opener, f"{base}/two")
+
+    assert handler.peers[0] != handler.peers[-1]
+
+
+def test_pooled_transport_still_refuses_redirects(server, opener) -> None:
+    base, _ = server
+
+    with pytest.raises(urllib.error.HTTPError) as exc_info:
+        _get(opener, f"{base}/redirect")
+
+    assert exc_info.value.code == 302
+    assert "refusing redirect" in str(exc_info.value.reason)
+    exc_info.value.close()
+
+
+def _lines(path: Path) -> list[dict[str, object]]:
+    if not path.exists():
+        return []
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_buffered_audit_holds_outcomes_until_block_exits(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "audit.jsonl"
+    monkeypatch.setenv("GITLAB_AUDIT_LOG", str(log))
+
+    with gitlab._buffered_audit():
+        gitlab._audit_attempt(
+            "tester", "GET", "https://gitlab.example.com/api/v4/projects/1"
+        )
+        assert [event["event"] for event in _lines(log)] == ["attempt"]
+        gitlab._audit_outcome(
+            "tester",
+            "GET",
+            "https://gitlab.example.com/api/v4/projects/1",
+            "error",
+            error="Bearer hunter2",
+        )
+        assert len(_lines(log)) == 1
+        gitlab._audit_attempt(
+            "tester", "GET", "https://gitlab.example.com/api/v4/projects/1"
+        )
+        assert [event["event"] for event in _lines(log)] == [
+            "attempt",
+            "outcome",
+            "attempt",
+        ]
+        gitlab._audit_outcome(
+            "tester", "GET", "https://gitlab.example.com/api/v4/projects/1", "success"
+        )
+
+    events = _lines(log)
+    assert [event["event"] for event in events] == [
+        "attempt",
+        "outcome",
+        "attempt",
+        "outcome",
+    ]
+    assert "hunter2" not in json.dumps(events)
+    assert gitlab._AUDIT_WRITER.buffering is False
+
+
+def test_buffered_audit_flushes_at_size_threshold(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "audit.jsonl"
+    monkeypatch.setenv("GITLAB_AUDIT_LOG", str(log))
+    monkeypatch.setattr(gitlab, "AUDIT_BUFFER_BYTES", 300)
+
+    with gitlab._buffered_audit():
+        for _ in range(3):
+            gitlab._audit_outcome(
+                "tester",
+                "GET",
+                "https://gitlab.example.com/api/v4/projects/1",
+                "success",
+            )
+        flushed = len(_lines(log))
+
+    assert flushed == 2
+    assert len(_lines(log)) == 3
+
+
+def test_audit_writer_follows_log_path_changes(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    first = tmp_path / "first.jsonl"
+    second = tmp_path / "second.jsonl"
+    monkeypatch.setenv("GITLAB_AUDIT_LOG", str(first))
+
+    with gitlab._buffered_audit():
+        gitlab._audit_outcome(
+            "tester", "GET", "https://gitlab.example.com/api/v4/projects/1", "success"
+        )
+        monkeypatch.setenv("GITLAB_AUDIT_LOG", str(second))
+        gitlab._audit_outcome(
+            "tester", "PUT", "https://gitlab.example.com/api/v4/projects/1", "success"
+        )
+
+    assert [event["method"] for event in _lines(first)] == ["GET"]
+    assert [event["method"] for event in _lines(second)] == ["PUT"]
+
+
+def test_close_audit_log_flushes_pending_records(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    log = tmp_path / "audit.jsonl"
+    monkeypatch.setenv("GITLAB_AUDIT_LOG", str(log))
+    monkeypatch.setattr(gitlab._AUDIT_WRITER, "buffering", True)
+
+    gitlab._audit_outcome(
+        "tester", "GET", "https://gitlab.example.com/api/v4/projects/1", "success"
+    )
+    assert _lines(log) == []
+    gitlab._close_audit_log()
+
+    assert len(_lines(log)) == 1
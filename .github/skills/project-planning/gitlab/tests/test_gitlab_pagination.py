@@ -0,0 +1,183 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Paginated list command tests for gitlab.py."""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+import urllib.request
+from email.message import Message
+from typing import Literal
+
+import gitlab
+import pytest
+from conftest import ConfiguredGitLab
+from pytest_mock import MockerFixture
+from test_constants import TEST_API_URL, TEST_PROJECT_ENCODED
+
+PROJECT_URL = f"{TEST_API_URL}/projects/{TEST_PROJECT_ENCODED}"
+
+
+class PageResponse:
+    """HTTP response stub that carries pagination headers."""
+
+    def __init__(self, records: list[object], **headers: str) -> None:
+        self._body = json.dumps(records).encode()
+        self.headers = Message()
+        self.headers["Content-Type"] = "application/json"
+        for name, value in headers.items():
+            self.headers[name.replace("_", "-")] = value
+
+    def __enter__(self) -> PageResponse:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> Literal[False]:
+        return False
+
+    def read(self, amount: int | None = None) -> bytes:
+        return self._body
+
+
+class PageServer:
+    """Answer requests from a URL-keyed page table and record request order."""
+
+    def __init__(self, pages: dict[str, PageResponse]) -> None:
+        self.pages = pages
+        self.urls: list[str] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, request: urllib.request.Request, timeout: int) -> PageResponse:
+        with self._lock:
+            self.urls.append(request.full_url)
+        return self.pages[request.full_url]
+
+
+@pytest.fixture
+def page_server(
+    configured_gitlab: ConfiguredGitLab,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+) -> PageServer:
+    server = PageServer({})
+    mocker.patch("gitlab._OPENER.open", side_effect=server)
+    monkeypatch.setattr(gitlab, "project", lambda: TEST_PROJECT_ENCODED)
+    return server
+
+
+def _link(url: str) -> str:
+    return f'<{url}>; rel="next", <{PROJECT_URL}/merge_requests?page=1>; rel="first"'
+
+
+def test_iter_records_follows_link_headers_and_prefetches(
+    page_server: PageServer,
+) -> None:
+    first = f"{PROJECT_URL}/merge_requests?per_page=2"
+    second = f"{PROJECT_URL}/merge_requests?per_page=2&id_after=2"
+    page_server.pages = {
+        first: PageResponse([{"iid": 1}, {"iid": 2}], Link=_link(second)),
+        second: PageResponse([{"iid": 3}]),
+    }
+
+    records = gitlab.iter_records(first)
+    head = next(records)
+    deadline = time.monotonic() + 5
+    while len(page_server.urls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert head == {"iid": 1}
+    assert page_server.urls == [first, second]
+    assert list(records) == [{"iid": 2}, {"iid": 3}]
+
+
+def test_iter_records_falls_back_to_x_next_page(page_server: PageServer) -> None:
+    first = f"{PROJECT_URL}/pipelines/10/jobs?per_page=100"
+    second = f"{PROJECT_URL}/pipelines/10/jobs?per_page=100&page=2"
+    page_server.pages = {
+        first: PageResponse([{"id": 1}], X_Next_Page="2"),
+        second: PageResponse([{"id": 2}], X_Next_Page=""),
+    }
+
+    assert [job["id"] for job in gitlab.iter_records(first)] == [1, 2]
+
+
+@pytest.mark.parametrize(
+    "link",
+    [
+        "https://evil.example.com/api/v4/projects/1/jobs?page=2",
+        "https://gitlab.example.com/other/projects/1/jobs?page=2",
+    ],
+)
+def test_iter_records_refuses_links_outside_the_api(
+    page_server: PageServer, link: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    first = f"{PROJECT_URL}/pipelines/10/jobs?per_page=100"
+    page_server.pages = {first: PageResponse([{"id": 1}], Link=f'<{link}>; rel="next"')}
+
+    with pytest.raises(SystemExit):
+        list(gitlab.iter_records(first))
+
+    assert "outside the GitLab API" in capsys.readouterr().err
+    assert page_server.urls == [first]
+
+
+def test_mr_list_all_streams_sanitized_json_lines(
+    page_server: PageServer, capsys: pytest.CaptureFixture[str]
+) -> None:
+    first = (
+        f"{PROJECT_URL}/merge_requests?state=opened&per_page=100"
+        "&order_by=created_at&sort=desc"
+    )
+    second = f"{first}&page=2"
+    page_server.pages = {
+        first: PageResponse([{"iid": 1, "access_token": "secret"}], X_Next_Page="2"),
+        second: PageResponse([{"iid": 2}]),
+    }
+
+    gitlab.cmd_mr_list(["opened", "--all"])
+
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"iid": 1, "access_token": "[REDACTED]"},
+        {"iid": 2},
+    ]
+
+
+def test_mr_notes_all_streams_user_notes_as_field_rows(
+    page_server: PageServer, capsys: pytest.CaptureFixture[str]
+) -> None:
+    first = f"{PROJECT_URL}/merge_requests/5/notes?per_page=100&sort=asc"
+    second = f"{PROJECT_URL}/merge_requests/5/notes?per_page=100&sort=asc&page=2"
+    page_server.pages = {
+        first: PageResponse(
+            [{"id": 1, "body": "hi"}, {"id": 2, "body": "bot", "system": True}],
+            Link=f'<{second}>; rel="next"',
+        ),
+        second: PageResponse([{"id": 3, "body": "bye"}]),
+    }
+    gitlab.selected_fields = ["id", "body"]
+
+    gitlab.cmd_mr_notes(["5", "--all"])
+
+    assert capsys.readouterr().out.splitlines() == ["id\tbody", "1\thi", "3\tbye"]
+
+
+def test_pipeline_jobs_all_requests_full_pages(
+    page_server: PageServer, capsys: pytest.CaptureFixture[str]
+) -> None:
+    first = f"{PROJECT_URL}/pipelines/10/jobs?per_page=100"
+    page_server.pages = {first: PageResponse([{"id": 1, "name": "build"}])}
+
+    gitlab.cmd_pipeline_jobs(["--all", "10"])
+
+    assert page_server.urls == [first]
+    assert json.loads(capsys.readouterr().out) == {"id": 1, "name": "build"}
+
+
+def test_paginated_page_must_be_a_list(page_server: PageServer) -> None:
+    first = f"{PROJECT_URL}/pipelines/10/jobs?per_page=100"
+    page_server.pages = {first: PageResponse({"message": "nope"})}  # type: ignore[arg-type]
+
+    with pytest.raises(SystemExit):
+        list(gitlab.iter_records(first))
@@ -0,0 +1,186 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Conditional polling tests for the gitlab.py pipeline-watch command."""
+
+from __future__ import annotations
+
+import io
+import json
+import urllib.error
+import urllib.request
+from email.message import Message
+from typing import Any, Literal
+
+import gitlab
+import pytest
+from conftest import ConfiguredGitLab
+from pytest_mock import MockerFixture
+from test_constants import TEST_API_URL, TEST_PROJECT_ENCODED
+
+PIPELINE_URL = f"{TEST_API_URL}/projects/{TEST_PROJECT_ENCODED}/pipelines/10"
+JOBS_URL = f"{PIPELINE_URL}/jobs?per_page=100"
+
+
+class JsonResponse:
+    """HTTP response stub that carries an ETag header."""
+
+    def __init__(self, payload: object, etag: str) -> None:
+        self._body = json.dumps(payload).encode()
+        self.headers = Message()
+        self.headers["Content-Type"] = "application/json"
+        self.headers["ETag"] = etag
+
+    def __enter__(self) -> JsonResponse:
+        return self
+
+    def __exit__(self, exc_type: object, exc: object, tb: object) -> Literal[False]:
+        return False
+
+    def read(self, amount: int | None = None) -> bytes:
+        return self._body
+
+
+class WatchServer:
+    """Replay pipeline and job states, answering 304 when nothing changed."""
+
+    def __init__(self, states: list[tuple[str, list[dict[str, Any]]]]) -> None:
+        self.states = states
+        self.poll = -1
+        self.requests: list[tuple[str, str | None]] = []
+
+    def __call__(self, request: urllib.request.Request, timeout: int) -> JsonResponse:
+        if request.full_url == PIPELINE_URL:
+            self.poll = min(self.poll + 1, len(self.states) - 1)
+        status, jobs = self.states[self.poll]
+        payload: object = (
+            {"id": 10, "status": status} if request.full_url == PIPELINE_URL else jobs
+        )
+        etag = f'W/"{hash(json.dumps(payload, sort_keys=True))}"'
+        if_none_match = request.get_header("If-none-match")
+        self.requests.append((request.full_url, if_none_match))
+        if if_none_match == etag:
+            headers = Message()
+            headers["ETag"] = etag
+            raise urllib.error.HTTPError(
+                request.full_url, 304, "Not Modified", headers, io.BytesIO(b"")
+            )
+        return JsonResponse(payload, etag)
+
+
+@pytest.fixture
+def watch(
+    configured_gitlab: ConfiguredGitLab,
+    monkeypatch: pytest.MonkeyPatch,
+    mocker: MockerFixture,
+):
+    monkeypatch.setattr(gitlab, "project", lambda: TEST_PROJECT_ENCODED)
+    sleeps: list[float] = []
+    monkeypatch.setattr(gitlab.time, "sleep", sleeps.append)
+
+    def _watch(states: list[tuple[str, list[dict[str, Any]]]]):
+        server = WatchServer(states)
+        mocker.patch("gitlab._OPENER.open", side_effect=server)
+        return server, sleeps
+
+    return _watch
+
+
+def _job(job_id: int, status: str) -> dict[str, Any]:
+    return {"id": job_id, "name": f"job-{job_id}", "stage": "test", "status": status}
+
+
+def _events(capsys: pytest.CaptureFixture[str]) -> list[dict[str, Any]]:
+    events = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    for event in events:
+        assert event.pop("ts")
+    return events
+
+
+def test_watch_emits_transitions_until_pipeline_finishes(
+    watch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    running = [_job(1, "running"), _job(2, "pending")]
+    watch(
+        [
+            ("running", running),
+            ("running", running),
+            ("running", [_job(1, "success"), _job(2, "running")]),
+            ("success", [_job(1, "success"), _job(2, "success")]),
+        ]
+    )
+
+    gitlab.cmd_pipeline_watch(["10"])
+
+    transitions = [
+        (event["event"], event.get("job"), event["previous"], event["status"])
+        for event in _events(capsys)
+    ]
+    assert transitions == [
+        ("job", 1, None, "running"),
+        ("job", 2, None, "pending"),
+        ("pipeline", None, None, "running"),
+        ("job", 1, "running", "success"),
+        ("job", 2, "pending", "running"),
+        ("job", 2, "running", "success"),
+        ("pipeline", None, "running", "success"),
+    ]
+
+
+def test_watch_revalidates_with_etags_and_backs_off_while_idle(watch) -> None:
+    jobs = [_job(1, "running")]
+    server, sleeps = watch(
+        [("running", jobs)] * 4 + [("success", [_job(1, "success")])]
+    )
+
+    gitlab.cmd_pipeline_watch(["10", "--interval", "4"])
+
+    conditional = [etag for url, etag in server.requests[2:8]]
+    assert all(conditional)
+    assert sleeps == [4.0, 6.0, 9.0, 13.5]
+
+
+def test_watch_backoff_is_capped(watch, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(gitlab, "WATCH_MAX_INTERVAL_SECONDS", 5)
+    _, sleeps = watch([("running", [])] * 5 + [("success", [])])
+
+    gitlab.cmd_pipeline_watch(["10"])
+
+    assert sleeps == [2.0, 3.0, 4.5, 5, 5]
+
+
+def test_watch_exits_nonzero_when_pipeline_fails(
+    watch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    watch([("failed", [_job(1, "failed")])])
+
+    with pytest.raises(SystemExit) as exc_info:
+        gitlab.cmd_pipeline_watch(["10"])
+
+    assert exc_info.value.code == gitlab.EXIT_FAILURE
+    assert "finished with status failed" in capsys.readouterr().err
+
+
+def test_watch_times_out(watch, monkeypatch: pytest.MonkeyPatch, capsys) -> None:
+    clock = iter([0.0, 0.0, 5.0])
+    monkeypatch.setattr(gitlab.time, "monotonic", lambda: next(clock))
+    watch([("running", [])])
+
+    with pytest.raises(SystemExit) as exc_info:
+        gitlab.cmd_pipeline_watch(["10", "--timeout", "1"])
+
+    assert exc_info.value.code == gitlab.EXIT_FAILURE
+    assert "timed out watching pipeline 10" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    "args",
+    [[], ["abc"], ["10", "--interval", "0"], ["10", "--timeout", "999999"]],
+)
+def test_watch_rejects_invalid_arguments(watch, args: list[str]) -> None:
+    server, _ = watch([("running", [])])
+
+    with pytest.raises(SystemExit) as exc_info:
+        gitlab.cmd_pipeline_watch(args)
+
+    assert exc_info.value.code == gitlab.EXIT_USAGE
+    assert server.requests == []
@@ -0,0 +1,150 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Project cache and lazy-import startup tests for gitlab.py."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import gitlab
+import pytest
+from pytest_mock import MockerFixture
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+REMOTE = "git@gitlab.com:group/project.git\n"
+
+
+@pytest.fixture
+def repo(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    root = tmp_path / "repo"
+    (root / ".git").mkdir(parents=True)
+    (root / ".git" / "config").write_text("[core]\n", encoding="utf-8")
+    (root / "src").mkdir()
+    monkeypatch.chdir(root / "src")
+    monkeypatch.delenv("GIT_DIR", raising=False)
+    monkeypatch.delenv("GIT_CONFIG_COUNT", raising=False)
+    return root
+
+
+def test_project_reuses_cached_remote_until_git_config_changes(
+    repo: Path, mocker: MockerFixture
+) -> None:
+    git = mocker.patch("subprocess.check_output", return_value=REMOTE)
+
+    assert gitlab.project() == "group%2Fproject"
+    assert gitlab.project() == "group%2Fproject"
+    assert git.call_count == 1
+
+    (repo / ".git" / "config").write_text("[core]\n\tbare = false\n", "utf-8")
+    git.return_value = "https://gitlab.com/other/project.git\n"
+
+    assert gitlab.project() == "other%2Fproject"
+    assert git.call_count == 2
+
+
+def test_project_cache_follows_linked_worktree_to_common_config(
+    tmp_path: Path, repo: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    worktree_git = repo / ".git" / "worktrees" / "feature"
+    worktree_git.mkdir(parents=True)
+    (worktree_git / "commondir").write_text("../..\n", encoding="utf-8")
+    worktree = tmp_path / "feature"
+    worktree.mkdir()
+    (worktree / ".git").write_text(f"gitdir: {worktree_git}\n", encoding="utf-8")
+    monkeypatch.chdir(worktree)
+    git = mocker.patch("subprocess.check_output", return_value=REMOTE)
+
+    gitlab.project()
+    gitlab.project()
+    assert git.call_count == 1
+
+    (repo / ".git" / "config").write_text("[core]\n\tbare = false\n", "utf-8")
+    gitlab.project()
+    assert git.call_count == 2
+
+
+@pytest.mark.parametrize(
+    ("name", "value"), [("GITLAB_PROJECT_CACHE", "0"), ("GIT_DIR", "/elsewhere")]
+)
+def test_project_cache_is_bypassed(
+    repo: Path,
+    mocker: MockerFixture,
+    monkeypatch: pytest.MonkeyPatch,
+    name: str,
+    value: str,
+) -> None:
+    monkeypatch.setenv(name, value)
+    git = mocker.patch("subprocess.check_output", return_value=REMOTE)
+
+    gitlab.project()
+    gitlab.project()
+
+    assert git.call_count == 2
+    assert not gitlab._project_cache_path().exists()
+
+
+def test_project_cache_ignores_tampered_entries(
+    repo: Path, mocker: MockerFixture
+) -> None:
+    git = mocker.patch("subprocess.check_output", return_value=REMOTE)
+    gitlab.project()
+    cache_path = gitlab._project_cache_path()
+    cache = json.loads(cache_path.read_text(encoding="utf-8"))
+    (entry,) = cache.values()
+    entry["project"] = "../../admin"
+    cache_path.write_text(json.dumps(cache), encoding="utf-8")
+
+    assert gitlab.project() == "group%2Fproject"
+    assert git.call_count == 2
+
+
+def test_project_cache_keeps_bounded_entries(
+    repo: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(gitlab, "MAX_PROJECT_CACHE_ENTRIES", 2)
+    mocker.patch("subprocess.check_output", return_value=REMOTE)
+    for index in range(3):
+        other = repo.parent / f"repo-{index}"
+        (other / ".git").mkdir(parents=True)
+        (other / ".git" / "config").write_text("", encoding="utf-8")
+        monkeypatch.chdir(other)
+        gitlab.project()
+
+    cache = json.loads(gitlab._project_cache_path().read_text(encoding="utf-8"))
+    assert [Path(key).name for key in cache] == ["repo-1", "repo-2"]
+
+
+def test_project_cache_write_failure_is_not_fatal(
+    repo: Path, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    blocker = repo.parent / "blocked"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(blocker))
+    mocker.patch("subprocess.check_output", return_value=REMOTE)
+
+    assert gitlab.project() == "group%2Fproject"
+
+
+def test_import_defers_oauth_and_credential_modules() -> None:
+    code = (
+        "import sys, gitlab\n"
+        "print(type(sys.modules['_gitlab_oauth']).__name__,"
+        " type(sys.modules['_gitlab_credentials']).__name__,"
+        " 'webbrowser' in sys.modules)\n"
+        "gitlab.oauth.OAuthError\n"
+        "print(type(sys.modules['_gitlab_oauth']).__name__)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": str(SCRIPTS_DIR)},
+        timeout=30,
+    )
+
+    assert result.stdout.splitlines() == ["_LazyModule _LazyModule False", "module"]
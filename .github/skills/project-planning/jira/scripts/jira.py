@@ -14,20 +14,29 @@ Server/Data Center with bearer token authentication.
 from __future__ import annotations
 
 import argparse
+import atexit
 import base64
+import contextlib
+import email.utils
+import http.client
 import io
 import json
 import logging
 import os
 import re
+import ssl
 import sys
+import threading
+import time
 import traceback
 import urllib.error
 import urllib.parse
 import urllib.request
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, cast
 
 EXIT_SUCCESS = 0
 EXIT_FAILURE = 1
@@ -35,6 +44,14 @@ EXIT_USAGE = 2
 REQUEST_TIMEOUT_SECONDS = 20
 MAX_BODY_BYTES = 256 * 1024
 MAX_RESULTS = 100
+DEFAULT_SEARCH_RESULTS = 50
+DEFAULT_COMMENT_JOBS = 4
+DEFAULT_BULK_JOBS = 4
+BULK_CREATE_BATCH_SIZE = 50
+MAX_THROTTLE_RETRIES = 5
+MAX_RETRY_AFTER_SECONDS = 60.0
+MAX_IDLE_CONNECTIONS = 4
+AUDIT_BUFFER_BYTES = 64 * 1024
 ISSUE_KEY_PATTERN = re.compile(r"^[A-Za-z][A-Za-z0-9]+-\d+$")
 INTEGER_PATTERN = re.compile(r"^\d+$")
 ATLASSIAN_SCOPED_ORIGIN = "https://api.atlassian.com"
@@ -143,7 +160,175 @@ class _NoRedirect(urllib.request.HTTPRedirectHandler):
         )
 
 
-_OPENER = urllib.request.build_opener(_NoRedirect())
+# Methods that are safe to resend when a reused connection turns out to be stale.
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+# A reused socket the server already closed fails with one of these before any
+# response bytes arrive.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class _PooledResponse(http.client.HTTPResponse):
+    """Response that hands its connection back to the pool once fully read."""
+
+    _release: Callable[[bool], None] | None = None
+
+    def close(self) -> None:
+        # ``fp`` is cleared only after the whole body has been consumed; a
+        # partially read response leaves unread bytes on the socket, so that
+        # connection must not carry another request.
+        reusable = self.fp is None and not self.will_close
+        super().close()
+        release, self._release = self._release, None
+        if release is not None:
+            release(reusable)
+
+
+class _ConnectionPool:
+    """Thread-safe set of idle persistent connections keyed by destination."""
+
+    def __init__(self, max_idle: int = MAX_IDLE_CONNECTIONS) -> None:
+        self._max_idle = max_idle
+        self._idle: dict[tuple[Any, ...], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: tuple[Any, ...]) -> http.client.HTTPConnection | None:
+        with self._lock:
+            idle = self._idle.get(key)
+            return idle.pop() if idle else None
+
+    def release(
+        self,
+        key: tuple[Any, ...],
+        connection: http.client.HTTPConnection,
+        reusable: bool,
+    ) -> None:
+        if reusable:
+            with self._lock:
+                idle = self._idle.setdefault(key, [])
+                if len(idle) < self._max_idle:
+                    idle.append(connection)
+                    return
+        connection.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for connections in idle.values():
+            for connection in connections:
+                connection.close()
+
+
+class _KeepAliveMixin:
+    """Serve ``urllib`` requests over pooled persistent connections.
+
+    The mixin replaces only the connection step of the standard handlers, so
+    the opener's redirect refusal, proxy selection, and error processing are
+    unchanged.
+    """
+
+    _pool: _ConnectionPool
+    _new_connection: Callable[[str, Any], http.client.HTTPConnection]
+
+    def _pooled_open(self, request: urllib.request.Request) -> _PooledResponse:
+        host = request.host
+        if not host:
+            raise urllib.error.URLError("no host given")
+        tunnel_host = getattr(request, "_tunnel_host", None)
+        key = (request.type, host, tunnel_host, request.timeout)
+        headers = dict(request.unredirected_hdrs)
+        headers.update({k: v for k, v in request.headers.items() if k not in headers})
+        headers = {name.title(): value for name, value in headers.items()}
+        headers["Connection"] = "keep-alive"
+        tunnel_headers = {}
+        if "Proxy-Authorization" in headers:
+            tunnel_headers["Proxy-Authorization"] = headers.pop("Proxy-Authorization")
+        method = request.get_method()
+
+        connection = self._pool.acquire(key)
+        while True:
+            reused = connection is not None
+            if connection is None:
+                connection = self._new_connection(host, request.timeout)
+                connection.response_class = _PooledResponse
+                if tunnel_host:
+                    connection.set_tunnel(tunnel_host, headers=tunnel_headers)
+            try:
+                try:
+                    connection.request(
+                        method,
+                        request.selector,
+                        request.data,
+                        headers,
+                        encode_chunked=request.has_header("Transfer-encoding"),
+                    )
+                except _STALE_CONNECTION_ERRORS:
+                    # An incomplete send cannot have been acted on, so any
+                    # method is safe to resend on a fresh connection.
+                    if not reused:
+                        raise
+                    connection.close()
+                    connection = None
+                    continue
+                try:
+                    response = connection.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    if not reused or method not in _IDEMPOTENT_METHODS:
+                        raise
+                    connection.close()
+                    connection = None
+                    continue
+            except OSError as exc:
+                connection.close()
+                raise urllib.error.URLError(exc) from exc
+            break
+
+        response = cast(_PooledResponse, response)
+        pooled = connection
+        response._release = lambda reusable: self._pool.release(key, pooled, reusable)
+        # Match ``AbstractHTTPHandler.do_open`` so error processing sees the
+        # same response surface as the standard handlers provide.
+        response.msg = response.reason  # type: ignore[assignment]
+        response.url = request.get_full_url()
+        return response
+
+
+class _KeepAliveHTTPHandler(_KeepAliveMixin, urllib.request.HTTPHandler):
+    """Plain HTTP handler for loopback development servers."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._pool = _ConnectionPool()
+        self._new_connection = lambda host, timeout: http.client.HTTPConnection(
+            host, timeout=timeout
+        )
+
+    def http_open(self, req: urllib.request.Request) -> _PooledResponse:
+        return self._pooled_open(req)
+
+
+class _KeepAliveHTTPSHandler(_KeepAliveMixin, urllib.request.HTTPSHandler):
+    """HTTPS handler that verifies certificates with one shared TLS context."""
+
+    def __init__(self) -> None:
+        context = ssl.create_default_context()
+        context.set_alpn_protocols(["http/1.1"])
+        super().__init__(context=context)
+        self._pool = _ConnectionPool()
+        self._new_connection = lambda host, timeout: http.client.HTTPSConnection(
+            host, timeout=timeout, context=context
+        )
+
+    def https_open(self, req: urllib.request.Request) -> _PooledResponse:
+        return self._pooled_open(req)
+
+
+_HTTP_HANDLER = _KeepAliveHTTPHandler()
+_HTTPS_HANDLER = _KeepAliveHTTPSHandler()
+_OPENER = urllib.request.build_opener(_NoRedirect(), _HTTP_HANDLER, _HTTPS_HANDLER)
 
 
 class ScriptError(Exception):
@@ -170,6 +355,7 @@ class JiraAPIError(ScriptError):
         resource: str = "",
         message: str = "",
         request_id: str = "",
+        retry_after: float | None = None,
         exit_code: int = EXIT_FAILURE,
     ) -> None:
         self.status = status
@@ -177,6 +363,7 @@ class JiraAPIError(ScriptError):
         self.resource = resource
         self.message = message
         self.request_id = request_id
+        self.retry_after = retry_after
         super().__init__(message, exit_code)
 
     def __str__(self) -> str:
@@ -248,6 +435,28 @@ def _response_request_id(response: Any) -> str:
     return ""
 
 
+def _retry_after_seconds(response: Any) -> float | None:
+    """Return the server's Retry-After delay in seconds, when it sends one.
+
+    The header is either a delay in seconds or an HTTP date.
+    """
+    headers = getattr(response, "headers", None)
+    if headers is None or not hasattr(headers, "get"):
+        return None
+    value = str(headers.get("Retry-After") or "").strip()
+    if not value:
+        return None
+    if INTEGER_PATTERN.match(value):
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
 def _is_loopback_host(hostname: str | None) -> bool:
     """Return True for loopback hosts that may allow local development."""
     if not hostname:
@@ -401,9 +610,109 @@ def _preview_for_logging(text: str, *, limit: int = 2048) -> str:
     return _redact(preview)
 
 
-def _audit_write(event: dict[str, Any]) -> bool:
+class _AuditWriter:
+    """Append-only audit sink that keeps the log open and batches records.
+
+    Each line is written whole under one lock, so records from worker threads
+    never interleave. While buffering is enabled, best-effort records wait in
+    memory until ``AUDIT_BUFFER_BYTES`` accumulate, a durable record arrives,
+    or the buffer is flushed; otherwise every record is flushed immediately.
+    """
+
+    def __init__(self) -> None:
+        self.buffering = False
+        self._lock = threading.Lock()
+        self._path = ""
+        self._handle: Any = None
+        self._pending: list[str] = []
+        self._pending_bytes = 0
+
+    def write(self, path: str, line: str, *, durable: bool) -> None:
+        with self._lock:
+            if path != self._path:
+                self._close_locked()
+            if self._handle is None:
+                self._handle = open(path, "a", encoding="utf-8")  # noqa: SIM115
+                self._path = path
+            self._pending.append(line)
+            self._pending_bytes += len(line)
+            if (
+                durable
+                or not self.buffering
+                or self._pending_bytes >= AUDIT_BUFFER_BYTES
+            ):
+                self._flush_locked()
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        with self._lock:
+            self._close_locked()
+
+    def _flush_locked(self) -> None:
+        if self._handle is None or not self._pending:
+            return
+        lines = "".join(self._pending)
+        self._pending = []
+        self._pending_bytes = 0
+        self._handle.write(lines)
+        self._handle.flush()
+
+    def _close_locked(self) -> None:
+        handle, self._handle, self._path = self._handle, None, ""
+        if handle is None:
+            return
+        try:
+            if self._pending:
+                handle.write("".join(self._pending))
+        finally:
+            self._pending = []
+            self._pending_bytes = 0
+            handle.close()
+
+
+_AUDIT_WRITER = _AuditWriter()
+
+
+def _close_audit_log() -> None:
+    """Flush and close the audit log, warning instead of raising."""
+    try:
+        _AUDIT_WRITER.close()
+    except OSError as exc:
+        _emit(f"warning: audit log flush failed: {exc}", level=logging.WARNING)
+
+
+atexit.register(_close_audit_log)
+
+
+@contextlib.contextmanager
+def _buffered_audit() -> Iterator[None]:
+    """Batch best-effort audit records for the duration of one command.
+
+    Attempt records still reach the log before their request is sent; only
+    outcome and item records wait, and they are flushed when the block exits.
+    """
+    _AUDIT_WRITER.buffering = True
+    try:
+        yield
+    finally:
+        _AUDIT_WRITER.buffering = False
+        try:
+            _AUDIT_WRITER.flush()
+        except OSError as exc:
+            _emit(f"warning: audit log flush failed: {exc}", level=logging.WARNING)
+
+
+def _audit_write(event: dict[str, Any], *, durable: bool = False) -> bool:
     """Append one audit event as a JSON line when auditing is enabled.
 
+    Args:
+        event: Audit record; string values are redacted before writing.
+        durable: Flush the record to the log before returning, even while
+            best-effort records are being buffered.
+
     Returns:
         True when an event was written, False when auditing is disabled.
 
@@ -420,8 +729,7 @@ def _audit_write(event: dict[str, Any]) -> bool:
         key: _redact(value) if isinstance(value, str) else value
         for key, value in _sanitize_structured(event).items()
     }
-    with open(path, "a", encoding="utf-8") as handle:
-        handle.write(json.dumps(record) + "\n")
+    _AUDIT_WRITER.write(path, json.dumps(record) + "\n", durable=durable)
     return True
 
 
@@ -462,7 +770,8 @@ def _audit_attempt(
                 "attempt",
                 origin=origin,
                 auth_mode=auth_mode,
-            )
+            ),
+            durable=True,
         )
     except OSError as exc:
         raise ScriptError(
@@ -500,6 +809,34 @@ def _audit_outcome(
         _emit(f"warning: audit outcome write failed: {exc}", level=logging.WARNING)
 
 
+def _audit_item(
+    actor: str,
+    method: str,
+    result: dict[str, Any],
+    *,
+    origin: str = "",
+    auth_mode: str = "unknown",
+) -> None:
+    """Write the per-item outcome record of a bulk operation (best-effort)."""
+    record = _audit_event(
+        actor,
+        method,
+        "item",
+        origin=origin,
+        auth_mode=auth_mode,
+    )
+    record["item"] = result["index"]
+    record["outcome"] = "error" if result["status"] == "failed" else "success"
+    if result.get("key"):
+        record["key"] = result["key"]
+    if result.get("error"):
+        record["error"] = _redact(result["error"])
+    try:
+        _audit_write(record)
+    except OSError as exc:
+        _emit(f"warning: audit item write failed: {exc}", level=logging.WARNING)
+
+
 def _create_response_with_body(
     body: str | bytes,
     *,
@@ -683,7 +1020,10 @@ class JiraClient:
                             EXIT_FAILURE,
                         )
         except urllib.error.HTTPError as exc:
-            body_bytes = _read_response_body(exc)
+            try:
+                body_bytes = _read_response_body(exc)
+            finally:
+                exc.close()
             raw = body_bytes.decode("utf-8", errors="replace")
             details = _extract_error_message(raw)
             resource = _scrub_url(url)
@@ -723,6 +1063,7 @@ class JiraClient:
                 resource=resource,
                 request_id=request_id,
                 message=details,
+                retry_after=_retry_after_seconds(exc),
             ) from exc
         except urllib.error.URLError as exc:
             _audit_outcome(
@@ -755,6 +1096,111 @@ class JiraClient:
         except json.JSONDecodeError:
             return raw
 
+    def iter_search(
+        self,
+        jql: str,
+        *,
+        page_size: int = MAX_RESULTS,
+        limit: int | None = None,
+        fields: str | None = None,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every issue matching ``jql``, one page at a time.
+
+        Server/Data Center pages advance with ``startAt``; Cloud's
+        ``/search/jql`` pages advance with ``nextPageToken``. The next page is
+        requested in the background while the caller consumes the current one,
+        so at most two pages are held in memory at once.
+
+        Args:
+            jql: JQL query string.
+            page_size: Issues requested per page, clamped to the Jira maximum.
+            limit: Optional cap on the total number of issues yielded.
+            fields: Optional comma-delimited field list to request instead of
+                the server default (all navigable fields).
+
+        Raises:
+            ScriptError: A page request fails or ``limit`` is not positive.
+        """
+        page_size = _clamp_max_results(page_size)
+        if limit is not None and limit <= 0:
+            raise ScriptError("--limit must be a positive integer", EXIT_USAGE)
+
+        remaining = limit
+
+        def page_path(start_at: int, token: str | None) -> str:
+            size = page_size if remaining is None else min(page_size, remaining)
+            return _search_page_path(
+                self.use_legacy_search, jql, size, fields, start_at, token
+            )
+
+        with ThreadPoolExecutor(max_workers=1) as prefetcher:
+            pending = prefetcher.submit(self.request, "GET", page_path(0, None))
+            start_at = 0
+            try:
+                while pending is not None:
+                    page = pending.result() or {}
+                    pending = None
+                    issues = page.get("issues") or []
+                    start_at += len(issues)
+                    if remaining is not None:
+                        issues = issues[:remaining]
+                        remaining -= len(issues)
+                    if issues and remaining != 0:
+                        next_path = _next_search_page(
+                            self.use_legacy_search, page, start_at, page_path
+                        )
+                        if next_path is not None:
+                            pending = prefetcher.submit(self.request, "GET", next_path)
+                    yield from issues
+            finally:
+                if pending is not None:
+                    pending.cancel()
+
+
+def _search_page_path(
+    use_legacy_search: bool,
+    jql: str,
+    size: int,
+    fields: str | None,
+    start_at: int = 0,
+    token: str | None = None,
+) -> str:
+    """Return the search path for one page of ``jql`` results."""
+    encoded_jql = urllib.parse.quote(jql, safe="")
+    encoded_fields = urllib.parse.quote(fields or "*navigable", safe=",*")
+    if use_legacy_search:
+        path = f"/search?jql={encoded_jql}&startAt={start_at}&maxResults={size}"
+        return f"{path}&fields={encoded_fields}" if fields else path
+    path = f"/search/jql?jql={encoded_jql}&maxResults={size}&fields={encoded_fields}"
+    if token:
+        path = f"{path}&nextPageToken={urllib.parse.quote(token, safe='')}"
+    return path
+
+
+def _next_search_page(
+    use_legacy_search: bool,
+    page: dict[str, Any],
+    start_at: int,
+    page_path: Callable[[int, str | None], str],
+) -> str | None:
+    """Return the path of the page after ``page``, or None on the last page."""
+    if not use_legacy_search:
+        token = page.get("nextPageToken")
+        if page.get("isLast") or not isinstance(token, str) or not token:
+            return None
+        return page_path(start_at, token)
+
+    total = page.get("total")
+    if isinstance(total, int):
+        return page_path(start_at, None) if start_at < total else None
+    # Without a total, a short page is the last one. The server reports the
+    # page size it actually used, which may be smaller than the one requested.
+    served = page.get("maxResults")
+    issues = page.get("issues") or []
+    if isinstance(served, int) and len(issues) < served:
+        return None
+    return page_path(start_at, None)
+
 
 def _validate_ascii_no_newlines(value: str, *, name: str) -> None:
     """Validate that a credential value is non-empty and ASCII-only."""
@@ -802,6 +1248,50 @@ def _extract_error_message(raw: str) -> str:
     return sanitized.strip() or "No error details returned"
 
 
+class _Throttle:
+    """Shared pause that every worker honors once any of them is rate limited."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self) -> None:
+        """Sleep until the most recent rate-limit pause has elapsed."""
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def defer(self, seconds: float) -> None:
+        """Hold every worker for ``seconds`` from now."""
+        with self._lock:
+            self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+
+
+def _request_throttled(
+    client: JiraClient,
+    throttle: _Throttle,
+    method: str,
+    path: str,
+    data: Any | None = None,
+) -> Any | None:
+    """Run a request, waiting out HTTP 429 responses before retrying.
+
+    The wait honors Retry-After, capped at ``MAX_RETRY_AFTER_SECONDS``, and
+    falls back to exponential backoff when the server sends none.
+    """
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        throttle.wait()
+        try:
+            return client.request(method, path, data)
+        except JiraAPIError as exc:
+            if exc.status != 429 or attempt == MAX_THROTTLE_RETRIES:
+                raise
+            delay = exc.retry_after if exc.retry_after is not None else 2.0**attempt
+            throttle.defer(min(delay, MAX_RETRY_AFTER_SECONDS))
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
 def _validate_issue_key(issue_key: str) -> None:
     """Validate a Jira issue key."""
     if not ISSUE_KEY_PATTERN.match(issue_key):
@@ -919,7 +1409,14 @@ def _quote_path_segment(value: str) -> str:
 
 def handle_search(client: JiraClient, args: argparse.Namespace) -> Any:
     """Search for Jira issues using JQL."""
-    max_results = _clamp_max_results(args.max_results)
+    if getattr(args, "all", False):
+        return _stream_search(client, args)
+    if getattr(args, "limit", None) is not None:
+        raise ScriptError("--limit requires --all", EXIT_USAGE)
+
+    max_results = _clamp_max_results(
+        DEFAULT_SEARCH_RESULTS if args.max_results is None else args.max_results
+    )
 
     encoded_jql = urllib.parse.quote(args.jql, safe="")
     if client.use_legacy_search:
@@ -934,6 +1431,30 @@ def handle_search(client: JiraClient, args: argparse.Namespace) -> Any:
     return response
 
 
+def _stream_search(client: JiraClient, args: argparse.Namespace) -> None:
+    """Write every matching issue to stdout as it arrives.
+
+    Issues are written one JSON object per line, or as tab-separated rows
+    under a header when ``--fields`` is set, so the output never has to be
+    held in memory.
+    """
+    issues = client.iter_search(
+        args.jql,
+        page_size=MAX_RESULTS if args.max_results is None else args.max_results,
+        limit=args.limit,
+    )
+    if args.fields:
+        _emit_structured_stdout("\t".join(args.fields))
+    for issue in issues:
+        sanitized = _sanitize_structured(issue)
+        if args.fields:
+            _emit_structured_stdout(
+                "\t".join(_extract_field(sanitized, name) for name in args.fields)
+            )
+        else:
+            _emit_structured_stdout(json.dumps(sanitized))
+
+
 def handle_get(client: JiraClient, args: argparse.Namespace) -> Any:
     """Fetch one Jira issue."""
     _validate_issue_key(args.issue_key)
@@ -960,6 +1481,23 @@ def handle_update(client: JiraClient, args: argparse.Namespace) -> Any:
     return {"key": args.issue_key, "status": "updated"}
 
 
+def _match_transition(
+    issue_key: str, target: str, transitions: list[dict[str, Any]]
+) -> str:
+    """Return the ID of the transition named ``target``."""
+    match = next((item for item in transitions if item.get("name") == target), None)
+    if match is None:
+        available = ", ".join(
+            sorted(item.get("name", "") for item in transitions if item.get("name"))
+        )
+        details = f" Available transitions: {available}" if available else ""
+        raise ScriptError(
+            f"Transition '{target}' was not found for {issue_key}.{details}",
+            EXIT_FAILURE,
+        )
+    return str(match["id"])
+
+
 def handle_transition(client: JiraClient, args: argparse.Namespace) -> Any:
     """Transition a Jira issue by transition ID or display name."""
     _validate_issue_key(args.issue_key)
@@ -970,17 +1508,7 @@ def handle_transition(client: JiraClient, args: argparse.Namespace) -> Any:
     else:
         response = client.request("GET", f"/issue/{args.issue_key}/transitions")
         transitions = (response or {}).get("transitions", [])
-        match = next((item for item in transitions if item.get("name") == target), None)
-        if match is None:
-            available = ", ".join(
-                sorted(item.get("name", "") for item in transitions if item.get("name"))
-            )
-            details = f" Available transitions: {available}" if available else ""
-            raise ScriptError(
-                f"Transition '{target}' was not found for {args.issue_key}.{details}",
-                EXIT_FAILURE,
-            )
-        transition_id = str(match["id"])
+        transition_id = _match_transition(args.issue_key, target, transitions)
 
     client.request(
         "POST",
@@ -1012,15 +1540,55 @@ def handle_comment(client: JiraClient, args: argparse.Namespace) -> Any:
     return client.request("POST", f"/issue/{args.issue_key}/comment", {"body": body})
 
 
+def _fetch_comments(
+    client: JiraClient, throttle: _Throttle, issue_key: str
+) -> list[dict[str, Any]]:
+    """Fetch every comment on one issue, following ``startAt`` pagination."""
+    comments: list[dict[str, Any]] = []
+    start_at = 0
+    while True:
+        response = _request_throttled(
+            client,
+            throttle,
+            "GET",
+            f"/issue/{issue_key}/comment?startAt={start_at}&maxResults={MAX_RESULTS}",
+        )
+        page = (response or {}).get("comments") or []
+        for comment in page:
+            comment["_issue"] = issue_key
+        comments.extend(page)
+        start_at += len(page)
+        total = (response or {}).get("total")
+        served = (response or {}).get("maxResults") or MAX_RESULTS
+        if not page:
+            return comments
+        if isinstance(total, int):
+            if start_at >= total:
+                return comments
+        elif len(page) < served:
+            return comments
+
+
 def handle_comments(client: JiraClient, args: argparse.Namespace) -> Any:
-    """List comments for one or more Jira issues."""
-    comment_rows: list[dict[str, Any]] = []
+    """List comments for one or more Jira issues.
+
+    Issues are fetched concurrently, up to ``--jobs`` at a time, and rows keep
+    the order of the issue keys on the command line.
+    """
+    jobs = getattr(args, "jobs", DEFAULT_COMMENT_JOBS)
+    if jobs <= 0:
+        raise ScriptError("--jobs must be a positive integer", EXIT_USAGE)
     for issue_key in args.issue_keys:
         _validate_issue_key(issue_key)
-        response = client.request("GET", f"/issue/{issue_key}/comment")
-        for comment in (response or {}).get("comments", []):
-            comment["_issue"] = issue_key
-            comment_rows.append(comment)
+
+    throttle = _Throttle()
+    comment_rows: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=min(jobs, len(args.issue_keys))) as pool:
+        for comments in pool.map(
+            lambda issue_key: _fetch_comments(client, throttle, issue_key),
+            args.issue_keys,
+        ):
+            comment_rows.extend(comments)
     return comment_rows
 
 
@@ -1038,6 +1606,320 @@ def handle_fields(client: JiraClient, args: argparse.Namespace) -> Any:
     return client.request("GET", f"/issue/createmeta/{quoted_project_key}/issuetypes")
 
 
+def _read_work_items(source: str | None, command: str) -> list[dict[str, Any]]:
+    """Read JSON-lines work items from a file or stdin.
+
+    Every line is parsed before any request is sent, so a malformed input
+    fails the whole command instead of applying part of it.
+    """
+    try:
+        handle = open(source, encoding="utf-8") if source else sys.stdin
+    except OSError as exc:
+        raise ScriptError(f"Cannot read {source}: {exc}", EXIT_USAGE) from exc
+    items: list[dict[str, Any]] = []
+    try:
+        for number, line in enumerate(handle, start=1):
+            if len(line.encode("utf-8")) > MAX_BODY_BYTES:
+                raise ScriptError(f"Line {number} exceeds size limit", EXIT_USAGE)
+            if not line.strip():
+                continue
+            try:
+                item = json.loads(line)
+            except json.JSONDecodeError as exc:
+                raise ScriptError(
+                    f"Invalid JSON on line {number}: {exc.msg}", EXIT_USAGE
+                ) from exc
+            if not isinstance(item, dict):
+                raise ScriptError(f"Line {number} must be a JSON object", EXIT_USAGE)
+            items.append(item)
+    finally:
+        if source:
+            handle.close()
+    if not items:
+        raise ScriptError(
+            f"Provide JSON lines as a file argument or through stdin for {command}",
+            EXIT_USAGE,
+        )
+    return items
+
+
+def _item_key(item: dict[str, Any], index: int) -> str:
+    """Return the validated issue key of a bulk work item."""
+    issue_key = item.get("key")
+    if not isinstance(issue_key, str):
+        raise ScriptError(f"Item {index} is missing an issue key", EXIT_USAGE)
+    _validate_issue_key(issue_key)
+    return issue_key
+
+
+def _bulk_jobs(args: argparse.Namespace) -> int:
+    """Return the validated worker count for a bulk command."""
+    if args.jobs <= 0:
+        raise ScriptError("--jobs must be a positive integer", EXIT_USAGE)
+    return args.jobs
+
+
+def _failed(index: int, error: str, key: str | None = None) -> dict[str, Any]:
+    """Build the result record of a bulk item that did not apply."""
+    result: dict[str, Any] = {"index": index, "status": "failed", "error": error}
+    if key:
+        result["key"] = key
+    return result
+
+
+def _report_bulk_results(
+    client: JiraClient,
+    method: str,
+    results: Iterator[dict[str, Any]],
+    total: int,
+) -> None:
+    """Write each item result as a JSON line and audit it.
+
+    Raises:
+        ScriptError: At least one item failed.
+    """
+    failures = 0
+    for result in results:
+        if result["status"] == "failed":
+            failures += 1
+        _audit_item(
+            client.audit_actor,
+            method,
+            result,
+            origin=client.audit_origin,
+            auth_mode=client.auth_mode,
+        )
+        _emit_structured_stdout(json.dumps(_sanitize_structured(result)))
+    if failures:
+        raise ScriptError(f"{failures} of {total} bulk items failed", EXIT_FAILURE)
+
+
+def _bulk_error_message(error: Any) -> str:
+    """Extract the message of one failed element from a bulk create response."""
+    element_errors = error.get("elementErrors") if isinstance(error, dict) else None
+    if isinstance(element_errors, dict) and (
+        element_errors.get("errorMessages") or element_errors.get("errors")
+    ):
+        return _extract_error_message(json.dumps(element_errors))
+    return "Jira rejected the item"
+
+
+def _create_batch(
+    client: JiraClient,
+    throttle: _Throttle,
+    batch: list[tuple[int, dict[str, Any]]],
+) -> list[dict[str, Any]]:
+    """Create one batch with ``POST /issue/bulk``, one issue at a time if absent."""
+    try:
+        response = _request_throttled(
+            client,
+            throttle,
+            "POST",
+            "/issue/bulk",
+            {"issueUpdates": [payload for _, payload in batch]},
+        )
+    except ScriptError as exc:
+        if not isinstance(exc, JiraAPIError) or exc.status not in {404, 405}:
+            return [_failed(index, str(exc)) for index, _ in batch]
+        return [
+            _create_one(client, throttle, index, payload) for index, payload in batch
+        ]
+
+    response = response if isinstance(response, dict) else {}
+    failed = {
+        error["failedElementNumber"]: _bulk_error_message(error)
+        for error in response.get("errors") or []
+        if isinstance(error, dict) and isinstance(error.get("failedElementNumber"), int)
+    }
+    created = iter(response.get("issues") or [])
+    results: list[dict[str, Any]] = []
+    for position, (index, _) in enumerate(batch):
+        if position in failed:
+            results.append(_failed(index, failed[position]))
+            continue
+        issue = next(created, None)
+        if not isinstance(issue, dict):
+            results.append(_failed(index, "Jira returned no issue for the item"))
+            continue
+        results.append({"index": index, "key": issue.get("key"), "status": "created"})
+    return results
+
+
+def _create_one(
+    client: JiraClient, throttle: _Throttle, index: int, payload: dict[str, Any]
+) -> dict[str, Any]:
+    """Create one issue with ``POST /issue``."""
+    try:
+        response = _request_throttled(client, throttle, "POST", "/issue", payload)
+    except ScriptError as exc:
+        return _failed(index, str(exc))
+    key = response.get("key") if isinstance(response, dict) else None
+    return {"index": index, "key": key, "status": "created"}
+
+
+def handle_bulk_create(client: JiraClient, args: argparse.Namespace) -> Any:
+    """Create issues from JSON lines, one create payload per line.
+
+    Items are sent in batches of ``BULK_CREATE_BATCH_SIZE`` to Jira's bulk
+    create endpoint, falling back to one request per issue when the server
+    does not offer it.
+    """
+    jobs = _bulk_jobs(args)
+    items = _read_work_items(args.input, "bulk-create")
+    numbered = list(enumerate(items, start=1))
+    batches = [
+        numbered[start : start + BULK_CREATE_BATCH_SIZE]
+        for start in range(0, len(numbered), BULK_CREATE_BATCH_SIZE)
+    ]
+    throttle = _Throttle()
+    with ThreadPoolExecutor(max_workers=min(jobs, len(batches))) as pool:
+        results = (
+            result
+            for batch_results in pool.map(
+                lambda batch: _create_batch(client, throttle, batch), batches
+            )
+            for result in batch_results
+        )
+        _report_bulk_results(client, "POST", results, len(items))
+
+
+def handle_bulk_update(client: JiraClient, args: argparse.Namespace) -> Any:
+    """Update issues from JSON lines of ``{"key": ..., <update payload>}``."""
+    jobs = _bulk_jobs(args)
+    items = _read_work_items(args.input, "bulk-update")
+    work: list[tuple[int, str, dict[str, Any]]] = []
+    for index, item in enumerate(items, start=1):
+        issue_key = _item_key(item, index)
+        payload = {name: value for name, value in item.items() if name != "key"}
+        if not payload:
+            raise ScriptError(f"Item {index} has no update payload", EXIT_USAGE)
+        work.append((index, issue_key, payload))
+
+    throttle = _Throttle()
+
+    def update(entry: tuple[int, str, dict[str, Any]]) -> dict[str, Any]:
+        index, issue_key, payload = entry
+        try:
+            _request_throttled(client, throttle, "PUT", f"/issue/{issue_key}", payload)
+        except ScriptError as exc:
+            return _failed(index, str(exc), issue_key)
+        return {"index": index, "key": issue_key, "status": "updated"}
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        _report_bulk_results(client, "PUT", pool.map(update, work), len(items))
+
+
+class _TransitionResolver:
+    """Resolve transition names to IDs once per project, issue type, and status.
+
+    Issues that share all three see the same workflow transitions, so one
+    ``GET /transitions`` serves the whole group. Transition conditions that
+    depend on the individual issue can still reject the ID; that surfaces as
+    the item's POST failing.
+    """
+
+    def __init__(self, client: JiraClient, throttle: _Throttle) -> None:
+        self._client = client
+        self._throttle = throttle
+        self._lock = threading.Lock()
+        self._contexts: dict[str, tuple[str, str, str]] = {}
+        self._transitions: dict[tuple[str, str, str], list[dict[str, Any]]] = {}
+
+    def load_contexts(self, issue_keys: list[str]) -> None:
+        """Look up project, issue type, and status for many issues per search.
+
+        Best effort: Jira rejects a whole ``key in (...)`` query when any key in
+        it is missing or hidden, so a failed chunk is skipped and its issues
+        fall back to a per-issue ``GET /transitions`` in ``resolve``, where a
+        bad key fails only its own item.
+        """
+        unique = sorted(set(issue_keys))
+        for start in range(0, len(unique), MAX_RESULTS):
+            chunk = unique[start : start + MAX_RESULTS]
+            path = _search_page_path(
+                self._client.use_legacy_search,
+                f"key in ({', '.join(chunk)})",
+                len(chunk),
+                "project,issuetype,status",
+            )
+            try:
+                page = _request_throttled(self._client, self._throttle, "GET", path)
+            except ScriptError:
+                continue
+            for issue in (page or {}).get("issues") or []:
+                fields = issue.get("fields") or {}
+                context = (
+                    str((fields.get("project") or {}).get("key", "")),
+                    str((fields.get("issuetype") or {}).get("id", "")),
+                    str((fields.get("status") or {}).get("id", "")),
+                )
+                if all(context):
+                    self._contexts[str(issue.get("key", ""))] = context
+
+    def resolve(self, issue_key: str, target: str) -> str:
+        """Return the transition ID for ``target`` on ``issue_key``."""
+        if INTEGER_PATTERN.match(target):
+            return target
+        context = self._contexts.get(issue_key)
+        with self._lock:
+            transitions = self._transitions.get(context) if context else None
+        if transitions is None:
+            response = _request_throttled(
+                self._client, self._throttle, "GET", f"/issue/{issue_key}/transitions"
+            )
+            transitions = (response or {}).get("transitions", [])
+            if context:
+                with self._lock:
+                    self._transitions[context] = transitions
+        return _match_transition(issue_key, target, transitions)
+
+
+def handle_bulk_transition(client: JiraClient, args: argparse.Namespace) -> Any:
+    """Transition issues from JSON lines of ``{"key": ..., "transition": ...}``."""
+    jobs = _bulk_jobs(args)
+    items = _read_work_items(args.input, "bulk-transition")
+    work: list[tuple[int, str, str]] = []
+    for index, item in enumerate(items, start=1):
+        issue_key = _item_key(item, index)
+        target = item.get("transition")
+        if isinstance(target, int):
+            target = str(target)
+        if not isinstance(target, str) or not target.strip():
+            raise ScriptError(f"Item {index} is missing a transition", EXIT_USAGE)
+        work.append((index, issue_key, target))
+
+    throttle = _Throttle()
+    resolver = _TransitionResolver(client, throttle)
+    named = [
+        issue_key for _, issue_key, target in work if not INTEGER_PATTERN.match(target)
+    ]
+    if named:
+        resolver.load_contexts(named)
+
+    def transition(entry: tuple[int, str, str]) -> dict[str, Any]:
+        index, issue_key, target = entry
+        try:
+            transition_id = resolver.resolve(issue_key, target)
+            _request_throttled(
+                client,
+                throttle,
+                "POST",
+                f"/issue/{issue_key}/transitions",
+                {"transition": {"id": transition_id}},
+            )
+        except ScriptError as exc:
+            return _failed(index, str(exc), issue_key)
+        return {
+            "index": index,
+            "key": issue_key,
+            "transitionId": transition_id,
+            "status": "transitioned",
+        }
+
+    with ThreadPoolExecutor(max_workers=min(jobs, len(work))) as pool:
+        _report_bulk_results(client, "POST", pool.map(transition, work), len(items))
+
+
 def create_parser() -> argparse.ArgumentParser:
     """Create the command-line parser."""
     parser = argparse.ArgumentParser(
@@ -1050,7 +1932,10 @@ def create_parser() -> argparse.ArgumentParser:
         "--confirm",
         dest="confirm",
         action="store_true",
-        help="Confirm write operations (create, update, transition, comment).",
+        help=(
+            "Confirm write operations (create, update, transition, comment, "
+            "and the bulk commands)."
+        ),
     )
     parser.add_argument(
         "--fields",
@@ -1067,9 +1952,23 @@ def create_parser() -> argparse.ArgumentParser:
     search_parser.add_argument(
         "max_results",
         nargs="?",
-        default=50,
+        default=None,
+        type=int,
+        help=(
+            "Maximum number of issues to return. Defaults to 50. With --all, "
+            "the page size instead, defaulting to 100."
+        ),
+    )
+    search_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Page through every match and stream issues to stdout as JSON lines.",
+    )
+    search_parser.add_argument(
+        "--limit",
         type=int,
-        help="Maximum number of issues to return. Defaults to 50.",
+        default=None,
+        help="With --all, stop after this many issues.",
     )
     search_parser.set_defaults(handler=handle_search)
 
@@ -1126,6 +2025,15 @@ def create_parser() -> argparse.ArgumentParser:
         nargs="+",
         help="One or more issue keys, for example PROJ-123 PROJ-124.",
     )
+    comments_parser.add_argument(
+        "--jobs",
+        type=int,
+        default=DEFAULT_COMMENT_JOBS,
+        help=(
+            "Number of issues to fetch concurrently. "
+            f"Defaults to {DEFAULT_COMMENT_JOBS}."
+        ),
+    )
     comments_parser.set_defaults(handler=handle_comments)
 
     fields_parser = subparsers.add_parser(
@@ -1139,6 +2047,41 @@ def create_parser() -> argparse.ArgumentParser:
     )
     fields_parser.set_defaults(handler=handle_fields)
 
+    bulk_commands = (
+        (
+            "bulk-create",
+            handle_bulk_create,
+            "Create issues from JSON lines of create payloads.",
+        ),
+        (
+            "bulk-update",
+            handle_bulk_update,
+            'Update issues from JSON lines of {"key": ..., "fields": ...}.',
+        ),
+        (
+            "bulk-transition",
+            handle_bulk_transition,
+            'Transition issues from JSON lines of {"key": ..., "transition": ...}.',
+        ),
+    )
+    for name, handler, help_text in bulk_commands:
+        bulk_parser = subparsers.add_parser(name, help=help_text)
+        bulk_parser.add_argument(
+            "input",
+            nargs="?",
+            help="JSON-lines file. If omitted, the script reads from stdin.",
+        )
+        bulk_parser.add_argument(
+            "--jobs",
+            type=int,
+            default=DEFAULT_BULK_JOBS,
+            help=(
+                f"Number of requests to run concurrently. Defaults to "
+                f"{DEFAULT_BULK_JOBS}."
+            ),
+        )
+        bulk_parser.set_defaults(handler=handler)
+
     return parser
 
 
@@ -1152,7 +2095,15 @@ def main() -> int:
         global _AUDIT_OP
         _AUDIT_OP = command
 
-        if command in {"create", "update", "transition", "comment"}:
+        if command in {
+            "create",
+            "update",
+            "transition",
+            "comment",
+            "bulk-create",
+            "bulk-update",
+            "bulk-transition",
+        }:
             confirmed = bool(args.confirm) or (
                 os.environ.get("JIRA_CONFIRM_WRITES", "").strip() == "1"
             )
@@ -1164,7 +2115,8 @@ def main() -> int:
                 )
 
         client = JiraClient.from_environment()
-        result = args.handler(client, args)
+        with _buffered_audit():
+            result = args.handler(client, args)
         _print_result(result, args.fields)
         return EXIT_SUCCESS
     except KeyboardInterrupt:
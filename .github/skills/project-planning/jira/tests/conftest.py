@@ -66,6 +66,9 @@ class ClientRecorder:
             return self.responses.pop(0)
         return None
 
+    # Pagination only depends on request(), so the recorder reuses the real one.
+    iter_search = jira.JiraClient.iter_search
+
 
 ResponseFactory = Callable[[str], FakeHttpResponse]
 StdinFactory = Callable[[str], None]
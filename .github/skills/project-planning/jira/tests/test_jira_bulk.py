@@ -0,0 +1,396 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Bulk create, update, and transition tests for jira.py."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, cast
+
+import jira
+import pytest
+from conftest import RecordedCall, StdinFactory
+
+Route = Callable[[str, str, Any], Any]
+
+
+@dataclass
+class BulkServer:
+    """Thread-safe fake client that answers requests through a route function."""
+
+    route: Route
+    use_legacy_search: bool = True
+    audit_actor: str = "bulk-tester"
+    audit_origin: str = "https://jira.example.com"
+    auth_mode: str = "data-center-pat"
+    calls: list[RecordedCall] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def request(self, method: str, path: str, data: object | None = None) -> Any:
+        with self._lock:
+            self.calls.append(RecordedCall(method=method, path=path, data=data))
+        return self.route(method, path, data)
+
+    iter_search = jira.JiraClient.iter_search
+
+    def paths(self, method: str) -> list[str]:
+        return [call.path for call in self.calls if call.method == method]
+
+
+def _write_items(tmp_path: Path, items: list[object]) -> str:
+    path = tmp_path / "items.jsonl"
+    path.write_text(
+        "\n".join(json.dumps(item) for item in items) + "\n\n", encoding="utf-8"
+    )
+    return str(path)
+
+
+def _run(
+    handler: Callable[[jira.JiraClient, argparse.Namespace], Any],
+    server: BulkServer,
+    source: str | None,
+    jobs: int = 4,
+) -> None:
+    args = argparse.Namespace(input=source, jobs=jobs)
+    handler(cast(jira.JiraClient, server), args)
+
+
+def _results(capsys: pytest.CaptureFixture[str]) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+
+
+def test_bulk_create_batches_and_maps_partial_failures(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    items = [{"fields": {"summary": f"Item {index}"}} for index in range(52)]
+
+    def route(method: str, path: str, data: Any) -> Any:
+        updates = data["issueUpdates"]
+        if len(updates) == 2:
+            return {"issues": [{"key": "PROJ-51"}, {"key": "PROJ-52"}], "errors": []}
+        return {
+            "issues": [{"key": f"PROJ-{index}"} for index in range(1, 50)],
+            "errors": [
+                {
+                    "failedElementNumber": 1,
+                    "elementErrors": {"errors": {"summary": "is required"}},
+                }
+            ],
+        }
+
+    server = BulkServer(route)
+
+    with pytest.raises(jira.ScriptError, match="1 of 52 bulk items failed"):
+        _run(jira.handle_bulk_create, server, _write_items(tmp_path, items))
+
+    assert server.paths("POST") == ["/issue/bulk", "/issue/bulk"]
+    results = _results(capsys)
+    assert [result["index"] for result in results] == list(range(1, 53))
+    assert results[0] == {"index": 1, "key": "PROJ-1", "status": "created"}
+    assert results[1] == {
+        "index": 2,
+        "status": "failed",
+        "error": "summary: is required",
+    }
+    assert results[2]["key"] == "PROJ-2"
+    assert results[-1] == {"index": 52, "key": "PROJ-52", "status": "created"}
+
+
+def test_bulk_create_falls_back_to_single_creates_without_bulk_endpoint(
+    stdin_factory: StdinFactory, capsys: pytest.CaptureFixture[str]
+) -> None:
+    created = iter(["PROJ-7", "PROJ-8"])
+
+    def route(method: str, path: str, data: Any) -> Any:
+        if path == "/issue/bulk":
+            raise jira.JiraAPIError(status=404, method=method, resource=path)
+        return {"key": next(created)}
+
+    server = BulkServer(route)
+    stdin_factory('{"fields": {"summary": "a"}}\n{"fields": {"summary": "b"}}\n')
+
+    _run(jira.handle_bulk_create, server, None, jobs=1)
+
+    assert server.paths("POST") == ["/issue/bulk", "/issue", "/issue"]
+    assert _results(capsys) == [
+        {"index": 1, "key": "PROJ-7", "status": "created"},
+        {"index": 2, "key": "PROJ-8", "status": "created"},
+    ]
+
+
+def test_bulk_update_reports_each_item_in_input_order(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def route(method: str, path: str, data: Any) -> Any:
+        if path == "/issue/PROJ-2":
+            raise jira.JiraAPIError(
+                status=400, method=method, resource=path, message="bad field"
+            )
+        return None
+
+    server = BulkServer(route)
+    items = [
+        {"key": f"PROJ-{index}", "fields": {"summary": f"S{index}"}}
+        for index in range(1, 4)
+    ]
+
+    with pytest.raises(jira.ScriptError, match="1 of 3 bulk items failed"):
+        _run(jira.handle_bulk_update, server, _write_items(tmp_path, items))
+
+    assert sorted(server.paths("PUT")) == [
+        "/issue/PROJ-1",
+        "/issue/PROJ-2",
+        "/issue/PROJ-3",
+    ]
+    assert next(call.data for call in server.calls if call.path == "/issue/PROJ-3") == {
+        "fields": {"summary": "S3"}
+    }
+    results = _results(capsys)
+    assert [result["status"] for result in results] == ["updated", "failed", "updated"]
+    assert results[1]["key"] == "PROJ-2"
+    assert "bad field" in results[1]["error"]
+
+
+@pytest.mark.parametrize(
+    ("line", "message"),
+    [
+        ("not json", "Invalid JSON on line 1"),
+        ("[1]", "Line 1 must be a JSON object"),
+        ('{"fields": {}}', "Item 1 is missing an issue key"),
+        ('{"key": "PROJ-1"}', "Item 1 has no update payload"),
+        ('{"key": "bad key", "fields": {}}', "Invalid issue key"),
+    ],
+)
+def test_bulk_update_rejects_invalid_input_before_any_request(
+    stdin_factory: StdinFactory, line: str, message: str
+) -> None:
+    server = BulkServer(lambda method, path, data: None)
+    stdin_factory(line + "\n")
+
+    with pytest.raises(jira.ScriptError, match=message) as exc_info:
+        _run(jira.handle_bulk_update, server, None)
+
+    assert exc_info.value.exit_code == jira.EXIT_USAGE
+    assert server.calls == []
+
+
+def test_bulk_commands_require_input_and_positive_jobs(
+    stdin_factory: StdinFactory,
+) -> None:
+    server = BulkServer(lambda method, path, data: None)
+    stdin_factory("\n")
+
+    with pytest.raises(jira.ScriptError, match="Provide JSON lines"):
+        _run(jira.handle_bulk_update, server, None)
+    with pytest.raises(jira.ScriptError, match="--jobs must be a positive"):
+        _run(jira.handle_bulk_update, server, None, jobs=0)
+
+
+def test_bulk_transition_resolves_names_once_per_workflow_context(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    contexts = {
+        "PROJ-1": ("PROJ", "1", "10"),
+        "PROJ-2": ("PROJ", "1", "10"),
+        "PROJ-3": ("PROJ", "2", "10"),
+    }
+
+    def route(method: str, path: str, data: Any) -> Any:
+        if path.startswith("/search?"):
+            return {
+                "total": len(contexts),
+                "issues": [
+                    {
+                        "key": key,
+                        "fields": {
+                            "project": {"key": project},
+                            "issuetype": {"id": type_id},
+                            "status": {"id": status_id},
+                        },
+                    }
+                    for key, (project, type_id, status_id) in contexts.items()
+                ],
+            }
+        if method == "GET":
+            return {"transitions": [{"id": "31", "name": "Done"}]}
+        return None
+
+    server = BulkServer(route)
+    items = [
+        {"key": "PROJ-1", "transition": "Done"},
+        {"key": "PROJ-2", "transition": "Done"},
+        {"key": "PROJ-3", "transition": "Done"},
+        {"key": "PROJ-4", "transition": 41},
+    ]
+
+    _run(jira.handle_bulk_transition, server, _write_items(tmp_path, items), jobs=1)
+
+    search_paths = [path for path in server.paths("GET") if path.startswith("/search")]
+    assert len(search_paths) == 1
+    assert "fields=project,issuetype,status" in search_paths[0]
+    assert sorted(p for p in server.paths("GET") if p.endswith("/transitions")) == [
+        "/issue/PROJ-1/transitions",
+        "/issue/PROJ-3/transitions",
+    ]
+    assert _results(capsys) == [
+        {"index": 1, "key": "PROJ-1", "transitionId": "31", "status": "transitioned"},
+        {"index": 2, "key": "PROJ-2", "transitionId": "31", "status": "transitioned"},
+        {"index": 3, "key": "PROJ-3", "transitionId": "31", "status": "transitioned"},
+        {"index": 4, "key": "PROJ-4", "transitionId": "41", "status": "transitioned"},
+    ]
+
+
+def test_bulk_transition_reports_invalid_key_per_item_when_context_search_fails(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def route(method: str, path: str, data: Any) -> Any:
+        if path.startswith("/search?"):
+            raise jira.JiraAPIError(
+                status=400,
+                method=method,
+                resource="/search",
+                message="An issue with key 'PROJ-404' does not exist",
+            )
+        if path == "/issue/PROJ-404/transitions":
+            raise jira.JiraAPIError(status=404, method=method, resource=path)
+        if method == "GET":
+            return {"transitions": [{"id": "31", "name": "Done"}]}
+        return None
+
+    server = BulkServer(route)
+    items = [
+        {"key": "PROJ-1", "transition": "Done"},
+        {"key": "PROJ-404", "transition": "Done"},
+        {"key": "PROJ-2", "transition": "Done"},
+    ]
+
+    with pytest.raises(jira.ScriptError, match="1 of 3 bulk items failed"):
+        _run(jira.handle_bulk_transition, server, _write_items(tmp_path, items), jobs=1)
+
+    results = _results(capsys)
+    assert [result["status"] for result in results] == [
+        "transitioned",
+        "failed",
+        "transitioned",
+    ]
+    assert results[1]["key"] == "PROJ-404"
+    assert server.paths("POST") == [
+        "/issue/PROJ-1/transitions",
+        "/issue/PROJ-2/transitions",
+    ]
+
+
+def test_bulk_transition_context_search_waits_out_rate_limits(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    monkeypatch.setattr(jira.time, "sleep", lambda seconds: None)
+    searches = iter([429, 200])
+
+    def route(method: str, path: str, data: Any) -> Any:
+        if path.startswith("/search?"):
+            if next(searches) == 429:
+                raise jira.JiraAPIError(
+                    status=429, method=method, resource="/search", retry_after=0
+                )
+            return {
+                "total": 1,
+                "issues": [
+                    {
+                        "key": "PROJ-1",
+                        "fields": {
+                            "project": {"key": "PROJ"},
+                            "issuetype": {"id": "1"},
+                            "status": {"id": "10"},
+                        },
+                    }
+                ],
+            }
+        if method == "GET":
+            return {"transitions": [{"id": "31", "name": "Done"}]}
+        return None
+
+    server = BulkServer(route)
+
+    _run(
+        jira.handle_bulk_transition,
+        server,
+        _write_items(tmp_path, [{"key": "PROJ-1", "transition": "Done"}]),
+    )
+
+    assert (
+        len([path for path in server.paths("GET") if path.startswith("/search")]) == 2
+    )
+    assert _results(capsys)[0]["status"] == "transitioned"
+
+
+def test_bulk_transition_reports_unknown_transition_per_item(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    def route(method: str, path: str, data: Any) -> Any:
+        if path.startswith("/search?"):
+            return {"total": 0, "issues": []}
+        return {"transitions": [{"id": "31", "name": "Done"}]}
+
+    server = BulkServer(route)
+
+    with pytest.raises(jira.ScriptError, match="1 of 1 bulk items failed"):
+        _run(
+            jira.handle_bulk_transition,
+            server,
+            _write_items(tmp_path, [{"key": "PROJ-1", "transition": "Ship"}]),
+        )
+
+    (result,) = _results(capsys)
+    assert result["status"] == "failed"
+    assert "Available transitions: Done" in result["error"]
+    assert server.paths("POST") == []
+
+
+def test_bulk_results_are_audited_per_item(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    audit_log = tmp_path / "audit.jsonl"
+    monkeypatch.setenv("JIRA_AUDIT_LOG", str(audit_log))
+    server = BulkServer(
+        lambda method, path, data: {
+            "issues": [{"key": "PROJ-1"}],
+            "errors": [{"failedElementNumber": 1, "elementErrors": {}}],
+        }
+    )
+
+    with pytest.raises(jira.ScriptError):
+        _run(
+            jira.handle_bulk_create,
+            server,
+            _write_items(tmp_path, [{"fields": {}}, {"fields": {}}]),
+        )
+
+    records = [
+        json.loads(line) for line in audit_log.read_text(encoding="utf-8").splitlines()
+    ]
+    assert [(r["event"], r["item"], r["outcome"]) for r in records] == [
+        ("item", 1, "success"),
+        ("item", 2, "error"),
+    ]
+    assert records[0]["key"] == "PROJ-1"
+    assert records[1]["error"] == "Jira rejected the item"
+    capsys.readouterr()
+
+
+def test_main_requires_confirmation_for_bulk_commands(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]
+) -> None:
+    monkeypatch.setattr("sys.argv", ["jira.py", "bulk-update"])
+    monkeypatch.delenv("JIRA_CONFIRM_WRITES", raising=False)
+
+    assert jira.main() == jira.EXIT_USAGE
+    assert "explicit confirmation" in capsys.readouterr().err
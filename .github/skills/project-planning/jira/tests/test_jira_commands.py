@@ -255,7 +255,7 @@ def test_handle_comments_aggregates_rows_by_issue(
         {"comments": [{"body": "one"}]},
         {"comments": [{"body": "two"}]},
     ]
-    args = argparse.Namespace(issue_keys=[TEST_ISSUE_KEY, TEST_ISSUE_KEY_TWO])
+    args = argparse.Namespace(issue_keys=[TEST_ISSUE_KEY, TEST_ISSUE_KEY_TWO], jobs=1)
 
     result = jira.handle_comments(handler_client, args)
 
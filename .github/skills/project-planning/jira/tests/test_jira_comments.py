@@ -0,0 +1,197 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Concurrent comment fetch and rate-limit tests for jira.py."""
+
+from __future__ import annotations
+
+import argparse
+import io
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from email.message import Message
+from email.utils import format_datetime
+from typing import cast
+
+import jira
+import pytest
+from pytest_mock import MockerFixture
+
+
+@dataclass
+class CommentServer:
+    """Thread-safe fake client serving comment pages by issue key."""
+
+    comments: dict[str, list[str]]
+    page_size: int = 2
+    throttled: dict[str, int] = field(default_factory=dict)
+    retry_after: float | None = None
+    delays: dict[str, float] = field(default_factory=dict)
+    paths: list[str] = field(default_factory=list)
+    _lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def request(self, method: str, path: str, data: object | None = None) -> object:
+        issue_key = path.split("/")[2]
+        with self._lock:
+            self.paths.append(path)
+            if self.throttled.get(issue_key, 0) > 0:
+                self.throttled[issue_key] -= 1
+                raise jira.JiraAPIError(
+                    status=429, method=method, retry_after=self.retry_after
+                )
+        if issue_key in self.delays:
+            time.sleep(self.delays[issue_key])
+        start_at = int(path.split("startAt=")[1].split("&")[0])
+        bodies = self.comments[issue_key]
+        return {
+            "startAt": start_at,
+            "maxResults": self.page_size,
+            "total": len(bodies),
+            "comments": [
+                {"body": body} for body in bodies[start_at : start_at + self.page_size]
+            ],
+        }
+
+
+@pytest.fixture
+def sleeps(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+    recorded: list[float] = []
+    monkeypatch.setattr(jira.time, "sleep", recorded.append)
+    return recorded
+
+
+def _comments(server: CommentServer, keys: list[str], jobs: int = 4) -> object:
+    args = argparse.Namespace(issue_keys=keys, jobs=jobs)
+    return jira.handle_comments(cast(jira.JiraClient, server), args)
+
+
+def test_handle_comments_follows_pagination_and_keeps_key_order() -> None:
+    server = CommentServer(
+        comments={"PROJ-1": ["a", "b", "c"], "PROJ-2": [], "PROJ-3": ["d"]},
+        delays={"PROJ-1": 0.05},
+    )
+
+    rows = _comments(server, ["PROJ-1", "PROJ-2", "PROJ-3"])
+
+    assert rows == [
+        {"body": "a", "_issue": "PROJ-1"},
+        {"body": "b", "_issue": "PROJ-1"},
+        {"body": "c", "_issue": "PROJ-1"},
+        {"body": "d", "_issue": "PROJ-3"},
+    ]
+    assert sorted(path for path in server.paths if "PROJ-1" in path) == [
+        f"/issue/PROJ-1/comment?startAt={start}&maxResults={jira.MAX_RESULTS}"
+        for start in (0, 2)
+    ]
+
+
+def test_handle_comments_waits_out_rate_limit_then_retries(
+    sleeps: list[float],
+) -> None:
+    server = CommentServer(
+        comments={"PROJ-1": ["a"]}, throttled={"PROJ-1": 2}, retry_after=3
+    )
+
+    rows = _comments(server, ["PROJ-1"])
+
+    assert rows == [{"body": "a", "_issue": "PROJ-1"}]
+    assert len(server.paths) == 3
+    assert len(sleeps) == 2
+    assert all(2.5 < delay <= 3 for delay in sleeps)
+
+
+def test_handle_comments_backs_off_without_retry_after(sleeps: list[float]) -> None:
+    server = CommentServer(comments={"PROJ-1": ["a"]}, throttled={"PROJ-1": 3})
+
+    _comments(server, ["PROJ-1"], jobs=1)
+
+    assert [round(delay) for delay in sleeps] == [1, 2, 4]
+
+
+def test_handle_comments_gives_up_after_repeated_rate_limits(
+    sleeps: list[float],
+) -> None:
+    server = CommentServer(
+        comments={"PROJ-1": ["a"]},
+        throttled={"PROJ-1": jira.MAX_THROTTLE_RETRIES + 1},
+        retry_after=1000,
+    )
+
+    with pytest.raises(jira.JiraAPIError) as exc_info:
+        _comments(server, ["PROJ-1"])
+
+    assert exc_info.value.status == 429
+    assert len(sleeps) == jira.MAX_THROTTLE_RETRIES
+    assert max(sleeps) <= jira.MAX_RETRY_AFTER_SECONDS
+
+
+def test_handle_comments_validates_keys_and_jobs_before_fetching() -> None:
+    server = CommentServer(comments={"PROJ-1": []})
+
+    with pytest.raises(jira.ScriptError, match="Invalid issue key"):
+        _comments(server, ["PROJ-1", "not-a-key"])
+    with pytest.raises(jira.ScriptError, match="--jobs must be a positive"):
+        _comments(server, ["PROJ-1"], jobs=0)
+
+    assert server.paths == []
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("7", 7.0),
+        ("soon", None),
+        ("", None),
+        (format_datetime(datetime(2000, 1, 1, tzinfo=timezone.utc)), 0.0),
+    ],
+)
+def test_retry_after_seconds_parses_delay_forms(
+    value: str, expected: float | None
+) -> None:
+    headers = Message()
+    headers["Retry-After"] = value
+
+    assert (
+        jira._retry_after_seconds(urllib.error.HTTPError("u", 429, "", headers, None))
+        == expected
+    )
+
+
+def test_retry_after_seconds_reads_future_http_date() -> None:
+    headers = Message()
+    when = datetime.now(timezone.utc) + timedelta(seconds=30)
+    headers["Retry-After"] = format_datetime(when, usegmt=True)
+
+    delay = jira._retry_after_seconds(
+        urllib.error.HTTPError("u", 429, "", headers, None)
+    )
+
+    assert delay is not None and 25 < delay <= 30
+
+
+def test_request_reports_retry_after_on_rate_limit(
+    configured_client: jira.JiraClient,
+    mocker: MockerFixture,
+) -> None:
+    headers = Message()
+    headers["Retry-After"] = "12"
+
+    def fake_open(request: urllib.request.Request, timeout: int) -> object:
+        raise urllib.error.HTTPError(
+            url=request.full_url,
+            code=429,
+            msg="Too Many Requests",
+            hdrs=headers,
+            fp=io.BytesIO(b'{"errorMessages": ["Rate limit exceeded"]}'),
+        )
+
+    mocker.patch("jira._OPENER.open", side_effect=fake_open)
+
+    with pytest.raises(jira.JiraAPIError) as exc_info:
+        configured_client.request("GET", "/issue/PROJ-1/comment")
+
+    assert exc_info.value.status == 429
+    assert exc_info.value.retry_after == 12.0
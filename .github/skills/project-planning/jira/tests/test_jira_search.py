@@ -0,0 +1,188 @@
+# Copyright (c) 2026 Microsoft Corporation. All rights reserved.
+# SPDX-License-Identifier: MIT
+"""Paginated search tests for jira.py."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import urllib.parse
+
+import jira
+import pytest
+from conftest import ClientRecorder
+from test_constants import FIELDS_ISSUE, TEST_JQL
+
+ENCODED_JQL = urllib.parse.quote(TEST_JQL, safe="")
+
+
+def _issues(start: int, count: int) -> list[dict[str, object]]:
+    return [
+        {"key": f"PROJ-{index}", "fields": {"summary": f"Issue {index}"}}
+        for index in range(start, start + count)
+    ]
+
+
+def _search_args(**overrides: object) -> argparse.Namespace:
+    values: dict[str, object] = {
+        "jql": TEST_JQL,
+        "max_results": None,
+        "all": True,
+        "limit": None,
+        "fields": None,
+    }
+    values.update(overrides)
+    return argparse.Namespace(**values)
+
+
+def test_iter_search_pages_legacy_search_with_start_at(
+    client_recorder: ClientRecorder,
+) -> None:
+    client_recorder.responses = [
+        {"startAt": 0, "maxResults": 2, "total": 5, "issues": _issues(0, 2)},
+        {"startAt": 2, "maxResults": 2, "total": 5, "issues": _issues(2, 2)},
+        {"startAt": 4, "maxResults": 2, "total": 5, "issues": _issues(4, 1)},
+    ]
+
+    keys = [
+        issue["key"] for issue in client_recorder.iter_search(TEST_JQL, page_size=2)
+    ]
+
+    assert keys == [f"PROJ-{index}" for index in range(5)]
+    assert [call.path for call in client_recorder.calls] == [
+        f"/search?jql={ENCODED_JQL}&startAt={start}&maxResults=2" for start in (0, 2, 4)
+    ]
+
+
+def test_iter_search_follows_server_page_size_without_total(
+    client_recorder: ClientRecorder,
+) -> None:
+    client_recorder.responses = [
+        {"maxResults": 2, "issues": _issues(0, 2)},
+        {"maxResults": 2, "issues": _issues(2, 1)},
+    ]
+
+    issues = list(client_recorder.iter_search(TEST_JQL, page_size=100))
+
+    assert len(issues) == 3
+    assert len(client_recorder.calls) == 2
+    assert "startAt=2&" in client_recorder.calls[1].path
+
+
+def test_iter_search_pages_cloud_search_with_next_page_token(
+    client_recorder: ClientRecorder,
+) -> None:
+    client_recorder.use_legacy_search = False
+    client_recorder.responses = [
+        {"issues": _issues(0, 2), "nextPageToken": "tok/en=1"},
+        {"issues": _issues(2, 2), "nextPageToken": "tok2", "isLast": True},
+    ]
+
+    issues = list(client_recorder.iter_search(TEST_JQL))
+
+    assert len(issues) == 4
+    assert [call.path for call in client_recorder.calls] == [
+        f"/search/jql?jql={ENCODED_JQL}&maxResults=100&fields=*navigable",
+        f"/search/jql?jql={ENCODED_JQL}&maxResults=100&fields=*navigable"
+        "&nextPageToken=tok%2Fen%3D1",
+    ]
+
+
+def test_iter_search_stops_at_limit_and_shrinks_last_page(
+    client_recorder: ClientRecorder,
+) -> None:
+    client_recorder.responses = [
+        {"total": 50, "issues": _issues(0, 3)},
+        {"total": 50, "issues": _issues(3, 2)},
+    ]
+
+    issues = list(client_recorder.iter_search(TEST_JQL, page_size=3, limit=5))
+
+    assert len(issues) == 5
+    assert [call.path.rsplit("=", 1)[1] for call in client_recorder.calls] == [
+        "3",
+        "2",
+    ]
+
+
+def test_iter_search_prefetches_next_page_before_current_is_consumed(
+    client_recorder: ClientRecorder,
+) -> None:
+    client_recorder.responses = [
+        {"total": 4, "issues": _issues(0, 2)},
+        {"total": 4, "issues": _issues(2, 2)},
+    ]
+    issues = client_recorder.iter_search(TEST_JQL, page_size=2)
+
+    first = next(issues)
+    deadline = time.monotonic() + 5
+    while len(client_recorder.calls) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert first["key"] == "PROJ-0"
+    assert len(client_recorder.calls) == 2
+    assert [issue["key"] for issue in issues] == ["PROJ-1", "PROJ-2", "PROJ-3"]
+
+
+def test_iter_search_rejects_non_positive_limit(
+    client_recorder: ClientRecorder,
+) -> None:
+    with pytest.raises(jira.ScriptError) as exc_info:
+        list(client_recorder.iter_search(TEST_JQL, limit=0))
+
+    assert exc_info.value.exit_code == jira.EXIT_USAGE
+    assert client_recorder.calls == []
+
+
+def test_handle_search_all_streams_json_lines(
+    client_recorder: ClientRecorder,
+    handler_client: jira.JiraClient,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    client_recorder.responses = [
+        {"total": 2, "issues": [{"key": "PROJ-1", "password": "hunter2"}]},
+        {"total": 2, "issues": [{"key": "PROJ-2"}]},
+    ]
+
+    result = jira.handle_search(handler_client, _search_args(max_results=1))
+
+    assert result is None
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"key": "PROJ-1", "password": "[REDACTED]"},
+        {"key": "PROJ-2"},
+    ]
+
+
+def test_handle_search_all_streams_selected_fields_as_rows(
+    client_recorder: ClientRecorder,
+    handler_client: jira.JiraClient,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    client_recorder.responses = [{"total": 2, "issues": _issues(0, 2)}]
+
+    jira.handle_search(handler_client, _search_args(fields=FIELDS_ISSUE))
+
+    assert capsys.readouterr().out.splitlines() == [
+        "key\tfields.summary",
+        "PROJ-0\tIssue 0",
+        "PROJ-1\tIssue 1",
+    ]
+
+
+def test_handle_search_rejects_limit_without_all(
+    handler_client: jira.JiraClient,
+) -> None:
+    with pytest.raises(jira.ScriptError, match="--limit requires --all"):
+        jira.handle_search(handler_client, _search_args(all=False, limit=10))
+
+
+def test_create_parser_parses_paginated_search_arguments() -> None:
+    args = jira.create_parser().parse_args(
+        ["search", TEST_JQL, "--all", "--limit", "500"]
+    )
+
+    assert args.all is True
+    assert args.limit == 500
+    assert args.max_results is None